@@ -0,0 +1,55 @@
+"""move finance export batch payloads to object storage
+
+Revision ID: 202605150001
+Revises: 202605140001
+Create Date: 2026-05-15 09:00:00.000000
+
+Adds ``finance_export_batches.storage_key`` pointing at a gzip-compressed
+NDJSON blob in object storage, and relaxes the inline ``payload_json`` column
+so new batches no longer fill it. Migrations stay schema-only: existing
+payloads are copied out by ``python -m app.cli backfill-export-batch-payloads``
+before revision 202605220001 drops the inline column.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "202605150001"
+down_revision = "202605140001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "finance_export_batches",
+        sa.Column("storage_key", sa.String(length=512), nullable=True),
+    )
+    op.alter_column(
+        "finance_export_batches",
+        "payload_json",
+        existing_type=sa.JSON(),
+        nullable=True,
+    )
+
+
+def downgrade() -> None:
+    missing = op.get_bind().scalar(
+        sa.text("SELECT count(*) FROM finance_export_batches WHERE payload_json IS NULL")
+    )
+    if missing:
+        raise RuntimeError(
+            f"{missing} finance export batches only have their payload in object storage; "
+            "downgrade to 202605150001, run "
+            "`python -m app.cli backfill-export-batch-payloads --restore`, then retry"
+        )
+    op.alter_column(
+        "finance_export_batches",
+        "payload_json",
+        existing_type=sa.JSON(),
+        nullable=False,
+    )
+    op.drop_column("finance_export_batches", "storage_key")
@@ -0,0 +1,44 @@
+"""add idempotency keys to finance transactions
+
+Revision ID: 202605160001
+Revises: 202605150001
+Create Date: 2026-05-16 09:00:00.000000
+
+Adds a nullable ``finance_transactions.idempotency_key`` used by bulk posting
+runs. Keys are unique per club through the partial index
+``uq_finance_transactions_club_idempotency_key``; single postings leave the
+column NULL and are not constrained by it.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "202605160001"
+down_revision = "202605150001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "finance_transactions",
+        sa.Column("idempotency_key", sa.String(length=128), nullable=True),
+    )
+    op.create_index(
+        "uq_finance_transactions_club_idempotency_key",
+        "finance_transactions",
+        ["club_id", "idempotency_key"],
+        unique=True,
+        postgresql_where=sa.text("idempotency_key IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "uq_finance_transactions_club_idempotency_key",
+        table_name="finance_transactions",
+    )
+    op.drop_column("finance_transactions", "idempotency_key")
@@ -0,0 +1,34 @@
+"""add club journal keyset index to finance transactions
+
+Revision ID: 202605170001
+Revises: 202605160001
+Create Date: 2026-05-17 09:00:00.000000
+
+Adds ``ix_finance_transactions_club_created_at_id`` on
+``(club_id, created_at, id)`` so the club journal can page by keyset on
+``(created_at, id)`` and cap its count without scanning the club's full ledger.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "202605170001"
+down_revision = "202605160001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_finance_transactions_club_created_at_id",
+        "finance_transactions",
+        ["club_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_finance_transactions_club_created_at_id",
+        table_name="finance_transactions",
+    )
@@ -0,0 +1,119 @@
+"""finance tender reconciliations and POS drawer codes
+
+Revision ID: 202605180001
+Revises: 202605170001
+Create Date: 2026-05-18 09:00:00.000000
+
+Adds ``finance_tender_reconciliations`` (one row per club and business date)
+for the close-day tender reconciliation, and an optional ``drawer_code`` on
+``pos_transactions`` so tenders can be totalled per drawer. The
+``(club_id, created_at)`` index on ``pos_transactions`` lets a month of POS
+tenders be grouped and streamed without a full-table scan.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "202605180001"
+down_revision = "202605170001"
+branch_labels = None
+depends_on = None
+
+
+finance_tender_reconciliation_status_enum = postgresql.ENUM(
+    "awaiting_settlement",
+    "balanced",
+    "drift",
+    name="financetenderreconciliationstatus",
+    create_type=False,
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    finance_tender_reconciliation_status_enum.create(bind, checkfirst=True)
+
+    op.add_column(
+        "pos_transactions",
+        sa.Column("drawer_code", sa.String(length=32), nullable=True),
+    )
+    op.create_table(
+        "finance_tender_reconciliations",
+        sa.Column("club_id", sa.Uuid(), nullable=False),
+        sa.Column("business_date", sa.Date(), nullable=False),
+        sa.Column("status", finance_tender_reconciliation_status_enum, nullable=False),
+        sa.Column("settlement_file_name", sa.String(length=255), nullable=True),
+        sa.Column(
+            "pos_card_total",
+            sa.Numeric(12, 2),
+            server_default=sa.text("0.00"),
+            nullable=False,
+        ),
+        sa.Column("acquirer_card_total", sa.Numeric(12, 2), nullable=True),
+        sa.Column("drift_amount", sa.Numeric(12, 2), nullable=True),
+        sa.Column("matched_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column(
+            "unmatched_pos_count",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        sa.Column(
+            "unmatched_acquirer_count",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        sa.Column("tender_totals", sa.JSON(), server_default=sa.text("'[]'::json"), nullable=False),
+        sa.Column("drawer_totals", sa.JSON(), server_default=sa.text("'[]'::json"), nullable=False),
+        sa.Column(
+            "employee_totals",
+            sa.JSON(),
+            server_default=sa.text("'[]'::json"),
+            nullable=False,
+        ),
+        sa.Column(
+            "unmatched_items",
+            sa.JSON(),
+            server_default=sa.text("'[]'::json"),
+            nullable=False,
+        ),
+        sa.Column("reconciled_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["club_id"], ["clubs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "club_id",
+            "business_date",
+            name="uq_finance_tender_reconciliations_club_business_date",
+        ),
+    )
+    op.create_index(
+        "ix_pos_transactions_club_created_at",
+        "pos_transactions",
+        ["club_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pos_transactions_club_created_at", table_name="pos_transactions")
+    op.drop_table("finance_tender_reconciliations")
+    op.drop_column("pos_transactions", "drawer_code")
+    bind = op.get_bind()
+    finance_tender_reconciliation_status_enum.drop(bind, checkfirst=True)
@@ -0,0 +1,60 @@
+"""club kpi daily snapshots
+
+Revision ID: 202605190001
+Revises: 202605180001
+Create Date: 2026-05-19 09:00:00.000000
+
+Adds ``club_kpi_daily``: one row per club, closed local business date and
+semantic metric, holding the metric's value and the additive components it
+was assembled from. The semantic layer re-aggregates windows from these rows
+and only reads the raw booking and finance tables for days not yet closed.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "202605190001"
+down_revision = "202605180001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "club_kpi_daily",
+        sa.Column("club_id", sa.Uuid(), nullable=False),
+        sa.Column("business_date", sa.Date(), nullable=False),
+        sa.Column("metric", sa.String(length=64), nullable=False),
+        sa.Column("metric_version", sa.String(length=32), nullable=False),
+        sa.Column("value", sa.Numeric(14, 2), nullable=True),
+        sa.Column("components", sa.JSON(), server_default=sa.text("'{}'::json"), nullable=False),
+        sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["club_id"], ["clubs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "club_id",
+            "business_date",
+            "metric",
+            name="uq_club_kpi_daily_club_business_date_metric",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("club_kpi_daily")
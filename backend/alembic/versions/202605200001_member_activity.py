@@ -0,0 +1,52 @@
+"""member activity projection
+
+Revision ID: 202605200001
+Revises: 202605190001
+Create Date: 2026-05-20 09:00:00.000000
+
+Adds ``member_activity``: all-time rounds, spend and last-played instant per
+club and person, kept current for the people touched by booking and finance
+charge writes so the unwindowed member-stats read skips the raw aggregates.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "202605200001"
+down_revision = "202605190001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "member_activity",
+        sa.Column("club_id", sa.Uuid(), nullable=False),
+        sa.Column("person_id", sa.Uuid(), nullable=False),
+        sa.Column("rounds", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("spend", sa.Numeric(14, 2), server_default=sa.text("0"), nullable=False),
+        sa.Column("last_played_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["club_id"], ["clubs.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["person_id"], ["people.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("club_id", "person_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("member_activity")
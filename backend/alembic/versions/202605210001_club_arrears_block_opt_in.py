@@ -0,0 +1,36 @@
+"""club arrears block opt-in
+
+Revision ID: 202605210001
+Revises: 202605200001
+Create Date: 2026-05-21 09:00:00.000000
+
+Adds ``club_configs.arrears_block_enabled`` so booking blocks for members in
+arrears apply only to clubs that switch them on.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "202605210001"
+down_revision = "202605200001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "club_configs",
+        sa.Column(
+            "arrears_block_enabled",
+            sa.Boolean(),
+            server_default=sa.text("false"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("club_configs", "arrears_block_enabled")
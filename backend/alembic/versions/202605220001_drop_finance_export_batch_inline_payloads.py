@@ -0,0 +1,54 @@
+"""drop finance export batch inline payloads
+
+Revision ID: 202605220001
+Revises: 202605210001
+Create Date: 2026-05-22 09:00:00.000000
+
+Makes ``finance_export_batches.storage_key`` required and drops the inline
+``payload_json`` column. Batches created before 202605150001 must have been
+copied to object storage first: upgrade to 202605210001, run
+``python -m app.cli backfill-export-batch-payloads``, then upgrade to head. The
+upgrade refuses to run while any batch is left.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "202605220001"
+down_revision = "202605210001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    pending = op.get_bind().scalar(
+        sa.text("SELECT count(*) FROM finance_export_batches WHERE storage_key IS NULL")
+    )
+    if pending:
+        raise RuntimeError(
+            f"{pending} finance export batches still hold their payload inline; upgrade to "
+            "202605210001, run `python -m app.cli backfill-export-batch-payloads`, then retry"
+        )
+    op.alter_column(
+        "finance_export_batches",
+        "storage_key",
+        existing_type=sa.String(length=512),
+        nullable=False,
+    )
+    op.drop_column("finance_export_batches", "payload_json")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "finance_export_batches",
+        sa.Column("payload_json", sa.JSON(), nullable=True),
+    )
+    op.alter_column(
+        "finance_export_batches",
+        "storage_key",
+        existing_type=sa.String(length=512),
+        nullable=True,
+    )
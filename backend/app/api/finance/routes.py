@@ -4,7 +4,7 @@ import uuid
 from datetime import date, datetime
 
 from fastapi import APIRouter, Depends, Query, status
-from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api.routes.club_access import (
@@ -12,11 +12,12 @@ from app.api.routes.club_access import (
     require_club_config_write,
     require_operations_read,
     require_operations_write,
+    resolve_operations_club_ids,
     resolve_required_club_context,
 )
 from app.auth.dependencies import get_current_user, get_db
 from app.core.exceptions import AuthorizationError
-from app.models import User
+from app.models import FinanceTransactionSource, FinanceTransactionType, User
 from app.schemas.finance import (
     AccountingExportProfileListResponse,
     AccountingExportProfileResponse,
@@ -24,7 +25,10 @@ from app.schemas.finance import (
     AccountingMappedExportPreviewResponse,
     FinanceAccountLedgerResponse,
     FinanceAccountSummaryResponse,
+    FinanceAgedReceivablesResponse,
     FinanceClubJournalResponse,
+    FinanceConsolidatedSummaryResponse,
+    FinanceExceptionsRangeResponse,
     FinanceExceptionsResponse,
     FinanceExportBatchCreateRequest,
     FinanceExportBatchCreateResult,
@@ -35,18 +39,35 @@ from app.schemas.finance import (
     FinanceExportBatchVoidResult,
     FinanceOutstandingSummaryResponse,
     FinanceRevenueSummaryResponse,
+    FinanceTenderReconciliationRangeResponse,
+    FinanceTransactionBatchCreateRequest,
+    FinanceTransactionBatchCreateResult,
     FinanceTransactionCreateRequest,
     FinanceTransactionCreateResult,
     FinanceTransactionVolumeSummaryResponse,
 )
+from app.services._csv import CsvStream
 from app.services.finance.accounting_profile_mapping_service import AccountingProfileMappingService
+from app.services.finance.consolidated_service import FinanceConsolidatedReportService
 from app.services.finance.export_batch_service import FinanceExportBatchService
 from app.services.finance.ledger_service import LedgerService
 from app.services.finance.read_model_service import FinanceReadModelService
+from app.services.finance.statement_service import FinanceStatementService
+from app.services.finance.tender_reconciliation_service import (
+    FinanceTenderReconciliationService,
+)
 
 router = APIRouter()
 
 
+def _csv_streaming_response(result: CsvStream) -> StreamingResponse:
+    return StreamingResponse(
+        result.chunks,
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{result.file_name}"'},
+    )
+
+
 @router.post(
     "/transactions",
     response_model=FinanceTransactionCreateResult,
@@ -65,6 +86,24 @@ def create_finance_transaction(
     return service.create_transaction(club_id=context.selected_club.id, payload=payload)
 
 
+@router.post(
+    "/transactions/batch",
+    response_model=FinanceTransactionBatchCreateResult,
+    status_code=status.HTTP_201_CREATED,
+)
+def create_finance_transactions_batch(
+    payload: FinanceTransactionBatchCreateRequest,
+    raw_selected_club_id: uuid.UUID | None = Depends(get_requested_club_id),  # noqa: B008
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+) -> FinanceTransactionBatchCreateResult:
+    context = resolve_required_club_context(db, current_user, raw_selected_club_id)
+    require_operations_write(current_user, context)
+    assert context.selected_club is not None
+    service = LedgerService(db)
+    return service.create_transactions_batch(club_id=context.selected_club.id, payload=payload)
+
+
 @router.get("/accounts", response_model=list[FinanceAccountSummaryResponse])
 def list_finance_accounts(
     raw_selected_club_id: uuid.UUID | None = Depends(get_requested_club_id),  # noqa: B008
@@ -80,6 +119,16 @@ def list_finance_accounts(
 
 @router.get("/journal", response_model=FinanceClubJournalResponse)
 def get_club_journal(
+    limit: int = Query(default=50, ge=1, le=500),  # noqa: B008
+    after: str | None = Query(default=None),  # noqa: B008
+    before: str | None = Query(default=None),  # noqa: B008
+    source: FinanceTransactionSource | None = Query(default=None),  # noqa: B008
+    transaction_type: FinanceTransactionType | None = Query(  # noqa: B008
+        default=None, alias="type"
+    ),
+    account_id: uuid.UUID | None = Query(default=None),  # noqa: B008
+    date_from: date | None = Query(default=None),  # noqa: B008
+    date_to: date | None = Query(default=None),  # noqa: B008
     raw_selected_club_id: uuid.UUID | None = Depends(get_requested_club_id),  # noqa: B008
     current_user: User = Depends(get_current_user),  # noqa: B008
     db: Session = Depends(get_db),  # noqa: B008
@@ -88,7 +137,17 @@ def get_club_journal(
     require_operations_read(current_user, context)
     assert context.selected_club is not None
     service = LedgerService(db)
-    return service.get_club_journal(club_id=context.selected_club.id)
+    return service.get_club_journal(
+        club_id=context.selected_club.id,
+        limit=limit,
+        after=after,
+        before=before,
+        source=source,
+        transaction_type=transaction_type,
+        account_id=account_id,
+        date_from=date_from,
+        date_to=date_to,
+    )
 
 
 @router.get("/summaries/revenue", response_model=FinanceRevenueSummaryResponse)
@@ -108,6 +167,21 @@ def get_finance_revenue_summary(
     )
 
 
+@router.get("/consolidated/summary", response_model=FinanceConsolidatedSummaryResponse)
+def get_finance_consolidated_summary(
+    club_id: list[uuid.UUID] | None = Query(default=None),  # noqa: B008
+    reference_datetime: datetime | None = Query(default=None),  # noqa: B008
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+) -> FinanceConsolidatedSummaryResponse:
+    club_ids = resolve_operations_club_ids(db, current_user, club_id)
+    service = FinanceConsolidatedReportService(db)
+    return service.get_consolidated_summary(
+        club_ids=club_ids,
+        reference_datetime=reference_datetime,
+    )
+
+
 @router.get("/summaries/outstanding", response_model=FinanceOutstandingSummaryResponse)
 def get_finance_outstanding_summary(
     raw_selected_club_id: uuid.UUID | None = Depends(get_requested_club_id),  # noqa: B008
@@ -121,6 +195,62 @@ def get_finance_outstanding_summary(
     return service.get_outstanding_summary(club_id=context.selected_club.id)
 
 
+@router.get("/summaries/aged-receivables", response_model=FinanceAgedReceivablesResponse)
+def get_finance_aged_receivables(
+    as_of: date | None = Query(default=None),  # noqa: B008
+    raw_selected_club_id: uuid.UUID | None = Depends(get_requested_club_id),  # noqa: B008
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+) -> FinanceAgedReceivablesResponse:
+    context = resolve_required_club_context(db, current_user, raw_selected_club_id)
+    require_operations_read(current_user, context)
+    assert context.selected_club is not None
+    service = FinanceReadModelService(db)
+    return service.get_aged_receivables(club_id=context.selected_club.id, as_of=as_of)
+
+
+@router.get("/summaries/aged-receivables/download")
+def download_finance_aged_receivables(
+    as_of: date | None = Query(default=None),  # noqa: B008
+    raw_selected_club_id: uuid.UUID | None = Depends(get_requested_club_id),  # noqa: B008
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+) -> StreamingResponse:
+    context = resolve_required_club_context(db, current_user, raw_selected_club_id)
+    require_operations_read(current_user, context)
+    assert context.selected_club is not None
+    service = FinanceReadModelService(db)
+    result = service.build_aged_receivables_download(
+        club_id=context.selected_club.id,
+        as_of=as_of,
+    )
+    return _csv_streaming_response(result)
+
+
+@router.get("/statements/download")
+def download_finance_statements(
+    date_from: date = Query(...),  # noqa: B008
+    date_to: date = Query(...),  # noqa: B008
+    raw_selected_club_id: uuid.UUID | None = Depends(get_requested_club_id),  # noqa: B008
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+) -> StreamingResponse:
+    context = resolve_required_club_context(db, current_user, raw_selected_club_id)
+    require_operations_read(current_user, context)
+    assert context.selected_club is not None
+    service = FinanceStatementService(db)
+    result = service.build_statement_archive(
+        club_id=context.selected_club.id,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return StreamingResponse(
+        result.chunks,
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{result.file_name}"'},
+    )
+
+
 @router.get("/summaries/transaction-volume", response_model=FinanceTransactionVolumeSummaryResponse)
 def get_finance_transaction_volume_summary(
     reference_datetime: datetime | None = Query(default=None),  # noqa: B008
@@ -152,6 +282,44 @@ def get_finance_exceptions(
     return service.get_exceptions(club_id=context.selected_club.id, target_date=date)
 
 
+@router.get("/exceptions/range", response_model=FinanceExceptionsRangeResponse)
+def get_finance_exceptions_range(
+    date_from: date = Query(...),  # noqa: B008
+    date_to: date = Query(...),  # noqa: B008
+    raw_selected_club_id: uuid.UUID | None = Depends(get_requested_club_id),  # noqa: B008
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+) -> FinanceExceptionsRangeResponse:
+    context = resolve_required_club_context(db, current_user, raw_selected_club_id)
+    require_operations_read(current_user, context)
+    assert context.selected_club is not None
+    service = FinanceReadModelService(db)
+    return service.get_exceptions_range(
+        club_id=context.selected_club.id,
+        date_from=date_from,
+        date_to=date_to,
+    )
+
+
+@router.get("/tender-reconciliations", response_model=FinanceTenderReconciliationRangeResponse)
+def list_tender_reconciliations(
+    date_from: date = Query(...),  # noqa: B008
+    date_to: date = Query(...),  # noqa: B008
+    raw_selected_club_id: uuid.UUID | None = Depends(get_requested_club_id),  # noqa: B008
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+) -> FinanceTenderReconciliationRangeResponse:
+    context = resolve_required_club_context(db, current_user, raw_selected_club_id)
+    require_operations_read(current_user, context)
+    assert context.selected_club is not None
+    service = FinanceTenderReconciliationService(db)
+    return service.list_reconciliations(
+        club_id=context.selected_club.id,
+        date_from=date_from,
+        date_to=date_to,
+    )
+
+
 @router.get("/accounts/{account_id}/ledger", response_model=FinanceAccountLedgerResponse)
 def get_account_ledger(
     account_id: uuid.UUID,
@@ -240,17 +408,13 @@ def download_finance_export_batch(
     raw_selected_club_id: uuid.UUID | None = Depends(get_requested_club_id),  # noqa: B008
     current_user: User = Depends(get_current_user),  # noqa: B008
     db: Session = Depends(get_db),  # noqa: B008
-) -> Response:
+) -> StreamingResponse:
     context = resolve_required_club_context(db, current_user, raw_selected_club_id)
     require_operations_read(current_user, context)
     assert context.selected_club is not None
     service = FinanceExportBatchService(db)
     result = service.build_download(club_id=context.selected_club.id, batch_id=batch_id)
-    return Response(
-        content=result.content,
-        media_type="text/csv",
-        headers={"Content-Disposition": f'attachment; filename="{result.file_name}"'},
-    )
+    return _csv_streaming_response(result)
 
 
 @router.get("/accounting-profiles", response_model=AccountingExportProfileListResponse)
@@ -339,7 +503,7 @@ def download_mapped_finance_export(
     raw_selected_club_id: uuid.UUID | None = Depends(get_requested_club_id),  # noqa: B008
     current_user: User = Depends(get_current_user),  # noqa: B008
     db: Session = Depends(get_db),  # noqa: B008
-) -> Response:
+) -> StreamingResponse:
     context = resolve_required_club_context(db, current_user, raw_selected_club_id)
     require_operations_read(current_user, context)
     assert context.selected_club is not None
@@ -349,9 +513,29 @@ def download_mapped_finance_export(
         batch_id=batch_id,
         profile_id=profile_id,
     )
-    return Response(
-        content=result.content,
-        media_type="text/csv",
+    return _csv_streaming_response(result)
+
+
+@router.get("/export-batches/{batch_id}/mapped-export/bundle")
+def download_mapped_finance_export_bundle(
+    batch_id: uuid.UUID,
+    profile_id: list[uuid.UUID] | None = Query(default=None),  # noqa: B008
+    raw_selected_club_id: uuid.UUID | None = Depends(get_requested_club_id),  # noqa: B008
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+) -> StreamingResponse:
+    context = resolve_required_club_context(db, current_user, raw_selected_club_id)
+    require_operations_read(current_user, context)
+    assert context.selected_club is not None
+    service = AccountingProfileMappingService(db)
+    result = service.build_mapped_export_bundle(
+        club_id=context.selected_club.id,
+        batch_id=batch_id,
+        profile_ids=profile_id,
+    )
+    return StreamingResponse(
+        result.chunks,
+        media_type="application/zip",
         headers={"Content-Disposition": f'attachment; filename="{result.file_name}"'},
     )
 
@@ -363,7 +547,7 @@ def export_mapped_finance_batch(
     raw_selected_club_id: uuid.UUID | None = Depends(get_requested_club_id),  # noqa: B008
     current_user: User = Depends(get_current_user),  # noqa: B008
     db: Session = Depends(get_db),  # noqa: B008
-) -> Response:
+) -> StreamingResponse:
     context = resolve_required_club_context(db, current_user, raw_selected_club_id)
     require_operations_write(current_user, context)
     assert context.selected_club is not None
@@ -376,11 +560,7 @@ def export_mapped_finance_batch(
         profile_id=profile_id,
         exported_by_person_id=current_user.person_id,
     )
-    return Response(
-        content=result.content,
-        media_type="text/csv",
-        headers={"Content-Disposition": f'attachment; filename="{result.file_name}"'},
-    )
+    return _csv_streaming_response(result)
 
 
 @router.post("/export-batches/{batch_id}/void", response_model=FinanceExportBatchVoidResult)
@@ -56,3 +56,31 @@ def require_club_config_write(user: User, context: TenancyContext) -> None:
         raise AuthorizationError("Selected club access is required")
     if context.selected_membership.role != ClubMembershipRole.CLUB_ADMIN:
         raise AuthorizationError("Club admin access is required for club configuration changes")
+
+
+def resolve_operations_club_ids(
+    db: Session,
+    user: User,
+    requested_club_ids: list[uuid.UUID] | None,
+) -> list[uuid.UUID]:
+    """Clubs a multi-club report may cover: every club the user operates by
+    default, or the requested subset when each one is available to them."""
+    if user.user_type == UserType.SUPERADMIN:
+        if not requested_club_ids:
+            raise AuthorizationError("Explicit club selection is required")
+        return list(dict.fromkeys(requested_club_ids))
+    context = TenancyService(db).resolve_context(user, None, allow_unselected=True)
+    operated_club_ids = [
+        membership.club_id
+        for membership in context.active_memberships
+        if membership.role in {ClubMembershipRole.CLUB_ADMIN, ClubMembershipRole.CLUB_STAFF}
+    ]
+    if not operated_club_ids:
+        raise AuthorizationError(
+            "Operational settings access is not available for this membership role"
+        )
+    if not requested_club_ids:
+        return operated_club_ids
+    if any(club_id not in operated_club_ids for club_id in requested_club_ids):
+        raise AuthorizationError("Selected club is not available to this user")
+    return list(dict.fromkeys(requested_club_ids))
@@ -51,6 +51,8 @@ def update_club_config(
     config.booking_window_days = payload.booking_window_days
     config.cancellation_policy_hours = payload.cancellation_policy_hours
     config.default_slot_interval_minutes = payload.default_slot_interval_minutes
+    if payload.arrears_block_enabled is not None:
+        config.arrears_block_enabled = payload.arrears_block_enabled
     db.add(config)
     db.commit()
     db.refresh(config)
@@ -1,19 +1,35 @@
 from __future__ import annotations
 
 import uuid
+from datetime import date
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.api.routes.club_access import (
     get_requested_club_id,
     require_operations_read,
+    require_operations_write,
     resolve_required_club_context,
 )
 from app.auth.dependencies import get_current_user, get_db
 from app.models import User
-from app.schemas.reports import ReportsSummaryResponse
+from app.schemas.board_pack import BoardPackResponse
+from app.schemas.reports import (
+    MemberStatsSummaryResponse,
+    MetricCourseBreakdownCollectionResponse,
+    MetricSeriesCollectionResponse,
+    MetricSeriesGranularity,
+    ReportsSummaryResponse,
+    UtilisationHeatmapResponse,
+)
+from app.services.board_pack_service import BoardPackService
 from app.services.reports_service import ReportsService
+from app.services.utilisation_heatmap_service import (
+    HEATMAP_DEFAULT_BAND_MINUTES,
+    HEATMAP_DEFAULT_WEEKS,
+    HEATMAP_MAX_WEEKS,
+)
 
 router = APIRouter()
 
@@ -29,3 +45,99 @@ def get_reports_summary(
     assert context.selected_club is not None
     service = ReportsService(db)
     return service.get_summary(club_id=context.selected_club.id)
+
+
+@router.get("/members/summary", response_model=MemberStatsSummaryResponse)
+def get_member_summary(
+    reference_date: date | None = Query(default=None),  # noqa: B008
+    raw_selected_club_id: uuid.UUID | None = Depends(get_requested_club_id),  # noqa: B008
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+) -> MemberStatsSummaryResponse:
+    context = resolve_required_club_context(db, current_user, raw_selected_club_id)
+    require_operations_read(current_user, context)
+    assert context.selected_club is not None
+    service = ReportsService(db)
+    return service.get_member_summary(
+        club_id=context.selected_club.id,
+        reference_date=reference_date,
+    )
+
+
+@router.get("/utilisation/heatmap", response_model=UtilisationHeatmapResponse)
+def get_utilisation_heatmap(
+    weeks: int = Query(default=HEATMAP_DEFAULT_WEEKS, ge=1, le=HEATMAP_MAX_WEEKS),  # noqa: B008
+    band_minutes: int = Query(default=HEATMAP_DEFAULT_BAND_MINUTES),  # noqa: B008
+    raw_selected_club_id: uuid.UUID | None = Depends(get_requested_club_id),  # noqa: B008
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+) -> UtilisationHeatmapResponse:
+    context = resolve_required_club_context(db, current_user, raw_selected_club_id)
+    require_operations_read(current_user, context)
+    assert context.selected_club is not None
+    service = ReportsService(db)
+    return service.get_utilisation_heatmap(
+        club_id=context.selected_club.id,
+        weeks=weeks,
+        band_minutes=band_minutes,
+    )
+
+
+@router.get("/metrics/series", response_model=MetricSeriesCollectionResponse)
+def get_metric_series(
+    metric: list[str] = Query(),  # noqa: B008
+    date_from: date = Query(),  # noqa: B008
+    date_to: date = Query(),  # noqa: B008
+    granularity: MetricSeriesGranularity = Query(  # noqa: B008
+        default=MetricSeriesGranularity.DAY
+    ),
+    raw_selected_club_id: uuid.UUID | None = Depends(get_requested_club_id),  # noqa: B008
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+) -> MetricSeriesCollectionResponse:
+    context = resolve_required_club_context(db, current_user, raw_selected_club_id)
+    require_operations_read(current_user, context)
+    assert context.selected_club is not None
+    service = ReportsService(db)
+    return service.get_metric_series(
+        club_id=context.selected_club.id,
+        metrics=metric,
+        date_from=date_from,
+        date_to=date_to,
+        granularity=granularity,
+    )
+
+
+@router.get("/metrics/courses", response_model=MetricCourseBreakdownCollectionResponse)
+def get_metric_course_breakdown(
+    metric: list[str] = Query(),  # noqa: B008
+    date_from: date = Query(),  # noqa: B008
+    date_to: date = Query(),  # noqa: B008
+    raw_selected_club_id: uuid.UUID | None = Depends(get_requested_club_id),  # noqa: B008
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+) -> MetricCourseBreakdownCollectionResponse:
+    context = resolve_required_club_context(db, current_user, raw_selected_club_id)
+    require_operations_read(current_user, context)
+    assert context.selected_club is not None
+    service = ReportsService(db)
+    return service.get_metric_course_breakdown(
+        club_id=context.selected_club.id,
+        metrics=metric,
+        date_from=date_from,
+        date_to=date_to,
+    )
+
+
+@router.post("/board-pack", response_model=BoardPackResponse)
+def generate_board_pack(
+    month: date | None = Query(default=None),  # noqa: B008
+    raw_selected_club_id: uuid.UUID | None = Depends(get_requested_club_id),  # noqa: B008
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+) -> BoardPackResponse:
+    context = resolve_required_club_context(db, current_user, raw_selected_club_id)
+    require_operations_write(current_user, context)
+    assert context.selected_club is not None
+    service = BoardPackService(db)
+    return service.generate(club_id=context.selected_club.id, month=month)
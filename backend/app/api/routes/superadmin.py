@@ -9,6 +9,7 @@ from app.auth.dependencies import get_current_superadmin, get_db
 from app.core.exceptions import AppError
 from app.events.emission_context import EmissionContext
 from app.models import User
+from app.schemas.reports import MetricProfileListResponse
 from app.schemas.superadmin import (
     SuperadminAccountingProfileActivationRequest,
     SuperadminAccountingProfileBindRequest,
@@ -30,6 +31,7 @@ from app.schemas.superadmin import (
     SuperadminClubStatusUpdateRequest,
     SuperadminClubSummary,
 )
+from app.semantic.profiling import get_metric_profile_store
 from app.services.accounting_template_service import AccountingTemplateService
 from app.services.superadmin_onboarding_service import SuperadminOnboardingService
 
@@ -281,3 +283,13 @@ def create_superadmin_club_invitation(
             correlation_id=_correlation_id(request),
         ),
     )
+
+
+@router.get("/diagnostics/metrics", response_model=MetricProfileListResponse)
+def list_superadmin_metric_profiles(
+    metric: str | None = Query(default=None),
+    club_id: uuid.UUID | None = Query(default=None),
+    _: User = Depends(get_current_superadmin),
+) -> MetricProfileListResponse:
+    """Semantic metric execution profile of the worker serving the request."""
+    return get_metric_profile_store().summarise(metric=metric, club_id=club_id)
@@ -1,14 +1,41 @@
 from __future__ import annotations
 
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Annotated
+
 import typer
+from sqlalchemy import select
 
+import app.semantic  # noqa: F401  (registers metrics and their cache invalidation)
+import app.services.member_activity_projection  # noqa: F401  (keeps member_activity current)
 from app.db import SessionLocal
+from app.models import Club
 from app.schemas.platform import (
     BootstrapInitialClubRequest,
     BootstrapRequest,
     BootstrapSuperadminRequest,
 )
+from app.schemas.tenant_export import TenantExportFormat, TenantExportProgress
+from app.services.board_pack_service import BOARD_PACK_DEFAULT_WORKERS, BoardPackService
+from app.services.finance.close_day_service import (
+    CLOSE_DAY_DEFAULT_WORKERS,
+    FinanceCloseDayService,
+)
+from app.services.finance.export_batch_service import FinanceExportBatchService
+from app.services.finance.statement_service import (
+    STATEMENT_DEFAULT_WORKERS,
+    FinanceStatementService,
+)
+from app.services.finance.tender_reconciliation_service import (
+    FinanceTenderReconciliationService,
+)
+from app.services.kpi_snapshot_service import KPI_SNAPSHOT_DEFAULT_WORKERS, KpiSnapshotService
+from app.services.people_read_model_service import PeopleReadModelService
 from app.services.platform_service import PlatformService
+from app.services.tenant_export_service import TenantExportService
 
 cli = typer.Typer(help="GreenLink backend maintenance commands")
 
@@ -42,5 +69,231 @@ def bootstrap_platform(
     typer.echo(response.message)
 
 
+@cli.command("close-day")
+def close_day(
+    business_date: Annotated[
+        datetime | None,
+        typer.Option(
+            "--date",
+            formats=["%Y-%m-%d"],
+            help="Business date to close for every club. Defaults to each club's last closed day.",
+        ),
+    ] = None,
+    club_ids: Annotated[
+        list[uuid.UUID] | None,
+        typer.Option("--club-id", help="Restrict the run to these clubs. Repeat for several."),
+    ] = None,
+    actor_email: Annotated[
+        str | None,
+        typer.Option(help="User recorded as batch creator. Defaults to the bootstrap superadmin."),
+    ] = None,
+    workers: Annotated[int, typer.Option(min=1)] = CLOSE_DAY_DEFAULT_WORKERS,
+    watch: Annotated[bool, typer.Option(help="Keep running and re-check every interval.")] = False,
+    interval_seconds: Annotated[int, typer.Option(min=30)] = 900,
+) -> None:
+    service = FinanceCloseDayService(SessionLocal, max_workers=workers)
+    while True:
+        report = service.run(
+            actor_email=actor_email,
+            business_date=business_date.date() if business_date else None,
+            club_ids=club_ids or None,
+        )
+        typer.echo(report.model_dump_json(indent=2))
+        if not watch:
+            if report.failed_count:
+                raise typer.Exit(code=1)
+            return
+        time.sleep(interval_seconds)
+
+
+@cli.command("backfill-export-batch-payloads")
+def backfill_export_batch_payloads(
+    restore: Annotated[
+        bool,
+        typer.Option(help="Copy stored payloads back inline before downgrading past 202605150001."),
+    ] = False,
+) -> None:
+    """Move export batch payloads held inline to object storage; run before 202605220001."""
+    with SessionLocal() as db:
+        service = FinanceExportBatchService(db)
+        if restore:
+            typer.echo(f"{service.restore_inline_payloads()} export batch payloads restored inline")
+        else:
+            typer.echo(f"{service.backfill_payload_storage()} export batch payloads copied")
+
+
+@cli.command("reconcile-tenders")
+def reconcile_tenders(
+    club_id: uuid.UUID,
+    date_from: Annotated[
+        datetime,
+        typer.Option("--from", formats=["%Y-%m-%d"], help="First business date to reconcile."),
+    ],
+    date_to: Annotated[
+        datetime | None,
+        typer.Option("--to", formats=["%Y-%m-%d"], help="Last business date. Defaults to --from."),
+    ] = None,
+    settlement_file: Annotated[
+        Path | None,
+        typer.Option(
+            exists=True,
+            dir_okay=False,
+            help="Acquirer settlement CSV with transaction_time, amount and optional reference.",
+        ),
+    ] = None,
+) -> None:
+    with SessionLocal() as db:
+        report = FinanceTenderReconciliationService(db).reconcile(
+            club_id=club_id,
+            date_from=date_from.date(),
+            date_to=(date_to or date_from).date(),
+            settlement_file=settlement_file,
+        )
+    typer.echo(report.model_dump_json(indent=2))
+    if report.drift_day_count:
+        raise typer.Exit(code=1)
+
+
+@cli.command("statements")
+def statements(
+    club_id: uuid.UUID,
+    date_from: Annotated[
+        datetime,
+        typer.Option("--from", formats=["%Y-%m-%d"], help="First day of the statement period."),
+    ],
+    date_to: Annotated[
+        datetime,
+        typer.Option("--to", formats=["%Y-%m-%d"], help="Last day of the statement period."),
+    ],
+    output: Annotated[
+        Path | None,
+        typer.Option(help="Zip file to write. Defaults to the archive name in the working dir."),
+    ] = None,
+    workers: Annotated[int, typer.Option(min=1)] = STATEMENT_DEFAULT_WORKERS,
+) -> None:
+    with SessionLocal() as db:
+        archive = FinanceStatementService(db, max_workers=workers).build_statement_archive(
+            club_id=club_id,
+            date_from=date_from.date(),
+            date_to=date_to.date(),
+        )
+        target = output or Path(archive.file_name)
+        with target.open("wb") as handle:
+            for chunk in archive.chunks:
+                handle.write(chunk)
+    typer.echo(str(target))
+
+
+@cli.command("export-tenant")
+def export_tenant(
+    club_id: uuid.UUID,
+    export_format: Annotated[
+        TenantExportFormat,
+        typer.Option("--format", help="Encoding of each entity file in the archive."),
+    ] = TenantExportFormat.NDJSON,
+) -> None:
+    def echo_progress(progress: TenantExportProgress) -> None:
+        state = "done" if progress.completed else "..."
+        typer.echo(
+            f"[{progress.entity_index}/{progress.entity_count}] {progress.entity}: "
+            f"{progress.rows_written} rows {state}",
+            err=True,
+        )
+
+    with SessionLocal() as db:
+        result = TenantExportService(db).export_club(
+            club_id=club_id,
+            export_format=export_format,
+            progress=echo_progress,
+        )
+    typer.echo(result.model_dump_json(indent=2))
+
+
+@cli.command("snapshot-kpis")
+def snapshot_kpis(
+    date_from: Annotated[
+        datetime | None,
+        typer.Option(
+            "--from",
+            formats=["%Y-%m-%d"],
+            help="First business date to backfill. Defaults to the trailing refresh range.",
+        ),
+    ] = None,
+    date_to: Annotated[
+        datetime | None,
+        typer.Option(
+            "--to",
+            formats=["%Y-%m-%d"],
+            help="Last business date. Defaults to, and is capped at, each club's yesterday.",
+        ),
+    ] = None,
+    club_ids: Annotated[
+        list[uuid.UUID] | None,
+        typer.Option("--club-id", help="Restrict the run to these clubs. Repeat for several."),
+    ] = None,
+    workers: Annotated[int, typer.Option(min=1)] = KPI_SNAPSHOT_DEFAULT_WORKERS,
+    watch: Annotated[bool, typer.Option(help="Keep running and re-check every interval.")] = False,
+    interval_seconds: Annotated[int, typer.Option(min=60)] = 86_400,
+) -> None:
+    service = KpiSnapshotService(SessionLocal, max_workers=workers)
+    while True:
+        report = service.run(
+            club_ids=club_ids or None,
+            date_from=date_from.date() if date_from else None,
+            date_to=date_to.date() if date_to else None,
+        )
+        typer.echo(report.model_dump_json(indent=2))
+        if not watch:
+            if report.failed_count:
+                raise typer.Exit(code=1)
+            return
+        time.sleep(interval_seconds)
+
+
+@cli.command("refresh-member-activity")
+def refresh_member_activity(
+    club_ids: Annotated[
+        list[uuid.UUID] | None,
+        typer.Option("--club-id", help="Restrict the run to these clubs. Repeat for several."),
+    ] = None,
+) -> None:
+    """Backfill the member_activity projection, one commit per club."""
+    with SessionLocal() as db:
+        statement = select(Club.id, Club.slug).where(Club.active.is_(True))
+        if club_ids:
+            statement = statement.where(Club.id.in_(club_ids))
+        service = PeopleReadModelService(db)
+        for club_id, club_slug in db.execute(statement.order_by(Club.slug.asc())).all():
+            row_count = service.refresh_member_activity(club_id=club_id)
+            db.commit()
+            typer.echo(f"{club_slug}: {row_count} member activity rows")
+
+
+@cli.command("board-packs")
+def board_packs(
+    month: Annotated[
+        datetime | None,
+        typer.Option(
+            formats=["%Y-%m"],
+            help="Month to report on. Defaults to each club's last complete month.",
+        ),
+    ] = None,
+    club_ids: Annotated[
+        list[uuid.UUID] | None,
+        typer.Option("--club-id", help="Restrict the run to these clubs. Repeat for several."),
+    ] = None,
+    workers: Annotated[int, typer.Option(min=1)] = BOARD_PACK_DEFAULT_WORKERS,
+) -> None:
+    """Generate Board Packs for every active club; schedule on the 1st of the month."""
+    with SessionLocal() as db:
+        report = BoardPackService(db, max_workers=workers).run(
+            club_ids=club_ids or None,
+            month=month.date() if month else None,
+        )
+    typer.echo(report.model_dump_json(indent=2))
+    if report.failed_count:
+        raise typer.Exit(code=1)
+
+
 if __name__ == "__main__":
     cli()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from decimal import Decimal
 from functools import lru_cache
 from pathlib import Path
 from typing import Literal
@@ -29,11 +30,23 @@ class Settings(BaseSettings):
     )
     log_level: str = "INFO"
     secure_cookies: bool = False
+    object_storage_backend: Literal["local", "s3"] = "local"
+    object_storage_local_root: Path = BACKEND_ROOT / "var" / "object-storage"
     object_storage_endpoint: str = "http://localhost:9000"
     object_storage_bucket: str = "greenlink-assets"
     object_storage_region: str = "us-east-1"
     object_storage_access_key: str
     object_storage_secret_key: str
+    arrears_block_threshold: Decimal = Decimal("0.00")
+    arrears_block_min_age_days: int = Field(default=30, ge=0)
+    arrears_block_cache_ttl_seconds: int = Field(default=900, ge=1)
+    semantic_cache_backend: Literal["memory", "redis", "disabled"] = "redis"
+    semantic_cache_max_entries: int = Field(default=4096, ge=1)
+    semantic_cache_default_ttl_seconds: int = Field(default=900, ge=0)
+    semantic_profiling_enabled: bool = True
+    semantic_profiling_window: int = Field(default=256, ge=1)
+    semantic_profiling_log_events: bool = False
+    member_activity_projection_enabled: bool = False
 
     @field_validator("allowed_origins", mode="before")
     @classmethod
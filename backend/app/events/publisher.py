@@ -1,13 +1,28 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
 from typing import Protocol
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.events.emission_context import EmissionContext
 from app.models import DomainEventRecord
 
+# ``Session.info`` entry collecting ``(club_id, event_type)`` for every event
+# published in the current transaction, for commit-time cache invalidation.
+PUBLISHED_EVENTS_KEY = "greenlink.published_events"
+
+
+@dataclass(slots=True)
+class BulkEvent:
+    aggregate_id: str
+    payload: dict[str, object]
+    before: dict[str, object] | None = None
+    after: dict[str, object] | None = None
+
 
 class EventPublisher(Protocol):
     def publish(
@@ -43,22 +58,78 @@ class DatabaseEventPublisher:
         after: dict[str, object] | None = None,
     ) -> None:
         ctx = context or EmissionContext()
-        enriched: dict[str, object] = {**payload}
-        enriched.setdefault("source_channel", ctx.source_channel)
-        if actor_person_id is not None:
-            enriched.setdefault("actor_person_id", str(actor_person_id))
-        if before is not None:
-            enriched.setdefault("before", before)
-        if after is not None:
-            enriched.setdefault("after", after)
+        self._note_published(event_type, club_id)
         self.db.add(
             DomainEventRecord(
                 event_type=event_type,
                 aggregate_type=aggregate_type,
                 aggregate_id=aggregate_id,
-                payload=enriched,
+                payload=self._enrich(
+                    payload,
+                    ctx=ctx,
+                    actor_person_id=actor_person_id,
+                    before=before,
+                    after=after,
+                ),
                 correlation_id=ctx.correlation_id,
                 club_id=club_id,
                 actor_user_id=ctx.actor_user_id,
             )
         )
+
+    def publish_many(
+        self,
+        *,
+        event_type: str,
+        aggregate_type: str,
+        events: Iterable[BulkEvent],
+        context: EmissionContext | None = None,
+        club_id: uuid.UUID | None = None,
+        actor_person_id: uuid.UUID | None = None,
+    ) -> int:
+        """Write one event per item with a single multi-row INSERT."""
+        ctx = context or EmissionContext()
+        rows = [
+            {
+                "event_type": event_type,
+                "aggregate_type": aggregate_type,
+                "aggregate_id": item.aggregate_id,
+                "payload": self._enrich(
+                    item.payload,
+                    ctx=ctx,
+                    actor_person_id=actor_person_id,
+                    before=item.before,
+                    after=item.after,
+                ),
+                "correlation_id": ctx.correlation_id,
+                "club_id": club_id,
+                "actor_user_id": ctx.actor_user_id,
+            }
+            for item in events
+        ]
+        if rows:
+            self._note_published(event_type, club_id)
+            self.db.execute(insert(DomainEventRecord), rows)
+        return len(rows)
+
+    def _note_published(self, event_type: str, club_id: uuid.UUID | None) -> None:
+        self.db.info.setdefault(PUBLISHED_EVENTS_KEY, set()).add((club_id, event_type))
+
+    def _enrich(
+        self,
+        payload: dict[str, object],
+        *,
+        ctx: EmissionContext,
+        actor_person_id: uuid.UUID | None,
+        before: dict[str, object] | None,
+        after: dict[str, object] | None,
+    ) -> dict[str, object]:
+        enriched: dict[str, object] = {**payload}
+        enriched.setdefault("source_channel", ctx.source_channel)
+        if actor_person_id is not None:
+            enriched.setdefault("actor_person_id", str(actor_person_id))
+        if before is not None:
+            enriched.setdefault("before", before)
+        if after is not None:
+            enriched.setdefault("after", after)
+        return enriched
@@ -7,6 +7,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 import app.semantic  # noqa: F401  (triggers semantic-layer metric registration)
+import app.services.member_activity_projection  # noqa: F401  (keeps member_activity current)
 from app.api.router import api_router
 from app.config import get_settings
 from app.core.exceptions import AppError
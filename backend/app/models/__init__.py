@@ -7,6 +7,7 @@ from app.models.booking_rule_set import BookingRuleSet
 from app.models.club import Club
 from app.models.club_config import ClubConfig
 from app.models.club_invitation import ClubInvitation
+from app.models.club_kpi_daily import ClubKpiDaily
 from app.models.club_membership import ClubMembership
 from app.models.club_module import ClubModule
 from app.models.club_setting import ClubSetting
@@ -36,6 +37,7 @@ from app.models.enums import (
     FinanceAccountStatus,
     FinanceExportBatchStatus,
     FinanceExportProfile,
+    FinanceTenderReconciliationStatus,
     FinanceTransactionSource,
     FinanceTransactionType,
     IntegrityIssueScope,
@@ -57,8 +59,10 @@ from app.models.enums import (
 from app.models.finance.account import FinanceAccount
 from app.models.finance.accounting_export_profile import AccountingExportProfile
 from app.models.finance.export_batch import FinanceExportBatch
+from app.models.finance.tender_reconciliation import FinanceTenderReconciliation
 from app.models.finance.tender_record import FinanceTenderRecord
 from app.models.finance.transaction import FinanceTransaction
+from app.models.member_activity import MemberActivity
 from app.models.news_post import NewsPost
 from app.models.order import Order
 from app.models.order_item import OrderItem
@@ -97,6 +101,7 @@ __all__ = [
     "Club",
     "ClubConfig",
     "ClubInvitation",
+    "ClubKpiDaily",
     "ClubOnboardingState",
     "ClubOnboardingStep",
     "ClubInvitationStatus",
@@ -112,6 +117,8 @@ __all__ = [
     "FinanceAccount",
     "FinanceAccountStatus",
     "FinanceExportBatch",
+    "FinanceTenderReconciliation",
+    "FinanceTenderReconciliationStatus",
     "FinanceTenderRecord",
     "FinanceExportBatchStatus",
     "FinanceExportProfile",
@@ -120,6 +127,7 @@ __all__ = [
     "FinanceTransactionType",
     "IntegrityIssueScope",
     "IntegrityIssueSeverity",
+    "MemberActivity",
     "NewsPost",
     "NewsPostStatus",
     "NewsPostVisibility",
@@ -3,7 +3,16 @@ from __future__ import annotations
 import uuid
 from typing import Any
 
-from sqlalchemy import JSON, ForeignKey, Integer, String, UniqueConstraint, Uuid, text
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    ForeignKey,
+    Integer,
+    String,
+    UniqueConstraint,
+    Uuid,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -43,6 +52,12 @@ class ClubConfig(UUIDPrimaryKeyMixin, TimestampMixin, Base):
         default=10,
         server_default=text("10"),
     )
+    arrears_block_enabled: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default=text("false"),
+    )
     preferred_accounting_profile_id: Mapped[uuid.UUID | None] = mapped_column(
         Uuid,
         ForeignKey("accounting_export_profiles.id", ondelete="SET NULL"),
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import JSON, ForeignKey, Numeric, String, UniqueConstraint, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.db.types import UTCDateTime
+from app.models.mixins import TimestampMixin, UUIDPrimaryKeyMixin
+
+
+class ClubKpiDaily(UUIDPrimaryKeyMixin, TimestampMixin, Base):
+    """One semantic metric's value for one club and closed local business date,
+    with the additive quantities (numerators and denominators) it was
+    assembled from so longer windows can be re-aggregated from snapshots."""
+
+    __tablename__ = "club_kpi_daily"
+    __table_args__ = (
+        UniqueConstraint(
+            "club_id",
+            "business_date",
+            "metric",
+            name="uq_club_kpi_daily_club_business_date_metric",
+        ),
+    )
+
+    club_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("clubs.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    business_date: Mapped[date] = mapped_column(nullable=False)
+    metric: Mapped[str] = mapped_column(String(64), nullable=False)
+    metric_version: Mapped[str] = mapped_column(String(32), nullable=False)
+    value: Mapped[Decimal | None] = mapped_column(Numeric(14, 2), nullable=True)
+    components: Mapped[dict[str, Any]] = mapped_column(
+        JSON,
+        nullable=False,
+        default=dict,
+        server_default=text("'{}'::json"),
+    )
+    computed_at: Mapped[datetime] = mapped_column(UTCDateTime(), nullable=False)
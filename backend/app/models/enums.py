@@ -183,6 +183,12 @@ class FinanceExportBatchStatus(StrEnum):
     VOID = "void"
 
 
+class FinanceTenderReconciliationStatus(StrEnum):
+    AWAITING_SETTLEMENT = "awaiting_settlement"
+    BALANCED = "balanced"
+    DRIFT = "drift"
+
+
 class OrderSource(StrEnum):
     PLAYER_APP = "player_app"
     STAFF = "staff"
@@ -1,6 +1,7 @@
 from app.models.finance.account import FinanceAccount
 from app.models.finance.accounting_export_profile import AccountingExportProfile
 from app.models.finance.export_batch import FinanceExportBatch
+from app.models.finance.tender_reconciliation import FinanceTenderReconciliation
 from app.models.finance.tender_record import FinanceTenderRecord
 from app.models.finance.transaction import FinanceTransaction
 
@@ -8,6 +9,7 @@ __all__ = [
     "AccountingExportProfile",
     "FinanceAccount",
     "FinanceExportBatch",
+    "FinanceTenderReconciliation",
     "FinanceTenderRecord",
     "FinanceTransaction",
 ]
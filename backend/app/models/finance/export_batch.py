@@ -80,4 +80,4 @@ class FinanceExportBatch(UUIDPrimaryKeyMixin, TimestampMixin, Base):
         server_default=text("0.00"),
     )
     metadata_json: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
-    payload_json: Mapped[list[dict[str, Any]]] = mapped_column(JSON, nullable=False, default=list)
+    storage_key: Mapped[str] = mapped_column(String(512), nullable=False)
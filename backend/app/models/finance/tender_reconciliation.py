@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import JSON, Enum, ForeignKey, Numeric, String, UniqueConstraint, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.db.types import UTCDateTime
+from app.models.enum_utils import enum_values
+from app.models.enums import FinanceTenderReconciliationStatus
+from app.models.mixins import TimestampMixin, UUIDPrimaryKeyMixin
+
+
+class FinanceTenderReconciliation(UUIDPrimaryKeyMixin, TimestampMixin, Base):
+    """Close-day tender totals for one club and business date, matched against
+    the acquirer settlement file when one was supplied."""
+
+    __tablename__ = "finance_tender_reconciliations"
+    __table_args__ = (
+        UniqueConstraint(
+            "club_id",
+            "business_date",
+            name="uq_finance_tender_reconciliations_club_business_date",
+        ),
+    )
+
+    club_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("clubs.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    business_date: Mapped[date] = mapped_column(nullable=False)
+    status: Mapped[FinanceTenderReconciliationStatus] = mapped_column(
+        Enum(FinanceTenderReconciliationStatus, values_callable=enum_values),
+        nullable=False,
+    )
+    settlement_file_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    pos_card_total: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
+        nullable=False,
+        default=Decimal("0.00"),
+        server_default=text("0.00"),
+    )
+    acquirer_card_total: Mapped[Decimal | None] = mapped_column(Numeric(12, 2), nullable=True)
+    drift_amount: Mapped[Decimal | None] = mapped_column(Numeric(12, 2), nullable=True)
+    matched_count: Mapped[int] = mapped_column(
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+    unmatched_pos_count: Mapped[int] = mapped_column(
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+    unmatched_acquirer_count: Mapped[int] = mapped_column(
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+    tender_totals: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSON,
+        nullable=False,
+        default=list,
+        server_default=text("'[]'::json"),
+    )
+    drawer_totals: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSON,
+        nullable=False,
+        default=list,
+        server_default=text("'[]'::json"),
+    )
+    employee_totals: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSON,
+        nullable=False,
+        default=list,
+        server_default=text("'[]'::json"),
+    )
+    unmatched_items: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSON,
+        nullable=False,
+        default=list,
+        server_default=text("'[]'::json"),
+    )
+    reconciled_at: Mapped[datetime] = mapped_column(UTCDateTime(), nullable=False)
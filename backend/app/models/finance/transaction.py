@@ -13,6 +13,7 @@ from sqlalchemy import (
     String,
     event,
     func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -35,6 +36,19 @@ class FinanceTransaction(UUIDPrimaryKeyMixin, Base):
             "account_id",
             "created_at",
         ),
+        Index(
+            "ix_finance_transactions_club_created_at_id",
+            "club_id",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "uq_finance_transactions_club_idempotency_key",
+            "club_id",
+            "idempotency_key",
+            unique=True,
+            postgresql_where=text("idempotency_key IS NOT NULL"),
+        ),
     )
 
     club_id: Mapped[uuid.UUID] = mapped_column(
@@ -56,6 +70,7 @@ class FinanceTransaction(UUIDPrimaryKeyMixin, Base):
     )
     reference_id: Mapped[uuid.UUID | None] = mapped_column(nullable=True)
     description: Mapped[str] = mapped_column(String(255), nullable=False)
+    idempotency_key: Mapped[str | None] = mapped_column(String(128), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         UTCDateTime(),
         nullable=False,
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import ForeignKey, Integer, Numeric, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.db.types import UTCDateTime
+from app.models.mixins import TimestampMixin
+
+
+class MemberActivity(TimestampMixin, Base):
+    """All-time rounds, spend and last-played instant per club and person.
+
+    A projection of bookings and finance charges, rewritten for the affected
+    people when those change (see ``app.services.member_activity_projection``)
+    and backfilled per club by the ``refresh-member-activity`` command.
+    """
+
+    __tablename__ = "member_activity"
+
+    club_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("clubs.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    person_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("people.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    rounds: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    spend: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2),
+        nullable=False,
+        server_default=text("0"),
+    )
+    last_played_at: Mapped[datetime | None] = mapped_column(UTCDateTime(), nullable=True)
+    refreshed_at: Mapped[datetime] = mapped_column(UTCDateTime(), nullable=False)
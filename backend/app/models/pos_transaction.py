@@ -8,6 +8,7 @@ from sqlalchemy import (
     CheckConstraint,
     Enum,
     ForeignKey,
+    Index,
     Numeric,
     String,
     UniqueConstraint,
@@ -31,6 +32,7 @@ class PosTransaction(UUIDPrimaryKeyMixin, Base):
             "finance_transaction_id",
             name="uq_pos_transactions_finance_transaction_id",
         ),
+        Index("ix_pos_transactions_club_created_at", "club_id", "created_at"),
     )
 
     club_id: Mapped[uuid.UUID] = mapped_column(
@@ -50,6 +52,7 @@ class PosTransaction(UUIDPrimaryKeyMixin, Base):
         index=True,
     )
     notes: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    drawer_code: Mapped[str | None] = mapped_column(String(32), nullable=True)
     created_by_user_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("users.id", ondelete="RESTRICT"),
         nullable=False,
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from app.schemas.finance import FinanceAgedReceivablesBuckets
+
+
+class BoardPackFinanceMonth(BaseModel):
+    month: date
+    revenue: Decimal
+    collections: Decimal
+
+
+class BoardPackFinancialPage(BaseModel):
+    """Page one. Revenue is charges posted in the month and collections are
+    payments received, both in the club's local calendar month."""
+
+    revenue: Decimal
+    collections: Decimal
+    revenue_trend: list[BoardPackFinanceMonth]
+    receivables: FinanceAgedReceivablesBuckets
+    accounts_in_arrears: int
+    total_members: int
+    active_members: int
+    new_members: int
+    members_by_status: dict[str, int]
+
+
+class BoardPackKpiMonth(BaseModel):
+    month: date
+    value: Decimal
+
+
+class BoardPackOperationalKpi(BaseModel):
+    metric: str
+    description: str
+    value: Decimal
+    trend: list[BoardPackKpiMonth]
+
+
+class BoardPackOperationalPage(BaseModel):
+    """Page two: one entry per operational semantic metric."""
+
+    kpis: list[BoardPackOperationalKpi]
+
+
+class BoardPackResponse(BaseModel):
+    club_id: uuid.UUID
+    club_name: str
+    month: date
+    trend_from: date
+    generated_at: datetime
+    financial: BoardPackFinancialPage
+    operational: BoardPackOperationalPage
+    file_name: str
+    storage_key: str
+
+
+class BoardPackClubResult(BaseModel):
+    club_id: uuid.UUID
+    club_slug: str
+    month: date | None = None
+    status: Literal["completed", "failed"]
+    storage_key: str | None = None
+    error_code: str | None = None
+    error_message: str | None = None
+
+
+class BoardPackRunReport(BaseModel):
+    started_at: datetime
+    finished_at: datetime
+    club_count: int
+    completed_count: int
+    failed_count: int
+    clubs: list[BoardPackClubResult] = Field(default_factory=list)
@@ -96,6 +96,7 @@ class BookingStateSnapshotInput(BaseModel):
     externally_unavailable: bool | None = None
     current_bookings_for_day: int | None = Field(default=None, ge=0)
     current_future_bookings: int | None = Field(default=None, ge=0)
+    account_in_arrears: bool | None = None
     blocked_reason: str | None = Field(default=None, max_length=255)
 
 
@@ -108,6 +109,7 @@ class BookingStateSnapshot(BaseModel):
     externally_unavailable: bool | None = None
     current_bookings_for_day: int | None = None
     current_future_bookings: int | None = None
+    account_in_arrears: bool | None = None
     blocked_reason: str | None = None
 
 
@@ -4,6 +4,7 @@ import uuid
 from datetime import date, datetime
 from decimal import Decimal
 from enum import StrEnum
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
@@ -11,6 +12,7 @@ from app.models import (
     FinanceAccountStatus,
     FinanceExportBatchStatus,
     FinanceExportProfile,
+    FinanceTenderReconciliationStatus,
     FinanceTransactionSource,
     FinanceTransactionType,
 )
@@ -57,6 +59,39 @@ class FinanceTransactionCreateResult(BaseModel):
     balance: Decimal
 
 
+class FinanceTransactionBatchItem(FinanceTransactionCreateRequest):
+    idempotency_key: str = Field(min_length=1, max_length=128)
+
+
+class FinanceTransactionBatchCreateRequest(BaseModel):
+    items: list[FinanceTransactionBatchItem] = Field(min_length=1, max_length=5000)
+
+    @model_validator(mode="after")
+    def validate_unique_idempotency_keys(self) -> FinanceTransactionBatchCreateRequest:
+        keys = [item.idempotency_key for item in self.items]
+        if len(set(keys)) != len(keys):
+            raise ValueError("idempotency_key must be unique within a batch")
+        return self
+
+
+class FinanceTransactionBatchItemResult(BaseModel):
+    idempotency_key: str
+    status: Literal["created", "replayed"]
+    transaction: FinanceTransactionResponse
+
+
+class FinanceAccountBalanceResponse(BaseModel):
+    account_id: uuid.UUID
+    balance: Decimal
+
+
+class FinanceTransactionBatchCreateResult(BaseModel):
+    created_count: int
+    replayed_count: int
+    items: list[FinanceTransactionBatchItemResult]
+    balances: list[FinanceAccountBalanceResponse]
+
+
 class FinanceTenderRecordResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -111,6 +146,9 @@ class FinanceJournalEntryResponse(FinanceTransactionResponse):
 class FinanceClubJournalResponse(BaseModel):
     entries: list[FinanceJournalEntryResponse]
     total_count: int
+    total_count_is_estimate: bool = False
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
 
 
 class FinanceSummaryPeriod(StrEnum):
@@ -181,6 +219,90 @@ class FinanceOutstandingSummaryResponse(BaseModel):
     pending_items_count: int
 
 
+class FinanceAgedReceivablesBuckets(BaseModel):
+    current: Decimal
+    days_30: Decimal
+    days_60: Decimal
+    days_90_plus: Decimal
+    total_outstanding: Decimal
+
+
+class FinanceAgedReceivablesAccountRow(FinanceAgedReceivablesBuckets):
+    account_id: uuid.UUID
+    account_customer_code: str
+    oldest_outstanding_at: datetime
+
+
+class FinanceAgedReceivablesResponse(BaseModel):
+    timezone: str
+    as_of: date
+    account_count: int
+    totals: FinanceAgedReceivablesBuckets
+    accounts: list[FinanceAgedReceivablesAccountRow]
+
+
+class FinanceConsolidatedPeriodTotals(FinanceSummaryWindowResponse):
+    revenue: Decimal
+    collections: Decimal
+    charge_count: int
+    transaction_count: int
+
+
+class FinanceConsolidatedCashPosition(BaseModel):
+    """Month-to-date POS tenders by type and the net balance of every member
+    finance account as of the local day (credit positive). ``received`` is
+    cash plus card; member-account tenders are charges, not money in."""
+
+    tenders: list[FinanceTenderTotal]
+    received: Decimal
+    account_balance: Decimal
+
+
+class FinanceConsolidatedKpi(BaseModel):
+    metric: str
+    version: str
+    result: dict[str, Any]
+
+
+class FinanceConsolidatedClubSummary(BaseModel):
+    """``kpis`` cover the month to date."""
+
+    club_id: uuid.UUID
+    club_name: str
+    timezone: str
+    as_of: date
+    day: FinanceConsolidatedPeriodTotals
+    week: FinanceConsolidatedPeriodTotals
+    month: FinanceConsolidatedPeriodTotals
+    receivables: FinanceAgedReceivablesBuckets
+    accounts_in_arrears: int
+    cash_position: FinanceConsolidatedCashPosition
+    kpis: list[FinanceConsolidatedKpi]
+
+
+class FinanceConsolidatedGroupTotals(BaseModel):
+    """Ratio KPIs are re-assembled from the clubs' summed quantities, so each
+    club weighs in by its volume rather than as an average of ratios."""
+
+    day_revenue: Decimal
+    day_collections: Decimal
+    week_revenue: Decimal
+    week_collections: Decimal
+    month_revenue: Decimal
+    month_collections: Decimal
+    receivables: FinanceAgedReceivablesBuckets
+    accounts_in_arrears: int
+    cash_position: FinanceConsolidatedCashPosition
+    kpis: list[FinanceConsolidatedKpi]
+
+
+class FinanceConsolidatedSummaryResponse(BaseModel):
+    reference_datetime: datetime
+    club_count: int
+    totals: FinanceConsolidatedGroupTotals
+    clubs: list[FinanceConsolidatedClubSummary]
+
+
 class FinanceExportBatchPreviewRow(BaseModel):
     entry_date: str
     transaction_id: str
@@ -292,11 +414,6 @@ class FinanceExportBatchRegenerateResult(BaseModel):
     batch: FinanceExportBatchDetailResponse
 
 
-class FinanceExportBatchDownloadResult(BaseModel):
-    file_name: str
-    content: str
-
-
 class FinanceExportBatchReconciliationSampleRow(BaseModel):
     transaction_id: str
     entry_date: str
@@ -424,9 +541,26 @@ class AccountingMappedExportPreviewResponse(BaseModel):
     rows: list[AccountingMappedExportPreviewRow]
 
 
-class AccountingMappedExportDownloadResult(BaseModel):
+class AccountingMappedExportBundleTarget(BaseModel):
+    accounting_profile_id: uuid.UUID
+    accounting_profile_code: str
+    accounting_profile_name: str
+    target_system: str
     file_name: str
-    content: str
+    content_hash: str
+    row_count: int
+    download_ready: bool
+    validation_errors: list[AccountingMappedExportValidationError]
+
+
+class AccountingMappedExportBundleManifest(BaseModel):
+    source_batch_id: uuid.UUID
+    source_export_profile: FinanceExportProfile
+    source_batch_content_hash: str
+    generated_at: datetime
+    target_count: int
+    ready_count: int
+    targets: list[AccountingMappedExportBundleTarget]
 
 
 class FinanceUnpaidBookingSummary(BaseModel):
@@ -454,3 +588,100 @@ class FinanceExceptionsResponse(BaseModel):
     unpaid_bookings: list[FinanceUnpaidBookingSummary]
     unresolved_orders: list[FinanceUnresolvedOrderSummary]
     total_exception_count: int
+
+
+class FinanceExceptionsDayBucket(FinanceExceptionsResponse):
+    no_show_risk_count: int
+    close_day_ready: bool
+
+
+class FinanceExceptionsRangeResponse(BaseModel):
+    timezone: str
+    date_from: date
+    date_to: date
+    days: list[FinanceExceptionsDayBucket]
+    total_exception_count: int
+    close_day_ready_count: int
+
+
+class FinanceCloseDayProfileResult(BaseModel):
+    accounting_profile_id: uuid.UUID
+    accounting_profile_code: str
+    target_system: str
+    status: Literal["exported", "already_exported", "failed"]
+    file_name: str | None = None
+    storage_key: str | None = None
+    content_hash: str | None = None
+    error_code: str | None = None
+    error_message: str | None = None
+
+
+class FinanceCloseDayClubResult(BaseModel):
+    club_id: uuid.UUID
+    club_slug: str
+    business_date: date
+    status: Literal["completed", "no_transactions", "failed"]
+    batch_id: uuid.UUID | None = None
+    batch_created: bool = False
+    profiles: list[FinanceCloseDayProfileResult] = Field(default_factory=list)
+    error_code: str | None = None
+    error_message: str | None = None
+
+
+class FinanceCloseDayRunReport(BaseModel):
+    started_at: datetime
+    finished_at: datetime
+    club_count: int
+    completed_count: int
+    no_transaction_count: int
+    failed_count: int
+    clubs: list[FinanceCloseDayClubResult]
+
+
+class FinanceTenderTotal(BaseModel):
+    tender_type: TenderType
+    amount: Decimal
+    count: int
+
+
+class FinanceTenderDrawerTotal(FinanceTenderTotal):
+    drawer_code: str | None = None
+
+
+class FinanceTenderEmployeeTotal(FinanceTenderTotal):
+    user_id: uuid.UUID
+    display_name: str | None = None
+
+
+class FinanceTenderUnmatchedItem(BaseModel):
+    side: Literal["pos", "acquirer"]
+    amount: Decimal
+    occurred_at: datetime
+    reference: str | None = None
+
+
+class FinanceTenderReconciliationDayResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    business_date: date
+    status: FinanceTenderReconciliationStatus
+    settlement_file_name: str | None = None
+    pos_card_total: Decimal
+    acquirer_card_total: Decimal | None = None
+    drift_amount: Decimal | None = None
+    matched_count: int
+    unmatched_pos_count: int
+    unmatched_acquirer_count: int
+    tender_totals: list[FinanceTenderTotal]
+    drawer_totals: list[FinanceTenderDrawerTotal]
+    employee_totals: list[FinanceTenderEmployeeTotal]
+    unmatched_items: list[FinanceTenderUnmatchedItem]
+    reconciled_at: datetime
+
+
+class FinanceTenderReconciliationRangeResponse(BaseModel):
+    club_id: uuid.UUID
+    date_from: date
+    date_to: date
+    days: list[FinanceTenderReconciliationDayResponse]
+    drift_day_count: int
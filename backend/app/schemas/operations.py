@@ -181,6 +181,8 @@ class ClubConfigUpsertRequest(BaseModel):
     booking_window_days: int = Field(ge=0, le=730)
     cancellation_policy_hours: int = Field(ge=0, le=720)
     default_slot_interval_minutes: int = Field(ge=1, le=240)
+    # Omitted by clients that predate the setting; leaves the stored value unchanged.
+    arrears_block_enabled: bool | None = None
 
     @field_validator("operating_hours")
     @classmethod
@@ -213,6 +215,7 @@ class ClubConfigResponse(BaseModel):
     booking_window_days: int
     cancellation_policy_hours: int
     default_slot_interval_minutes: int
+    arrears_block_enabled: bool
     preferred_accounting_profile_id: uuid.UUID | None
     created_at: datetime
     updated_at: datetime
@@ -85,6 +85,7 @@ class PosTransactionCreateRequest(BaseModel):
     tender_type: TenderType
     person_id: uuid.UUID | None = None
     notes: str | None = Field(default=None, max_length=500)
+    drawer_code: str | None = Field(default=None, min_length=1, max_length=32)
 
 
 class PosTransactionItemDetail(BaseModel):
@@ -105,6 +106,7 @@ class PosTransactionDetail(BaseModel):
     tender_type: TenderType
     finance_transaction_id: uuid.UUID | None
     notes: str | None
+    drawer_code: str | None = None
     created_by_user_id: uuid.UUID
     created_at: datetime
     items: list[PosTransactionItemDetail]
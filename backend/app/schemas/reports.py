@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import uuid
-from datetime import date
+from datetime import date, datetime, time
 from decimal import Decimal
+from enum import StrEnum
+from typing import Any, Literal
 
 from pydantic import BaseModel
 
@@ -73,3 +75,152 @@ class MemberActivityResponse(BaseModel):
     rounds: int
     spend: Decimal
     last_played: date | None
+
+
+class MemberActivitySort(StrEnum):
+    PERSON = "person"
+    ROUNDS = "rounds"
+    SPEND = "spend"
+    LAST_PLAYED = "last_played"
+
+
+# ---------- Utilisation heatmap schemas ---------------------------------
+
+
+class UtilisationHeatmapCell(BaseModel):
+    """One weekday (0 = Monday) and local time band. ``booked_places`` sums
+    ``party_size`` over bookings that were not cancelled; ``capacity_places``
+    is the calendar's player places in the band less blocked slots.
+    ``utilisation`` is ``None`` when the band has no capacity."""
+
+    weekday: int
+    band_start: time
+    booked_places: int
+    capacity_places: int
+    utilisation: Decimal | None
+
+
+class UtilisationHeatmapResponse(BaseModel):
+    """Whole weeks of closed local days; ``date_to`` is exclusive."""
+
+    club_id: uuid.UUID
+    date_from: date
+    date_to: date
+    band_minutes: int
+    cells: list[UtilisationHeatmapCell]
+
+
+# ---------- Semantic metric series schemas -------------------------------
+
+
+class MetricSeriesGranularity(StrEnum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class MetricSeriesPointResponse(BaseModel):
+    period_start: date
+    period_end: date
+    result: dict[str, Any]
+
+
+class MetricSeriesResponse(BaseModel):
+    metric: str
+    version: str
+    points: list[MetricSeriesPointResponse]
+
+
+class MetricSeriesCollectionResponse(BaseModel):
+    """Per-period values for one or more semantic metrics.
+
+    ``date_to`` and each point's ``period_end`` are exclusive; the first and
+    last week or month are clipped to the requested range.
+    """
+
+    club_id: uuid.UUID
+    date_from: date
+    date_to: date
+    granularity: MetricSeriesGranularity
+    series: list[MetricSeriesResponse]
+
+
+class MetricCourseValueResponse(BaseModel):
+    course_id: uuid.UUID
+    result: dict[str, Any]
+
+
+class MetricCourseBreakdownResponse(BaseModel):
+    metric: str
+    version: str
+    courses: list[MetricCourseValueResponse]
+
+
+class MetricCourseBreakdownCollectionResponse(BaseModel):
+    """Values for one or more semantic metrics per course of the club, in
+    course-name order. ``date_to`` is exclusive."""
+
+    club_id: uuid.UUID
+    date_from: date
+    date_to: date
+    metrics: list[MetricCourseBreakdownResponse]
+
+
+# ---------- Semantic metric profile schemas ------------------------------
+
+
+class MetricProfileHistogramBucket(BaseModel):
+    """Samples with wall time up to ``le_ms``; ``None`` is the open-ended bucket."""
+
+    le_ms: int | None
+    count: int
+
+
+class MetricProfileSummary(BaseModel):
+    """Rolling window of ``compute`` samples for one metric and club in this
+    worker process. Cache hits execute no statements, so ``statements_max``
+    and ``rows_max`` come from misses; ``*_last`` is the latest sample.
+    Computations that raised are included and counted in ``error_count``."""
+
+    metric: str
+    club_id: uuid.UUID
+    sample_count: int
+    cache_hits: int
+    cache_misses: int
+    error_count: int
+    wall_ms_p50: float
+    wall_ms_p95: float
+    wall_ms_max: float
+    statements_max: int
+    statements_last: int
+    rows_max: int
+    rows_last: int
+    last_recorded_at: datetime
+    histogram: list[MetricProfileHistogramBucket]
+
+
+class MetricProfileListResponse(BaseModel):
+    window: int
+    profiles: list[MetricProfileSummary]
+
+
+# ---------- Daily KPI snapshot run schemas -------------------------------
+
+
+class KpiSnapshotClubResult(BaseModel):
+    club_id: uuid.UUID
+    club_slug: str
+    date_from: date
+    date_to: date
+    status: Literal["completed", "failed"]
+    row_count: int = 0
+    error_message: str | None = None
+
+
+class KpiSnapshotRunReport(BaseModel):
+    started_at: datetime
+    finished_at: datetime
+    club_count: int
+    completed_count: int
+    failed_count: int
+    clubs: list[KpiSnapshotClubResult]
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+
+class TenantExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class TenantExportEntitySummary(BaseModel):
+    entity: str
+    file_name: str
+    row_count: int
+
+
+class TenantExportProgress(BaseModel):
+    entity: str
+    entity_index: int
+    entity_count: int
+    rows_written: int
+    completed: bool
+
+
+class TenantExportReport(BaseModel):
+    club_id: uuid.UUID
+    format: TenantExportFormat
+    storage_key: str
+    byte_count: int
+    started_at: datetime
+    completed_at: datetime
+    entities: list[TenantExportEntitySummary]
@@ -8,6 +8,14 @@ denominator semantics with RevPUR / effective green fee, and the green-fee
 revenue formula is identical across RevPATT / RevPUR / effective green
 fee.
 
+The helpers are expressed as named *quantities* (``QUANTITIES``), each built
+from one or more labelled scalar-subquery fragments. ``evaluate_quantities``
+selects every fragment the requested quantities need in a single statement,
+so metrics evaluated together through ``compute_many`` share one round trip
+instead of issuing one query per helper per metric. ``evaluate_quantity_series``
+reads the same fragments grouped by club-local day for ``compute_series``, and
+``evaluate_quantities_by_course`` grouped by course for ``compute_by_course``.
+
 Tenant scope is enforced at every helper — every query carries the
 ``club_id`` predicate. The vat_category tags at the originator records
 (bookings.vat_category, order_items.vat_category,
@@ -17,11 +25,14 @@ pos_transaction_items.vat_category) drive the revenue split.
 from __future__ import annotations
 
 import uuid
-from datetime import time, timedelta
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, replace
+from datetime import UTC, date, datetime, time, timedelta
 from decimal import Decimal
+from zoneinfo import ZoneInfo
 
-from sqlalchemy import func, or_, select
-from sqlalchemy.orm import Session
+from sqlalchemy import ColumnElement, Date, Select, cast, column, func, or_, select, values
+from sqlalchemy.orm import InstrumentedAttribute, Session
 
 from app.models import (
     Booking,
@@ -40,18 +51,61 @@ from app.models import (
     TeeSheetSlotState,
     VatCategory,
 )
-from app.services._window import TimeWindow
+from app.services._window import TimeWindow, optional_date, resolve_window
 
 ZERO = Decimal("0.00")
 
+FragmentSelect = Select[tuple[object]]
+
+
+@dataclass(frozen=True, slots=True)
+class Fragment:
+    """One aggregate read: ``build`` returns a single-column SELECT labelled
+    ``value`` for a window. ``timestamp`` is the column a series groups on by
+    club-local date; club settings that do not vary by day leave it unset.
+    ``course`` is the column a per-course read groups on; club settings leave
+    it unset and apply to every course, other reads without it (F&B) cannot
+    be split by course."""
+
+    build: Callable[[uuid.UUID, TimeWindow], FragmentSelect]
+    timestamp: InstrumentedAttribute[object] | None = None
+    course: InstrumentedAttribute[uuid.UUID] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Quantity:
+    """An intermediate value shared by metrics: the SQL fragments it reads and
+    how the fragment values combine into the quantity for a window.
+
+    Every quantity is additive over days, so a series bucket (week, month)
+    is the sum of its daily values.
+    """
+
+    fragments: tuple[str, ...]
+    finish: Callable[[Mapping[str, object], TimeWindow], object]
 
-def green_fee_revenue(session: Session, *, club_id: uuid.UUID, window: TimeWindow) -> Decimal:
+
+def resolve_metric_window(
+    session: Session,
+    *,
+    club_id: uuid.UUID,
+    params: Mapping[str, object],
+) -> TimeWindow:
+    return resolve_window(
+        session,
+        club_id=club_id,
+        date_from=optional_date(params.get("date_from")),
+        date_to=optional_date(params.get("date_to")),
+    )
+
+
+def _green_fee_revenue_fragment(club_id: uuid.UUID, window: TimeWindow) -> FragmentSelect:
     """Sum of charge-type finance transactions where the originating booking
     is tagged ``vat_category='green_fee'`` and the transaction was posted
     in the window.
     """
-    total = session.scalar(
-        select(func.coalesce(func.sum(func.abs(FinanceTransaction.amount)), ZERO))
+    return (
+        select(func.coalesce(func.sum(func.abs(FinanceTransaction.amount)), ZERO).label("value"))
         .select_from(FinanceTransaction)
         .join(Booking, Booking.id == FinanceTransaction.reference_id)
         .where(
@@ -63,80 +117,100 @@ def green_fee_revenue(session: Session, *, club_id: uuid.UUID, window: TimeWindo
             FinanceTransaction.created_at < window.end_utc,
         )
     )
-    return total if total is not None else ZERO
 
 
-def utilised_rounds(session: Session, *, club_id: uuid.UUID, window: TimeWindow) -> int:
+def _utilised_rounds_fragment(club_id: uuid.UUID, window: TimeWindow) -> FragmentSelect:
     """Sum of ``party_size`` across bookings whose status is CHECKED_IN or
     COMPLETED with a ``slot_datetime`` in the window. Matches the brief:
     no-shows and cancellations do NOT count.
     """
-    total = session.scalar(
-        select(func.coalesce(func.sum(Booking.party_size), 0)).where(
-            Booking.club_id == club_id,
-            Booking.status.in_([BookingStatus.CHECKED_IN, BookingStatus.COMPLETED]),
-            Booking.slot_datetime >= window.start_utc,
-            Booking.slot_datetime < window.end_utc,
-        )
+    return select(func.coalesce(func.sum(Booking.party_size), 0).label("value")).where(
+        Booking.club_id == club_id,
+        Booking.status.in_([BookingStatus.CHECKED_IN, BookingStatus.COMPLETED]),
+        Booking.slot_datetime >= window.start_utc,
+        Booking.slot_datetime < window.end_utc,
     )
-    return int(total or 0)
 
 
-def fnb_revenue(session: Session, *, club_id: uuid.UUID, window: TimeWindow) -> Decimal:
-    """Sum of F&B-tagged line revenue from both originator surfaces:
-      * player-app halfway-house orders (order_items.vat_category='fnb',
-        order status COLLECTED)
-      * POS transactions (pos_transaction_items.vat_category='fnb', any
-        tender type)
-    Line revenue is summed directly; finance-transaction headers are not,
-    to avoid double-counting.
-    """
-    order_branch = (
-        session.scalar(
-            select(
-                func.coalesce(
-                    func.sum(OrderItem.unit_price_snapshot * OrderItem.quantity),
-                    ZERO,
-                )
-            )
-            .select_from(OrderItem)
-            .join(Order, Order.id == OrderItem.order_id)
-            .where(
-                Order.club_id == club_id,
-                Order.status == OrderStatus.COLLECTED,
-                OrderItem.vat_category == VatCategory.FNB.value,
-                Order.created_at >= window.start_utc,
-                Order.created_at < window.end_utc,
+def _fnb_order_revenue_fragment(club_id: uuid.UUID, window: TimeWindow) -> FragmentSelect:
+    """Player-app halfway-house F&B lines (order status COLLECTED)."""
+    return (
+        select(
+            func.coalesce(func.sum(OrderItem.unit_price_snapshot * OrderItem.quantity), ZERO).label(
+                "value"
             )
         )
-        or ZERO
+        .select_from(OrderItem)
+        .join(Order, Order.id == OrderItem.order_id)
+        .where(
+            Order.club_id == club_id,
+            Order.status == OrderStatus.COLLECTED,
+            OrderItem.vat_category == VatCategory.FNB.value,
+            Order.created_at >= window.start_utc,
+            Order.created_at < window.end_utc,
+        )
     )
 
-    pos_branch = (
-        session.scalar(
-            select(
-                func.coalesce(
-                    func.sum(PosTransactionItem.unit_price_snapshot * PosTransactionItem.quantity),
-                    ZERO,
-                )
-            )
-            .select_from(PosTransactionItem)
-            .join(PosTransaction, PosTransaction.id == PosTransactionItem.pos_transaction_id)
-            .where(
-                PosTransaction.club_id == club_id,
-                PosTransactionItem.vat_category == VatCategory.FNB.value,
-                PosTransaction.created_at >= window.start_utc,
-                PosTransaction.created_at < window.end_utc,
-            )
+
+def _fnb_pos_revenue_fragment(club_id: uuid.UUID, window: TimeWindow) -> FragmentSelect:
+    """POS F&B lines, any tender type."""
+    return (
+        select(
+            func.coalesce(
+                func.sum(PosTransactionItem.unit_price_snapshot * PosTransactionItem.quantity),
+                ZERO,
+            ).label("value")
+        )
+        .select_from(PosTransactionItem)
+        .join(PosTransaction, PosTransaction.id == PosTransactionItem.pos_transaction_id)
+        .where(
+            PosTransaction.club_id == club_id,
+            PosTransactionItem.vat_category == VatCategory.FNB.value,
+            PosTransaction.created_at >= window.start_utc,
+            PosTransaction.created_at < window.end_utc,
         )
-        or ZERO
     )
 
-    return order_branch + pos_branch
 
+def _slot_interval_fragment(club_id: uuid.UUID, window: TimeWindow) -> FragmentSelect:
+    return select(ClubConfig.default_slot_interval_minutes.label("value")).where(
+        ClubConfig.club_id == club_id
+    )
+
+
+def _operating_hours_fragment(club_id: uuid.UUID, window: TimeWindow) -> FragmentSelect:
+    return select(ClubConfig.operating_hours.label("value")).where(ClubConfig.club_id == club_id)
+
+
+def _active_tee_count_fragment(club_id: uuid.UUID, window: TimeWindow) -> FragmentSelect:
+    return (
+        select(func.count().label("value"))
+        .select_from(Tee)
+        .join(Course, Course.id == Tee.course_id)
+        .where(Course.club_id == club_id, Tee.active.is_(True))
+    )
+
+
+def _blocked_slot_count_fragment(club_id: uuid.UUID, window: TimeWindow) -> FragmentSelect:
+    return (
+        select(func.count().label("value"))
+        .select_from(TeeSheetSlotState)
+        .where(
+            TeeSheetSlotState.club_id == club_id,
+            TeeSheetSlotState.slot_datetime >= window.start_utc,
+            TeeSheetSlotState.slot_datetime < window.end_utc,
+            or_(
+                TeeSheetSlotState.manually_blocked.is_(True),
+                TeeSheetSlotState.competition_controlled.is_(True),
+                TeeSheetSlotState.event_controlled.is_(True),
+                TeeSheetSlotState.externally_unavailable.is_(True),
+            ),
+        )
+    )
 
-def generated_slot_count(session: Session, *, club_id: uuid.UUID, window: TimeWindow) -> int:
-    """Compute the available tee-time slot denominator for RevPATT.
+
+def _finish_generated_slots(values: Mapping[str, object], window: TimeWindow) -> int:
+    """Available tee-time slot denominator for RevPATT.
 
     Gross slots per day = ``(operating_minutes // default_slot_interval_minutes)
     × active_tees × 2 lanes`` (HOLE_1 + HOLE_10), with a one-row phantom
@@ -144,26 +218,16 @@ def generated_slot_count(session: Session, *, club_id: uuid.UUID, window: TimeWi
     TeeSheetService._load_row_scopes. Blocked slots
     (``manually_blocked``, ``competition_controlled``, ``event_controlled``,
     ``externally_unavailable`` flags on TeeSheetSlotState) are subtracted.
+    A club without a ClubConfig row has no slots. Per course, the tee count
+    and blocked slots are the course's own, so a course without active tees
+    gets its own phantom row.
     """
-    config = session.scalar(select(ClubConfig).where(ClubConfig.club_id == club_id))
-    if config is None:
-        return 0
-    interval = config.default_slot_interval_minutes
-    if interval <= 0:
+    interval = values["slot_interval_minutes"]
+    if not isinstance(interval, int) or interval <= 0:
         return 0
+    row_count = calendar_row_count(values["active_tee_count"])
 
-    tees_count = (
-        session.scalar(
-            select(func.count())
-            .select_from(Tee)
-            .join(Course, Course.id == Tee.course_id)
-            .where(Course.club_id == club_id, Tee.active.is_(True))
-        )
-        or 0
-    )
-    row_count = max(int(tees_count), 1) * 2  # HOLE_1 + HOLE_10 lanes
-
-    operating = config.operating_hours or {}
+    operating = values["operating_hours"] or {}
     gross = 0
     current = window.date_from
     while current < window.date_to:
@@ -171,26 +235,206 @@ def generated_slot_count(session: Session, *, club_id: uuid.UUID, window: TimeWi
         gross += _slots_per_row_for_day(day_hours, interval_minutes=interval) * row_count
         current += timedelta(days=1)
 
-    blocked = (
-        session.scalar(
-            select(func.count())
-            .select_from(TeeSheetSlotState)
-            .where(
-                TeeSheetSlotState.club_id == club_id,
-                TeeSheetSlotState.slot_datetime >= window.start_utc,
-                TeeSheetSlotState.slot_datetime < window.end_utc,
-                or_(
-                    TeeSheetSlotState.manually_blocked.is_(True),
-                    TeeSheetSlotState.competition_controlled.is_(True),
-                    TeeSheetSlotState.event_controlled.is_(True),
-                    TeeSheetSlotState.externally_unavailable.is_(True),
-                ),
+    return max(gross - int(values["blocked_slot_count"] or 0), 0)
+
+
+FRAGMENTS: dict[str, Fragment] = {
+    "green_fee_revenue": Fragment(
+        _green_fee_revenue_fragment, FinanceTransaction.created_at, Booking.course_id
+    ),
+    "utilised_rounds": Fragment(
+        _utilised_rounds_fragment, Booking.slot_datetime, Booking.course_id
+    ),
+    "fnb_order_revenue": Fragment(_fnb_order_revenue_fragment, Order.created_at),
+    "fnb_pos_revenue": Fragment(_fnb_pos_revenue_fragment, PosTransaction.created_at),
+    "slot_interval_minutes": Fragment(_slot_interval_fragment),
+    "operating_hours": Fragment(_operating_hours_fragment),
+    "active_tee_count": Fragment(_active_tee_count_fragment, course=Tee.course_id),
+    "blocked_slot_count": Fragment(
+        _blocked_slot_count_fragment,
+        TeeSheetSlotState.slot_datetime,
+        TeeSheetSlotState.course_id,
+    ),
+}
+
+QUANTITIES: dict[str, Quantity] = {
+    "green_fee_revenue": Quantity(
+        fragments=("green_fee_revenue",),
+        finish=lambda values, window: values["green_fee_revenue"] or ZERO,
+    ),
+    "utilised_rounds": Quantity(
+        fragments=("utilised_rounds",),
+        finish=lambda values, window: int(values["utilised_rounds"] or 0),
+    ),
+    # Line revenue is summed directly; finance-transaction headers are not,
+    # to avoid double-counting member-account-charged orders.
+    "fnb_revenue": Quantity(
+        fragments=("fnb_order_revenue", "fnb_pos_revenue"),
+        finish=lambda values, window: (
+            (values["fnb_order_revenue"] or ZERO) + (values["fnb_pos_revenue"] or ZERO)
+        ),
+    ),
+    "generated_slots": Quantity(
+        fragments=(
+            "slot_interval_minutes",
+            "operating_hours",
+            "active_tee_count",
+            "blocked_slot_count",
+        ),
+        finish=_finish_generated_slots,
+    ),
+}
+
+
+def evaluate_quantities(
+    session: Session,
+    *,
+    club_id: uuid.UUID,
+    window: TimeWindow,
+    names: Iterable[str],
+) -> dict[str, object]:
+    """Evaluate the named quantities for one window with a single SELECT of
+    every fragment they need; a fragment shared by several quantities is
+    selected once."""
+    requested, fragment_names = _plan(names)
+    if not fragment_names:
+        return {}
+    row = session.execute(
+        select(
+            *(
+                FRAGMENTS[name].build(club_id, window).scalar_subquery().label(name)
+                for name in fragment_names
             )
         )
-        or 0
+    ).one()
+    values = row._mapping
+    return {name: QUANTITIES[name].finish(values, window) for name in requested}
+
+
+def evaluate_quantity_series(
+    session: Session,
+    *,
+    club_id: uuid.UUID,
+    window: TimeWindow,
+    names: Iterable[str],
+) -> list[tuple[date, dict[str, object]]]:
+    """Evaluate the named quantities for every local day of ``window``.
+
+    The window's days are sent as a VALUES calendar; each dated fragment is
+    grouped on the club-local date of its timestamp and outer-joined to the
+    calendar, and the club settings ride along as scalar subqueries. The whole
+    range is therefore one statement however many days it spans.
+    """
+    requested, fragment_names = _plan(names)
+    days = [
+        window.date_from + timedelta(days=offset)
+        for offset in range((window.date_to - window.date_from).days)
+    ]
+    if not fragment_names:
+        return [(day, {}) for day in days]
+    calendar = values(column("day", Date()), name="calendar").data([(day,) for day in days])
+    columns: list[ColumnElement[object]] = [calendar.c.day]
+    statement = select().select_from(calendar)
+    for name in fragment_names:
+        fragment = FRAGMENTS[name]
+        if fragment.timestamp is None:
+            columns.append(fragment.build(club_id, window).scalar_subquery().label(name))
+            continue
+        local_day = cast(func.timezone(window.timezone_name, fragment.timestamp), Date)
+        grouped = (
+            fragment.build(club_id, window)
+            .add_columns(local_day.label("day"))
+            .group_by(local_day)
+            .subquery(name)
+        )
+        statement = statement.outerjoin(grouped, grouped.c.day == calendar.c.day)
+        columns.append(grouped.c.value.label(name))
+    rows = session.execute(statement.add_columns(*columns).order_by(calendar.c.day))
+    series: list[tuple[date, dict[str, object]]] = []
+    for row in rows:
+        day_window = slice_window(window, date_from=row.day, date_to=row.day + timedelta(days=1))
+        quantities = {name: QUANTITIES[name].finish(row._mapping, day_window) for name in requested}
+        series.append((row.day, quantities))
+    return series
+
+
+def evaluate_quantities_by_course(
+    session: Session,
+    *,
+    club_id: uuid.UUID,
+    window: TimeWindow,
+    names: Iterable[str],
+) -> dict[uuid.UUID, dict[str, object]]:
+    """Evaluate the named quantities for one window per course of the club,
+    keyed by course id in course-name order.
+
+    Mirrors ``evaluate_quantity_series`` with courses in place of days: each
+    fragment with a ``course`` column is grouped on it and outer-joined to the
+    club's courses, and the club settings ride along as scalar subqueries, so
+    all courses cost the same single statement as the club-wide read. Raises
+    ``ValueError`` for quantities that cannot be split by course.
+    """
+    requested, fragment_names = _plan(names)
+    unattributable = [
+        name
+        for name in fragment_names
+        if FRAGMENTS[name].course is None and FRAGMENTS[name].timestamp is not None
+    ]
+    if unattributable:
+        raise ValueError(f"Quantities cannot be split by course: {unattributable!r}")
+    courses = (
+        select(Course.id.label("course_id"), Course.name.label("course_name"))
+        .where(Course.club_id == club_id)
+        .subquery("club_courses")
     )
+    columns: list[ColumnElement[object]] = [courses.c.course_id]
+    statement = select().select_from(courses)
+    for name in fragment_names:
+        fragment = FRAGMENTS[name]
+        if fragment.course is None:
+            columns.append(fragment.build(club_id, window).scalar_subquery().label(name))
+            continue
+        grouped = (
+            fragment.build(club_id, window)
+            .add_columns(fragment.course.label("course_id"))
+            .group_by(fragment.course)
+            .subquery(name)
+        )
+        statement = statement.outerjoin(grouped, grouped.c.course_id == courses.c.course_id)
+        columns.append(grouped.c.value.label(name))
+    rows = session.execute(
+        statement.add_columns(*columns).order_by(courses.c.course_name, courses.c.course_id)
+    )
+    return {
+        row.course_id: {name: QUANTITIES[name].finish(row._mapping, window) for name in requested}
+        for row in rows
+    }
+
 
-    return max(gross - int(blocked), 0)
+def _plan(names: Iterable[str]) -> tuple[list[str], list[str]]:
+    requested = list(dict.fromkeys(names))
+    fragment_names = list(
+        dict.fromkeys(fragment for name in requested for fragment in QUANTITIES[name].fragments)
+    )
+    return requested, fragment_names
+
+
+def slice_window(window: TimeWindow, *, date_from: date, date_to: date) -> TimeWindow:
+    """The part of ``window`` covering local days ``[date_from, date_to)``."""
+    zone = ZoneInfo(window.timezone_name)
+    return replace(
+        window,
+        date_from=date_from,
+        date_to=date_to,
+        start_utc=datetime.combine(date_from, datetime.min.time(), tzinfo=zone).astimezone(UTC),
+        end_utc=datetime.combine(date_to, datetime.min.time(), tzinfo=zone).astimezone(UTC),
+    )
+
+
+def add_quantities(totals: dict[str, object], quantities: Mapping[str, object]) -> None:
+    """Accumulate additive quantities (one day's, or a sub-window's) into ``totals``."""
+    for name, value in quantities.items():
+        totals[name] = totals[name] + value if name in totals else value
 
 
 def safe_ratio(numerator: Decimal, denominator: int | Decimal) -> Decimal:
@@ -207,15 +451,29 @@ def safe_ratio(numerator: Decimal, denominator: int | Decimal) -> Decimal:
     return (numerator / Decimal(denominator)).quantize(Decimal("0.01"))
 
 
-def _slots_per_row_for_day(day_hours: object, *, interval_minutes: int) -> int:
+def calendar_row_count(active_tee_count: object) -> int:
+    """Tee-sheet rows per slot time: active tees × 2 lanes (HOLE_1 + HOLE_10),
+    with the phantom row of a club that has no active tees."""
+    return max(int(active_tee_count or 0), 1) * 2
+
+
+def opening_minutes(day_hours: object) -> tuple[int, int] | None:
+    """Open and close of one ``operating_hours`` day in minutes after local
+    midnight, or ``None`` when the day is closed or its hours are unusable."""
     if not isinstance(day_hours, dict) or day_hours.get("closed"):
-        return 0
+        return None
     open_t = _parse_hhmm(day_hours.get("open"))
     close_t = _parse_hhmm(day_hours.get("close"))
     if open_t is None or close_t is None or close_t <= open_t:
+        return None
+    return open_t.hour * 60 + open_t.minute, close_t.hour * 60 + close_t.minute
+
+
+def _slots_per_row_for_day(day_hours: object, *, interval_minutes: int) -> int:
+    opening = opening_minutes(day_hours)
+    if opening is None:
         return 0
-    open_minutes = open_t.hour * 60 + open_t.minute
-    close_minutes = close_t.hour * 60 + close_t.minute
+    open_minutes, close_minutes = opening
     return (close_minutes - open_minutes) // interval_minutes
 
 
@@ -1,15 +1,35 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Mapping
+from datetime import date
 
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy.orm import Session
 
+from app.semantic._queries import resolve_metric_window
+from app.semantic.snapshots import read_window_quantities
+
+
+class MetricSeriesPoint(BaseModel):
+    """One bucket of a metric series; ``period_end`` is exclusive."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    period_start: date
+    period_end: date
+    result: BaseModel
+
 
 class Metric(BaseModel):
     """Contract every semantic-layer metric satisfies.
 
-    Subclass and override :meth:`compute`. Each subclass is instantiated once at
+    Subclass and either declare ``quantities`` (names from
+    ``app.semantic._queries.QUANTITIES``) and override :meth:`assemble`, or
+    override :meth:`compute` outright. Declared quantities let
+    :func:`app.semantic.registry.compute_many` evaluate shared SQL once for a
+    batch of metrics, and are what ``club_kpi_daily`` snapshots store per day
+    (``app.semantic.snapshots``). Each subclass is instantiated once at
     module-import time and registered via :func:`app.semantic.registry.register`.
     Extends the per-method Pydantic response model pattern from
     ``app/services/finance/read_model_service.py``.
@@ -23,6 +43,13 @@ class Metric(BaseModel):
     version: str
     owner: str
     dependencies: list[str]
+    # Seconds a computed result may be served from the metric cache; ``None``
+    # uses the configured default and ``0`` never caches.
+    cache_ttl_seconds: int | None = None
+    # Domain event type prefixes whose commit invalidates the club's results.
+    invalidated_by: list[str] = []
+    # Shared intermediate quantities ``assemble`` reads, evaluated per window.
+    quantities: list[str] = []
 
     def compute(
         self,
@@ -30,4 +57,12 @@ class Metric(BaseModel):
         club_id: uuid.UUID,
         **params: object,
     ) -> BaseModel:
+        if not self.quantities:
+            raise NotImplementedError
+        window = resolve_metric_window(session, club_id=club_id, params=params)
+        return self.assemble(
+            read_window_quantities(session, club_id=club_id, window=window, metrics=[self])
+        )
+
+    def assemble(self, quantities: Mapping[str, object]) -> BaseModel:
         raise NotImplementedError
@@ -0,0 +1,271 @@
+"""Result cache for semantic-layer metrics.
+
+Results are cached under ``(metric name, version, club, normalised params)``
+for the metric's TTL. Each ``(club, metric)`` pair also carries a generation
+number that is part of the key: a committed transaction that published a
+domain event a metric declares in ``invalidated_by`` bumps that generation, so
+stale entries are never read again and simply age out of the backend. Slot
+states, and memberships on some paths (invitation acceptance), are written
+without a domain event, so their writes are recorded as the
+``tee_sheet.slot_state.written`` and ``club_membership.written`` pseudo-events
+at flush time.
+
+The backend is Redis by default, so entries and generations are shared and an
+invalidation committed by one worker is seen by all of them. ``memory`` keeps
+both in a per-process LRU and only suits a single worker: other workers would
+serve stale results for the full TTL. A Redis outage degrades to computing
+every call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from itertools import chain
+from typing import Protocol
+
+import redis
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.core.datetime import utc_now
+from app.events.publisher import PUBLISHED_EVENTS_KEY
+from app.models import ClubMembership, TeeSheetSlotState
+from app.semantic.base import Metric
+
+SLOT_STATE_WRITTEN_EVENT = "tee_sheet.slot_state.written"
+MEMBERSHIP_WRITTEN_EVENT = "club_membership.written"
+_KEY_PREFIX = "semantic"
+
+_log = logging.getLogger(__name__)
+
+
+class MetricCacheBackend(Protocol):
+    def get(self, key: str) -> str | None: ...
+
+    def set(self, key: str, value: str, *, ttl_seconds: int) -> None: ...
+
+    def generation(self, scope: str) -> int: ...
+
+    def bump_generation(self, scope: str) -> None: ...
+
+
+class InMemoryMetricCacheBackend:
+    """Bounded LRU held in the worker process."""
+
+    def __init__(self, *, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, *, ttl_seconds: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def generation(self, scope: str) -> int:
+        with self._lock:
+            return self._generations.get(scope, 0)
+
+    def bump_generation(self, scope: str) -> None:
+        with self._lock:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+
+
+class RedisMetricCacheBackend:
+    """Entries and generations shared across workers through Redis."""
+
+    def __init__(self, client: redis.Redis) -> None:
+        self.client = client
+
+    def get(self, key: str) -> str | None:
+        try:
+            return self.client.get(key)
+        except redis.RedisError:
+            _log.warning("Semantic metric cache read failed", exc_info=True)
+            return None
+
+    def set(self, key: str, value: str, *, ttl_seconds: int) -> None:
+        try:
+            self.client.set(key, value, ex=ttl_seconds)
+        except redis.RedisError:
+            _log.warning("Semantic metric cache write failed", exc_info=True)
+
+    def generation(self, scope: str) -> int:
+        try:
+            return int(self.client.get(f"{_KEY_PREFIX}:generation:{scope}") or 0)
+        except redis.RedisError:
+            _log.warning("Semantic metric cache generation read failed", exc_info=True)
+            return 0
+
+    def bump_generation(self, scope: str) -> None:
+        try:
+            self.client.incr(f"{_KEY_PREFIX}:generation:{scope}")
+        except redis.RedisError:
+            _log.warning("Semantic metric cache invalidation failed", exc_info=True)
+
+
+class MetricResultCache:
+    def __init__(self, backend: MetricCacheBackend, *, default_ttl_seconds: int) -> None:
+        self.backend = backend
+        self.default_ttl_seconds = default_ttl_seconds
+
+    def get_or_compute(
+        self,
+        metric: Metric,
+        *,
+        club_id: uuid.UUID,
+        params: dict[str, object],
+        compute: Callable[[], BaseModel],
+    ) -> BaseModel:
+        key = self.key_for(metric, club_id=club_id, params=params)
+        cached = self.lookup(metric, key)
+        if cached is not None:
+            return cached
+        result = compute()
+        self.store(metric, key, result)
+        return result
+
+    def key_for(
+        self,
+        metric: Metric,
+        *,
+        club_id: uuid.UUID,
+        params: dict[str, object],
+    ) -> str | None:
+        """Cache key for this computation, or ``None`` when the metric is not cached."""
+        if self._ttl_seconds(metric) <= 0:
+            return None
+        generation = self.backend.generation(self._scope(club_id, metric.name))
+        return (
+            f"{_KEY_PREFIX}:{metric.name}:{metric.version}:{club_id}:"
+            f"{generation}:{self._params_digest(params)}"
+        )
+
+    def lookup(self, metric: Metric, key: str | None) -> BaseModel | None:
+        if key is None:
+            return None
+        cached = self.backend.get(key)
+        if cached is None:
+            return None
+        return metric.result_schema.model_validate_json(cached)
+
+    def store(self, metric: Metric, key: str | None, result: BaseModel) -> None:
+        if key is not None:
+            self.backend.set(key, result.model_dump_json(), ttl_seconds=self._ttl_seconds(metric))
+
+    def invalidate(
+        self,
+        *,
+        club_id: uuid.UUID,
+        event_types: Iterable[str],
+        metrics: Iterable[Metric],
+    ) -> None:
+        event_types = set(event_types)
+        for metric in metrics:
+            if any(
+                event_type.startswith(prefix)
+                for prefix in metric.invalidated_by
+                for event_type in event_types
+            ):
+                self.backend.bump_generation(self._scope(club_id, metric.name))
+
+    def _ttl_seconds(self, metric: Metric) -> int:
+        if metric.cache_ttl_seconds is not None:
+            return metric.cache_ttl_seconds
+        return self.default_ttl_seconds
+
+    def _scope(self, club_id: uuid.UUID, metric_name: str) -> str:
+        return f"{club_id}:{metric_name}"
+
+    def _params_digest(self, params: dict[str, object]) -> str:
+        normalised = {name: value for name, value in params.items() if value is not None}
+        if "date_from" not in normalised and "reference_date" not in normalised:
+            # The window defaults to the club's "today"; pin the entry to the hour.
+            normalised["_as_of_hour"] = utc_now().strftime("%Y-%m-%dT%H")
+        encoded = json.dumps(normalised, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:32]
+
+
+class _DisabledMetricCacheBackend:
+    def get(self, key: str) -> str | None:
+        return None
+
+    def set(self, key: str, value: str, *, ttl_seconds: int) -> None:
+        return None
+
+    def generation(self, scope: str) -> int:
+        return 0
+
+    def bump_generation(self, scope: str) -> None:
+        return None
+
+
+@lru_cache
+def get_metric_cache() -> MetricResultCache:
+    settings = get_settings()
+    backend: MetricCacheBackend
+    if settings.semantic_cache_backend == "redis":
+        backend = RedisMetricCacheBackend(redis.from_url(settings.redis_url, decode_responses=True))
+    elif settings.semantic_cache_backend == "memory":
+        backend = InMemoryMetricCacheBackend(max_entries=settings.semantic_cache_max_entries)
+    else:
+        backend = _DisabledMetricCacheBackend()
+    return MetricResultCache(
+        backend,
+        default_ttl_seconds=settings.semantic_cache_default_ttl_seconds,
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _record_unpublished_writes(session: Session, flush_context: object) -> None:
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, TeeSheetSlotState):
+            session.info.setdefault(PUBLISHED_EVENTS_KEY, set()).add(
+                (instance.club_id, SLOT_STATE_WRITTEN_EVENT)
+            )
+        elif isinstance(instance, ClubMembership):
+            session.info.setdefault(PUBLISHED_EVENTS_KEY, set()).add(
+                (instance.club_id, MEMBERSHIP_WRITTEN_EVENT)
+            )
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_events(session: Session) -> None:
+    published: set[tuple[uuid.UUID | None, str]] = session.info.pop(PUBLISHED_EVENTS_KEY, set())
+    if not published:
+        return
+    from app.semantic.registry import list_metrics
+
+    by_club: dict[uuid.UUID, set[str]] = {}
+    for club_id, event_type in published:
+        if club_id is not None:
+            by_club.setdefault(club_id, set()).add(event_type)
+    cache = get_metric_cache()
+    metrics = list_metrics()
+    for club_id, event_types in by_club.items():
+        cache.invalidate(club_id=club_id, event_types=event_types, metrics=metrics)
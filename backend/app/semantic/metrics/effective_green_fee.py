@@ -1,15 +1,13 @@
 from __future__ import annotations
 
-import uuid
+from collections.abc import Mapping
 from decimal import Decimal
 
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
 
-from app.semantic._queries import green_fee_revenue, safe_ratio, utilised_rounds
+from app.semantic._queries import safe_ratio
 from app.semantic.base import Metric
 from app.semantic.registry import register
-from app.services._window import optional_date, resolve_window
 
 ZERO = Decimal("0.00")
 
@@ -19,12 +17,7 @@ class EffectiveGreenFeeResult(BaseModel):
 
 
 class _EffectiveGreenFeeMetric(Metric):
-    def compute(
-        self,
-        session: Session,
-        club_id: uuid.UUID,
-        **params: object,
-    ) -> EffectiveGreenFeeResult:
+    def assemble(self, quantities: Mapping[str, object]) -> EffectiveGreenFeeResult:
         """Effective average green fee.
 
         SQL summary::
@@ -38,14 +31,8 @@ class _EffectiveGreenFeeMetric(Metric):
         PRODUCT.md §3.2: "GreenLink reports effective rates always". The
         dashboard surfaces choose which framing to show where.
         """
-        window = resolve_window(
-            session,
-            club_id=club_id,
-            date_from=optional_date(params.get("date_from")),
-            date_to=optional_date(params.get("date_to")),
-        )
-        revenue = green_fee_revenue(session, club_id=club_id, window=window)
-        rounds = utilised_rounds(session, club_id=club_id, window=window)
+        revenue = quantities["green_fee_revenue"]
+        rounds = quantities["utilised_rounds"]
         return EffectiveGreenFeeResult(value=safe_ratio(revenue, rounds))
 
 
@@ -60,6 +47,8 @@ effective_green_fee = _EffectiveGreenFeeMetric(
     version="0.1.0",
     owner="greenlink-core",
     dependencies=[],
+    quantities=["green_fee_revenue", "utilised_rounds"],
+    invalidated_by=["booking.", "finance."],
 )
 
 register(effective_green_fee)
@@ -1,15 +1,13 @@
 from __future__ import annotations
 
-import uuid
+from collections.abc import Mapping
 from decimal import Decimal
 
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
 
-from app.semantic._queries import fnb_revenue, safe_ratio, utilised_rounds
+from app.semantic._queries import safe_ratio
 from app.semantic.base import Metric
 from app.semantic.registry import register
-from app.services._window import optional_date, resolve_window
 
 ZERO = Decimal("0.00")
 
@@ -19,12 +17,7 @@ class FnbPerRoundResult(BaseModel):
 
 
 class _FnbPerRoundMetric(Metric):
-    def compute(
-        self,
-        session: Session,
-        club_id: uuid.UUID,
-        **params: object,
-    ) -> FnbPerRoundResult:
+    def assemble(self, quantities: Mapping[str, object]) -> FnbPerRoundResult:
         """F&B revenue per utilised round.
 
         SQL summary::
@@ -48,14 +41,8 @@ class _FnbPerRoundMetric(Metric):
         Line revenue is the source of truth; FinanceTransaction headers
         are not summed (would double-count member-account-charged orders).
         """
-        window = resolve_window(
-            session,
-            club_id=club_id,
-            date_from=optional_date(params.get("date_from")),
-            date_to=optional_date(params.get("date_to")),
-        )
-        revenue = fnb_revenue(session, club_id=club_id, window=window)
-        rounds = utilised_rounds(session, club_id=club_id, window=window)
+        revenue = quantities["fnb_revenue"]
+        rounds = quantities["utilised_rounds"]
         return FnbPerRoundResult(value=safe_ratio(revenue, rounds))
 
 
@@ -69,6 +56,8 @@ fnb_per_round = _FnbPerRoundMetric(
     version="0.1.0",
     owner="greenlink-core",
     dependencies=[],
+    quantities=["fnb_revenue", "utilised_rounds"],
+    invalidated_by=["booking.", "finance.", "order.", "pos."],
 )
 
 register(fnb_per_round)
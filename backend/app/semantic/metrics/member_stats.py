@@ -64,6 +64,7 @@ member_stats = _MemberStatsMetric(
     version="0.1.0",
     owner="greenlink-core",
     dependencies=[],
+    invalidated_by=["account_customer.", "booking.", "club_membership.", "finance.", "person."],
 )
 
 register(member_stats)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import uuid
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from app.schemas.reports import MemberStatsSummaryResponse
+from app.semantic.base import Metric
+from app.semantic.registry import register
+
+
+class _MemberSummaryMetric(Metric):
+    def compute(
+        self,
+        session: Session,
+        club_id: uuid.UUID,
+        **params: object,
+    ) -> MemberStatsSummaryResponse:
+        """Club-wide membership distributions as of ``reference_date``.
+
+        Delegates to ``PeopleReadModelService.summary``, a single aggregate
+        query. Callers pass the club-local date explicitly so results are
+        cached per club and day until a membership write commits.
+        """
+        from app.services.people_read_model_service import PeopleReadModelService
+
+        reference_date = params.get("reference_date")
+        return PeopleReadModelService(session).summary(
+            club_id=club_id,
+            reference_date=reference_date if isinstance(reference_date, date) else None,
+        )
+
+
+member_summary = _MemberSummaryMetric(
+    name="member_summary",
+    description=(
+        "Membership summary — members by role, status and tenure bucket, average "
+        "tenure and this month's growth."
+    ),
+    result_schema=MemberStatsSummaryResponse,
+    version="0.1.0",
+    owner="greenlink-core",
+    dependencies=[],
+    cache_ttl_seconds=86_400,
+    # Also matches the ``club_membership.written`` pseudo-event for writes that
+    # publish no domain event.
+    invalidated_by=["club_membership."],
+)
+
+register(member_summary)
@@ -1,19 +1,14 @@
 from __future__ import annotations
 
-import uuid
+from collections.abc import Mapping
 from decimal import Decimal
 
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
 
-from app.semantic._queries import (
-    generated_slot_count,
-    green_fee_revenue,
-    safe_ratio,
-)
+from app.semantic._queries import safe_ratio
 from app.semantic.base import Metric
+from app.semantic.cache import SLOT_STATE_WRITTEN_EVENT
 from app.semantic.registry import register
-from app.services._window import optional_date, resolve_window
 
 ZERO = Decimal("0.00")
 
@@ -23,12 +18,7 @@ class RevPATTResult(BaseModel):
 
 
 class _RevPATTMetric(Metric):
-    def compute(
-        self,
-        session: Session,
-        club_id: uuid.UUID,
-        **params: object,
-    ) -> RevPATTResult:
+    def assemble(self, quantities: Mapping[str, object]) -> RevPATTResult:
         """Revenue per Available Tee Time.
 
         SQL summary::
@@ -48,14 +38,8 @@ class _RevPATTMetric(Metric):
         × active tees × 2 lanes (HOLE_1, HOLE_10); blocked slots in
         TeeSheetSlotState are subtracted.
         """
-        window = resolve_window(
-            session,
-            club_id=club_id,
-            date_from=optional_date(params.get("date_from")),
-            date_to=optional_date(params.get("date_to")),
-        )
-        revenue = green_fee_revenue(session, club_id=club_id, window=window)
-        slots = generated_slot_count(session, club_id=club_id, window=window)
+        revenue = quantities["green_fee_revenue"]
+        slots = quantities["generated_slots"]
         return RevPATTResult(value=safe_ratio(revenue, slots))
 
 
@@ -69,6 +53,8 @@ revpatt = _RevPATTMetric(
     version="0.1.0",
     owner="greenlink-core",
     dependencies=[],
+    quantities=["green_fee_revenue", "generated_slots"],
+    invalidated_by=["booking.", "finance.", SLOT_STATE_WRITTEN_EVENT],
 )
 
 register(revpatt)
@@ -1,15 +1,13 @@
 from __future__ import annotations
 
-import uuid
+from collections.abc import Mapping
 from decimal import Decimal
 
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
 
-from app.semantic._queries import green_fee_revenue, safe_ratio, utilised_rounds
+from app.semantic._queries import safe_ratio
 from app.semantic.base import Metric
 from app.semantic.registry import register
-from app.services._window import optional_date, resolve_window
 
 ZERO = Decimal("0.00")
 
@@ -19,12 +17,7 @@ class RevPURResult(BaseModel):
 
 
 class _RevPURMetric(Metric):
-    def compute(
-        self,
-        session: Session,
-        club_id: uuid.UUID,
-        **params: object,
-    ) -> RevPURResult:
+    def assemble(self, quantities: Mapping[str, object]) -> RevPURResult:
         """Revenue per Utilised Round.
 
         SQL summary::
@@ -41,14 +34,8 @@ class _RevPURMetric(Metric):
         no-shows and cancellations drop out of both numerator (no revenue
         captured) and denominator (not counted as utilised).
         """
-        window = resolve_window(
-            session,
-            club_id=club_id,
-            date_from=optional_date(params.get("date_from")),
-            date_to=optional_date(params.get("date_to")),
-        )
-        revenue = green_fee_revenue(session, club_id=club_id, window=window)
-        rounds = utilised_rounds(session, club_id=club_id, window=window)
+        revenue = quantities["green_fee_revenue"]
+        rounds = quantities["utilised_rounds"]
         return RevPURResult(value=safe_ratio(revenue, rounds))
 
 
@@ -59,6 +46,8 @@ revpur = _RevPURMetric(
     version="0.1.0",
     owner="greenlink-core",
     dependencies=[],
+    quantities=["green_fee_revenue", "utilised_rounds"],
+    invalidated_by=["booking.", "finance."],
 )
 
 register(revpur)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+from pydantic import BaseModel
+
+from app.semantic.base import Metric
+from app.semantic.registry import register
+
+
+class RoundsPlayedResult(BaseModel):
+    value: int
+
+
+class _RoundsPlayedMetric(Metric):
+    def assemble(self, quantities: Mapping[str, object]) -> RoundsPlayedResult:
+        """Rounds played — the RevPUR / effective green fee denominator.
+
+        SQL summary::
+
+            value = SUM(b.party_size)
+                      FROM bookings b
+                      WHERE b.club_id = :club
+                        AND b.status IN ('checked_in', 'completed')
+                        AND b.slot_datetime IN [start_utc, end_utc)
+        """
+        return RoundsPlayedResult(value=quantities["utilised_rounds"])
+
+
+rounds_played = _RoundsPlayedMetric(
+    name="rounds_played",
+    description="Rounds played — players checked in or completed on the tee sheet.",
+    result_schema=RoundsPlayedResult,
+    version="0.1.0",
+    owner="greenlink-core",
+    dependencies=[],
+    quantities=["utilised_rounds"],
+    invalidated_by=["booking."],
+)
+
+register(rounds_played)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import uuid
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from app.schemas.reports import UtilisationHeatmapResponse
+from app.semantic.base import Metric
+from app.semantic.cache import SLOT_STATE_WRITTEN_EVENT
+from app.semantic.registry import register
+
+
+class _UtilisationHeatmapMetric(Metric):
+    def compute(
+        self,
+        session: Session,
+        club_id: uuid.UUID,
+        **params: object,
+    ) -> UtilisationHeatmapResponse:
+        """Booked places against capacity per weekday and local time band.
+
+        Delegates to ``UtilisationHeatmapService.heatmap`` (three grouped
+        statements for any window length). Callers pass the club-local date
+        explicitly so results are cached per club and day until a booking,
+        slot-state or club event commits.
+        """
+        from app.services.utilisation_heatmap_service import (
+            HEATMAP_DEFAULT_BAND_MINUTES,
+            HEATMAP_DEFAULT_WEEKS,
+            UtilisationHeatmapService,
+        )
+
+        weeks = params.get("weeks", HEATMAP_DEFAULT_WEEKS)
+        band_minutes = params.get("band_minutes", HEATMAP_DEFAULT_BAND_MINUTES)
+        reference_date = params.get("reference_date")
+        return UtilisationHeatmapService(session).heatmap(
+            club_id=club_id,
+            weeks=weeks if isinstance(weeks, int) else HEATMAP_DEFAULT_WEEKS,
+            band_minutes=(
+                band_minutes if isinstance(band_minutes, int) else HEATMAP_DEFAULT_BAND_MINUTES
+            ),
+            reference_date=reference_date if isinstance(reference_date, date) else None,
+        )
+
+
+utilisation_heatmap = _UtilisationHeatmapMetric(
+    name="utilisation_heatmap",
+    description=(
+        "Utilisation heatmap — booked player places against tee-sheet capacity by "
+        "weekday and local time band over recent weeks."
+    ),
+    result_schema=UtilisationHeatmapResponse,
+    version="0.1.0",
+    owner="greenlink-core",
+    dependencies=[],
+    cache_ttl_seconds=86_400,
+    invalidated_by=["booking.", "club.", SLOT_STATE_WRITTEN_EVENT],
+)
+
+register(utilisation_heatmap)
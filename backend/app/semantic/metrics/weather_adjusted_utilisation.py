@@ -40,6 +40,7 @@ weather_adjusted_utilisation = _WeatherAdjustedUtilisationMetric(
     version="0.1.0",
     owner="greenlink-core",
     dependencies=[],
+    invalidated_by=[],
 )
 
 register(weather_adjusted_utilisation)
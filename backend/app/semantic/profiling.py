@@ -0,0 +1,209 @@
+"""Execution profile of semantic-layer metrics.
+
+Every :func:`app.semantic.registry.compute` call records one sample per
+``(metric, club)``: wall time, SQL statements executed, rows returned,
+whether the result came from the metric cache and whether it raised. Statements are counted by an
+engine-wide cursor listener that only charges the computations active in the
+current context, so concurrent requests and worker threads never see each
+other's statements; a metric computed inside another one is charged to both.
+Rows are the driver's ``rowcount`` summed over statements that report one.
+
+Samples are held per process in a rolling window of the last
+``semantic_profiling_window`` computations per pair and summarised on read
+(percentiles and a fixed wall-time histogram) for the superadmin diagnostics
+endpoint. With ``semantic_profiling_log_events`` each sample is also logged
+as a ``key=value`` line, with the same fields under ``extra["metric_profile"]``
+for structured handlers.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import get_settings
+from app.core.datetime import utc_now
+from app.schemas.reports import (
+    MetricProfileHistogramBucket,
+    MetricProfileListResponse,
+    MetricProfileSummary,
+)
+
+# Upper bounds (inclusive) of the wall-time histogram buckets; slower samples
+# land in a final open-ended bucket.
+WALL_TIME_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class MetricSample:
+    metric: str
+    club_id: uuid.UUID
+    recorded_at: datetime
+    wall_ms: float = 0.0
+    statements: int = 0
+    rows: int = 0
+    cache_hit: bool = True
+    error: bool = False
+
+
+_active_samples: ContextVar[tuple[MetricSample, ...]] = ContextVar(
+    "semantic_active_samples", default=()
+)
+
+
+class MetricProfileStore:
+    """Rolling window of samples per ``(metric, club)`` held in the worker process."""
+
+    def __init__(self, *, window: int) -> None:
+        self.window = window
+        self._samples: dict[tuple[str, uuid.UUID], deque[MetricSample]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, sample: MetricSample) -> None:
+        with self._lock:
+            samples = self._samples.get((sample.metric, sample.club_id))
+            if samples is None:
+                samples = deque(maxlen=self.window)
+                self._samples[(sample.metric, sample.club_id)] = samples
+            samples.append(sample)
+
+    def summarise(
+        self,
+        *,
+        metric: str | None = None,
+        club_id: uuid.UUID | None = None,
+    ) -> MetricProfileListResponse:
+        with self._lock:
+            selected = [
+                list(samples)
+                for (name, sample_club_id), samples in self._samples.items()
+                if (metric is None or name == metric)
+                and (club_id is None or sample_club_id == club_id)
+            ]
+        profiles = sorted(
+            (_summary(samples) for samples in selected),
+            key=lambda profile: (profile.metric, str(profile.club_id)),
+        )
+        return MetricProfileListResponse(window=self.window, profiles=profiles)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+@lru_cache
+def get_metric_profile_store() -> MetricProfileStore:
+    return MetricProfileStore(window=get_settings().semantic_profiling_window)
+
+
+@contextmanager
+def profile_metric(metric: str, club_id: uuid.UUID) -> Iterator[MetricSample]:
+    """Sample one computation; the caller marks ``cache_hit = False`` when it computes."""
+    sample = MetricSample(metric=metric, club_id=club_id, recorded_at=utc_now())
+    settings = get_settings()
+    if not settings.semantic_profiling_enabled:
+        yield sample
+        return
+    token = _active_samples.set((*_active_samples.get(), sample))
+    started = time.perf_counter()
+    try:
+        yield sample
+    except Exception:
+        sample.error = True
+        raise
+    finally:
+        # Failed computations are often the slow ones, so they are recorded too.
+        sample.wall_ms = (time.perf_counter() - started) * 1000
+        _active_samples.reset(token)
+        get_metric_profile_store().record(sample)
+        if settings.semantic_profiling_log_events:
+            _log_sample(sample)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _count_statement(
+    conn: object,
+    cursor: object,
+    statement: str,
+    parameters: object,
+    context: object,
+    executemany: bool,
+) -> None:
+    active = _active_samples.get()
+    if not active:
+        return
+    rowcount = getattr(cursor, "rowcount", -1)
+    for sample in active:
+        sample.statements += 1
+        if isinstance(rowcount, int) and rowcount > 0:
+            sample.rows += rowcount
+
+
+def _summary(samples: list[MetricSample]) -> MetricProfileSummary:
+    wall_times = sorted(sample.wall_ms for sample in samples)
+    cache_hits = sum(1 for sample in samples if sample.cache_hit)
+    histogram = [0] * (len(WALL_TIME_BUCKETS_MS) + 1)
+    for wall_ms in wall_times:
+        index = next(
+            (index for index, bound in enumerate(WALL_TIME_BUCKETS_MS) if wall_ms <= bound),
+            len(WALL_TIME_BUCKETS_MS),
+        )
+        histogram[index] += 1
+    bounds: list[int | None] = [*WALL_TIME_BUCKETS_MS, None]
+    return MetricProfileSummary(
+        metric=samples[0].metric,
+        club_id=samples[0].club_id,
+        sample_count=len(samples),
+        cache_hits=cache_hits,
+        cache_misses=len(samples) - cache_hits,
+        error_count=sum(1 for sample in samples if sample.error),
+        wall_ms_p50=round(_percentile(wall_times, 50), 3),
+        wall_ms_p95=round(_percentile(wall_times, 95), 3),
+        wall_ms_max=round(wall_times[-1], 3),
+        statements_max=max(sample.statements for sample in samples),
+        statements_last=samples[-1].statements,
+        rows_max=max(sample.rows for sample in samples),
+        rows_last=samples[-1].rows,
+        last_recorded_at=samples[-1].recorded_at,
+        histogram=[
+            MetricProfileHistogramBucket(le_ms=bound, count=count)
+            for bound, count in zip(bounds, histogram, strict=True)
+        ],
+    )
+
+
+def _percentile(ordered: list[float], percentile: int) -> float:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    rank = max(-(-percentile * len(ordered) // 100), 1)
+    return ordered[rank - 1]
+
+
+def _log_sample(sample: MetricSample) -> None:
+    fields = {
+        "metric": sample.metric,
+        "club_id": str(sample.club_id),
+        "cache": "hit" if sample.cache_hit else "miss",
+        "wall_ms": round(sample.wall_ms, 3),
+        "statements": sample.statements,
+        "rows": sample.rows,
+        "error": sample.error,
+    }
+    _log.info(
+        "semantic_metric_profile %s",
+        " ".join(f"{name}={value}" for name, value in fields.items()),
+        extra={"metric_profile": fields},
+    )
@@ -1,11 +1,24 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Iterable
+from datetime import date, timedelta
 
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from app.semantic.base import Metric
+from app.schemas.reports import MetricSeriesGranularity
+from app.semantic._queries import (
+    add_quantities,
+    evaluate_quantities_by_course,
+    resolve_metric_window,
+)
+from app.semantic.base import Metric, MetricSeriesPoint
+from app.semantic.cache import get_metric_cache
+from app.semantic.profiling import profile_metric
+from app.semantic.snapshots import read_daily_quantities, read_window_quantities
+
+SERIES_MAX_DAYS = 366
 
 _REGISTRY: dict[str, Metric] = {}
 
@@ -32,13 +45,184 @@ def compute(
 ) -> BaseModel:
     """Look up a metric by name and delegate to its ``compute`` method.
 
-    Materialisation is on-demand for v1: no cache layer, no materialised view,
-    no scheduler. The migration trigger (>25 metrics, compound-metric clunk, an
-    analyst joins, or a paying customer needs dbt-grade introspection) is named
-    in PRODUCT.md §7 and is when this decision is revisited.
+    Results are served from the metric result cache (``app.semantic.cache``)
+    while their TTL runs and no event in the metric's ``invalidated_by`` has
+    been committed for the club; otherwise the metric is computed on demand.
+    There is still no materialised view and no scheduler. The migration
+    trigger (>25 metrics, compound-metric clunk, an analyst joins, or a paying
+    customer needs dbt-grade introspection) is named in PRODUCT.md §7 and is
+    when this decision is revisited.
+
+    Each call is sampled by ``app.semantic.profiling`` (wall time, statements,
+    rows, cache hit or miss); ``compute_many``, ``compute_series`` and
+    ``compute_by_course`` share their reads across metrics and are not sampled.
     """
     metric = get_metric(name)
+    _check_dependencies(metric)
+    with profile_metric(metric.name, club_id) as sample:
+
+        def compute_uncached() -> BaseModel:
+            sample.cache_hit = False
+            return metric.compute(session, club_id, **params)
+
+        return get_metric_cache().get_or_compute(
+            metric,
+            club_id=club_id,
+            params=params,
+            compute=compute_uncached,
+        )
+
+
+def compute_many(
+    names: Iterable[str],
+    session: Session,
+    club_id: uuid.UUID,
+    **params: object,
+) -> dict[str, BaseModel]:
+    """Compute several metrics for one club and window in a single plan.
+
+    Cached results are served first. The remaining metrics that declare
+    ``quantities`` share one ``resolve_window`` call and one read of the
+    union of their intermediate quantities (``club_kpi_daily`` snapshots for
+    closed days, one live SELECT for the rest), each assembled from the
+    shared values; metrics without declared quantities fall back to their own
+    ``compute``. Results are keyed by metric name in request order.
+    """
+    metrics = [get_metric(name) for name in dict.fromkeys(names)]
+    for metric in metrics:
+        _check_dependencies(metric)
+    cache = get_metric_cache()
+    results: dict[str, BaseModel] = {}
+    pending: list[tuple[Metric, str | None]] = []
+    for metric in metrics:
+        key = cache.key_for(metric, club_id=club_id, params=params)
+        cached = cache.lookup(metric, key)
+        if cached is not None:
+            results[metric.name] = cached
+        else:
+            pending.append((metric, key))
+
+    planned = [metric for metric, _ in pending if metric.quantities]
+    if planned:
+        window = resolve_metric_window(session, club_id=club_id, params=params)
+        quantities = read_window_quantities(
+            session,
+            club_id=club_id,
+            window=window,
+            metrics=planned,
+        )
+    for metric, key in pending:
+        if metric.quantities:
+            result = metric.assemble(quantities)
+        else:
+            result = metric.compute(session, club_id, **params)
+        cache.store(metric, key, result)
+        results[metric.name] = result
+    return {metric.name: results[metric.name] for metric in metrics}
+
+
+def compute_series(
+    names: Iterable[str],
+    session: Session,
+    club_id: uuid.UUID,
+    *,
+    date_from: date,
+    date_to: date,
+    granularity: MetricSeriesGranularity = MetricSeriesGranularity.DAY,
+) -> dict[str, list[MetricSeriesPoint]]:
+    """Compute each metric per day, ISO week or calendar month of a range.
+
+    ``date_to`` is exclusive. Buckets are clipped to the range, so a series
+    starting mid-week opens with a partial week. Quantities for closed days
+    come from ``club_kpi_daily`` snapshots and the remaining days from one
+    grouped live statement (``read_daily_quantities``); a bucket sums its
+    days' quantities and each metric assembles its value from the sums.
+    Metrics without declared quantities fall back to ``compute`` once per
+    bucket. Series are not cached.
+    """
+    if date_to <= date_from:
+        raise ValueError("date_to must be strictly after date_from")
+    if (date_to - date_from).days > SERIES_MAX_DAYS:
+        raise ValueError(f"Metric series are limited to {SERIES_MAX_DAYS} days")
+    metrics = [get_metric(name) for name in dict.fromkeys(names)]
+    for metric in metrics:
+        _check_dependencies(metric)
+    window = resolve_metric_window(
+        session,
+        club_id=club_id,
+        params={"date_from": date_from, "date_to": date_to},
+    )
+    daily = read_daily_quantities(session, club_id=club_id, window=window, metrics=metrics)
+    buckets: dict[date, dict[str, object]] = {}
+    for day, quantities in daily:
+        totals = buckets.setdefault(_bucket_start(day, granularity, floor=date_from), {})
+        add_quantities(totals, quantities)
+    periods = list(buckets)
+    period_ends = [*periods[1:], date_to]
+
+    series: dict[str, list[MetricSeriesPoint]] = {}
+    for metric in metrics:
+        points: list[MetricSeriesPoint] = []
+        for period_start, period_end in zip(periods, period_ends, strict=True):
+            if metric.quantities:
+                result = metric.assemble(buckets[period_start])
+            else:
+                result = metric.compute(
+                    session, club_id, date_from=period_start, date_to=period_end
+                )
+            points.append(
+                MetricSeriesPoint(period_start=period_start, period_end=period_end, result=result)
+            )
+        series[metric.name] = points
+    return series
+
+
+def compute_by_course(
+    names: Iterable[str],
+    session: Session,
+    club_id: uuid.UUID,
+    **params: object,
+) -> dict[uuid.UUID, dict[str, BaseModel]]:
+    """Compute several metrics for one window per course of the club.
+
+    The union of the metrics' quantities is read live in one statement grouped
+    by course (``evaluate_quantities_by_course``), the same round trips as the
+    club-wide ``compute_many``; ``club_kpi_daily`` snapshots are per club, so
+    closed days are not served from them. Only metrics whose quantities can be
+    split by course qualify; others raise ``ValueError``. Results are keyed by
+    course id in course-name order, then metric name in request order, and
+    are not cached.
+    """
+    metrics = [get_metric(name) for name in dict.fromkeys(names)]
+    for metric in metrics:
+        _check_dependencies(metric)
+    unplanned = [metric.name for metric in metrics if not metric.quantities]
+    if unplanned:
+        raise ValueError(f"Metrics without quantities cannot be split by course: {unplanned!r}")
+    window = resolve_metric_window(session, club_id=club_id, params=params)
+    by_course = evaluate_quantities_by_course(
+        session,
+        club_id=club_id,
+        window=window,
+        names=[name for metric in metrics for name in metric.quantities],
+    )
+    return {
+        course_id: {metric.name: metric.assemble(quantities) for metric in metrics}
+        for course_id, quantities in by_course.items()
+    }
+
+
+def _bucket_start(day: date, granularity: MetricSeriesGranularity, *, floor: date) -> date:
+    if granularity == MetricSeriesGranularity.WEEK:
+        start = day - timedelta(days=day.weekday())
+    elif granularity == MetricSeriesGranularity.MONTH:
+        start = day.replace(day=1)
+    else:
+        start = day
+    return max(start, floor)
+
+
+def _check_dependencies(metric: Metric) -> None:
     missing = [dep for dep in metric.dependencies if dep not in _REGISTRY]
     if missing:
         raise ValueError(f"Metric {metric.name!r} depends on unregistered metrics: {missing!r}")
-    return metric.compute(session, club_id, **params)
@@ -0,0 +1,212 @@
+"""Daily KPI snapshots in ``club_kpi_daily``.
+
+Every metric that declares ``quantities`` is snapshotted per club and closed
+local business date: its value plus the additive quantities it was assembled
+from. Windowed reads re-aggregate those components, so closed days never touch
+bookings, finance transactions or the POS tables again. Days from the club's
+"today" onwards, and any closed day not yet snapshotted (or snapshotted under
+an older metric version), are read live; the live read starts at the first
+such day so a window costs at most one snapshot SELECT plus one live SELECT.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import TYPE_CHECKING
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.datetime import utc_now
+from app.models import ClubKpiDaily
+from app.semantic._queries import (
+    add_quantities,
+    evaluate_quantities,
+    evaluate_quantity_series,
+    resolve_metric_window,
+    slice_window,
+)
+from app.services._window import TimeWindow
+
+if TYPE_CHECKING:
+    from app.semantic.base import Metric
+
+
+def refresh_daily_snapshots(
+    session: Session,
+    *,
+    club_id: uuid.UUID,
+    date_from: date,
+    date_to: date,
+    metrics: Sequence[Metric],
+) -> int:
+    """Recompute and upsert snapshots for local days ``[date_from, date_to)``.
+
+    The quantities for every day come from one grouped live read; the caller
+    commits. Returns the number of rows written.
+    """
+    snapshotted = [metric for metric in metrics if metric.quantities]
+    if not snapshotted:
+        return 0
+    window = resolve_metric_window(
+        session,
+        club_id=club_id,
+        params={"date_from": date_from, "date_to": date_to},
+    )
+    daily = evaluate_quantity_series(
+        session,
+        club_id=club_id,
+        window=window,
+        names=(name for metric in snapshotted for name in metric.quantities),
+    )
+    computed_at = utc_now()
+    rows: list[dict[str, object]] = []
+    for business_date, quantities in daily:
+        for metric in snapshotted:
+            components = {name: quantities[name] for name in metric.quantities}
+            value = getattr(metric.assemble(components), "value", None)
+            rows.append(
+                {
+                    "club_id": club_id,
+                    "business_date": business_date,
+                    "metric": metric.name,
+                    "metric_version": metric.version,
+                    "value": Decimal(value) if isinstance(value, Decimal | int) else None,
+                    "components": {
+                        name: _encode_component(component) for name, component in components.items()
+                    },
+                    "computed_at": computed_at,
+                }
+            )
+    if not rows:
+        return 0
+    statement = pg_insert(ClubKpiDaily).values(rows)
+    session.execute(
+        statement.on_conflict_do_update(
+            constraint="uq_club_kpi_daily_club_business_date_metric",
+            set_={
+                "metric_version": statement.excluded.metric_version,
+                "value": statement.excluded.value,
+                "components": statement.excluded.components,
+                "computed_at": statement.excluded.computed_at,
+                "updated_at": computed_at,
+            },
+        )
+    )
+    return len(rows)
+
+
+def read_window_quantities(
+    session: Session,
+    *,
+    club_id: uuid.UUID,
+    window: TimeWindow,
+    metrics: Sequence[Metric],
+) -> dict[str, object]:
+    """The metrics' quantities summed over ``window``."""
+    names = _quantity_names(metrics)
+    if not names:
+        return {}
+    snapshots, live_from = _read_snapshots(session, club_id=club_id, window=window, metrics=metrics)
+    totals: dict[str, object] = {}
+    for quantities in snapshots.values():
+        add_quantities(totals, quantities)
+    if live_from < window.date_to:
+        add_quantities(
+            totals,
+            evaluate_quantities(
+                session,
+                club_id=club_id,
+                window=slice_window(window, date_from=live_from, date_to=window.date_to),
+                names=names,
+            ),
+        )
+    return {name: totals[name] for name in names}
+
+
+def read_daily_quantities(
+    session: Session,
+    *,
+    club_id: uuid.UUID,
+    window: TimeWindow,
+    metrics: Sequence[Metric],
+) -> list[tuple[date, dict[str, object]]]:
+    """The metrics' quantities for every local day of ``window``, in order."""
+    names = _quantity_names(metrics)
+    snapshots, live_from = _read_snapshots(session, club_id=club_id, window=window, metrics=metrics)
+    daily = [
+        (business_date, {name: quantities[name] for name in names})
+        for business_date, quantities in snapshots.items()
+    ]
+    if live_from < window.date_to:
+        daily.extend(
+            evaluate_quantity_series(
+                session,
+                club_id=club_id,
+                window=slice_window(window, date_from=live_from, date_to=window.date_to),
+                names=names,
+            )
+        )
+    return daily
+
+
+def _read_snapshots(
+    session: Session,
+    *,
+    club_id: uuid.UUID,
+    window: TimeWindow,
+    metrics: Sequence[Metric],
+) -> tuple[dict[date, dict[str, object]], date]:
+    """Snapshot quantities for the leading run of fully snapshotted closed days,
+    and the first day that has to be read live."""
+    today = utc_now().astimezone(ZoneInfo(window.timezone_name)).date()
+    closed_to = min(window.date_to, today)
+    snapshotted = {metric.name: metric.version for metric in metrics if metric.quantities}
+    if closed_to <= window.date_from or not snapshotted:
+        return {}, window.date_from
+    rows = session.execute(
+        select(
+            ClubKpiDaily.business_date,
+            ClubKpiDaily.metric,
+            ClubKpiDaily.metric_version,
+            ClubKpiDaily.components,
+        ).where(
+            ClubKpiDaily.club_id == club_id,
+            ClubKpiDaily.business_date >= window.date_from,
+            ClubKpiDaily.business_date < closed_to,
+            ClubKpiDaily.metric.in_(snapshotted),
+        )
+    )
+    by_day: dict[date, dict[str, dict[str, object]]] = {}
+    for business_date, metric, metric_version, components in rows:
+        if snapshotted[metric] == metric_version:
+            by_day.setdefault(business_date, {})[metric] = components
+    covered: dict[date, dict[str, object]] = {}
+    day = window.date_from
+    while day < closed_to and len(by_day.get(day, {})) == len(snapshotted):
+        quantities: dict[str, object] = {}
+        for components in by_day[day].values():
+            quantities.update(
+                {name: _decode_component(value) for name, value in components.items()}
+            )
+        covered[day] = quantities
+        day += timedelta(days=1)
+    return covered, day
+
+
+def _quantity_names(metrics: Sequence[Metric]) -> list[str]:
+    return list(dict.fromkeys(name for metric in metrics for name in metric.quantities))
+
+
+def _encode_component(value: object) -> object:
+    # JSON keeps integers exact; money goes through a string to stay a Decimal.
+    return str(value) if isinstance(value, Decimal) else value
+
+
+def _decode_component(value: object) -> object:
+    return Decimal(value) if isinstance(value, str) else value
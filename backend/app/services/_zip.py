@@ -0,0 +1,54 @@
+"""Streamed zip bundles for multi-file downloads.
+
+The archive is written to a sink that only buffers what ``zipfile`` has emitted
+since the last yield, so a bundle of several large CSVs is served entry by
+entry without being assembled in memory first.
+"""
+
+from __future__ import annotations
+
+import zipfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class ZipStream:
+    file_name: str
+    chunks: Iterator[bytes]
+
+
+class _ChunkSink:
+    # Deliberately has no tell()/seek(): zipfile then writes data descriptors and
+    # never needs to rewind into bytes that were already handed to the client.
+    def __init__(self) -> None:
+        self._pending: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._pending.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        return None
+
+    def drain(self) -> bytes:
+        chunk = b"".join(self._pending)
+        self._pending.clear()
+        return chunk
+
+
+def iter_zip_chunks(entries: Iterable[tuple[str, Iterable[bytes]]]) -> Iterator[bytes]:
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in entries:
+            # Entry sizes are unknown up front; without zip64 headers zipfile
+            # refuses to write past 2 GiB in one entry.
+            with archive.open(name, mode="w", force_zip64=True) as entry:
+                for chunk in content:
+                    entry.write(chunk)
+                    if pending := sink.drain():
+                        yield pending
+            if pending := sink.drain():
+                yield pending
+    if pending := sink.drain():
+        yield pending
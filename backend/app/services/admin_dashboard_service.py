@@ -9,7 +9,6 @@ from sqlalchemy.orm import Session
 
 from app.models import (
     Booking,
-    BookingPaymentStatus,
     BookingStatus,
     ClubConfig,
     ClubMembership,
@@ -27,6 +26,7 @@ from app.schemas.admin_dashboard import (
     DashboardTeeOccupancy,
 )
 from app.services.booking_state_service import LIVE_OCCUPANCY_STATUSES
+from app.services.finance.read_model_service import FinanceReadModelService
 from app.services.targets_service import TARGET_DOMAIN_REGISTRY
 
 
@@ -70,10 +70,10 @@ class AdminDashboardService:
         tee_occupancy, tee_warnings = self._get_tee_occupancy(club_id)
         recent_activity = self._get_recent_activity(club_id)
         active_targets = self._get_active_targets(club_id)
-        unpaid_bookings_today = self._get_unpaid_bookings_today(club_id)
-        no_show_risk_count = self._get_no_show_risk_count(club_id)
+        unpaid_bookings_today, no_show_risk_count, close_day_ready = self._get_close_day_state(
+            club_id
+        )
         arrivals_due_count = self._get_arrivals_due_count(club_id)
-        close_day_ready = unpaid_bookings_today == 0 and no_show_risk_count == 0
         return AdminDashboardSummaryResponse(
             member_count=member_count,
             tee_occupancy=tee_occupancy,
@@ -260,54 +260,23 @@ class AdminDashboardService:
             )
         return result
 
-    def _get_unpaid_bookings_today(self, club_id: uuid.UUID) -> int:
-        """Count of today's reserved or checked-in bookings with payment_status=pending."""
-        club_config = self.db.scalar(select(ClubConfig).where(ClubConfig.club_id == club_id))
-        if club_config is None:
-            return 0
-        zone = ZoneInfo(club_config.timezone)
-        today = datetime.now(zone).date()
-        today_start_utc = datetime.combine(today, time.min, tzinfo=zone).astimezone(UTC)
-        today_end_utc = datetime.combine(
-            today + timedelta(days=1), time.min, tzinfo=zone
-        ).astimezone(UTC)
-        count = self.db.scalar(
-            select(func.count())
-            .select_from(Booking)
-            .where(
-                Booking.club_id == club_id,
-                Booking.slot_datetime >= today_start_utc,
-                Booking.slot_datetime < today_end_utc,
-                Booking.payment_status == BookingPaymentStatus.PENDING,
-                Booking.status.in_((BookingStatus.RESERVED, BookingStatus.CHECKED_IN)),
-            )
-        )
-        return count or 0
-
-    def _get_no_show_risk_count(self, club_id: uuid.UUID) -> int:
-        """Count of today's reserved bookings whose start time has already passed."""
+    def _get_close_day_state(self, club_id: uuid.UUID) -> tuple[int, int, bool]:
+        """Today's unpaid bookings, no-show risks and readiness, shared with the workbench."""
         club_config = self.db.scalar(select(ClubConfig).where(ClubConfig.club_id == club_id))
         if club_config is None:
-            return 0
-        zone = ZoneInfo(club_config.timezone)
-        today = datetime.now(zone).date()
-        today_start_utc = datetime.combine(today, time.min, tzinfo=zone).astimezone(UTC)
-        today_end_utc = datetime.combine(
-            today + timedelta(days=1), time.min, tzinfo=zone
-        ).astimezone(UTC)
-        now_utc = datetime.now(UTC)
-        count = self.db.scalar(
-            select(func.count())
-            .select_from(Booking)
-            .where(
-                Booking.club_id == club_id,
-                Booking.status == BookingStatus.RESERVED,
-                Booking.slot_datetime >= today_start_utc,
-                Booking.slot_datetime < today_end_utc,
-                Booking.slot_datetime < now_utc,
+            return 0, 0, True
+        today = datetime.now(ZoneInfo(club_config.timezone)).date()
+        day = (
+            FinanceReadModelService(self.db)
+            .get_exceptions_range(
+                club_id=club_id,
+                date_from=today,
+                date_to=today,
+                now=datetime.now(UTC),
             )
+            .days[0]
         )
-        return count or 0
+        return len(day.unpaid_bookings), day.no_show_risk_count, day.close_day_ready
 
     def _get_arrivals_due_count(self, club_id: uuid.UUID) -> int:
         """Count of today's reserved bookings due within the next 90 minutes."""
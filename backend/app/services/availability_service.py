@@ -100,6 +100,12 @@ class AvailabilityService:
             resolved_checks,
             unresolved_checks,
         )
+        self._record_outcome(
+            self._evaluate_account_standing(decision_input.booking_state),
+            blockers,
+            resolved_checks,
+            unresolved_checks,
+        )
         self._record_outcome(
             self._evaluate_advance_window(slot_policy, rule_evaluation, context),
             blockers,
@@ -209,6 +215,31 @@ class AvailabilityService:
                 )
         return outcomes
 
+    def _evaluate_account_standing(
+        self,
+        booking_state: BookingStateSnapshot,
+    ) -> tuple[str, AvailabilityTrace] | None:
+        if booking_state.account_in_arrears is None:
+            return None
+        if booking_state.account_in_arrears:
+            return (
+                "blocked",
+                AvailabilityTrace(
+                    code="account_in_arrears",
+                    reason=(
+                        "Your club account has an overdue balance. Please settle it with "
+                        "the club office to book tee times."
+                    ),
+                ),
+            )
+        return (
+            "resolved",
+            AvailabilityTrace(
+                code="account_in_good_standing",
+                reason="Booking account has no overdue balance",
+            ),
+        )
+
     def _evaluate_advance_window(
         self,
         slot_policy: SlotPolicySummary | None,
@@ -0,0 +1,398 @@
+"""Monthly two-page Board Pack: financial KPIs, then operational KPIs.
+
+The independent groups — finance revenue trend, aged receivables, membership
+and the operational metric series — run concurrently on worker threads, each
+with its own session, then the result is assembled and rendered to a
+print-ready HTML artefact (one ``.page`` per printed page) stored in object
+storage. Every figure covers a closed local calendar month plus the eleven
+before it, so the operational series is served from the ``club_kpi_daily``
+snapshots wherever they exist.
+"""
+
+from __future__ import annotations
+
+import html
+import logging
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from typing import TypeVar
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import Date, cast, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.datetime import utc_now
+from app.core.exceptions import AppError, NotFoundError
+from app.models import Club, FinanceTransaction, FinanceTransactionType
+from app.schemas.board_pack import (
+    BoardPackClubResult,
+    BoardPackFinanceMonth,
+    BoardPackFinancialPage,
+    BoardPackKpiMonth,
+    BoardPackOperationalKpi,
+    BoardPackOperationalPage,
+    BoardPackResponse,
+    BoardPackRunReport,
+)
+from app.schemas.finance import FinanceAgedReceivablesResponse
+from app.schemas.reports import MemberStatsSummaryResponse, MetricSeriesGranularity
+from app.semantic import MetricSeriesPoint, compute_series, get_metric
+from app.services.finance.read_model_service import FinanceReadModelService
+from app.services.people_read_model_service import PeopleReadModelService
+from app.storage.object_storage import build_object_storage_client
+
+_log = logging.getLogger(__name__)
+
+ZERO = Decimal("0.00")
+BOARD_PACK_DEFAULT_WORKERS = 4
+BOARD_PACK_TREND_MONTHS = 12
+BOARD_PACK_CONTENT_TYPE = "text/html; charset=utf-8"
+BOARD_PACK_OPERATIONAL_METRICS = (
+    "rounds_played",
+    "revpatt",
+    "revpur",
+    "effective_green_fee",
+    "fnb_per_round",
+)
+
+T = TypeVar("T")
+
+
+class BoardPackService:
+    def __init__(
+        self,
+        db: Session,
+        *,
+        session_factory: Callable[[], Session] | None = None,
+        max_workers: int = BOARD_PACK_DEFAULT_WORKERS,
+    ) -> None:
+        self.db = db
+        self.session_factory = session_factory or sessionmaker(
+            bind=db.get_bind(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+        self.max_workers = max_workers
+        self.storage = build_object_storage_client()
+
+    def generate(
+        self,
+        *,
+        club_id: uuid.UUID,
+        month: date | None = None,
+        now: datetime | None = None,
+    ) -> BoardPackResponse:
+        """Build, render and store the pack for ``month`` (any day in it).
+
+        Defaults to the last complete local calendar month.
+        """
+        club = self.db.get(Club, club_id)
+        if club is None:
+            raise NotFoundError("Club not found")
+        zone = ZoneInfo(club.timezone)
+        current_month = (now or utc_now()).astimezone(zone).date().replace(day=1)
+        month_start = month.replace(day=1) if month is not None else _add_months(current_month, -1)
+        if month_start >= current_month:
+            raise AppError(
+                code="board_pack_month_open",
+                message="Board Packs are only produced for completed months",
+                status_code=400,
+            )
+        month_end = _add_months(month_start, 1)
+        trend_from = _add_months(month_start, 1 - BOARD_PACK_TREND_MONTHS)
+        as_of = month_end - timedelta(days=1)
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="board-pack",
+        ) as executor:
+            finance_trend = executor.submit(
+                self._in_session,
+                self._finance_trend,
+                club_id=club_id,
+                zone=zone,
+                date_from=trend_from,
+                date_to=month_end,
+            )
+            receivables = executor.submit(
+                self._in_session,
+                lambda db: FinanceReadModelService(db).get_aged_receivables(
+                    club_id=club_id, as_of=as_of
+                ),
+            )
+            members = executor.submit(
+                self._in_session,
+                lambda db: PeopleReadModelService(db).summary(
+                    club_id=club_id, reference_date=as_of
+                ),
+            )
+            operational = executor.submit(
+                self._in_session,
+                lambda db: compute_series(
+                    BOARD_PACK_OPERATIONAL_METRICS,
+                    db,
+                    club_id,
+                    date_from=trend_from,
+                    date_to=month_end,
+                    granularity=MetricSeriesGranularity.MONTH,
+                ),
+            )
+            financial = self._financial_page(
+                finance_trend.result(),
+                receivables=receivables.result(),
+                members=members.result(),
+            )
+            operational_page = self._operational_page(operational.result())
+
+        period = f"{month_start:%Y-%m}"
+        file_name = f"greenlink-board-pack-{club.slug}-{period}.html"
+        storage_key = f"board-packs/{club_id}/{period}.html"
+        response = BoardPackResponse(
+            club_id=club_id,
+            club_name=club.name,
+            month=month_start,
+            trend_from=trend_from,
+            generated_at=utc_now(),
+            financial=financial,
+            operational=operational_page,
+            file_name=file_name,
+            storage_key=storage_key,
+        )
+        self.storage.put_object(
+            storage_key,
+            _render_html(response).encode("utf-8"),
+            content_type=BOARD_PACK_CONTENT_TYPE,
+        )
+        return response
+
+    def run(
+        self,
+        *,
+        club_ids: list[uuid.UUID] | None = None,
+        month: date | None = None,
+        now: datetime | None = None,
+    ) -> BoardPackRunReport:
+        """Generate the pack for every active club; meant for the 1st of the month."""
+        started_at = utc_now()
+        statement = select(Club.id, Club.slug).where(Club.active.is_(True))
+        if club_ids is not None:
+            statement = statement.where(Club.id.in_(club_ids))
+        results: list[BoardPackClubResult] = []
+        for club_id, club_slug in self.db.execute(statement.order_by(Club.slug.asc())).all():
+            result = BoardPackClubResult(club_id=club_id, club_slug=club_slug, status="completed")
+            try:
+                pack = self.generate(club_id=club_id, month=month, now=now)
+            except AppError as exc:
+                result.status = "failed"
+                result.error_code = exc.code
+                result.error_message = exc.message
+            except Exception as exc:
+                _log.exception("Board Pack failed for club %s", club_id)
+                result.status = "failed"
+                result.error_code = "board_pack_unexpected_error"
+                result.error_message = str(exc)
+            else:
+                result.month = pack.month
+                result.storage_key = pack.storage_key
+            results.append(result)
+        return BoardPackRunReport(
+            started_at=started_at,
+            finished_at=utc_now(),
+            club_count=len(results),
+            completed_count=sum(1 for result in results if result.status == "completed"),
+            failed_count=sum(1 for result in results if result.status == "failed"),
+            clubs=results,
+        )
+
+    def _in_session(self, work: Callable[..., T], **kwargs: object) -> T:
+        with self.session_factory() as db:
+            return work(db, **kwargs)
+
+    def _finance_trend(
+        self,
+        db: Session,
+        *,
+        club_id: uuid.UUID,
+        zone: ZoneInfo,
+        date_from: date,
+        date_to: date,
+    ) -> list[BoardPackFinanceMonth]:
+        local_month = cast(
+            func.date_trunc("month", func.timezone(zone.key, FinanceTransaction.created_at)),
+            Date,
+        )
+        rows = db.execute(
+            select(
+                local_month,
+                func.coalesce(
+                    func.sum(func.abs(FinanceTransaction.amount)).filter(
+                        FinanceTransaction.type == FinanceTransactionType.CHARGE
+                    ),
+                    ZERO,
+                ),
+                func.coalesce(
+                    func.sum(FinanceTransaction.amount).filter(
+                        FinanceTransaction.type == FinanceTransactionType.PAYMENT
+                    ),
+                    ZERO,
+                ),
+            )
+            .where(
+                FinanceTransaction.club_id == club_id,
+                FinanceTransaction.created_at >= _local_day_start_utc(date_from, zone),
+                FinanceTransaction.created_at < _local_day_start_utc(date_to, zone),
+            )
+            .group_by(local_month)
+        )
+        totals = {month: (revenue, collections) for month, revenue, collections in rows}
+        trend: list[BoardPackFinanceMonth] = []
+        month = date_from
+        while month < date_to:
+            revenue, collections = totals.get(month, (ZERO, ZERO))
+            trend.append(
+                BoardPackFinanceMonth(month=month, revenue=revenue, collections=collections)
+            )
+            month = _add_months(month, 1)
+        return trend
+
+    def _financial_page(
+        self,
+        trend: list[BoardPackFinanceMonth],
+        *,
+        receivables: FinanceAgedReceivablesResponse,
+        members: MemberStatsSummaryResponse,
+    ) -> BoardPackFinancialPage:
+        return BoardPackFinancialPage(
+            revenue=trend[-1].revenue,
+            collections=trend[-1].collections,
+            revenue_trend=trend,
+            receivables=receivables.totals,
+            accounts_in_arrears=receivables.account_count,
+            total_members=members.total_members,
+            active_members=members.by_status.get("active", 0),
+            new_members=members.growth_this_month,
+            members_by_status=members.by_status,
+        )
+
+    def _operational_page(
+        self,
+        series: dict[str, list[MetricSeriesPoint]],
+    ) -> BoardPackOperationalPage:
+        kpis: list[BoardPackOperationalKpi] = []
+        for name in BOARD_PACK_OPERATIONAL_METRICS:
+            trend = [
+                BoardPackKpiMonth(
+                    month=point.period_start,
+                    value=Decimal(getattr(point.result, "value", ZERO)),
+                )
+                for point in series[name]
+            ]
+            kpis.append(
+                BoardPackOperationalKpi(
+                    metric=name,
+                    description=get_metric(name).description,
+                    value=trend[-1].value,
+                    trend=trend,
+                )
+            )
+        return BoardPackOperationalPage(kpis=kpis)
+
+
+def _add_months(month_start: date, months: int) -> date:
+    index = month_start.year * 12 + month_start.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _local_day_start_utc(local_date: date, zone: ZoneInfo) -> datetime:
+    return datetime.combine(local_date, datetime.min.time(), tzinfo=zone).astimezone(UTC)
+
+
+_HTML_STYLE = """
+body { font-family: Georgia, serif; color: #1b2a1f; margin: 0; }
+.page { padding: 18mm; page-break-after: always; }
+.page:last-child { page-break-after: auto; }
+h1 { font-size: 20pt; margin: 0 0 2mm; }
+h2 { font-size: 13pt; margin: 6mm 0 2mm; border-bottom: 1px solid #1b4d3e; }
+table { border-collapse: collapse; width: 100%; font-size: 9pt; }
+th, td { padding: 1.5mm 2mm; text-align: right; border-bottom: 1px solid #d9e0da; }
+th:first-child, td:first-child { text-align: left; }
+.headline td { font-size: 12pt; font-weight: bold; }
+"""
+
+
+def _render_html(pack: BoardPackResponse) -> str:
+    month_label = f"{pack.month:%B %Y}"
+    title = html.escape(f"{pack.club_name} — Board Pack {month_label}")
+    financial = pack.financial
+    receivables = financial.receivables
+    finance_rows = "".join(
+        _row(f"{entry.month:%b %Y}", _money(entry.revenue), _money(entry.collections))
+        for entry in financial.revenue_trend
+    )
+    membership_rows = "".join(
+        _row(status.replace("_", " ").title(), str(count))
+        for status, count in sorted(financial.members_by_status.items())
+    )
+    trend_months = [point.month for point in pack.operational.kpis[0].trend]
+    kpi_header = _row("KPI", *(f"{month:%b %y}" for month in trend_months), cell="th")
+    kpi_rows = "".join(
+        _row(
+            kpi.description.split(" — ")[0],
+            *(_kpi_value(kpi.metric, point.value) for point in kpi.trend),
+        )
+        for kpi in pack.operational.kpis
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>{title}</title><style>{_HTML_STYLE}</style></head>
+<body>
+<section class="page">
+<h1>{title}</h1>
+<p>Financial KPIs · generated {pack.generated_at:%Y-%m-%d %H:%M} UTC</p>
+<table class="headline">
+{_row("Revenue", _money(financial.revenue))}
+{_row("Collections", _money(financial.collections))}
+{_row("Receivables outstanding", _money(receivables.total_outstanding))}
+{_row("Active members", str(financial.active_members))}
+</table>
+<h2>Revenue and collections, trailing {len(financial.revenue_trend)} months</h2>
+<table>{_row("Month", "Revenue", "Collections", cell="th")}{finance_rows}</table>
+<h2>Receivables ageing at month end ({financial.accounts_in_arrears} accounts in arrears)</h2>
+<table>
+{_row("Current", "30 days", "60 days", "90+ days", "Total", cell="th")}
+{
+        _row(
+            _money(receivables.current),
+            _money(receivables.days_30),
+            _money(receivables.days_60),
+            _money(receivables.days_90_plus),
+            _money(receivables.total_outstanding),
+        )
+    }
+</table>
+<h2>Membership ({financial.total_members} total, {financial.new_members} joined this month)</h2>
+<table>{_row("Status", "Members", cell="th")}{membership_rows}</table>
+</section>
+<section class="page">
+<h1>{title}</h1>
+<p>Operational KPIs</p>
+<table>{kpi_header}{kpi_rows}</table>
+</section>
+</body>
+</html>
+"""
+
+
+def _row(*cells: str, cell: str = "td") -> str:
+    return "<tr>" + "".join(f"<{cell}>{html.escape(value)}</{cell}>" for value in cells) + "</tr>"
+
+
+def _money(value: Decimal) -> str:
+    return f"{value:,.2f}"
+
+
+def _kpi_value(metric: str, value: Decimal) -> str:
+    return f"{value:,.0f}" if metric == "rounds_played" else _money(value)
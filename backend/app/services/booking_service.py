@@ -45,6 +45,7 @@ from app.services.booking_state_service import (
     LIVE_OCCUPANCY_STATUSES,
     BookingStateService,
 )
+from app.services.finance.arrears_block_service import ArrearsBlockService
 from app.services.rule_context_service import RuleContextService
 
 TOLERATED_CREATE_UNRESOLVED_CODES = {"live_concurrency_not_evaluated"}
@@ -58,6 +59,7 @@ class BookingService:
         self.availability_service = AvailabilityService(db)
         self.booking_commercial_service = BookingCommercialService(db)
         self.participant_resolver = BookingParticipantResolver(db)
+        self.arrears_block_service = ArrearsBlockService(db)
         self.publisher = DatabaseEventPublisher(db)
 
     def create_booking(
@@ -213,6 +215,11 @@ class BookingService:
             person_id=primary_participant.person_id,
             reference_datetime=reference_datetime,
         )
+        if primary_participant.person_id is not None:
+            booking_state.account_in_arrears = self.arrears_block_service.is_blocked(
+                club_id=club_id,
+                person_id=primary_participant.person_id,
+            )
 
         decision_input = self.booking_state_service.build_decision_input(
             rule_context,
@@ -241,5 +241,6 @@ class BookingStateService:
             externally_unavailable=booking_state.externally_unavailable,
             current_bookings_for_day=booking_state.current_bookings_for_day,
             current_future_bookings=booking_state.current_future_bookings,
+            account_in_arrears=booking_state.account_in_arrears,
             blocked_reason=booking_state.blocked_reason,
         )
@@ -1,12 +1,10 @@
 from __future__ import annotations
 
-import csv
-import hashlib
-import io
-import json
 import re
 import uuid
-from decimal import Decimal, InvalidOperation
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
 
 from pydantic import ValidationError
 from sqlalchemy import select
@@ -19,23 +17,43 @@ from app.events.emission_context import EmissionContext
 from app.events.publisher import DatabaseEventPublisher
 from app.models import (
     AccountingExportProfile,
+    FinanceExportBatch,
     FinanceExportBatchStatus,
     FinanceExportProfile,
-    FinanceTransactionSource,
-    FinanceTransactionType,
 )
 from app.schemas.finance import (
     AccountingExportProfileListResponse,
     AccountingExportProfileMappingConfig,
     AccountingExportProfileResponse,
     AccountingExportProfileUpsertRequest,
-    AccountingMappedExportDownloadResult,
+    AccountingMappedExportBundleManifest,
+    AccountingMappedExportBundleTarget,
     AccountingMappedExportPreviewResponse,
-    AccountingMappedExportPreviewRow,
     AccountingMappedExportValidationError,
     FinanceExportBatchPreviewRow,
 )
+from app.services._csv import CsvStream, iter_csv_chunks
+from app.services._zip import ZipStream, iter_zip_chunks
 from app.services.finance.export_batch_service import FinanceExportBatchService
+from app.services.finance.mapped_export_engine import (
+    MAPPED_EXPORT_CSV_COLUMNS,
+    MappedExportColumns,
+    compile_profile_mapping,
+    map_columns,
+    read_source_columns,
+)
+
+BUNDLE_MANIFEST_FILE_NAME = "manifest.json"
+
+
+@dataclass(frozen=True, slots=True)
+class PreparedMappedExport:
+    """A validated mapped export that has not been recorded against its batch yet."""
+
+    batch: FinanceExportBatch
+    profile: AccountingExportProfile
+    mapped: MappedExportColumns
+    file_name: str
 
 
 class AccountingProfileMappingService:
@@ -189,27 +207,9 @@ class AccountingProfileMappingService:
         batch_id: uuid.UUID,
         profile_id: uuid.UUID,
     ) -> AccountingMappedExportPreviewResponse:
-        batch = self.batch_service.get_batch(club_id=club_id, batch_id=batch_id)
-        profile = self.get_profile(club_id=club_id, profile_id=profile_id)
-        if not profile.is_active:
-            raise AppError(
-                code="accounting_export_profile_inactive",
-                message="Only active accounting export profiles may be applied",
-                status_code=400,
-            )
-
-        mapped_rows, validation_errors = self._build_validated_mapped_rows(
-            batch=batch, profile=profile
-        )
-        generated_at = utc_now()
-        output_mode = self._output_mode(profile.target_system)
-        file_name = self._mapped_file_name(
-            target_system=profile.target_system,
-            profile_code=profile.code,
-            date_from=batch.date_from.isoformat(),
-            date_to=batch.date_to.isoformat(),
+        batch, profile, mapped = self._build_mapped_export(
+            club_id=club_id, batch_id=batch_id, profile_id=profile_id
         )
-        content_hash = self._content_hash(mapped_rows)
         return AccountingMappedExportPreviewResponse(
             source_batch_id=batch.id,
             source_export_profile=FinanceExportProfile(batch.export_profile),
@@ -217,19 +217,19 @@ class AccountingProfileMappingService:
             accounting_profile_code=profile.code,
             accounting_profile_name=profile.name,
             target_system=profile.target_system,
-            generated_at=generated_at,
-            file_name=file_name,
-            content_hash=content_hash,
-            row_count=len(mapped_rows),
-            download_ready=len(validation_errors) == 0,
+            generated_at=utc_now(),
+            file_name=self._mapped_file_name_for(batch=batch, profile=profile),
+            content_hash=mapped.content_hash(),
+            row_count=mapped.row_count,
+            download_ready=len(mapped.validation_errors) == 0,
             metadata_json={
-                "output_mode": output_mode,
+                "output_mode": self._output_mode(profile.target_system),
                 "source_batch_content_hash": batch.content_hash,
                 "source_batch_file_name": batch.file_name,
                 "column_order": self._column_order(profile.target_system),
             },
-            validation_errors=validation_errors,
-            rows=mapped_rows,
+            validation_errors=mapped.validation_errors,
+            rows=mapped.to_preview_rows(),
         )
 
     def build_mapped_export_download(
@@ -238,19 +238,72 @@ class AccountingProfileMappingService:
         club_id: uuid.UUID,
         batch_id: uuid.UUID,
         profile_id: uuid.UUID,
-    ) -> AccountingMappedExportDownloadResult:
-        preview = self.build_mapped_export_preview(
+    ) -> CsvStream:
+        batch, profile, mapped = self._build_mapped_export(
             club_id=club_id, batch_id=batch_id, profile_id=profile_id
         )
-        if preview.validation_errors:
-            raise AppError(
-                code="accounting_export_validation_failed",
-                message=self._validation_failure_message(preview.validation_errors),
-                status_code=422,
+        self._raise_for_validation_errors(mapped.validation_errors)
+        return self._to_csv_stream(
+            file_name=self._mapped_file_name_for(batch=batch, profile=profile),
+            mapped=mapped,
+        )
+
+    def build_mapped_export_bundle(
+        self,
+        *,
+        club_id: uuid.UUID,
+        batch_id: uuid.UUID,
+        profile_ids: list[uuid.UUID] | None = None,
+    ) -> ZipStream:
+        batch = self.batch_service.get_batch(club_id=club_id, batch_id=batch_id)
+        profiles = self._bundle_profiles(club_id=club_id, profile_ids=profile_ids)
+
+        # One read of the canonical payload feeds every target; each profile then
+        # only costs a column pass over data that is already in memory.
+        source, source_errors = self._read_source(batch)
+        targets: list[AccountingMappedExportBundleTarget] = []
+        entries: list[tuple[str, Iterator[bytes]]] = []
+        for profile in profiles:
+            mapped = self._map_profile(profile, source, source_errors)
+            file_name = self._mapped_file_name_for(batch=batch, profile=profile)
+            download_ready = len(mapped.validation_errors) == 0
+            targets.append(
+                AccountingMappedExportBundleTarget(
+                    accounting_profile_id=profile.id,
+                    accounting_profile_code=profile.code,
+                    accounting_profile_name=profile.name,
+                    target_system=profile.target_system,
+                    file_name=file_name,
+                    content_hash=mapped.content_hash(),
+                    row_count=mapped.row_count,
+                    download_ready=download_ready,
+                    validation_errors=mapped.validation_errors,
+                )
             )
-        return AccountingMappedExportDownloadResult(
-            file_name=preview.file_name,
-            content=self._to_csv(preview.rows),
+            if download_ready:
+                entries.append(
+                    (file_name, iter_csv_chunks(MAPPED_EXPORT_CSV_COLUMNS, mapped.iter_rows()))
+                )
+
+        manifest = AccountingMappedExportBundleManifest(
+            source_batch_id=batch.id,
+            source_export_profile=FinanceExportProfile(batch.export_profile),
+            source_batch_content_hash=batch.content_hash,
+            generated_at=utc_now(),
+            target_count=len(targets),
+            ready_count=len(entries),
+            targets=targets,
+        )
+        manifest_entry = (
+            BUNDLE_MANIFEST_FILE_NAME,
+            iter([manifest.model_dump_json(indent=2).encode("utf-8")]),
+        )
+        return ZipStream(
+            file_name=(
+                f"greenlink-mapped-bundle-{batch.date_from.isoformat()}"
+                f"-to-{batch.date_to.isoformat()}.zip"
+            ),
+            chunks=iter_zip_chunks([manifest_entry, *entries]),
         )
 
     def export_mapped_batch(
@@ -261,7 +314,28 @@ class AccountingProfileMappingService:
         profile_id: uuid.UUID,
         exported_by_person_id: uuid.UUID,
         context: EmissionContext | None = None,
-    ) -> AccountingMappedExportDownloadResult:
+    ) -> CsvStream:
+        prepared = self.prepare_mapped_export(
+            club_id=club_id, batch_id=batch_id, profile_id=profile_id
+        )
+        self.record_mapped_export(
+            prepared, exported_by_person_id=exported_by_person_id, context=context
+        )
+        return self.render_mapped_export(prepared)
+
+    def prepare_mapped_export(
+        self,
+        *,
+        club_id: uuid.UUID,
+        batch_id: uuid.UUID,
+        profile_id: uuid.UUID,
+    ) -> PreparedMappedExport:
+        """Map and validate the batch for ``profile_id`` without recording an export.
+
+        Callers that persist the file themselves write it between this and
+        :meth:`record_mapped_export`, so an export is only recorded once its
+        file exists.
+        """
         batch = self.batch_service.get_batch(club_id=club_id, batch_id=batch_id)
         if batch.status == FinanceExportBatchStatus.VOID:
             raise AppError(
@@ -270,18 +344,10 @@ class AccountingProfileMappingService:
                 status_code=409,
             )
 
-        profile = self.get_profile(club_id=club_id, profile_id=profile_id)
-        preview = self.build_mapped_export_preview(
-            club_id=club_id,
-            batch_id=batch_id,
-            profile_id=profile_id,
+        batch, profile, mapped = self._build_mapped_export(
+            club_id=club_id, batch_id=batch_id, profile_id=profile_id
         )
-        if preview.validation_errors:
-            raise AppError(
-                code="accounting_export_validation_failed",
-                message=self._validation_failure_message(preview.validation_errors),
-                status_code=422,
-            )
+        self._raise_for_validation_errors(mapped.validation_errors)
         reconciliation = self.batch_service.get_batch_reconciliation(
             club_id=club_id,
             batch_id=batch_id,
@@ -295,7 +361,27 @@ class AccountingProfileMappingService:
                 ),
                 status_code=409,
             )
+        return PreparedMappedExport(
+            batch=batch,
+            profile=profile,
+            mapped=mapped,
+            file_name=self._mapped_file_name_for(batch=batch, profile=profile),
+        )
+
+    def render_mapped_export(self, prepared: PreparedMappedExport) -> CsvStream:
+        return self._to_csv_stream(file_name=prepared.file_name, mapped=prepared.mapped)
 
+    def record_mapped_export(
+        self,
+        prepared: PreparedMappedExport,
+        *,
+        exported_by_person_id: uuid.UUID,
+        context: EmissionContext | None = None,
+    ) -> str:
+        """Append the export event to the batch and commit; returns the content hash."""
+        batch, profile, mapped = prepared.batch, prepared.profile, prepared.mapped
+        file_name = prepared.file_name
+        content_hash = mapped.content_hash()
         metadata = dict(batch.metadata_json or {})
         export_events = list(metadata.get("export_events") or [])
         export_events.append(
@@ -306,10 +392,10 @@ class AccountingProfileMappingService:
                 "accounting_profile_code": profile.code,
                 "accounting_profile_name": profile.name,
                 "target_system": profile.target_system,
-                "mapped_file_name": preview.file_name,
-                "mapped_content_hash": preview.content_hash,
-                "mapped_row_count": preview.row_count,
-                "output_mode": preview.metadata_json.get("output_mode"),
+                "mapped_file_name": file_name,
+                "mapped_content_hash": content_hash,
+                "mapped_row_count": mapped.row_count,
+                "output_mode": self._output_mode(profile.target_system),
             }
         )
         metadata["export_events"] = export_events
@@ -328,44 +414,114 @@ class AccountingProfileMappingService:
                 "actor_person_id": str(exported_by_person_id),
             },
             context=context,
-            club_id=club_id,
+            club_id=batch.club_id,
             actor_person_id=exported_by_person_id,
             before={"status": previous_status},
             after={
                 "status": FinanceExportBatchStatus.EXPORTED.value,
-                "mapped_file_name": preview.file_name,
-                "mapped_content_hash": preview.content_hash,
+                "mapped_file_name": file_name,
+                "mapped_content_hash": content_hash,
             },
         )
         self.db.commit()
+        return content_hash
 
-        return AccountingMappedExportDownloadResult(
-            file_name=preview.file_name,
-            content=self._to_csv(preview.rows),
-        )
+    def _build_mapped_export(
+        self,
+        *,
+        club_id: uuid.UUID,
+        batch_id: uuid.UUID,
+        profile_id: uuid.UUID,
+    ) -> tuple[FinanceExportBatch, AccountingExportProfile, MappedExportColumns]:
+        batch = self.batch_service.get_batch(club_id=club_id, batch_id=batch_id)
+        profile = self.get_profile(club_id=club_id, profile_id=profile_id)
+        if not profile.is_active:
+            raise AppError(
+                code="accounting_export_profile_inactive",
+                message="Only active accounting export profiles may be applied",
+                status_code=400,
+            )
+        source, source_errors = self._read_source(batch)
+        return batch, profile, self._map_profile(profile, source, source_errors)
 
-    def _build_validated_mapped_rows(
+    def _bundle_profiles(
         self,
         *,
-        batch,
+        club_id: uuid.UUID,
+        profile_ids: list[uuid.UUID] | None,
+    ) -> list[AccountingExportProfile]:
+        # Explicitly requested profiles are rendered whether or not they are the
+        # club's active posting profile: a bundle is a read-only download and
+        # records no export event against the batch.
+        if profile_ids:
+            return [
+                self.get_profile(club_id=club_id, profile_id=profile_id)
+                for profile_id in dict.fromkeys(profile_ids)
+            ]
+        profiles = list(
+            self.db.scalars(
+                select(AccountingExportProfile)
+                .where(
+                    AccountingExportProfile.club_id == club_id,
+                    AccountingExportProfile.is_active.is_(True),
+                )
+                .order_by(AccountingExportProfile.code.asc())
+            ).all()
+        )
+        if not profiles:
+            raise AppError(
+                code="accounting_export_profile_missing",
+                message="No active accounting export profile is configured for this club",
+                status_code=400,
+            )
+        return profiles
+
+    def _read_source(
+        self,
+        batch: FinanceExportBatch,
+    ) -> tuple[dict[str, list[Any]], list[AccountingMappedExportValidationError]]:
+        source = read_source_columns(self.batch_service.iter_payload_records(batch))
+        if source is None:
+            return self._validate_source_records(batch)
+        return source, []
+
+    def _map_profile(
+        self,
         profile: AccountingExportProfile,
-    ) -> tuple[list[AccountingMappedExportPreviewRow], list[AccountingMappedExportValidationError]]:
-        validation_errors: list[AccountingMappedExportValidationError] = []
+        source: dict[str, list[Any]],
+        source_errors: list[AccountingMappedExportValidationError],
+    ) -> MappedExportColumns:
         try:
             config = AccountingExportProfileMappingConfig.model_validate(
                 profile.mapping_config_json
             )
         except ValidationError as exc:
-            return [], self._collect_model_validation_errors(
-                exc,
-                code="accounting_export_profile_invalid",
-                message_prefix="Profile mapping config is invalid",
+            return MappedExportColumns.rejected(
+                self._collect_model_validation_errors(
+                    exc,
+                    code="accounting_export_profile_invalid",
+                    message_prefix="Profile mapping config is invalid",
+                )
             )
+        if source_errors:
+            return MappedExportColumns.rejected(source_errors)
 
-        canonical_rows: list[FinanceExportBatchPreviewRow] = []
-        for row_index, row in enumerate(batch.payload_json, start=1):
+        mapping = compile_profile_mapping(config, target_system=profile.target_system)
+        return map_columns(source, mapping)
+
+    def _validate_source_records(
+        self,
+        batch: FinanceExportBatch,
+    ) -> tuple[dict[str, list[Any]], list[AccountingMappedExportValidationError]]:
+        # Slow path, only taken when the fast column read finds a malformed record:
+        # validate row by row so each problem is reported against its row.
+        validation_errors: list[AccountingMappedExportValidationError] = []
+        canonical_rows: list[dict[str, Any]] = []
+        for row_index, row in enumerate(self.batch_service.iter_payload_records(batch), start=1):
             try:
-                canonical_rows.append(FinanceExportBatchPreviewRow.model_validate(row))
+                canonical_rows.append(
+                    FinanceExportBatchPreviewRow.model_validate(row).model_dump(mode="json")
+                )
             except ValidationError as exc:
                 validation_errors.extend(
                     self._collect_model_validation_errors(
@@ -376,17 +532,10 @@ class AccountingProfileMappingService:
                     )
                 )
         if validation_errors:
-            return [], validation_errors
-
-        mapped_rows = self._map_rows(canonical_rows=canonical_rows, config=config)
-        validation_errors.extend(self._validate_mapped_rows(mapped_rows=mapped_rows, config=config))
-        validation_errors.extend(
-            self._validate_target_system_rows(
-                target_system=profile.target_system,
-                mapped_rows=mapped_rows,
-            )
-        )
-        return mapped_rows, validation_errors
+            return {}, validation_errors
+        source = read_source_columns(canonical_rows)
+        assert source is not None
+        return source, []
 
     def _to_profile_response(
         self, profile: AccountingExportProfile
@@ -406,219 +555,6 @@ class AccountingProfileMappingService:
             updated_at=profile.updated_at,
         )
 
-    def _map_rows(
-        self,
-        *,
-        canonical_rows: list[FinanceExportBatchPreviewRow],
-        config: AccountingExportProfileMappingConfig,
-    ) -> list[AccountingMappedExportPreviewRow]:
-        rows: list[AccountingMappedExportPreviewRow] = []
-        for row in canonical_rows:
-            transaction_type = FinanceTransactionType(row.transaction_type)
-            mapping = config.transaction_mappings[transaction_type]
-            reference_token = row.reference_id or row.transaction_id
-            description = f"{mapping.description_prefix} {row.description}".strip()
-            rows.append(
-                AccountingMappedExportPreviewRow(
-                    date=row.entry_date,
-                    reference=f"{config.reference_prefix}-{reference_token}",
-                    description=description,
-                    debit_account_code=mapping.debit_account_code,
-                    credit_account_code=mapping.credit_account_code,
-                    amount=self._decimal_string(abs(Decimal(row.amount))),
-                    customer_account_code=row.account_customer_code
-                    or config.fallback_customer_code,
-                    source_type=row.source,
-                )
-            )
-        return rows
-
-    def _validate_mapped_rows(
-        self,
-        *,
-        mapped_rows: list[AccountingMappedExportPreviewRow],
-        config: AccountingExportProfileMappingConfig,
-    ) -> list[AccountingMappedExportValidationError]:
-        validation_errors: list[AccountingMappedExportValidationError] = []
-        reference_prefix = f"{config.reference_prefix}-"
-        for row_index, row in enumerate(mapped_rows, start=1):
-            if not row.reference.strip():
-                validation_errors.append(
-                    self._validation_error(
-                        code="accounting_export_reference_missing",
-                        message=f"Mapped row {row_index} is missing a reference",
-                        row_index=row_index,
-                        field="reference",
-                    )
-                )
-            elif not row.reference.startswith(reference_prefix):
-                validation_errors.append(
-                    self._validation_error(
-                        code="accounting_export_reference_prefix_invalid",
-                        message=(
-                            f"Mapped row {row_index} reference must start with '{reference_prefix}'"
-                        ),
-                        row_index=row_index,
-                        field="reference",
-                    )
-                )
-
-            if not row.description.strip():
-                validation_errors.append(
-                    self._validation_error(
-                        code="accounting_export_description_missing",
-                        message=f"Mapped row {row_index} is missing a description",
-                        row_index=row_index,
-                        field="description",
-                    )
-                )
-
-            for field_name, value in (
-                ("debit_account_code", row.debit_account_code),
-                ("credit_account_code", row.credit_account_code),
-                ("customer_account_code", row.customer_account_code),
-            ):
-                if value.strip():
-                    continue
-                validation_errors.append(
-                    self._validation_error(
-                        code=f"accounting_export_{field_name}_missing",
-                        message=f"Mapped row {row_index} is missing {field_name.replace('_', ' ')}",
-                        row_index=row_index,
-                        field=field_name,
-                    )
-                )
-
-            try:
-                amount = Decimal(row.amount)
-            except InvalidOperation:
-                validation_errors.append(
-                    self._validation_error(
-                        code="accounting_export_amount_invalid",
-                        message=f"Mapped row {row_index} amount is not a valid decimal",
-                        row_index=row_index,
-                        field="amount",
-                    )
-                )
-            else:
-                if amount <= 0:
-                    validation_errors.append(
-                        self._validation_error(
-                            code="accounting_export_amount_non_positive",
-                            message=f"Mapped row {row_index} amount must be positive",
-                            row_index=row_index,
-                            field="amount",
-                        )
-                    )
-                elif amount.quantize(Decimal("0.01")) != amount:
-                    validation_errors.append(
-                        self._validation_error(
-                            code="accounting_export_amount_precision_invalid",
-                            message=f"Mapped row {row_index} amount must use two decimal places",
-                            row_index=row_index,
-                            field="amount",
-                        )
-                    )
-
-            try:
-                FinanceTransactionSource(row.source_type)
-            except ValueError:
-                validation_errors.append(
-                    self._validation_error(
-                        code="accounting_export_source_type_invalid",
-                        message=f"Mapped row {row_index} source type is not recognized",
-                        row_index=row_index,
-                        field="source_type",
-                    )
-                )
-
-        return validation_errors
-
-    def _validate_target_system_rows(
-        self,
-        *,
-        target_system: str,
-        mapped_rows: list[AccountingMappedExportPreviewRow],
-    ) -> list[AccountingMappedExportValidationError]:
-        validation_errors: list[AccountingMappedExportValidationError] = []
-
-        if target_system == "pastel_like":
-            for row_index, row in enumerate(mapped_rows, start=1):
-                if len(row.reference) > 20:
-                    validation_errors.append(
-                        self._validation_error(
-                            code="accounting_export_pastel_reference_too_long",
-                            message=(
-                                f"Mapped row {row_index} reference exceeds "
-                                "the Pastel-like 20 character limit"
-                            ),
-                            row_index=row_index,
-                            field="reference",
-                        )
-                    )
-                for field_name, value in (
-                    ("debit_account_code", row.debit_account_code),
-                    ("credit_account_code", row.credit_account_code),
-                    ("customer_account_code", row.customer_account_code),
-                ):
-                    if len(value) > 12:
-                        validation_errors.append(
-                            self._validation_error(
-                                code=f"accounting_export_pastel_{field_name}_too_long",
-                                message=(
-                                    f"Mapped row {row_index} {field_name.replace('_', ' ')} "
-                                    "exceeds the Pastel-like 12 character limit"
-                                ),
-                                row_index=row_index,
-                                field=field_name,
-                            )
-                        )
-
-        elif target_system == "sage_like":
-            for row_index, row in enumerate(mapped_rows, start=1):
-                if len(row.description) > 60:
-                    validation_errors.append(
-                        self._validation_error(
-                            code="accounting_export_sage_description_too_long",
-                            message=(
-                                f"Mapped row {row_index} description exceeds "
-                                "the Sage-like 60 character limit"
-                            ),
-                            row_index=row_index,
-                            field="description",
-                        )
-                    )
-                if len(row.reference) > 30:
-                    validation_errors.append(
-                        self._validation_error(
-                            code="accounting_export_sage_reference_too_long",
-                            message=(
-                                f"Mapped row {row_index} reference exceeds "
-                                "the Sage-like 30 character limit"
-                            ),
-                            row_index=row_index,
-                            field="reference",
-                        )
-                    )
-                for field_name, value in (
-                    ("debit_account_code", row.debit_account_code),
-                    ("credit_account_code", row.credit_account_code),
-                ):
-                    if value != value.upper():
-                        validation_errors.append(
-                            self._validation_error(
-                                code=f"accounting_export_sage_{field_name}_case_invalid",
-                                message=(
-                                    f"Mapped row {row_index} {field_name.replace('_', ' ')} "
-                                    "must be uppercase for Sage-like exports"
-                                ),
-                                row_index=row_index,
-                                field=field_name,
-                            )
-                        )
-
-        return validation_errors
-
     def _collect_model_validation_errors(
         self,
         exc: ValidationError,
@@ -669,43 +605,22 @@ class AccountingProfileMappingService:
             top_messages = f"{top_messages}, plus {len(validation_errors) - 3} more"
         return f"Mapped export validation failed: {top_messages}"
 
-    def _content_hash(self, rows: list[AccountingMappedExportPreviewRow]) -> str:
-        canonical = json.dumps(
-            [row.model_dump(mode="json") for row in rows],
-            sort_keys=True,
-            separators=(",", ":"),
-        )
-        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    def _raise_for_validation_errors(
+        self,
+        validation_errors: list[AccountingMappedExportValidationError],
+    ) -> None:
+        if validation_errors:
+            raise AppError(
+                code="accounting_export_validation_failed",
+                message=self._validation_failure_message(validation_errors),
+                status_code=422,
+            )
 
-    def _to_csv(self, rows: list[AccountingMappedExportPreviewRow]) -> str:
-        output = io.StringIO()
-        writer = csv.writer(output, lineterminator="\n")
-        writer.writerow(
-            [
-                "date",
-                "reference",
-                "description",
-                "debit_account_code",
-                "credit_account_code",
-                "amount",
-                "customer_account_code",
-                "source_type",
-            ]
+    def _to_csv_stream(self, *, file_name: str, mapped: MappedExportColumns) -> CsvStream:
+        return CsvStream(
+            file_name=file_name,
+            chunks=iter_csv_chunks(MAPPED_EXPORT_CSV_COLUMNS, mapped.iter_rows()),
         )
-        for row in rows:
-            writer.writerow(
-                [
-                    row.date,
-                    row.reference,
-                    row.description,
-                    row.debit_account_code,
-                    row.credit_account_code,
-                    row.amount,
-                    row.customer_account_code,
-                    row.source_type,
-                ]
-            )
-        return output.getvalue()
 
     def _normalize_code(self, value: str) -> str:
         collapsed = re.sub(r"[^a-z0-9]+", "_", value.strip().lower()).strip("_")
@@ -740,6 +655,19 @@ class AccountingProfileMappingService:
     ) -> str:
         return f"greenlink-{target_system}_mapped-{profile_code}-{date_from}-to-{date_to}.csv"
 
+    def _mapped_file_name_for(
+        self,
+        *,
+        batch: FinanceExportBatch,
+        profile: AccountingExportProfile,
+    ) -> str:
+        return self._mapped_file_name(
+            target_system=profile.target_system,
+            profile_code=profile.code,
+            date_from=batch.date_from.isoformat(),
+            date_to=batch.date_to.isoformat(),
+        )
+
     def _column_order(self, target_system: str) -> list[str]:
         if target_system == "pastel_like":
             return [
@@ -774,9 +702,6 @@ class AccountingProfileMappingService:
             "source_type",
         ]
 
-    def _decimal_string(self, value: Decimal) -> str:
-        return f"{value.quantize(Decimal('0.01'))}"
-
     def _deactivate_other_profiles(
         self,
         *,
@@ -0,0 +1,167 @@
+"""Per-club set of people whose finance accounts are in arrears, shared in Redis.
+
+Blocking is opt-in per club (``club_configs.arrears_block_enabled``). For those
+clubs booking creation only needs to know whether the primary participant is
+blocked, so the aged-debt aggregation is done once per club and kept as a Redis
+set every worker reads. Postings made through ``LedgerService`` refresh just
+the accounts they touched in that shared set; the TTL covers debt that ages
+past the cut-off without any new posting. A Redis outage degrades to checking
+the one person against the ledger.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from functools import lru_cache
+
+import redis
+from sqlalchemy import ColumnElement, and_, func, select
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.core.datetime import utc_now
+from app.models import AccountCustomer, ClubConfig, FinanceAccount, FinanceTransaction
+
+_KEY_PREFIX = "arrears"
+
+_log = logging.getLogger(__name__)
+
+
+@lru_cache
+def get_arrears_redis() -> redis.Redis:
+    return redis.from_url(get_settings().redis_url, decode_responses=True)
+
+
+class ArrearsBlockService:
+    def __init__(self, db: Session, *, client: redis.Redis | None = None) -> None:
+        self.db = db
+        self.client = client or get_arrears_redis()
+        settings = get_settings()
+        self.threshold = settings.arrears_block_threshold
+        self.min_age = timedelta(days=settings.arrears_block_min_age_days)
+        self.ttl_seconds = settings.arrears_block_cache_ttl_seconds
+
+    def is_blocked(self, *, club_id: uuid.UUID, person_id: uuid.UUID) -> bool:
+        enabled = self.db.scalar(
+            select(ClubConfig.arrears_block_enabled).where(ClubConfig.club_id == club_id)
+        )
+        if not enabled:
+            return False
+        try:
+            with self.client.pipeline(transaction=False) as pipeline:
+                pipeline.exists(self._loaded_key(club_id))
+                pipeline.sismember(self._blocked_key(club_id), str(person_id))
+                loaded, blocked = pipeline.execute()
+        except redis.RedisError:
+            _log.warning("Arrears set read failed; checking the ledger directly", exc_info=True)
+            return bool(
+                self._aged_outstanding_rows(
+                    club_id=club_id,
+                    now=utc_now(),
+                    extra_filter=AccountCustomer.person_id == person_id,
+                    blocked_only=True,
+                )
+            )
+        if loaded:
+            return bool(blocked)
+        return person_id in self._load_club(club_id)
+
+    def refresh_accounts(self, *, club_id: uuid.UUID, account_ids: list[uuid.UUID]) -> None:
+        if not account_ids:
+            return
+        try:
+            loaded = self.client.exists(self._loaded_key(club_id))
+        except redis.RedisError:
+            _log.warning("Arrears set read failed; skipping refresh", exc_info=True)
+            return
+        if not loaded:
+            # Nothing cached yet (or blocking is off); the next read loads the whole club.
+            return
+        rows = self._aged_outstanding_rows(
+            club_id=club_id,
+            now=utc_now(),
+            extra_filter=FinanceAccount.id.in_(account_ids),
+            blocked_only=False,
+        )
+        blocked_key = self._blocked_key(club_id)
+        try:
+            with self.client.pipeline(transaction=True) as pipeline:
+                for person_id, aged_outstanding in rows:
+                    if aged_outstanding > self.threshold:
+                        pipeline.sadd(blocked_key, str(person_id))
+                    else:
+                        pipeline.srem(blocked_key, str(person_id))
+                pipeline.execute()
+        except redis.RedisError:
+            _log.warning("Arrears set refresh failed", exc_info=True)
+
+    def invalidate(self, club_id: uuid.UUID) -> None:
+        try:
+            self.client.delete(self._loaded_key(club_id), self._blocked_key(club_id))
+        except redis.RedisError:
+            _log.warning("Arrears set invalidation failed", exc_info=True)
+
+    def _load_club(self, club_id: uuid.UUID) -> set[uuid.UUID]:
+        rows = self._aged_outstanding_rows(club_id=club_id, now=utc_now(), blocked_only=True)
+        blocked_person_ids = {person_id for person_id, _ in rows}
+        blocked_key = self._blocked_key(club_id)
+        try:
+            # The set vanishes when empty, so a separate marker records the load.
+            with self.client.pipeline(transaction=True) as pipeline:
+                pipeline.delete(blocked_key)
+                if blocked_person_ids:
+                    pipeline.sadd(blocked_key, *map(str, blocked_person_ids))
+                    pipeline.expire(blocked_key, self.ttl_seconds)
+                pipeline.set(self._loaded_key(club_id), "1", ex=self.ttl_seconds)
+                pipeline.execute()
+        except redis.RedisError:
+            _log.warning("Arrears set write failed", exc_info=True)
+        return blocked_person_ids
+
+    def _blocked_key(self, club_id: uuid.UUID) -> str:
+        return f"{_KEY_PREFIX}:{club_id}:blocked"
+
+    def _loaded_key(self, club_id: uuid.UUID) -> str:
+        return f"{_KEY_PREFIX}:{club_id}:loaded"
+
+    def _aged_outstanding_rows(
+        self,
+        *,
+        club_id: uuid.UUID,
+        now: datetime,
+        blocked_only: bool,
+        extra_filter: ColumnElement[bool] | None = None,
+    ) -> list[tuple[uuid.UUID, Decimal]]:
+        # Debt older than the cut-off, less anything paid or credited since. Charges
+        # posted after the cut-off are not yet overdue and never count.
+        cutoff = now - self.min_age
+        amount = FinanceTransaction.amount
+        aged_outstanding = -(
+            func.coalesce(func.sum(amount).filter(FinanceTransaction.created_at <= cutoff), 0)
+            + func.coalesce(
+                func.sum(amount).filter(and_(FinanceTransaction.created_at > cutoff, amount > 0)),
+                0,
+            )
+        )
+        statement = (
+            select(AccountCustomer.person_id, aged_outstanding)
+            .select_from(FinanceAccount)
+            .join(AccountCustomer, AccountCustomer.id == FinanceAccount.account_customer_id)
+            .outerjoin(
+                FinanceTransaction,
+                and_(
+                    FinanceTransaction.account_id == FinanceAccount.id,
+                    FinanceTransaction.club_id == club_id,
+                ),
+            )
+            .where(FinanceAccount.club_id == club_id)
+            .group_by(AccountCustomer.person_id)
+        )
+        if extra_filter is not None:
+            statement = statement.where(extra_filter)
+        if blocked_only:
+            statement = statement.having(aged_outstanding > self.threshold)
+        return [(person_id, Decimal(value)) for person_id, value in self.db.execute(statement)]
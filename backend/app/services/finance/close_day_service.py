@@ -0,0 +1,356 @@
+"""Unattended close-day run: daily export batch plus mapped exports per club.
+
+Each club is processed on its own worker thread with its own session, so one
+club's failure or slow export never holds up the rest. Every step is
+idempotent per (club, business date, accounting profile): the canonical batch
+comes from ``generate_or_get_existing`` and a profile already recorded in the
+batch's ``export_events`` is skipped, so the run can be repeated on a timer.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.datetime import utc_now
+from app.core.exceptions import AppError
+from app.events.emission_context import EmissionContext
+from app.models import (
+    AccountingExportProfile,
+    Club,
+    ClubConfig,
+    FinanceExportProfile,
+    PlatformState,
+    User,
+)
+from app.schemas.finance import (
+    FinanceCloseDayClubResult,
+    FinanceCloseDayProfileResult,
+    FinanceCloseDayRunReport,
+    FinanceExportBatchCreateRequest,
+    FinanceExportBatchExportEventResponse,
+)
+from app.services.finance.accounting_profile_mapping_service import (
+    AccountingProfileMappingService,
+)
+from app.services.finance.export_batch_service import FinanceExportBatchService
+from app.storage.object_storage import build_object_storage_client
+
+_log = logging.getLogger(__name__)
+
+CLOSE_DAY_DEFAULT_WORKERS = 4
+CLOSE_DAY_SOURCE_CHANNEL = "close_day_scheduler"
+
+
+class FinanceCloseDayService:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        max_workers: int = CLOSE_DAY_DEFAULT_WORKERS,
+    ) -> None:
+        self.session_factory = session_factory
+        self.max_workers = max_workers
+        self.storage = build_object_storage_client()
+
+    def run(
+        self,
+        *,
+        actor_email: str | None = None,
+        business_date: date | None = None,
+        club_ids: list[uuid.UUID] | None = None,
+        now: datetime | None = None,
+    ) -> FinanceCloseDayRunReport:
+        started_at = utc_now()
+        reference_now = now or started_at
+        with self.session_factory() as db:
+            actor = self._resolve_actor(db, actor_email=actor_email)
+            assert actor.person_id is not None
+            actor_person_id = actor.person_id
+            clubs = self._load_clubs(db, club_ids=club_ids)
+            work = [
+                (
+                    club.id,
+                    club.slug,
+                    business_date
+                    or self._latest_closed_business_date(
+                        club=club,
+                        operating_hours=operating_hours,
+                        now=reference_now,
+                    ),
+                )
+                for club, operating_hours in clubs
+            ]
+        context = EmissionContext(
+            actor_user_id=actor.id,
+            source_channel=CLOSE_DAY_SOURCE_CHANNEL,
+            correlation_id=f"close-day-{started_at:%Y%m%dT%H%M%SZ}",
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="close-day",
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._close_club_day,
+                    club_id=club_id,
+                    club_slug=club_slug,
+                    business_date=club_business_date,
+                    actor_person_id=actor_person_id,
+                    context=context,
+                )
+                for club_id, club_slug, club_business_date in work
+            ]
+            results = [future.result() for future in futures]
+
+        return FinanceCloseDayRunReport(
+            started_at=started_at,
+            finished_at=utc_now(),
+            club_count=len(results),
+            completed_count=sum(1 for result in results if result.status == "completed"),
+            no_transaction_count=sum(1 for result in results if result.status == "no_transactions"),
+            failed_count=sum(1 for result in results if result.status == "failed"),
+            clubs=results,
+        )
+
+    def _close_club_day(
+        self,
+        *,
+        club_id: uuid.UUID,
+        club_slug: str,
+        business_date: date,
+        actor_person_id: uuid.UUID,
+        context: EmissionContext,
+    ) -> FinanceCloseDayClubResult:
+        result = FinanceCloseDayClubResult(
+            club_id=club_id,
+            club_slug=club_slug,
+            business_date=business_date,
+            status="completed",
+        )
+        with self.session_factory() as db:
+            try:
+                created = FinanceExportBatchService(db).generate_or_get_existing(
+                    club_id=club_id,
+                    created_by_person_id=actor_person_id,
+                    payload=FinanceExportBatchCreateRequest(
+                        export_profile=FinanceExportProfile.JOURNAL_BASIC,
+                        date_from=business_date,
+                        date_to=business_date,
+                    ),
+                    context=context,
+                )
+            except AppError as exc:
+                db.rollback()
+                result.status = (
+                    "no_transactions" if exc.code == "finance_export_empty" else "failed"
+                )
+                result.error_code = exc.code
+                result.error_message = exc.message
+                return result
+            except Exception as exc:
+                db.rollback()
+                _log.exception("close-day batch failed for club %s on %s", club_id, business_date)
+                result.status = "failed"
+                result.error_code = "close_day_unexpected_error"
+                result.error_message = str(exc)
+                return result
+
+            result.batch_id = created.batch.id
+            result.batch_created = created.created
+            try:
+                self._export_profiles(
+                    db,
+                    result=result,
+                    club_id=club_id,
+                    business_date=business_date,
+                    export_events=created.batch.metadata_json.export_events,
+                    actor_person_id=actor_person_id,
+                    context=context,
+                )
+            except Exception as exc:
+                db.rollback()
+                _log.exception(
+                    "close-day mapped exports failed for club %s on %s", club_id, business_date
+                )
+                result.status = "failed"
+                result.error_code = "close_day_unexpected_error"
+                result.error_message = str(exc)
+        return result
+
+    def _export_profiles(
+        self,
+        db: Session,
+        *,
+        result: FinanceCloseDayClubResult,
+        club_id: uuid.UUID,
+        business_date: date,
+        export_events: list[FinanceExportBatchExportEventResponse],
+        actor_person_id: uuid.UUID,
+        context: EmissionContext,
+    ) -> None:
+        assert result.batch_id is not None
+        previous_exports = {event.accounting_profile_id: event for event in export_events}
+        profiles = db.scalars(
+            select(AccountingExportProfile)
+            .where(
+                AccountingExportProfile.club_id == club_id,
+                AccountingExportProfile.is_active.is_(True),
+            )
+            .order_by(AccountingExportProfile.code.asc())
+        ).all()
+        mapping_service = AccountingProfileMappingService(db)
+        for profile in profiles:
+            profile_result = self._export_profile(
+                db,
+                mapping_service=mapping_service,
+                profile=profile,
+                batch_id=result.batch_id,
+                business_date=business_date,
+                previous_export=previous_exports.get(str(profile.id)),
+                actor_person_id=actor_person_id,
+                context=context,
+            )
+            if profile_result.status == "failed":
+                result.status = "failed"
+            result.profiles.append(profile_result)
+
+    def _export_profile(
+        self,
+        db: Session,
+        *,
+        mapping_service: AccountingProfileMappingService,
+        profile: AccountingExportProfile,
+        batch_id: uuid.UUID,
+        business_date: date,
+        previous_export: FinanceExportBatchExportEventResponse | None,
+        actor_person_id: uuid.UUID,
+        context: EmissionContext,
+    ) -> FinanceCloseDayProfileResult:
+        result = FinanceCloseDayProfileResult(
+            accounting_profile_id=profile.id,
+            accounting_profile_code=profile.code,
+            target_system=profile.target_system,
+            status="exported",
+        )
+        if previous_export is not None:
+            result.status = "already_exported"
+            result.file_name = previous_export.mapped_file_name
+            result.storage_key = self._storage_key(
+                club_id=profile.club_id,
+                business_date=business_date,
+                file_name=previous_export.mapped_file_name,
+            )
+            result.content_hash = previous_export.mapped_content_hash
+            return result
+
+        # The file is written before the export event is recorded: a failed write
+        # leaves the profile unexported, so the next run retries it.
+        try:
+            prepared = mapping_service.prepare_mapped_export(
+                club_id=profile.club_id,
+                batch_id=batch_id,
+                profile_id=profile.id,
+            )
+            content = b"".join(mapping_service.render_mapped_export(prepared).chunks)
+            storage_key = self._storage_key(
+                club_id=profile.club_id,
+                business_date=business_date,
+                file_name=prepared.file_name,
+            )
+            self.storage.put_object(storage_key, content, content_type="text/csv")
+            content_hash = mapping_service.record_mapped_export(
+                prepared,
+                exported_by_person_id=actor_person_id,
+                context=context,
+            )
+        except AppError as exc:
+            db.rollback()
+            result.status = "failed"
+            result.error_code = exc.code
+            result.error_message = exc.message
+            return result
+        except Exception as exc:
+            db.rollback()
+            _log.exception(
+                "close-day mapped export failed for club %s profile %s", profile.club_id, profile.id
+            )
+            result.status = "failed"
+            result.error_code = "close_day_unexpected_error"
+            result.error_message = str(exc)
+            return result
+
+        result.file_name = prepared.file_name
+        result.storage_key = storage_key
+        result.content_hash = content_hash
+        return result
+
+    def _resolve_actor(self, db: Session, *, actor_email: str | None) -> User:
+        if actor_email is not None:
+            actor = db.scalar(select(User).where(User.email == actor_email))
+        else:
+            platform_state = db.get(PlatformState, 1)
+            actor = (
+                db.get(User, platform_state.initialized_by_user_id)
+                if platform_state is not None and platform_state.initialized_by_user_id
+                else None
+            )
+        if actor is None or actor.person_id is None:
+            raise AppError(
+                code="close_day_actor_unresolved",
+                message="Close-day runs need an actor user linked to a person record",
+                status_code=400,
+            )
+        return actor
+
+    def _load_clubs(
+        self,
+        db: Session,
+        *,
+        club_ids: list[uuid.UUID] | None,
+    ) -> list[tuple[Club, dict[str, object]]]:
+        statement = (
+            select(Club, ClubConfig.operating_hours)
+            .outerjoin(ClubConfig, ClubConfig.club_id == Club.id)
+            .where(Club.active.is_(True))
+            .order_by(Club.slug.asc())
+        )
+        if club_ids is not None:
+            statement = statement.where(Club.id.in_(club_ids))
+        return [(club, operating_hours or {}) for club, operating_hours in db.execute(statement)]
+
+    def _latest_closed_business_date(
+        self,
+        *,
+        club: Club,
+        operating_hours: dict[str, object],
+        now: datetime,
+    ) -> date:
+        local_now = now.astimezone(ZoneInfo(club.timezone))
+        today = local_now.date()
+        day_hours = operating_hours.get(today.strftime("%A").lower())
+        close_time = None
+        if isinstance(day_hours, dict) and not day_hours.get("closed"):
+            close_time = self._parse_hhmm(day_hours.get("close"))
+        if close_time is not None and local_now.time() >= close_time:
+            return today
+        return today - timedelta(days=1)
+
+    def _storage_key(self, *, club_id: uuid.UUID, business_date: date, file_name: str) -> str:
+        return f"finance-close-day/{club_id}/{business_date.isoformat()}/{file_name}"
+
+    def _parse_hhmm(self, value: object) -> time | None:
+        if not isinstance(value, str) or ":" not in value:
+            return None
+        hours, minutes = value.split(":", 1)
+        if not hours.isdigit() or not minutes.isdigit():
+            return None
+        return time(hour=int(hours), minute=int(minutes))
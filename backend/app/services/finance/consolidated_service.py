@@ -0,0 +1,448 @@
+"""Finance roll-ups across a management group of clubs.
+
+Each club keeps its own timezone windows: the per-club window boundaries are
+sent to Postgres as a small VALUES list and every aggregate joins against it,
+so revenue, collections, receivables ageing and the cash position for the
+whole group come back from three ``GROUP BY club_id`` statements regardless of
+how many clubs are in the group. Month-to-date KPIs come from the semantic
+layer's daily snapshots, read for each club on a bounded pool of worker
+threads; the group KPIs are assembled from the clubs' summed quantities.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import ColumnElement, DateTime, Uuid, and_, case, column, func, select, values
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.expression import Values
+
+from app.core.exceptions import AppError, NotFoundError
+from app.models import Club, FinanceTenderRecord, FinanceTransaction, FinanceTransactionType
+from app.models.enums import TenderType
+from app.schemas.finance import (
+    FinanceAgedReceivablesBuckets,
+    FinanceConsolidatedCashPosition,
+    FinanceConsolidatedClubSummary,
+    FinanceConsolidatedGroupTotals,
+    FinanceConsolidatedKpi,
+    FinanceConsolidatedPeriodTotals,
+    FinanceConsolidatedSummaryResponse,
+    FinanceSummaryPeriod,
+    FinanceTenderTotal,
+)
+from app.semantic import Metric, get_metric
+from app.semantic._queries import add_quantities
+from app.semantic.snapshots import read_window_quantities
+from app.services._window import TimeWindow
+from app.services.finance.read_model_service import FinanceReadModelService, SummaryWindow
+
+ZERO = Decimal("0.00")
+CONSOLIDATED_MAX_CLUBS = 50
+CONSOLIDATED_DEFAULT_WORKERS = 4
+CONSOLIDATED_KPI_METRICS = (
+    "rounds_played",
+    "revpatt",
+    "revpur",
+    "effective_green_fee",
+    "fnb_per_round",
+)
+_PERIODS = (FinanceSummaryPeriod.DAY, FinanceSummaryPeriod.WEEK, FinanceSummaryPeriod.MONTH)
+_BUCKETS = ("current", "days_30", "days_60", "days_90_plus", "total_outstanding")
+_RECEIVED_TENDERS = (TenderType.CASH, TenderType.CARD)
+
+
+class FinanceConsolidatedReportService:
+    def __init__(
+        self,
+        db: Session,
+        *,
+        session_factory: Callable[[], Session] | None = None,
+        max_workers: int = CONSOLIDATED_DEFAULT_WORKERS,
+    ) -> None:
+        self.db = db
+        self.read_models = FinanceReadModelService(db)
+        self.session_factory = session_factory or sessionmaker(
+            bind=db.get_bind(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+        self.max_workers = max_workers
+
+    def get_consolidated_summary(
+        self,
+        *,
+        club_ids: list[uuid.UUID],
+        reference_datetime: datetime | None = None,
+    ) -> FinanceConsolidatedSummaryResponse:
+        requested = list(dict.fromkeys(club_ids))
+        if not requested:
+            raise AppError(
+                code="finance_consolidation_clubs_required",
+                message="At least one club is required for a consolidated report",
+                status_code=400,
+            )
+        if len(requested) > CONSOLIDATED_MAX_CLUBS:
+            raise AppError(
+                code="finance_consolidation_too_many_clubs",
+                message=f"Consolidated reports are limited to {CONSOLIDATED_MAX_CLUBS} clubs",
+                status_code=400,
+            )
+        clubs = list(
+            self.db.scalars(
+                select(Club).where(Club.id.in_(requested)).order_by(Club.name.asc())
+            ).all()
+        )
+        if len(clubs) != len(requested):
+            raise NotFoundError("Club not found")
+
+        normalized_reference_datetime = (
+            reference_datetime.astimezone(UTC)
+            if reference_datetime is not None
+            else datetime.now(UTC)
+        )
+        windows_by_club: dict[uuid.UUID, dict[FinanceSummaryPeriod, SummaryWindow]] = {}
+        as_of_by_club: dict[uuid.UUID, date] = {}
+        window_rows: list[tuple[object, ...]] = []
+        kpi_windows: list[TimeWindow] = []
+        for club in clubs:
+            zone = ZoneInfo(club.timezone)
+            windows = self.read_models.build_summary_windows(
+                zone=zone,
+                reference_datetime=normalized_reference_datetime,
+            )
+            as_of = normalized_reference_datetime.astimezone(zone).date()
+            day_end_utc = self._local_day_start_utc(as_of + timedelta(days=1), zone)
+            windows_by_club[club.id] = windows
+            as_of_by_club[club.id] = as_of
+            # KPIs stop at the local day: capacity-based ones would otherwise
+            # count the slots of the rest of the month.
+            kpi_windows.append(
+                TimeWindow(
+                    club_id=club.id,
+                    timezone_name=club.timezone,
+                    date_from=windows[FinanceSummaryPeriod.MONTH].start_local_date,
+                    date_to=as_of + timedelta(days=1),
+                    start_utc=windows[FinanceSummaryPeriod.MONTH].start_utc,
+                    end_utc=day_end_utc,
+                )
+            )
+            window_rows.append(
+                (
+                    club.id,
+                    *(
+                        boundary
+                        for period in _PERIODS
+                        for boundary in (windows[period].start_utc, windows[period].end_utc)
+                    ),
+                    min(window.start_utc for window in windows.values()),
+                    max(window.end_utc for window in windows.values()),
+                    day_end_utc,
+                    self._local_day_start_utc(as_of - timedelta(days=29), zone),
+                    self._local_day_start_utc(as_of - timedelta(days=59), zone),
+                    self._local_day_start_utc(as_of - timedelta(days=89), zone),
+                )
+            )
+        club_windows = values(
+            column("club_id", Uuid()),
+            *(
+                column(f"{period.value}_{edge}", DateTime(timezone=True))
+                for period in _PERIODS
+                for edge in ("start", "end")
+            ),
+            column("range_start", DateTime(timezone=True)),
+            column("range_end", DateTime(timezone=True)),
+            column("aging_cutoff", DateTime(timezone=True)),
+            column("current_from", DateTime(timezone=True)),
+            column("days_30_from", DateTime(timezone=True)),
+            column("days_60_from", DateTime(timezone=True)),
+            name="club_windows",
+        ).data(window_rows)
+
+        period_totals = self._period_totals(club_windows)
+        receivables = self._receivables(club_windows)
+        tenders = self._tenders(club_windows)
+        kpi_quantities = self._kpi_quantities(kpi_windows)
+
+        summaries = [
+            FinanceConsolidatedClubSummary(
+                club_id=club.id,
+                club_name=club.name,
+                timezone=club.timezone,
+                as_of=as_of_by_club[club.id],
+                **{
+                    period.value: FinanceConsolidatedPeriodTotals(
+                        period=period,
+                        date_from=windows_by_club[club.id][period].start_local_date,
+                        date_to=windows_by_club[club.id][period].end_local_date,
+                        **period_totals[club.id][period],
+                    )
+                    for period in _PERIODS
+                },
+                receivables=receivables[club.id][0],
+                accounts_in_arrears=receivables[club.id][1],
+                cash_position=self._cash_position(
+                    tenders.get(club.id, {}), account_balance=receivables[club.id][2]
+                ),
+                kpis=self._kpis(kpi_quantities[club.id]),
+            )
+            for club in clubs
+        ]
+        group_tenders: dict[TenderType, tuple[Decimal, int]] = {}
+        group_quantities: dict[str, object] = {}
+        for club in clubs:
+            for tender_type, (amount, count) in tenders.get(club.id, {}).items():
+                group_amount, group_count = group_tenders.get(tender_type, (ZERO, 0))
+                group_tenders[tender_type] = (group_amount + amount, group_count + count)
+            add_quantities(group_quantities, kpi_quantities[club.id])
+        return FinanceConsolidatedSummaryResponse(
+            reference_datetime=normalized_reference_datetime,
+            club_count=len(summaries),
+            totals=FinanceConsolidatedGroupTotals(
+                **{
+                    f"{period.value}_{measure}": sum(
+                        (getattr(getattr(summary, period.value), measure) for summary in summaries),
+                        ZERO,
+                    )
+                    for period in _PERIODS
+                    for measure in ("revenue", "collections")
+                },
+                receivables=FinanceAgedReceivablesBuckets(
+                    **{
+                        bucket: sum(
+                            (getattr(summary.receivables, bucket) for summary in summaries),
+                            ZERO,
+                        )
+                        for bucket in _BUCKETS
+                    }
+                ),
+                accounts_in_arrears=sum(summary.accounts_in_arrears for summary in summaries),
+                cash_position=self._cash_position(
+                    group_tenders,
+                    account_balance=sum(
+                        (summary.cash_position.account_balance for summary in summaries), ZERO
+                    ),
+                ),
+                kpis=self._kpis(group_quantities),
+            ),
+            clubs=summaries,
+        )
+
+    def _period_totals(
+        self,
+        club_windows: Values,
+    ) -> dict[uuid.UUID, dict[FinanceSummaryPeriod, dict[str, object]]]:
+        transaction = FinanceTransaction
+        measures: list[ColumnElement[object]] = []
+        for period in _PERIODS:
+            in_window = and_(
+                transaction.created_at >= club_windows.c[f"{period.value}_start"],
+                transaction.created_at < club_windows.c[f"{period.value}_end"],
+            )
+            is_charge = transaction.type == FinanceTransactionType.CHARGE
+            measures.extend(
+                (
+                    func.coalesce(
+                        func.sum(func.abs(transaction.amount)).filter(is_charge, in_window), ZERO
+                    ),
+                    func.coalesce(
+                        func.sum(transaction.amount).filter(
+                            transaction.type == FinanceTransactionType.PAYMENT, in_window
+                        ),
+                        ZERO,
+                    ),
+                    func.count(transaction.id).filter(is_charge, in_window),
+                    func.count(transaction.id).filter(in_window),
+                )
+            )
+        rows = self.db.execute(
+            select(club_windows.c.club_id, *measures)
+            .select_from(club_windows)
+            .outerjoin(
+                transaction,
+                and_(
+                    transaction.club_id == club_windows.c.club_id,
+                    transaction.created_at >= club_windows.c.range_start,
+                    transaction.created_at < club_windows.c.range_end,
+                ),
+            )
+            .group_by(club_windows.c.club_id)
+        )
+        totals: dict[uuid.UUID, dict[FinanceSummaryPeriod, dict[str, object]]] = {}
+        for club_id, *measured in rows:
+            totals[club_id] = {
+                period: dict(
+                    zip(
+                        ("revenue", "collections", "charge_count", "transaction_count"),
+                        measured[index * 4 : index * 4 + 4],
+                        strict=True,
+                    )
+                )
+                for index, period in enumerate(_PERIODS)
+            }
+        return totals
+
+    def _receivables(
+        self,
+        club_windows: Values,
+    ) -> dict[uuid.UUID, tuple[FinanceAgedReceivablesBuckets, int, Decimal]]:
+        # Same FIFO credit allocation as FinanceReadModelService.get_aged_receivables,
+        # with each club's own as-of cut-off and bucket boundaries joined in. The
+        # net ledger balance for the cash position rides along on the same rows.
+        transaction = FinanceTransaction
+        debit_amount = case((transaction.amount < 0, -transaction.amount), else_=ZERO)
+        credit_amount = case((transaction.amount > 0, transaction.amount), else_=ZERO)
+        allocated = (
+            select(
+                transaction.club_id.label("club_id"),
+                transaction.account_id.label("account_id"),
+                transaction.created_at.label("created_at"),
+                transaction.amount.label("amount"),
+                debit_amount.label("debit_amount"),
+                func.sum(debit_amount)
+                .over(
+                    partition_by=transaction.account_id,
+                    order_by=(transaction.created_at, transaction.id),
+                    rows=(None, 0),
+                )
+                .label("cumulative_debit"),
+                func.sum(credit_amount)
+                .over(partition_by=transaction.account_id)
+                .label("total_credit"),
+            )
+            .join(club_windows, club_windows.c.club_id == transaction.club_id)
+            .where(transaction.created_at < club_windows.c.aging_cutoff)
+            .subquery()
+        )
+        outstanding = func.greatest(
+            ZERO,
+            func.least(
+                allocated.c.debit_amount,
+                allocated.c.cumulative_debit - allocated.c.total_credit,
+            ),
+        )
+
+        def _bucket(*conditions: ColumnElement[bool]) -> ColumnElement[Decimal]:
+            return func.coalesce(func.sum(outstanding).filter(*conditions), ZERO)
+
+        rows = self.db.execute(
+            select(
+                club_windows.c.club_id,
+                _bucket(allocated.c.created_at >= club_windows.c.current_from),
+                _bucket(
+                    allocated.c.created_at >= club_windows.c.days_30_from,
+                    allocated.c.created_at < club_windows.c.current_from,
+                ),
+                _bucket(
+                    allocated.c.created_at >= club_windows.c.days_60_from,
+                    allocated.c.created_at < club_windows.c.days_30_from,
+                ),
+                _bucket(allocated.c.created_at < club_windows.c.days_60_from),
+                func.coalesce(func.sum(outstanding), ZERO),
+                func.count(func.distinct(allocated.c.account_id)).filter(outstanding > 0),
+                func.coalesce(func.sum(allocated.c.amount), ZERO),
+            )
+            .select_from(club_windows)
+            .outerjoin(allocated, allocated.c.club_id == club_windows.c.club_id)
+            .group_by(club_windows.c.club_id)
+        )
+        return {
+            club_id: (
+                FinanceAgedReceivablesBuckets(**dict(zip(_BUCKETS, buckets, strict=True))),
+                accounts_in_arrears,
+                account_balance,
+            )
+            for club_id, *buckets, accounts_in_arrears, account_balance in rows
+        }
+
+    def _tenders(
+        self,
+        club_windows: Values,
+    ) -> dict[uuid.UUID, dict[TenderType, tuple[Decimal, int]]]:
+        tender = FinanceTenderRecord
+        rows = self.db.execute(
+            select(
+                club_windows.c.club_id,
+                tender.tender_type,
+                func.sum(tender.amount),
+                func.count(tender.id),
+            )
+            .select_from(club_windows)
+            .join(
+                tender,
+                and_(
+                    tender.club_id == club_windows.c.club_id,
+                    tender.created_at >= club_windows.c.month_start,
+                    tender.created_at < club_windows.c.aging_cutoff,
+                ),
+            )
+            .group_by(club_windows.c.club_id, tender.tender_type)
+        )
+        tenders: dict[uuid.UUID, dict[TenderType, tuple[Decimal, int]]] = {}
+        for club_id, tender_type, amount, count in rows:
+            tenders.setdefault(club_id, {})[tender_type] = (amount, count)
+        return tenders
+
+    def _kpi_quantities(self, windows: list[TimeWindow]) -> dict[uuid.UUID, dict[str, object]]:
+        metrics = [get_metric(name) for name in CONSOLIDATED_KPI_METRICS]
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(windows)),
+            thread_name_prefix="finance-consolidated",
+        ) as executor:
+            futures = {
+                window.club_id: executor.submit(self._read_quantities, window, metrics)
+                for window in windows
+            }
+            return {club_id: future.result() for club_id, future in futures.items()}
+
+    def _read_quantities(self, window: TimeWindow, metrics: list[Metric]) -> dict[str, object]:
+        with self.session_factory() as db:
+            return read_window_quantities(
+                db, club_id=window.club_id, window=window, metrics=metrics
+            )
+
+    def _cash_position(
+        self,
+        tenders: dict[TenderType, tuple[Decimal, int]],
+        *,
+        account_balance: Decimal,
+    ) -> FinanceConsolidatedCashPosition:
+        totals = [
+            FinanceTenderTotal(
+                tender_type=tender_type,
+                amount=tenders.get(tender_type, (ZERO, 0))[0],
+                count=tenders.get(tender_type, (ZERO, 0))[1],
+            )
+            for tender_type in TenderType
+        ]
+        return FinanceConsolidatedCashPosition(
+            tenders=totals,
+            received=sum(
+                (total.amount for total in totals if total.tender_type in _RECEIVED_TENDERS),
+                ZERO,
+            ),
+            account_balance=account_balance,
+        )
+
+    def _kpis(self, quantities: dict[str, object]) -> list[FinanceConsolidatedKpi]:
+        kpis: list[FinanceConsolidatedKpi] = []
+        for name in CONSOLIDATED_KPI_METRICS:
+            metric = get_metric(name)
+            kpis.append(
+                FinanceConsolidatedKpi(
+                    metric=metric.name,
+                    version=metric.version,
+                    result=metric.assemble(
+                        {key: quantities[key] for key in metric.quantities}
+                    ).model_dump(),
+                )
+            )
+        return kpis
+
+    def _local_day_start_utc(self, local_date: date, zone: ZoneInfo) -> datetime:
+        return datetime.combine(local_date, datetime.min.time(), tzinfo=zone).astimezone(UTC)
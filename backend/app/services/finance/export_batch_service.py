@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-import csv
 import hashlib
-import io
 import json
 import uuid
 from collections import Counter
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, time, timedelta
 from decimal import Decimal
+from itertools import chain, groupby
+from operator import attrgetter, itemgetter
+from typing import Any
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import select
+from sqlalchemy import JSON, Select, String, Uuid, column, select, table, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -32,7 +34,6 @@ from app.schemas.finance import (
     FinanceExportBatchCreateRequest,
     FinanceExportBatchCreateResult,
     FinanceExportBatchDetailResponse,
-    FinanceExportBatchDownloadResult,
     FinanceExportBatchListResponse,
     FinanceExportBatchPreviewRow,
     FinanceExportBatchReconciliationResponse,
@@ -41,6 +42,35 @@ from app.schemas.finance import (
     FinanceExportBatchSummaryResponse,
     FinanceExportBatchVoidResult,
 )
+from app.services._csv import CsvStream, iter_csv_chunks
+from app.storage.ndjson import NDJSON_GZIP_CONTENT_TYPE, encode_ndjson_gz, iter_ndjson_gz
+from app.storage.object_storage import build_object_storage_client
+
+EXPORT_BATCH_CSV_COLUMNS = (
+    "entry_date",
+    "transaction_id",
+    "account_customer_code",
+    "transaction_type",
+    "source",
+    "reference_id",
+    "description",
+    "amount",
+    "debit_amount",
+    "credit_amount",
+)
+RECONCILIATION_SAMPLE_LIMIT = 5
+RECONCILIATION_FETCH_SIZE = 1000
+
+# The inline payload column is no longer mapped on FinanceExportBatch; it only
+# survives on databases migrated from before 202605150001, until 202605220001.
+_INLINE_PAYLOAD_BATCHES = table(
+    "finance_export_batches",
+    column("id", Uuid()),
+    column("club_id", Uuid()),
+    column("content_hash", String()),
+    column("storage_key", String()),
+    column("payload_json", JSON(none_as_null=True)),
+)
 
 
 @dataclass(slots=True)
@@ -49,10 +79,38 @@ class SelectedFinanceTransaction:
     account_customer_code: str | None
 
 
+class _ContentHasher:
+    """Incremental SHA-256 over the canonical JSON array of export rows.
+
+    Feeds the digest the exact bytes ``json.dumps(rows, sort_keys=True,
+    separators=(",", ":"))`` would produce, one row at a time, so hashes stay
+    compatible with batches persisted before hashing was streamed.
+    """
+
+    def __init__(self) -> None:
+        self._digest = hashlib.sha256(b"[")
+        self._separator = b""
+
+    def update(self, row: FinanceExportBatchPreviewRow) -> None:
+        self._digest.update(self._separator)
+        self._digest.update(
+            json.dumps(row.model_dump(mode="json"), sort_keys=True, separators=(",", ":")).encode(
+                "utf-8"
+            )
+        )
+        self._separator = b","
+
+    def hexdigest(self) -> str:
+        digest = self._digest.copy()
+        digest.update(b"]")
+        return digest.hexdigest()
+
+
 class FinanceExportBatchService:
     def __init__(self, db: Session) -> None:
         self.db = db
         self.publisher = DatabaseEventPublisher(db)
+        self.storage = build_object_storage_client()
 
     def generate_or_get_existing(
         self,
@@ -97,6 +155,14 @@ class FinanceExportBatchService:
         total_credits = sum((Decimal(row.credit_amount) for row in rows), Decimal("0.00"))
         source_counts = Counter(row.source for row in rows)
         type_counts = Counter(row.transaction_type for row in rows)
+        # Keys are content-addressed, so a racing generator or a regeneration with
+        # unchanged rows rewrites identical bytes rather than leaving an orphan.
+        storage_key = self._storage_key(club_id=club_id, content_hash=content_hash)
+        self.storage.put_object(
+            storage_key,
+            encode_ndjson_gz(row.model_dump(mode="json") for row in rows),
+            content_type=NDJSON_GZIP_CONTENT_TYPE,
+        )
 
         batch = FinanceExportBatch(
             club_id=club_id,
@@ -120,7 +186,7 @@ class FinanceExportBatchService:
                 "source_counts": dict(sorted(source_counts.items())),
                 "transaction_type_counts": dict(sorted(type_counts.items())),
             },
-            payload_json=[row.model_dump(mode="json") for row in rows],
+            storage_key=storage_key,
         )
         self.db.add(batch)
         try:
@@ -203,14 +269,60 @@ class FinanceExportBatchService:
         *,
         club_id: uuid.UUID,
         batch_id: uuid.UUID,
-    ) -> FinanceExportBatchDownloadResult:
+    ) -> CsvStream:
         batch = self.get_batch(club_id=club_id, batch_id=batch_id)
-        rows = [FinanceExportBatchPreviewRow.model_validate(row) for row in batch.payload_json]
-        return FinanceExportBatchDownloadResult(
+        row_values = itemgetter(*EXPORT_BATCH_CSV_COLUMNS)
+        return CsvStream(
             file_name=batch.file_name,
-            content=self._to_csv(rows),
+            chunks=iter_csv_chunks(
+                EXPORT_BATCH_CSV_COLUMNS,
+                (row_values(row) for row in self.iter_payload_records(batch)),
+            ),
         )
 
+    def iter_payload_records(self, batch: FinanceExportBatch) -> Iterator[dict[str, Any]]:
+        return iter_ndjson_gz(self.storage.iter_object(batch.storage_key))
+
+    def backfill_payload_storage(self) -> int:
+        """Copy payloads still held inline out to object storage, one commit per
+        batch. Returns the number of batches copied."""
+        batches = _INLINE_PAYLOAD_BATCHES
+        batch_ids = self.db.scalars(
+            select(batches.c.id).where(batches.c.storage_key.is_(None))
+        ).all()
+        for batch_id in batch_ids:
+            club_id, content_hash, payload = self.db.execute(
+                select(batches.c.club_id, batches.c.content_hash, batches.c.payload_json).where(
+                    batches.c.id == batch_id
+                )
+            ).one()
+            storage_key = self._storage_key(club_id=club_id, content_hash=content_hash)
+            self.storage.put_object(
+                storage_key,
+                encode_ndjson_gz(payload or []),
+                content_type=NDJSON_GZIP_CONTENT_TYPE,
+            )
+            self.db.execute(
+                update(batches).where(batches.c.id == batch_id).values(storage_key=storage_key)
+            )
+            self.db.commit()
+        return len(batch_ids)
+
+    def restore_inline_payloads(self) -> int:
+        """Reverse of :meth:`backfill_payload_storage` for a downgrade below
+        202605150001: read every stored payload back into the inline column."""
+        batches = _INLINE_PAYLOAD_BATCHES
+        rows = self.db.execute(
+            select(batches.c.id, batches.c.storage_key).where(batches.c.payload_json.is_(None))
+        ).all()
+        for batch_id, storage_key in rows:
+            payload = list(iter_ndjson_gz(self.storage.iter_object(storage_key)))
+            self.db.execute(
+                update(batches).where(batches.c.id == batch_id).values(payload_json=payload)
+            )
+            self.db.commit()
+        return len(rows)
+
     def get_batch_reconciliation(
         self,
         *,
@@ -218,20 +330,60 @@ class FinanceExportBatchService:
         batch_id: uuid.UUID,
     ) -> FinanceExportBatchReconciliationResponse:
         batch = self.get_batch(club_id=club_id, batch_id=batch_id)
-        persisted_rows = [
-            FinanceExportBatchPreviewRow.model_validate(row) for row in batch.payload_json
-        ]
-        selected_transactions, _ = self._select_transactions(
+        statement, _ = self._selection_statement(
             club_id=club_id,
             date_from=batch.date_from,
             date_to=batch.date_to,
         )
-        current_rows = self._build_rows(selected_transactions)
-        persisted_by_id = {row.transaction_id: row for row in persisted_rows}
-        current_by_id = {row.transaction_id: row for row in current_rows}
-        missing_ids = [tx_id for tx_id in persisted_by_id if tx_id not in current_by_id]
-        new_ids = [tx_id for tx_id in current_by_id if tx_id not in persisted_by_id]
-        current_content_hash = self._content_hash(current_rows)
+        persisted_rows = (
+            FinanceExportBatchPreviewRow.model_validate(row)
+            for row in self.iter_payload_records(batch)
+        )
+        current_hasher = _ContentHasher()
+        persisted_count = 0
+        current_count = 0
+        missing_count = 0
+        new_count = 0
+        missing_samples: list[FinanceExportBatchReconciliationSampleRow] = []
+        new_samples: list[FinanceExportBatchReconciliationSampleRow] = []
+
+        def count_persisted(
+            rows: Iterable[FinanceExportBatchPreviewRow],
+        ) -> Iterator[FinanceExportBatchPreviewRow]:
+            nonlocal persisted_count
+            for row in rows:
+                persisted_count += 1
+                yield row
+
+        def hash_current(
+            rows: Iterable[FinanceExportBatchPreviewRow],
+        ) -> Iterator[FinanceExportBatchPreviewRow]:
+            nonlocal current_count
+            for row in rows:
+                current_hasher.update(row)
+                current_count += 1
+                yield row
+
+        current_rows = (
+            self._build_row(transaction, account_customer_code)
+            for transaction, account_customer_code in self.db.execute(
+                statement,
+                execution_options={"yield_per": RECONCILIATION_FETCH_SIZE},
+            )
+        )
+        for persisted, current in self._merge_join(
+            self._order_by_day_and_id(count_persisted(persisted_rows)),
+            self._order_by_day_and_id(hash_current(current_rows)),
+        ):
+            if current is None:
+                missing_count += 1
+                if len(missing_samples) < RECONCILIATION_SAMPLE_LIMIT:
+                    missing_samples.append(self._to_reconciliation_sample(persisted))
+            elif persisted is None:
+                new_count += 1
+                if len(new_samples) < RECONCILIATION_SAMPLE_LIMIT:
+                    new_samples.append(self._to_reconciliation_sample(current))
+        current_content_hash = current_hasher.hexdigest()
 
         return FinanceExportBatchReconciliationResponse(
             batch_id=batch.id,
@@ -240,16 +392,12 @@ class FinanceExportBatchService:
             matches_live_state=batch.content_hash == current_content_hash,
             persisted_content_hash=batch.content_hash,
             current_content_hash=current_content_hash,
-            persisted_transaction_count=len(persisted_rows),
-            current_transaction_count=len(current_rows),
-            missing_transaction_count=len(missing_ids),
-            new_transaction_count=len(new_ids),
-            missing_transactions=[
-                self._to_reconciliation_sample(persisted_by_id[tx_id]) for tx_id in missing_ids[:5]
-            ],
-            new_transactions=[
-                self._to_reconciliation_sample(current_by_id[tx_id]) for tx_id in new_ids[:5]
-            ],
+            persisted_transaction_count=persisted_count,
+            current_transaction_count=current_count,
+            missing_transaction_count=missing_count,
+            new_transaction_count=new_count,
+            missing_transactions=missing_samples,
+            new_transactions=new_samples,
         )
 
     def void_batch(
@@ -397,6 +545,29 @@ class FinanceExportBatchService:
         date_from: date,
         date_to: date,
     ) -> tuple[list[SelectedFinanceTransaction], str]:
+        statement, timezone_name = self._selection_statement(
+            club_id=club_id,
+            date_from=date_from,
+            date_to=date_to,
+        )
+        return (
+            [
+                SelectedFinanceTransaction(
+                    transaction=transaction,
+                    account_customer_code=account_customer_code,
+                )
+                for transaction, account_customer_code in self.db.execute(statement).all()
+            ],
+            timezone_name,
+        )
+
+    def _selection_statement(
+        self,
+        *,
+        club_id: uuid.UUID,
+        date_from: date,
+        date_to: date,
+    ) -> tuple[Select[tuple[FinanceTransaction, str]], str]:
         club = self.db.get(Club, club_id)
         if club is None:
             raise NotFoundError("Club not found")
@@ -407,7 +578,7 @@ class FinanceExportBatchService:
         start_utc = start_local.astimezone(UTC)
         end_utc = end_local.astimezone(UTC)
 
-        rows = self.db.execute(
+        statement = (
             select(FinanceTransaction, AccountCustomer.account_code)
             .join(FinanceAccount, FinanceTransaction.account_id == FinanceAccount.id)
             .join(AccountCustomer, FinanceAccount.account_customer_id == AccountCustomer.id)
@@ -417,54 +588,83 @@ class FinanceExportBatchService:
                 FinanceTransaction.created_at < end_utc,
             )
             .order_by(FinanceTransaction.created_at.asc(), FinanceTransaction.id.asc())
-        ).all()
-
-        return (
-            [
-                SelectedFinanceTransaction(
-                    transaction=transaction,
-                    account_customer_code=account_customer_code,
-                )
-                for transaction, account_customer_code in rows
-            ],
-            club.timezone,
         )
+        return statement, club.timezone
 
     def _build_rows(
         self,
         selected_transactions: list[SelectedFinanceTransaction],
     ) -> list[FinanceExportBatchPreviewRow]:
-        rows: list[FinanceExportBatchPreviewRow] = []
-        for selected in selected_transactions:
-            transaction = selected.transaction
-            amount = Decimal(transaction.amount)
-            debit_amount = abs(amount) if amount < 0 else Decimal("0.00")
-            credit_amount = amount if amount > 0 else Decimal("0.00")
-            rows.append(
-                FinanceExportBatchPreviewRow(
-                    entry_date=transaction.created_at.date().isoformat(),
-                    transaction_id=str(transaction.id),
-                    account_customer_code=selected.account_customer_code,
-                    transaction_type=transaction.type.value,
-                    source=transaction.source.value,
-                    reference_id=str(transaction.reference_id)
-                    if transaction.reference_id
-                    else None,
-                    description=transaction.description,
-                    amount=self._decimal_string(amount),
-                    debit_amount=self._decimal_string(debit_amount),
-                    credit_amount=self._decimal_string(credit_amount),
-                )
-            )
-        return rows
+        return [
+            self._build_row(selected.transaction, selected.account_customer_code)
+            for selected in selected_transactions
+        ]
 
-    def _content_hash(self, rows: list[FinanceExportBatchPreviewRow]) -> str:
-        canonical = json.dumps(
-            [row.model_dump(mode="json") for row in rows],
-            sort_keys=True,
-            separators=(",", ":"),
+    def _build_row(
+        self,
+        transaction: FinanceTransaction,
+        account_customer_code: str | None,
+    ) -> FinanceExportBatchPreviewRow:
+        amount = Decimal(transaction.amount)
+        debit_amount = abs(amount) if amount < 0 else Decimal("0.00")
+        credit_amount = amount if amount > 0 else Decimal("0.00")
+        return FinanceExportBatchPreviewRow(
+            entry_date=transaction.created_at.date().isoformat(),
+            transaction_id=str(transaction.id),
+            account_customer_code=account_customer_code,
+            transaction_type=transaction.type.value,
+            source=transaction.source.value,
+            reference_id=str(transaction.reference_id) if transaction.reference_id else None,
+            description=transaction.description,
+            amount=self._decimal_string(amount),
+            debit_amount=self._decimal_string(debit_amount),
+            credit_amount=self._decimal_string(credit_amount),
         )
-        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _order_by_day_and_id(
+        self,
+        rows: Iterable[FinanceExportBatchPreviewRow],
+    ) -> Iterator[FinanceExportBatchPreviewRow]:
+        # Both sides arrive in (created_at, id) order, so entry dates are already
+        # non-decreasing; re-sorting one day at a time yields (entry_date,
+        # transaction_id) order while buffering at most a single day of rows.
+        return chain.from_iterable(
+            sorted(day_rows, key=attrgetter("transaction_id"))
+            for _, day_rows in groupby(rows, key=attrgetter("entry_date"))
+        )
+
+    def _merge_join(
+        self,
+        persisted_rows: Iterator[FinanceExportBatchPreviewRow],
+        current_rows: Iterator[FinanceExportBatchPreviewRow],
+    ) -> Iterator[tuple[FinanceExportBatchPreviewRow | None, FinanceExportBatchPreviewRow | None]]:
+        def merge_key(row: FinanceExportBatchPreviewRow) -> tuple[str, str]:
+            return row.entry_date, row.transaction_id
+
+        persisted = next(persisted_rows, None)
+        current = next(current_rows, None)
+        while persisted is not None or current is not None:
+            if current is None or (
+                persisted is not None and merge_key(persisted) < merge_key(current)
+            ):
+                yield persisted, None
+                persisted = next(persisted_rows, None)
+            elif persisted is None or merge_key(current) < merge_key(persisted):
+                yield None, current
+                current = next(current_rows, None)
+            else:
+                yield persisted, current
+                persisted = next(persisted_rows, None)
+                current = next(current_rows, None)
+
+    def _content_hash(self, rows: Iterable[FinanceExportBatchPreviewRow]) -> str:
+        hasher = _ContentHasher()
+        for row in rows:
+            hasher.update(row)
+        return hasher.hexdigest()
+
+    def _storage_key(self, *, club_id: uuid.UUID, content_hash: str) -> str:
+        return f"finance-export-batches/{club_id}/{content_hash}.ndjson.gz"
 
     def _file_name(
         self,
@@ -498,42 +698,11 @@ class FinanceExportBatchService:
     def _to_detail(self, batch: FinanceExportBatch) -> FinanceExportBatchDetailResponse:
         return FinanceExportBatchDetailResponse(
             **self._to_summary(batch).model_dump(),
-            rows=[FinanceExportBatchPreviewRow.model_validate(row) for row in batch.payload_json],
-        )
-
-    def _to_csv(self, rows: list[FinanceExportBatchPreviewRow]) -> str:
-        output = io.StringIO()
-        writer = csv.writer(output, lineterminator="\n")
-        writer.writerow(
-            [
-                "entry_date",
-                "transaction_id",
-                "account_customer_code",
-                "transaction_type",
-                "source",
-                "reference_id",
-                "description",
-                "amount",
-                "debit_amount",
-                "credit_amount",
-            ]
+            rows=[
+                FinanceExportBatchPreviewRow.model_validate(row)
+                for row in self.iter_payload_records(batch)
+            ],
         )
-        for row in rows:
-            writer.writerow(
-                [
-                    row.entry_date,
-                    row.transaction_id,
-                    row.account_customer_code or "",
-                    row.transaction_type,
-                    row.source,
-                    row.reference_id or "",
-                    row.description,
-                    row.amount,
-                    row.debit_amount,
-                    row.credit_amount,
-                ]
-            )
-        return output.getvalue()
 
     def _decimal_string(self, value: Decimal) -> str:
         return f"{value.quantize(Decimal('0.01'))}"
@@ -1,32 +1,53 @@
 from __future__ import annotations
 
+import base64
+import json
 import uuid
+from datetime import UTC, date, datetime, time, timedelta
 from decimal import Decimal
+from zoneinfo import ZoneInfo
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, Select, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session, selectinload
 
-from app.core.exceptions import NotFoundError
+from app.core.exceptions import AppError, ConflictError, NotFoundError
 from app.events.emission_context import EmissionContext
-from app.events.publisher import DatabaseEventPublisher
-from app.models import FinanceAccount, FinanceTransaction
+from app.events.publisher import BulkEvent, DatabaseEventPublisher
+from app.models import (
+    AccountCustomer,
+    Club,
+    FinanceAccount,
+    FinanceTransaction,
+    FinanceTransactionSource,
+    FinanceTransactionType,
+)
 from app.schemas.finance import (
+    FinanceAccountBalanceResponse,
     FinanceAccountCustomerSummary,
     FinanceAccountLedgerResponse,
     FinanceAccountSummaryResponse,
     FinanceClubJournalResponse,
     FinanceJournalEntryResponse,
     FinanceLedgerEntryResponse,
+    FinanceTransactionBatchCreateRequest,
+    FinanceTransactionBatchCreateResult,
+    FinanceTransactionBatchItem,
+    FinanceTransactionBatchItemResult,
     FinanceTransactionCreateRequest,
     FinanceTransactionCreateResult,
     FinanceTransactionResponse,
 )
+from app.services.finance.arrears_block_service import ArrearsBlockService
+
+JOURNAL_EXACT_COUNT_LIMIT = 10_000
 
 
 class LedgerService:
     def __init__(self, db: Session) -> None:
         self.db = db
         self.publisher = DatabaseEventPublisher(db)
+        self.arrears_block_service = ArrearsBlockService(db)
 
     def create_transaction(
         self,
@@ -69,12 +90,167 @@ class LedgerService:
         )
         self.db.commit()
         self.db.refresh(transaction)
+        self.arrears_block_service.refresh_accounts(club_id=club_id, account_ids=[account.id])
 
         return FinanceTransactionCreateResult(
             transaction=FinanceTransactionResponse.model_validate(transaction),
             balance=self._compute_balance(club_id=club_id, account_id=account.id),
         )
 
+    def create_transactions_batch(
+        self,
+        *,
+        club_id: uuid.UUID,
+        payload: FinanceTransactionBatchCreateRequest,
+        context: EmissionContext | None = None,
+    ) -> FinanceTransactionBatchCreateResult:
+        account_ids = list(dict.fromkeys(item.account_id for item in payload.items))
+        known_account_ids = set(
+            self.db.scalars(
+                select(FinanceAccount.id).where(
+                    FinanceAccount.club_id == club_id,
+                    FinanceAccount.id.in_(account_ids),
+                )
+            ).all()
+        )
+        missing_account_ids = [
+            account_id for account_id in account_ids if account_id not in known_account_ids
+        ]
+        if missing_account_ids:
+            raise NotFoundError(
+                "Finance account not found: "
+                + ", ".join(str(account_id) for account_id in missing_account_ids)
+            )
+
+        existing = self._load_by_idempotency_keys(
+            club_id=club_id,
+            keys=[item.idempotency_key for item in payload.items],
+        )
+        pending: list[tuple[uuid.UUID, FinanceTransactionBatchItem]] = []
+        for item in payload.items:
+            replayed = existing.get(item.idempotency_key)
+            if replayed is None:
+                pending.append((uuid.uuid4(), item))
+            else:
+                self._assert_replay_matches(item, replayed)
+
+        created: dict[str, FinanceTransactionResponse] = {}
+        if pending:
+            # A concurrent retry of the same run may have claimed some keys since
+            # they were looked up; those rows are skipped here and treated as replays.
+            # Inserting into the table (not the entity) keeps this one multi-row
+            # INSERT ... RETURNING.
+            table = FinanceTransaction.__table__
+            statement = (
+                pg_insert(table)
+                .values(
+                    [
+                        {
+                            "id": transaction_id,
+                            "club_id": club_id,
+                            "account_id": item.account_id,
+                            "amount": item.amount,
+                            "type": item.type,
+                            "source": item.source,
+                            "reference_id": item.reference_id,
+                            "description": item.description,
+                            "idempotency_key": item.idempotency_key,
+                        }
+                        for transaction_id, item in pending
+                    ]
+                )
+                .on_conflict_do_nothing(
+                    index_elements=["club_id", "idempotency_key"],
+                    index_where=table.c.idempotency_key.is_not(None),
+                )
+                .returning(table.c.id, table.c.created_at)
+            )
+            inserted_at = {
+                transaction_id: created_at
+                for transaction_id, created_at in self.db.execute(statement)
+            }
+            lost: list[FinanceTransactionBatchItem] = []
+            for transaction_id, item in pending:
+                created_at = inserted_at.get(transaction_id)
+                if created_at is None:
+                    lost.append(item)
+                    continue
+                created[item.idempotency_key] = FinanceTransactionResponse(
+                    id=transaction_id,
+                    club_id=club_id,
+                    account_id=item.account_id,
+                    amount=item.amount,
+                    type=item.type,
+                    source=item.source,
+                    reference_id=item.reference_id,
+                    description=item.description,
+                    created_at=created_at,
+                )
+            if lost:
+                existing.update(
+                    self._load_by_idempotency_keys(
+                        club_id=club_id, keys=[item.idempotency_key for item in lost]
+                    )
+                )
+                for item in lost:
+                    self._assert_replay_matches(item, existing[item.idempotency_key])
+
+        items = [
+            FinanceTransactionBatchItemResult(
+                idempotency_key=item.idempotency_key,
+                status="created",
+                transaction=created[item.idempotency_key],
+            )
+            if item.idempotency_key in created
+            else FinanceTransactionBatchItemResult(
+                idempotency_key=item.idempotency_key,
+                status="replayed",
+                transaction=FinanceTransactionResponse.model_validate(
+                    existing[item.idempotency_key]
+                ),
+            )
+            for item in payload.items
+        ]
+
+        self.publisher.publish_many(
+            event_type="finance.transaction.posted",
+            aggregate_type="finance_transaction",
+            events=(
+                BulkEvent(
+                    aggregate_id=str(transaction_response.id),
+                    payload={
+                        "transaction_id": str(transaction_response.id),
+                        "account_id": str(transaction_response.account_id),
+                        "amount": str(transaction_response.amount),
+                        "type": transaction_response.type.value,
+                        "source": transaction_response.source.value,
+                        "idempotency_key": idempotency_key,
+                    },
+                    after=transaction_response.model_dump(mode="json"),
+                )
+                for idempotency_key, transaction_response in created.items()
+            ),
+            context=context,
+            club_id=club_id,
+        )
+        balances = self._compute_balances(club_id=club_id, account_ids=account_ids)
+        self.db.commit()
+        if created:
+            self.arrears_block_service.refresh_accounts(
+                club_id=club_id,
+                account_ids=list({response.account_id for response in created.values()}),
+            )
+
+        return FinanceTransactionBatchCreateResult(
+            created_count=len(created),
+            replayed_count=len(items) - len(created),
+            items=items,
+            balances=[
+                FinanceAccountBalanceResponse(account_id=account_id, balance=balances[account_id])
+                for account_id in account_ids
+            ],
+        )
+
     def get_account_ledger(
         self,
         *,
@@ -170,30 +346,62 @@ class LedgerService:
         *,
         club_id: uuid.UUID,
         limit: int = 50,
+        after: str | None = None,
+        before: str | None = None,
+        source: FinanceTransactionSource | None = None,
+        transaction_type: FinanceTransactionType | None = None,
+        account_id: uuid.UUID | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
     ) -> FinanceClubJournalResponse:
-
-        from app.models import AccountCustomer
-
-        total_count = (
-            self.db.scalar(select(func.count()).where(FinanceTransaction.club_id == club_id)) or 0
+        if after is not None and before is not None:
+            raise AppError(
+                code="finance_journal_cursor_conflict",
+                message="Page with either after or before, not both",
+                status_code=400,
+            )
+        filters = self._journal_filters(
+            club_id=club_id,
+            source=source,
+            transaction_type=transaction_type,
+            account_id=account_id,
+            date_from=date_from,
+            date_to=date_to,
         )
-
-        rows = list(
-            self.db.execute(
-                select(FinanceTransaction, AccountCustomer.account_code)
-                .join(
-                    FinanceAccount,
-                    FinanceTransaction.account_id == FinanceAccount.id,
-                )
-                .join(
-                    AccountCustomer,
-                    FinanceAccount.account_customer_id == AccountCustomer.id,
-                )
-                .where(FinanceTransaction.club_id == club_id)
-                .order_by(FinanceTransaction.created_at.desc(), FinanceTransaction.id.desc())
-                .limit(limit)
-            ).all()
+        statement = (
+            select(FinanceTransaction, AccountCustomer.account_code)
+            .join(
+                FinanceAccount,
+                FinanceTransaction.account_id == FinanceAccount.id,
+            )
+            .join(
+                AccountCustomer,
+                FinanceAccount.account_customer_id == AccountCustomer.id,
+            )
+            .where(*filters)
         )
+        position = tuple_(FinanceTransaction.created_at, FinanceTransaction.id)
+
+        if before is not None:
+            # Walk towards newer entries in ascending order, then flip the page so it
+            # reads newest first like every other page.
+            statement = statement.where(
+                position > tuple_(*self._decode_journal_cursor(before))
+            ).order_by(FinanceTransaction.created_at.asc(), FinanceTransaction.id.asc())
+            rows = list(self.db.execute(statement.limit(limit + 1)).tuples().all())
+            has_newer = len(rows) > limit
+            rows = rows[:limit][::-1]
+            has_older = True
+        else:
+            if after is not None:
+                statement = statement.where(position < tuple_(*self._decode_journal_cursor(after)))
+            statement = statement.order_by(
+                FinanceTransaction.created_at.desc(), FinanceTransaction.id.desc()
+            )
+            rows = list(self.db.execute(statement.limit(limit + 1)).tuples().all())
+            has_older = len(rows) > limit
+            rows = rows[:limit]
+            has_newer = after is not None
 
         entries = [
             FinanceJournalEntryResponse(
@@ -210,8 +418,19 @@ class LedgerService:
             )
             for tx, account_code in rows
         ]
+        total_count, total_count_is_estimate = self._count_journal(filters)
 
-        return FinanceClubJournalResponse(entries=entries, total_count=total_count)
+        return FinanceClubJournalResponse(
+            entries=entries,
+            total_count=total_count,
+            total_count_is_estimate=total_count_is_estimate,
+            next_cursor=(
+                self._encode_journal_cursor(entries[-1]) if entries and has_older else None
+            ),
+            prev_cursor=(
+                self._encode_journal_cursor(entries[0]) if entries and has_newer else None
+            ),
+        )
 
     def _load_account(
         self,
@@ -228,6 +447,140 @@ class LedgerService:
             )
         )
 
+    def _load_by_idempotency_keys(
+        self,
+        *,
+        club_id: uuid.UUID,
+        keys: list[str],
+    ) -> dict[str, FinanceTransaction]:
+        transactions = self.db.scalars(
+            select(FinanceTransaction).where(
+                FinanceTransaction.club_id == club_id,
+                FinanceTransaction.idempotency_key.in_(keys),
+            )
+        ).all()
+        return {
+            transaction.idempotency_key: transaction
+            for transaction in transactions
+            if transaction.idempotency_key is not None
+        }
+
+    def _assert_replay_matches(
+        self,
+        item: FinanceTransactionBatchItem,
+        transaction: FinanceTransaction,
+    ) -> None:
+        if (
+            transaction.account_id != item.account_id
+            or transaction.amount != item.amount
+            or transaction.type != item.type
+            or transaction.source != item.source
+            or transaction.reference_id != item.reference_id
+            or transaction.description != item.description
+        ):
+            raise ConflictError(
+                f"Idempotency key {item.idempotency_key!r} was already used for a "
+                "different posting",
+                code="finance_idempotency_key_conflict",
+            )
+
+    def _compute_balances(
+        self,
+        *,
+        club_id: uuid.UUID,
+        account_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, Decimal]:
+        balances = dict.fromkeys(account_ids, Decimal("0.00"))
+        rows = self.db.execute(
+            select(FinanceTransaction.account_id, func.sum(FinanceTransaction.amount))
+            .where(
+                FinanceTransaction.club_id == club_id,
+                FinanceTransaction.account_id.in_(account_ids),
+            )
+            .group_by(FinanceTransaction.account_id)
+        ).tuples()
+        for account_id, balance in rows:
+            balances[account_id] = balance
+        return balances
+
+    def _journal_filters(
+        self,
+        *,
+        club_id: uuid.UUID,
+        source: FinanceTransactionSource | None,
+        transaction_type: FinanceTransactionType | None,
+        account_id: uuid.UUID | None,
+        date_from: date | None,
+        date_to: date | None,
+    ) -> list[ColumnElement[bool]]:
+        filters: list[ColumnElement[bool]] = [FinanceTransaction.club_id == club_id]
+        if source is not None:
+            filters.append(FinanceTransaction.source == source)
+        if transaction_type is not None:
+            filters.append(FinanceTransaction.type == transaction_type)
+        if account_id is not None:
+            filters.append(FinanceTransaction.account_id == account_id)
+        if date_from is not None or date_to is not None:
+            club = self.db.get(Club, club_id)
+            if club is None:
+                raise NotFoundError("Club not found")
+            zone = ZoneInfo(club.timezone)
+            if date_from is not None:
+                filters.append(
+                    FinanceTransaction.created_at
+                    >= datetime.combine(date_from, time.min, tzinfo=zone).astimezone(UTC)
+                )
+            if date_to is not None:
+                filters.append(
+                    FinanceTransaction.created_at
+                    < datetime.combine(
+                        date_to + timedelta(days=1), time.min, tzinfo=zone
+                    ).astimezone(UTC)
+                )
+        return filters
+
+    def _count_journal(self, filters: list[ColumnElement[bool]]) -> tuple[int, bool]:
+        # Counting stops after JOURNAL_EXACT_COUNT_LIMIT index entries; past that the
+        # planner's row estimate is reported instead of scanning the whole journal.
+        matching = select(FinanceTransaction.id).where(*filters)
+        capped = (
+            self.db.scalar(
+                select(func.count()).select_from(
+                    matching.limit(JOURNAL_EXACT_COUNT_LIMIT + 1).subquery()
+                )
+            )
+            or 0
+        )
+        if capped <= JOURNAL_EXACT_COUNT_LIMIT:
+            return capped, False
+        return max(capped, self._planner_row_estimate(matching)), True
+
+    def _planner_row_estimate(self, statement: Select[tuple[uuid.UUID]]) -> int:
+        compiled = statement.compile(
+            dialect=self.db.get_bind().dialect,
+            compile_kwargs={"literal_binds": True},
+        )
+        plan = self.db.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}").scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def _encode_journal_cursor(self, entry: FinanceJournalEntryResponse) -> str:
+        raw = f"{entry.created_at.isoformat()}|{entry.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def _decode_journal_cursor(self, cursor: str) -> tuple[datetime, uuid.UUID]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+            created_at, transaction_id = raw.split("|", 1)
+            return datetime.fromisoformat(created_at), uuid.UUID(transaction_id)
+        except ValueError as exc:
+            raise AppError(
+                code="finance_journal_cursor_invalid",
+                message="Journal cursor is not valid",
+                status_code=400,
+            ) from exc
+
     def _compute_balance(self, *, club_id: uuid.UUID, account_id: uuid.UUID) -> Decimal:
         balance = self.db.scalar(
             select(func.sum(FinanceTransaction.amount)).where(
@@ -0,0 +1,391 @@
+"""Columnar mapping engine behind accounting-profile exports.
+
+A profile's mapping config is compiled once into per-transaction-type lookup
+tables plus a list of column checks for its target system. Canonical batch
+records are then read into plain column lists, mapped with one comprehension
+per output column, validated one column at a time and written straight to CSV
+without building a model per row. Preview, download and export all consume the
+same :class:`MappedExportColumns` result.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from json.encoder import encode_basestring_ascii
+from operator import itemgetter
+from typing import Any
+
+from app.models import FinanceTransactionSource
+from app.schemas.finance import (
+    AccountingExportProfileMappingConfig,
+    AccountingMappedExportPreviewRow,
+    AccountingMappedExportValidationError,
+)
+
+MAPPED_EXPORT_CSV_COLUMNS = (
+    "date",
+    "reference",
+    "description",
+    "debit_account_code",
+    "credit_account_code",
+    "amount",
+    "customer_account_code",
+    "source_type",
+)
+SOURCE_COLUMNS = (
+    "entry_date",
+    "transaction_id",
+    "account_customer_code",
+    "transaction_type",
+    "source",
+    "reference_id",
+    "description",
+    "amount",
+)
+_NULLABLE_SOURCE_COLUMNS = frozenset({"account_customer_code", "reference_id"})
+_HASH_KEY_ORDER = tuple(sorted(MAPPED_EXPORT_CSV_COLUMNS))
+_HASH_ROW_TEMPLATE = "{" + ",".join(f'"{column}":%s' for column in _HASH_KEY_ORDER) + "}"
+_TWO_DECIMAL_AMOUNT = re.compile(r"-?\d+\.\d{2}")
+_SOURCE_TYPES = frozenset(item.value for item in FinanceTransactionSource)
+_CENT = Decimal("0.01")
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnCheck:
+    field: str
+    fails: Callable[[str], bool]
+    code: str
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledProfileMapping:
+    reference_prefix: str
+    fallback_customer_code: str
+    debit_by_type: dict[str, str]
+    credit_by_type: dict[str, str]
+    description_prefix_by_type: dict[str, str]
+    mapping_checks: tuple[ColumnCheck, ...]
+    target_checks: tuple[ColumnCheck, ...]
+
+
+@dataclass(slots=True)
+class MappedExportColumns:
+    columns: dict[str, list[str]]
+    row_count: int
+    validation_errors: list[AccountingMappedExportValidationError]
+
+    @classmethod
+    def rejected(
+        cls,
+        validation_errors: list[AccountingMappedExportValidationError],
+    ) -> MappedExportColumns:
+        return cls(
+            columns={name: [] for name in MAPPED_EXPORT_CSV_COLUMNS},
+            row_count=0,
+            validation_errors=validation_errors,
+        )
+
+    def iter_rows(self) -> Iterator[tuple[str, ...]]:
+        return zip(*(self.columns[name] for name in MAPPED_EXPORT_CSV_COLUMNS), strict=True)
+
+    def to_preview_rows(self) -> list[AccountingMappedExportPreviewRow]:
+        return [
+            AccountingMappedExportPreviewRow.model_construct(
+                **dict(zip(MAPPED_EXPORT_CSV_COLUMNS, row, strict=True))
+            )
+            for row in self.iter_rows()
+        ]
+
+    def content_hash(self) -> str:
+        # Byte-for-byte the canonical ``json.dumps([row.model_dump() ...],
+        # sort_keys=True, separators=(",", ":"))`` the per-row models produced.
+        digest = hashlib.sha256(b"[")
+        separator = b""
+        encoded = [map(encode_basestring_ascii, self.columns[name]) for name in _HASH_KEY_ORDER]
+        for values in zip(*encoded, strict=True):
+            digest.update(separator)
+            digest.update((_HASH_ROW_TEMPLATE % values).encode("ascii"))
+            separator = b","
+        digest.update(b"]")
+        return digest.hexdigest()
+
+
+def compile_profile_mapping(
+    config: AccountingExportProfileMappingConfig,
+    *,
+    target_system: str,
+) -> CompiledProfileMapping:
+    mappings = {
+        transaction_type.value: mapping
+        for transaction_type, mapping in config.transaction_mappings.items()
+    }
+    return CompiledProfileMapping(
+        reference_prefix=config.reference_prefix,
+        fallback_customer_code=config.fallback_customer_code,
+        debit_by_type={key: value.debit_account_code for key, value in mappings.items()},
+        credit_by_type={key: value.credit_account_code for key, value in mappings.items()},
+        description_prefix_by_type={
+            key: value.description_prefix for key, value in mappings.items()
+        },
+        mapping_checks=_mapping_checks(f"{config.reference_prefix}-"),
+        target_checks=_target_checks(target_system),
+    )
+
+
+def read_source_columns(records: Iterable[dict[str, Any]]) -> dict[str, list[Any]] | None:
+    """Split canonical batch records into columns, or ``None`` if any is malformed."""
+    row_values = itemgetter(*SOURCE_COLUMNS)
+    try:
+        rows = [row_values(record) for record in records]
+    except (KeyError, TypeError):
+        return None
+    if not rows:
+        return {name: [] for name in SOURCE_COLUMNS}
+    columns = {
+        name: list(values)
+        for name, values in zip(SOURCE_COLUMNS, zip(*rows, strict=True), strict=True)
+    }
+    for name, values in columns.items():
+        allowed = (str, type(None)) if name in _NULLABLE_SOURCE_COLUMNS else (str,)
+        if not all(isinstance(value, allowed) for value in values):
+            return None
+    return columns
+
+
+def map_columns(
+    source: dict[str, list[Any]],
+    mapping: CompiledProfileMapping,
+) -> MappedExportColumns:
+    transaction_types = source["transaction_type"]
+    row_count = len(transaction_types)
+    unmapped_errors = [
+        AccountingMappedExportValidationError(
+            code="accounting_export_transaction_type_unmapped",
+            message=f"Canonical row {row_index} has unmapped transaction type '{value}'",
+            row_index=row_index,
+            field="transaction_type",
+        )
+        for row_index, value in enumerate(transaction_types, start=1)
+        if value not in mapping.debit_by_type
+    ]
+    if unmapped_errors:
+        return MappedExportColumns.rejected(unmapped_errors)
+
+    prefix = mapping.reference_prefix
+    fallback_customer_code = mapping.fallback_customer_code
+    description_prefixes = mapping.description_prefix_by_type
+    columns = {
+        "date": source["entry_date"],
+        "reference": [
+            f"{prefix}-{reference_id or transaction_id}"
+            for reference_id, transaction_id in zip(
+                source["reference_id"], source["transaction_id"], strict=True
+            )
+        ],
+        "description": [
+            f"{description_prefixes[transaction_type]} {description}".strip()
+            for transaction_type, description in zip(
+                transaction_types, source["description"], strict=True
+            )
+        ],
+        "debit_account_code": list(map(mapping.debit_by_type.__getitem__, transaction_types)),
+        "credit_account_code": list(map(mapping.credit_by_type.__getitem__, transaction_types)),
+        "amount": list(map(_absolute_amount, source["amount"])),
+        "customer_account_code": [
+            code or fallback_customer_code for code in source["account_customer_code"]
+        ],
+        "source_type": source["source"],
+    }
+    # Checks run one column at a time; _run_checks then stable-sorts failures by
+    # row so errors still read row by row in check order.
+    validation_errors = _run_checks(columns, mapping.mapping_checks) + _run_checks(
+        columns, mapping.target_checks
+    )
+    return MappedExportColumns(
+        columns=columns,
+        row_count=row_count,
+        validation_errors=validation_errors,
+    )
+
+
+def _run_checks(
+    columns: dict[str, list[str]],
+    checks: tuple[ColumnCheck, ...],
+) -> list[AccountingMappedExportValidationError]:
+    failures = [
+        (row_index, check)
+        for check in checks
+        for row_index, value in enumerate(columns[check.field], start=1)
+        if check.fails(value)
+    ]
+    failures.sort(key=itemgetter(0))
+    return [
+        AccountingMappedExportValidationError(
+            code=check.code,
+            message=check.message.format(row_index=row_index),
+            row_index=row_index,
+            field=check.field,
+        )
+        for row_index, check in failures
+    ]
+
+
+def _absolute_amount(value: str) -> str:
+    if _TWO_DECIMAL_AMOUNT.fullmatch(value):
+        return value.removeprefix("-")
+    try:
+        return f"{abs(Decimal(value)).quantize(_CENT)}"
+    except InvalidOperation:
+        return value
+
+
+def _parse_amount(value: str) -> Decimal | None:
+    try:
+        amount = Decimal(value)
+    except InvalidOperation:
+        return None
+    return amount if amount.is_finite() else None
+
+
+def _amount_invalid(value: str) -> bool:
+    return not _TWO_DECIMAL_AMOUNT.fullmatch(value) and _parse_amount(value) is None
+
+
+def _amount_non_positive(value: str) -> bool:
+    amount = _parse_amount(value)
+    return amount is not None and amount <= 0
+
+
+def _amount_precision_invalid(value: str) -> bool:
+    if _TWO_DECIMAL_AMOUNT.fullmatch(value):
+        return False
+    amount = _parse_amount(value)
+    return amount is not None and amount > 0 and amount.quantize(_CENT) != amount
+
+
+def _is_blank(value: str) -> bool:
+    return not value.strip()
+
+
+def _mapping_checks(reference_prefix: str) -> tuple[ColumnCheck, ...]:
+    def missing_code(field: str) -> ColumnCheck:
+        return ColumnCheck(
+            field=field,
+            fails=_is_blank,
+            code=f"accounting_export_{field}_missing",
+            message=f"Mapped row {{row_index}} is missing {field.replace('_', ' ')}",
+        )
+
+    return (
+        ColumnCheck(
+            field="reference",
+            fails=_is_blank,
+            code="accounting_export_reference_missing",
+            message="Mapped row {row_index} is missing a reference",
+        ),
+        ColumnCheck(
+            field="reference",
+            fails=lambda value: bool(value.strip()) and not value.startswith(reference_prefix),
+            code="accounting_export_reference_prefix_invalid",
+            message=(
+                "Mapped row {row_index} reference must start with "
+                f"'{reference_prefix.replace('{', '{{').replace('}', '}}')}'"
+            ),
+        ),
+        ColumnCheck(
+            field="description",
+            fails=_is_blank,
+            code="accounting_export_description_missing",
+            message="Mapped row {row_index} is missing a description",
+        ),
+        missing_code("debit_account_code"),
+        missing_code("credit_account_code"),
+        missing_code("customer_account_code"),
+        ColumnCheck(
+            field="amount",
+            fails=_amount_invalid,
+            code="accounting_export_amount_invalid",
+            message="Mapped row {row_index} amount is not a valid decimal",
+        ),
+        ColumnCheck(
+            field="amount",
+            fails=_amount_non_positive,
+            code="accounting_export_amount_non_positive",
+            message="Mapped row {row_index} amount must be positive",
+        ),
+        ColumnCheck(
+            field="amount",
+            fails=_amount_precision_invalid,
+            code="accounting_export_amount_precision_invalid",
+            message="Mapped row {row_index} amount must use two decimal places",
+        ),
+        ColumnCheck(
+            field="source_type",
+            fails=lambda value: value not in _SOURCE_TYPES,
+            code="accounting_export_source_type_invalid",
+            message="Mapped row {row_index} source type is not recognized",
+        ),
+    )
+
+
+def _target_checks(target_system: str) -> tuple[ColumnCheck, ...]:
+    if target_system == "pastel_like":
+        return (
+            ColumnCheck(
+                field="reference",
+                fails=lambda value: len(value) > 20,
+                code="accounting_export_pastel_reference_too_long",
+                message=(
+                    "Mapped row {row_index} reference exceeds the Pastel-like 20 character limit"
+                ),
+            ),
+            *(
+                ColumnCheck(
+                    field=field,
+                    fails=lambda value: len(value) > 12,
+                    code=f"accounting_export_pastel_{field}_too_long",
+                    message=(
+                        f"Mapped row {{row_index}} {field.replace('_', ' ')} "
+                        "exceeds the Pastel-like 12 character limit"
+                    ),
+                )
+                for field in ("debit_account_code", "credit_account_code", "customer_account_code")
+            ),
+        )
+    if target_system == "sage_like":
+        return (
+            ColumnCheck(
+                field="description",
+                fails=lambda value: len(value) > 60,
+                code="accounting_export_sage_description_too_long",
+                message=(
+                    "Mapped row {row_index} description exceeds the Sage-like 60 character limit"
+                ),
+            ),
+            ColumnCheck(
+                field="reference",
+                fails=lambda value: len(value) > 30,
+                code="accounting_export_sage_reference_too_long",
+                message=(
+                    "Mapped row {row_index} reference exceeds the Sage-like 30 character limit"
+                ),
+            ),
+            *(
+                ColumnCheck(
+                    field=field,
+                    fails=lambda value: value != value.upper(),
+                    code=f"accounting_export_sage_{field}_case_invalid",
+                    message=(
+                        f"Mapped row {{row_index}} {field.replace('_', ' ')} "
+                        "must be uppercase for Sage-like exports"
+                    ),
+                )
+                for field in ("debit_account_code", "credit_account_code")
+            ),
+        )
+    return ()
@@ -7,11 +7,13 @@ from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, case, func, select
 from sqlalchemy.orm import Session
 
-from app.core.exceptions import NotFoundError
+from app.core.datetime import utc_now
+from app.core.exceptions import AppError, NotFoundError
 from app.models import (
+    AccountCustomer,
     Booking,
     BookingPaymentStatus,
     BookingStatus,
@@ -24,6 +26,11 @@ from app.models import (
     OrderStatus,
 )
 from app.schemas.finance import (
+    FinanceAgedReceivablesAccountRow,
+    FinanceAgedReceivablesBuckets,
+    FinanceAgedReceivablesResponse,
+    FinanceExceptionsDayBucket,
+    FinanceExceptionsRangeResponse,
     FinanceExceptionsResponse,
     FinanceOutstandingSummaryResponse,
     FinanceRevenuePeriodSummaryResponse,
@@ -36,12 +43,23 @@ from app.schemas.finance import (
     FinanceUnpaidBookingSummary,
     FinanceUnresolvedOrderSummary,
 )
+from app.services._csv import CsvStream, iter_csv_chunks
 
 ZERO = Decimal("0.00")
+EXCEPTIONS_MAX_RANGE_DAYS = 31
 OPERATIONAL_REVENUE_SOURCES = {
     FinanceTransactionSource.POS,
     FinanceTransactionSource.ORDER,
 }
+AGED_RECEIVABLES_CSV_COLUMNS = (
+    "account_customer_code",
+    "current",
+    "days_30",
+    "days_60",
+    "days_90_plus",
+    "total_outstanding",
+    "oldest_outstanding_at",
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -241,6 +259,160 @@ class FinanceReadModelService:
             pending_items_count=pending_item_count,
         )
 
+    def get_aged_receivables(
+        self,
+        *,
+        club_id: uuid.UUID,
+        as_of: date | None = None,
+    ) -> FinanceAgedReceivablesResponse:
+        """Age each account's outstanding charges into current/30/60/90+ buckets.
+
+        Credits (positive postings) are allocated FIFO against debits (negative
+        postings): a running debit total per account is compared with the
+        account's total credit, so each debit keeps only the part that the
+        credits have not yet consumed. The allocation, bucketing and per-account
+        roll-up all run in one statement; only one row per account in arrears
+        comes back. A debit's age is measured in club-local days from its
+        posting date to ``as_of``, and postings after ``as_of`` are ignored.
+        """
+        club = self.db.get(Club, club_id)
+        if club is None:
+            raise NotFoundError("Club not found")
+        zone = ZoneInfo(club.timezone)
+        as_of_date = as_of or datetime.now(zone).date()
+        cutoff_utc = self._local_day_start_utc(as_of_date + timedelta(days=1), zone)
+        current_from_utc = self._local_day_start_utc(as_of_date - timedelta(days=29), zone)
+        days_30_from_utc = self._local_day_start_utc(as_of_date - timedelta(days=59), zone)
+        days_60_from_utc = self._local_day_start_utc(as_of_date - timedelta(days=89), zone)
+
+        debit_amount = case((FinanceTransaction.amount < 0, -FinanceTransaction.amount), else_=ZERO)
+        credit_amount = case((FinanceTransaction.amount > 0, FinanceTransaction.amount), else_=ZERO)
+        allocated = (
+            select(
+                FinanceTransaction.account_id.label("account_id"),
+                FinanceTransaction.created_at.label("created_at"),
+                debit_amount.label("debit_amount"),
+                func.sum(debit_amount)
+                .over(
+                    partition_by=FinanceTransaction.account_id,
+                    order_by=(FinanceTransaction.created_at, FinanceTransaction.id),
+                    rows=(None, 0),
+                )
+                .label("cumulative_debit"),
+                func.sum(credit_amount)
+                .over(partition_by=FinanceTransaction.account_id)
+                .label("total_credit"),
+            )
+            .where(
+                FinanceTransaction.club_id == club_id,
+                FinanceTransaction.created_at < cutoff_utc,
+            )
+            .subquery()
+        )
+        outstanding = func.greatest(
+            ZERO,
+            func.least(
+                allocated.c.debit_amount,
+                allocated.c.cumulative_debit - allocated.c.total_credit,
+            ),
+        )
+
+        def _bucket(*conditions: ColumnElement[bool]) -> ColumnElement[Decimal]:
+            return func.coalesce(func.sum(outstanding).filter(*conditions), ZERO)
+
+        total_outstanding = func.sum(outstanding)
+        rows = self.db.execute(
+            select(
+                allocated.c.account_id,
+                AccountCustomer.account_code,
+                _bucket(allocated.c.created_at >= current_from_utc).label("current"),
+                _bucket(
+                    allocated.c.created_at >= days_30_from_utc,
+                    allocated.c.created_at < current_from_utc,
+                ).label("days_30"),
+                _bucket(
+                    allocated.c.created_at >= days_60_from_utc,
+                    allocated.c.created_at < days_30_from_utc,
+                ).label("days_60"),
+                _bucket(allocated.c.created_at < days_60_from_utc).label("days_90_plus"),
+                total_outstanding.label("total_outstanding"),
+                func.min(allocated.c.created_at)
+                .filter(outstanding > 0)
+                .label("oldest_outstanding_at"),
+            )
+            .join(FinanceAccount, FinanceAccount.id == allocated.c.account_id)
+            .join(AccountCustomer, AccountCustomer.id == FinanceAccount.account_customer_id)
+            .group_by(allocated.c.account_id, AccountCustomer.account_code)
+            .having(total_outstanding > 0)
+            .order_by(total_outstanding.desc(), AccountCustomer.account_code.asc())
+        ).all()
+
+        accounts = [
+            FinanceAgedReceivablesAccountRow(
+                account_id=row.account_id,
+                account_customer_code=row.account_code,
+                current=row.current,
+                days_30=row.days_30,
+                days_60=row.days_60,
+                days_90_plus=row.days_90_plus,
+                total_outstanding=row.total_outstanding,
+                oldest_outstanding_at=row.oldest_outstanding_at,
+            )
+            for row in rows
+        ]
+        return FinanceAgedReceivablesResponse(
+            timezone=club.timezone,
+            as_of=as_of_date,
+            account_count=len(accounts),
+            totals=FinanceAgedReceivablesBuckets(
+                current=sum((row.current for row in accounts), start=ZERO),
+                days_30=sum((row.days_30 for row in accounts), start=ZERO),
+                days_60=sum((row.days_60 for row in accounts), start=ZERO),
+                days_90_plus=sum((row.days_90_plus for row in accounts), start=ZERO),
+                total_outstanding=sum((row.total_outstanding for row in accounts), start=ZERO),
+            ),
+            accounts=accounts,
+        )
+
+    def build_aged_receivables_download(
+        self,
+        *,
+        club_id: uuid.UUID,
+        as_of: date | None = None,
+    ) -> CsvStream:
+        report = self.get_aged_receivables(club_id=club_id, as_of=as_of)
+        totals = report.totals
+        rows = [
+            (
+                row.account_customer_code,
+                row.current,
+                row.days_30,
+                row.days_60,
+                row.days_90_plus,
+                row.total_outstanding,
+                row.oldest_outstanding_at.isoformat(),
+            )
+            for row in report.accounts
+        ]
+        rows.append(
+            (
+                "TOTAL",
+                totals.current,
+                totals.days_30,
+                totals.days_60,
+                totals.days_90_plus,
+                totals.total_outstanding,
+                "",
+            )
+        )
+        return CsvStream(
+            file_name=f"greenlink-aged-receivables-{report.as_of.isoformat()}.csv",
+            chunks=iter_csv_chunks(AGED_RECEIVABLES_CSV_COLUMNS, rows),
+        )
+
+    def _local_day_start_utc(self, local_date: date, zone: ZoneInfo) -> datetime:
+        return datetime.combine(local_date, datetime.min.time(), tzinfo=zone).astimezone(UTC)
+
     def _build_windows(
         self,
         *,
@@ -256,8 +428,19 @@ class FinanceReadModelService:
             if reference_datetime is not None
             else datetime.now(UTC)
         )
-        local_reference = normalized_reference_datetime.astimezone(zone)
-        local_day = local_reference.date()
+        windows = self.build_summary_windows(
+            zone=zone,
+            reference_datetime=normalized_reference_datetime,
+        )
+        return club.timezone, normalized_reference_datetime, windows
+
+    def build_summary_windows(
+        self,
+        *,
+        zone: ZoneInfo,
+        reference_datetime: datetime,
+    ) -> dict[FinanceSummaryPeriod, SummaryWindow]:
+        local_day = reference_datetime.astimezone(zone).date()
         week_start = local_day - timedelta(days=local_day.weekday())
         next_day = local_day + timedelta(days=1)
         next_week = week_start + timedelta(days=7)
@@ -267,7 +450,7 @@ class FinanceReadModelService:
             if local_day.month == 12
             else local_day.replace(month=local_day.month + 1, day=1)
         )
-        windows = {
+        return {
             FinanceSummaryPeriod.DAY: self._summary_window(
                 FinanceSummaryPeriod.DAY, local_day, next_day, zone
             ),
@@ -278,7 +461,6 @@ class FinanceReadModelService:
                 FinanceSummaryPeriod.MONTH, month_start, next_month, zone
             ),
         }
-        return club.timezone, normalized_reference_datetime, windows
 
     def _summary_window(
         self,
@@ -308,76 +490,154 @@ class FinanceReadModelService:
         target_date: date,
     ) -> FinanceExceptionsResponse:
         """Return unpaid bookings and unresolved orders for a given date."""
+        day = self.get_exceptions_range(
+            club_id=club_id, date_from=target_date, date_to=target_date
+        ).days[0]
+        return FinanceExceptionsResponse(
+            date=day.date,
+            unpaid_bookings=day.unpaid_bookings,
+            unresolved_orders=day.unresolved_orders,
+            total_exception_count=day.total_exception_count,
+        )
+
+    def get_exceptions_range(
+        self,
+        *,
+        club_id: uuid.UUID,
+        date_from: date,
+        date_to: date,
+        now: datetime | None = None,
+    ) -> FinanceExceptionsRangeResponse:
+        """Return per-day exception buckets and close-day readiness for a date range.
+
+        A day is ready to close when it has no unpaid bookings and no reserved
+        booking whose tee time has already passed (a likely no-show).
+        """
+        if date_to < date_from:
+            raise AppError(
+                code="finance_exceptions_range_invalid",
+                message="date_to must be on or after date_from",
+                status_code=400,
+            )
+        if (date_to - date_from).days >= EXCEPTIONS_MAX_RANGE_DAYS:
+            raise AppError(
+                code="finance_exceptions_range_too_long",
+                message=f"Exception ranges are limited to {EXCEPTIONS_MAX_RANGE_DAYS} days",
+                status_code=400,
+            )
         club = self.db.get(Club, club_id)
         if club is None:
             raise NotFoundError("Club not found")
         zone = ZoneInfo(club.timezone)
-
-        # Day window in club local time → UTC bounds for slot_datetime comparison.
-        day_start_utc = datetime.combine(target_date, datetime.min.time(), tzinfo=zone).astimezone(
-            UTC
+        now_utc = (now or utc_now()).astimezone(UTC)
+        range_start_utc = self._local_day_start_utc(date_from, zone)
+        range_end_utc = self._local_day_start_utc(date_to + timedelta(days=1), zone)
+
+        unpaid_bookings: dict[date, list[FinanceUnpaidBookingSummary]] = defaultdict(list)
+        no_show_risk_counts: dict[date, int] = defaultdict(int)
+        has_refund = (
+            select(FinanceTransaction.id)
+            .where(
+                FinanceTransaction.club_id == club_id,
+                FinanceTransaction.type == FinanceTransactionType.REFUND,
+                FinanceTransaction.reference_id == Booking.id,
+            )
+            .exists()
         )
-        day_end_utc = datetime.combine(
-            target_date + timedelta(days=1), datetime.min.time(), tzinfo=zone
-        ).astimezone(UTC)
-
-        unpaid_bookings_stmt = (
-            select(Booking)
+        is_no_show_risk = (Booking.status == BookingStatus.RESERVED) & (
+            Booking.slot_datetime < now_utc
+        )
+        booking_rows = self.db.execute(
+            select(
+                Booking.id,
+                Booking.course_id,
+                Booking.slot_datetime,
+                Booking.party_size,
+                Booking.fee_label,
+                Booking.primary_person_id,
+                Booking.payment_status == BookingPaymentStatus.PENDING,
+                is_no_show_risk,
+                has_refund,
+            )
             .where(
                 Booking.club_id == club_id,
-                Booking.payment_status == BookingPaymentStatus.PENDING,
                 Booking.status.notin_([BookingStatus.CANCELLED, BookingStatus.NO_SHOW]),
-                Booking.slot_datetime >= day_start_utc,
-                Booking.slot_datetime < day_end_utc,
+                Booking.slot_datetime >= range_start_utc,
+                Booking.slot_datetime < range_end_utc,
+                (Booking.payment_status == BookingPaymentStatus.PENDING) | is_no_show_risk,
             )
             .order_by(Booking.slot_datetime)
-        )
-        unpaid_bookings = list(self.db.execute(unpaid_bookings_stmt).scalars().all())
-
-        # Detect which of the unpaid bookings have a REFUND transaction (refund follow-up).
-        unpaid_booking_ids = {b.id for b in unpaid_bookings}
-        refunded_booking_ids: set[uuid.UUID] = set()
-        if unpaid_booking_ids:
-            refund_stmt = select(FinanceTransaction.reference_id).where(
-                FinanceTransaction.club_id == club_id,
-                FinanceTransaction.type == FinanceTransactionType.REFUND,
-                FinanceTransaction.reference_id.in_(unpaid_booking_ids),
-            )
-            refunded_booking_ids = set(self.db.scalars(refund_stmt).all())
+        ).tuples()
+        for (
+            booking_id,
+            course_id,
+            slot_datetime,
+            party_size,
+            fee_label,
+            primary_person_id,
+            is_unpaid,
+            is_no_show,
+            has_refund_transaction,
+        ) in booking_rows:
+            local_day = slot_datetime.astimezone(zone).date()
+            if is_no_show:
+                no_show_risk_counts[local_day] += 1
+            if is_unpaid:
+                unpaid_bookings[local_day].append(
+                    FinanceUnpaidBookingSummary(
+                        id=booking_id,
+                        course_id=course_id,
+                        slot_datetime=slot_datetime,
+                        party_size=party_size,
+                        fee_label=fee_label,
+                        primary_person_id=primary_person_id,
+                        has_refund_transaction=has_refund_transaction,
+                    )
+                )
 
-        # Unresolved orders: not collected and not cancelled, created on the target date.
-        order_day_start_utc = datetime.combine(
-            target_date, datetime.min.time(), tzinfo=zone
-        ).astimezone(UTC)
-        order_day_end_utc = datetime.combine(
-            target_date + timedelta(days=1), datetime.min.time(), tzinfo=zone
-        ).astimezone(UTC)
-        unresolved_orders_stmt = (
-            select(Order)
+        # Unresolved orders: not collected and not cancelled, bucketed by creation day.
+        unresolved_orders: dict[date, list[FinanceUnresolvedOrderSummary]] = defaultdict(list)
+        order_rows = self.db.execute(
+            select(Order.id, Order.status, Order.created_at)
             .where(
                 Order.club_id == club_id,
                 Order.status.notin_([OrderStatus.COLLECTED, OrderStatus.CANCELLED]),
-                Order.created_at >= order_day_start_utc,
-                Order.created_at < order_day_end_utc,
+                Order.created_at >= range_start_utc,
+                Order.created_at < range_end_utc,
             )
             .order_by(Order.created_at)
-        )
-        unresolved_orders = list(self.db.execute(unresolved_orders_stmt).scalars().all())
+        ).tuples()
+        for order_id, order_status, created_at in order_rows:
+            unresolved_orders[created_at.astimezone(zone).date()].append(
+                FinanceUnresolvedOrderSummary(
+                    id=order_id, status=order_status.value, created_at=created_at
+                )
+            )
 
-        unpaid_booking_summaries = [
-            FinanceUnpaidBookingSummary.model_validate(b).model_copy(
-                update={"has_refund_transaction": b.id in refunded_booking_ids}
+        days: list[FinanceExceptionsDayBucket] = []
+        for offset in range((date_to - date_from).days + 1):
+            local_day = date_from + timedelta(days=offset)
+            day_bookings = unpaid_bookings.get(local_day, [])
+            day_orders = unresolved_orders.get(local_day, [])
+            no_show_risk_count = no_show_risk_counts.get(local_day, 0)
+            days.append(
+                FinanceExceptionsDayBucket(
+                    date=local_day,
+                    unpaid_bookings=day_bookings,
+                    unresolved_orders=day_orders,
+                    total_exception_count=len(day_bookings) + len(day_orders),
+                    no_show_risk_count=no_show_risk_count,
+                    close_day_ready=not day_bookings and no_show_risk_count == 0,
+                )
             )
-            for b in unpaid_bookings
-        ]
 
-        return FinanceExceptionsResponse(
-            date=target_date,
-            unpaid_bookings=unpaid_booking_summaries,
-            unresolved_orders=[
-                FinanceUnresolvedOrderSummary.model_validate(o) for o in unresolved_orders
-            ],
-            total_exception_count=len(unpaid_bookings) + len(unresolved_orders),
+        return FinanceExceptionsRangeResponse(
+            timezone=club.timezone,
+            date_from=date_from,
+            date_to=date_to,
+            days=days,
+            total_exception_count=sum(day.total_exception_count for day in days),
+            close_day_ready_count=sum(1 for day in days if day.close_day_ready),
         )
 
     def _to_revenue_period_summary(
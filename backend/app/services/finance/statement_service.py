@@ -0,0 +1,307 @@
+"""Batch member statements for a club and period, streamed as one zip archive.
+
+Accounts are split into chunks rendered on worker threads, each with its own
+session. A chunk is a single query returning every account's opening balance
+alongside its period postings, ordered by account and posting time, so a
+statement is grouped on the fly as the rows stream past and no account's full
+history is ever loaded. Chunks are handed to the archive in order while the
+next ones render, and ``summary.csv`` closes the archive with one row per
+statement.
+"""
+
+from __future__ import annotations
+
+import re
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from itertools import groupby
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.exceptions import AppError, NotFoundError
+from app.models import AccountCustomer, Club, FinanceAccount, FinanceTransaction, Person
+from app.services._csv import iter_csv_chunks
+from app.services._zip import ZipStream, iter_zip_chunks
+
+ZERO = Decimal("0.00")
+STATEMENT_MAX_RANGE_DAYS = 366
+STATEMENT_CHUNK_ACCOUNTS = 250
+STATEMENT_DEFAULT_WORKERS = 4
+STATEMENT_STREAM_BATCH = 2_000
+STATEMENT_COLUMNS = (
+    "posted_at",
+    "description",
+    "type",
+    "source",
+    "reference_id",
+    "debit",
+    "credit",
+    "balance",
+)
+STATEMENT_SUMMARY_COLUMNS = (
+    "account_customer_code",
+    "member_name",
+    "opening_balance",
+    "total_debits",
+    "total_credits",
+    "closing_balance",
+    "line_count",
+    "file_name",
+)
+_UNSAFE_FILE_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+@dataclass(slots=True)
+class _StatementSection:
+    file_name: str
+    account_code: str
+    member_name: str
+    opening_balance: Decimal
+    total_debits: Decimal
+    total_credits: Decimal
+    closing_balance: Decimal
+    line_count: int
+    content: bytes
+
+
+class FinanceStatementService:
+    def __init__(
+        self,
+        db: Session,
+        *,
+        session_factory: Callable[[], Session] | None = None,
+        max_workers: int = STATEMENT_DEFAULT_WORKERS,
+        chunk_accounts: int = STATEMENT_CHUNK_ACCOUNTS,
+    ) -> None:
+        self.db = db
+        self.session_factory = session_factory or sessionmaker(
+            bind=db.get_bind(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+        self.max_workers = max_workers
+        self.chunk_accounts = chunk_accounts
+
+    def build_statement_archive(
+        self,
+        *,
+        club_id: uuid.UUID,
+        date_from: date,
+        date_to: date,
+    ) -> ZipStream:
+        if date_to < date_from:
+            raise AppError(
+                code="finance_statement_range_invalid",
+                message="date_to must be on or after date_from",
+                status_code=400,
+            )
+        if (date_to - date_from).days >= STATEMENT_MAX_RANGE_DAYS:
+            raise AppError(
+                code="finance_statement_range_too_long",
+                message=f"Statement periods are limited to {STATEMENT_MAX_RANGE_DAYS} days",
+                status_code=400,
+            )
+        club = self.db.get(Club, club_id)
+        if club is None:
+            raise NotFoundError("Club not found")
+        zone = ZoneInfo(club.timezone)
+        period_start_utc = self._local_day_start_utc(date_from, zone)
+        period_end_utc = self._local_day_start_utc(date_to + timedelta(days=1), zone)
+        account_ids = list(
+            self.db.scalars(
+                select(FinanceAccount.id)
+                .join(AccountCustomer, AccountCustomer.id == FinanceAccount.account_customer_id)
+                .where(FinanceAccount.club_id == club_id)
+                .order_by(AccountCustomer.account_code.asc(), FinanceAccount.id.asc())
+            )
+        )
+        chunks = [
+            account_ids[start : start + self.chunk_accounts]
+            for start in range(0, len(account_ids), self.chunk_accounts)
+        ]
+        entries = self._iter_entries(
+            club_id=club_id,
+            chunks=chunks,
+            zone=zone,
+            period_start_utc=period_start_utc,
+            period_end_utc=period_end_utc,
+        )
+        return ZipStream(
+            file_name=(f"greenlink-statements-{date_from.isoformat()}-{date_to.isoformat()}.zip"),
+            chunks=iter_zip_chunks(entries),
+        )
+
+    def _iter_entries(
+        self,
+        *,
+        club_id: uuid.UUID,
+        chunks: list[list[uuid.UUID]],
+        zone: ZoneInfo,
+        period_start_utc: datetime,
+        period_end_utc: datetime,
+    ) -> Iterator[tuple[str, list[bytes]]]:
+        summary_rows: list[tuple[object, ...]] = []
+        pending_chunks = iter(chunks)
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="statements",
+        ) as executor:
+
+            def submit_next() -> Future[list[_StatementSection]] | None:
+                account_ids = next(pending_chunks, None)
+                if account_ids is None:
+                    return None
+                return executor.submit(
+                    self._render_chunk,
+                    club_id=club_id,
+                    account_ids=account_ids,
+                    zone=zone,
+                    period_start_utc=period_start_utc,
+                    period_end_utc=period_end_utc,
+                )
+
+            # Keep at most max_workers chunks rendered ahead of the archive writer.
+            in_flight: deque[Future[list[_StatementSection]]] = deque()
+            for _ in range(self.max_workers):
+                future = submit_next()
+                if future is None:
+                    break
+                in_flight.append(future)
+            while in_flight:
+                sections = in_flight.popleft().result()
+                future = submit_next()
+                if future is not None:
+                    in_flight.append(future)
+                for section in sections:
+                    summary_rows.append(
+                        (
+                            section.account_code,
+                            section.member_name,
+                            section.opening_balance,
+                            section.total_debits,
+                            section.total_credits,
+                            section.closing_balance,
+                            section.line_count,
+                            section.file_name,
+                        )
+                    )
+                    yield section.file_name, [section.content]
+        yield "summary.csv", list(iter_csv_chunks(STATEMENT_SUMMARY_COLUMNS, summary_rows))
+
+    def _render_chunk(
+        self,
+        *,
+        club_id: uuid.UUID,
+        account_ids: list[uuid.UUID],
+        zone: ZoneInfo,
+        period_start_utc: datetime,
+        period_end_utc: datetime,
+    ) -> list[_StatementSection]:
+        opening = (
+            select(
+                FinanceTransaction.account_id.label("account_id"),
+                func.sum(FinanceTransaction.amount).label("balance"),
+            )
+            .where(
+                FinanceTransaction.club_id == club_id,
+                FinanceTransaction.account_id.in_(account_ids),
+                FinanceTransaction.created_at < period_start_utc,
+            )
+            .group_by(FinanceTransaction.account_id)
+            .subquery()
+        )
+        statement = (
+            select(
+                FinanceAccount.id,
+                AccountCustomer.account_code,
+                Person.full_name,
+                func.coalesce(opening.c.balance, ZERO),
+                FinanceTransaction.created_at,
+                FinanceTransaction.description,
+                FinanceTransaction.type,
+                FinanceTransaction.source,
+                FinanceTransaction.reference_id,
+                FinanceTransaction.amount,
+            )
+            .select_from(FinanceAccount)
+            .join(AccountCustomer, AccountCustomer.id == FinanceAccount.account_customer_id)
+            .join(Person, Person.id == AccountCustomer.person_id)
+            .outerjoin(opening, opening.c.account_id == FinanceAccount.id)
+            .outerjoin(
+                FinanceTransaction,
+                and_(
+                    FinanceTransaction.account_id == FinanceAccount.id,
+                    FinanceTransaction.created_at >= period_start_utc,
+                    FinanceTransaction.created_at < period_end_utc,
+                ),
+            )
+            .where(FinanceAccount.id.in_(account_ids))
+            .order_by(
+                AccountCustomer.account_code.asc(),
+                FinanceAccount.id.asc(),
+                FinanceTransaction.created_at.asc(),
+                FinanceTransaction.id.asc(),
+            )
+            .execution_options(yield_per=STATEMENT_STREAM_BATCH)
+        )
+        with self.session_factory() as db:
+            return [
+                self._render_section(rows, zone=zone)
+                for _, rows in groupby(db.execute(statement), key=lambda row: row[0])
+            ]
+
+    def _render_section(self, rows, *, zone: ZoneInfo) -> _StatementSection:
+        first = next(rows)
+        account_id, account_code, member_name, opening_balance, *_ = first
+        balance = opening_balance
+        total_debits = ZERO
+        total_credits = ZERO
+        lines: list[tuple[object, ...]] = [
+            ("", "Opening balance", "", "", "", "", "", opening_balance)
+        ]
+        for row in (first, *rows):
+            _, _, _, _, created_at, description, tx_type, source, reference_id, amount = row
+            if created_at is None:
+                # Outer-join placeholder for an account with no postings in the period.
+                continue
+            balance += amount
+            debit = -amount if amount < 0 else ZERO
+            credit = amount if amount > 0 else ZERO
+            total_debits += debit
+            total_credits += credit
+            lines.append(
+                (
+                    created_at.astimezone(zone).isoformat(),
+                    description,
+                    tx_type.value,
+                    source.value,
+                    str(reference_id) if reference_id is not None else "",
+                    debit,
+                    credit,
+                    balance,
+                )
+            )
+        line_count = len(lines) - 1
+        lines.append(("", "Closing balance", "", "", "", "", "", balance))
+        return _StatementSection(
+            # Sanitised codes can collide ("A/1", "A_1"); the account id keeps names unique.
+            file_name=f"statements/{_UNSAFE_FILE_CHARS.sub('_', account_code)}-{account_id}.csv",
+            account_code=account_code,
+            member_name=member_name,
+            opening_balance=opening_balance,
+            total_debits=total_debits,
+            total_credits=total_credits,
+            closing_balance=balance,
+            line_count=line_count,
+            content=b"".join(iter_csv_chunks(STATEMENT_COLUMNS, lines)),
+        )
+
+    def _local_day_start_utc(self, local_date: date, zone: ZoneInfo) -> datetime:
+        return datetime.combine(local_date, datetime.min.time(), tzinfo=zone).astimezone(UTC)
@@ -0,0 +1,548 @@
+"""Close-day tender reconciliation against acquirer settlement files.
+
+Tender totals by type, drawer and employee come straight from grouped queries.
+Card tenders are streamed from the database already sorted by (business date,
+amount, time) and merged with the sorted acquirer lines in one two-pointer
+pass, so a month of POS volume reconciles without materialising ORM rows.
+"""
+
+from __future__ import annotations
+
+import csv
+import uuid
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import ColumnElement, Date, String, cast, func, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.datetime import utc_now
+from app.core.exceptions import AppError, NotFoundError
+from app.models import (
+    Club,
+    FinanceTenderReconciliation,
+    FinanceTenderReconciliationStatus,
+    FinanceTenderRecord,
+    PosTransaction,
+    User,
+)
+from app.models.enums import TenderType
+from app.schemas.finance import (
+    FinanceTenderDrawerTotal,
+    FinanceTenderEmployeeTotal,
+    FinanceTenderReconciliationDayResponse,
+    FinanceTenderReconciliationRangeResponse,
+    FinanceTenderTotal,
+    FinanceTenderUnmatchedItem,
+)
+
+ZERO = Decimal("0.00")
+CENT = Decimal("0.01")
+TENDER_RECONCILIATION_MAX_RANGE_DAYS = 31
+TENDER_RECONCILIATION_STREAM_BATCH = 2_000
+UNMATCHED_ITEMS_PER_DAY_LIMIT = 50
+SETTLEMENT_FILE_COLUMNS = ("transaction_time", "amount")
+POS_SIDE_COLUMNS = frozenset(
+    {"pos_card_total", "tender_totals", "drawer_totals", "employee_totals"}
+)
+
+# (business_date, amount, occurred_at, reference)
+CardLine = tuple[date, Decimal, datetime, str | None]
+
+
+@dataclass(slots=True)
+class _DayMatch:
+    acquirer_card_total: Decimal = ZERO
+    matched_count: int = 0
+    unmatched_pos_count: int = 0
+    unmatched_acquirer_count: int = 0
+    unmatched_items: list[FinanceTenderUnmatchedItem] = field(default_factory=list)
+
+    def record_unmatched(self, side: str, line: CardLine) -> None:
+        if side == "pos":
+            self.unmatched_pos_count += 1
+        else:
+            self.unmatched_acquirer_count += 1
+            self.acquirer_card_total += line[1]
+        if len(self.unmatched_items) < UNMATCHED_ITEMS_PER_DAY_LIMIT:
+            self.unmatched_items.append(
+                FinanceTenderUnmatchedItem(
+                    side=side,
+                    amount=line[1],
+                    occurred_at=line[2],
+                    reference=line[3],
+                )
+            )
+
+
+class FinanceTenderReconciliationService:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def reconcile(
+        self,
+        *,
+        club_id: uuid.UUID,
+        date_from: date,
+        date_to: date,
+        settlement_file: Path | None = None,
+    ) -> FinanceTenderReconciliationRangeResponse:
+        self._validate_range(date_from=date_from, date_to=date_to)
+        club = self.db.get(Club, club_id)
+        if club is None:
+            raise NotFoundError("Club not found")
+        zone = ZoneInfo(club.timezone)
+        range_start_utc = self._local_day_start_utc(date_from, zone)
+        range_end_utc = self._local_day_start_utc(date_to + timedelta(days=1), zone)
+
+        tender_totals = self._tender_totals(
+            club_id=club_id,
+            timezone_name=club.timezone,
+            range_start_utc=range_start_utc,
+            range_end_utc=range_end_utc,
+        )
+        drawer_totals = self._drawer_totals(
+            club_id=club_id,
+            timezone_name=club.timezone,
+            range_start_utc=range_start_utc,
+            range_end_utc=range_end_utc,
+        )
+        employee_totals = self._employee_totals(
+            club_id=club_id,
+            timezone_name=club.timezone,
+            range_start_utc=range_start_utc,
+            range_end_utc=range_end_utc,
+        )
+        matches: dict[date, _DayMatch] = defaultdict(_DayMatch)
+        if settlement_file is not None:
+            acquirer_lines = self._read_settlement_file(
+                settlement_file,
+                zone=zone,
+                date_from=date_from,
+                date_to=date_to,
+            )
+            pos_lines = self._stream_card_tenders(
+                club_id=club_id,
+                timezone_name=club.timezone,
+                range_start_utc=range_start_utc,
+                range_end_utc=range_end_utc,
+            )
+            matches = self._match_card_tenders(pos_lines, acquirer_lines)
+
+        reconciled_at = utc_now()
+        rows: list[dict[str, object]] = []
+        business_date = date_from
+        while business_date <= date_to:
+            day_tenders = tender_totals.get(business_date, [])
+            pos_card_total = sum(
+                (item.amount for item in day_tenders if item.tender_type == TenderType.CARD),
+                ZERO,
+            )
+            match = matches[business_date] if settlement_file is not None else None
+            status = FinanceTenderReconciliationStatus.AWAITING_SETTLEMENT
+            drift_amount = None
+            if match is not None:
+                drift_amount = match.acquirer_card_total - pos_card_total
+                status = (
+                    FinanceTenderReconciliationStatus.BALANCED
+                    if drift_amount == ZERO
+                    and match.unmatched_pos_count == 0
+                    and match.unmatched_acquirer_count == 0
+                    else FinanceTenderReconciliationStatus.DRIFT
+                )
+            rows.append(
+                {
+                    "club_id": club_id,
+                    "business_date": business_date,
+                    "status": status,
+                    "settlement_file_name": (
+                        settlement_file.name if settlement_file is not None else None
+                    ),
+                    "pos_card_total": pos_card_total,
+                    "acquirer_card_total": match.acquirer_card_total if match else None,
+                    "drift_amount": drift_amount,
+                    "matched_count": match.matched_count if match else 0,
+                    "unmatched_pos_count": match.unmatched_pos_count if match else 0,
+                    "unmatched_acquirer_count": match.unmatched_acquirer_count if match else 0,
+                    "tender_totals": self._dump(day_tenders),
+                    "drawer_totals": self._dump(drawer_totals.get(business_date, [])),
+                    "employee_totals": self._dump(employee_totals.get(business_date, [])),
+                    "unmatched_items": self._dump(match.unmatched_items if match else []),
+                    "reconciled_at": reconciled_at,
+                }
+            )
+            business_date += timedelta(days=1)
+
+        # Without a settlement file only the POS side is refreshed, so a rerun keeps
+        # any acquirer match already recorded for the day.
+        refreshed_columns = (
+            set(rows[0]) - {"club_id", "business_date"}
+            if settlement_file is not None
+            else POS_SIDE_COLUMNS
+        )
+        statement = pg_insert(FinanceTenderReconciliation).values(rows)
+        self.db.execute(
+            statement.on_conflict_do_update(
+                constraint="uq_finance_tender_reconciliations_club_business_date",
+                set_={
+                    **{column: statement.excluded[column] for column in refreshed_columns},
+                    "updated_at": reconciled_at,
+                },
+            )
+        )
+        self.db.commit()
+        return self.list_reconciliations(club_id=club_id, date_from=date_from, date_to=date_to)
+
+    def list_reconciliations(
+        self,
+        *,
+        club_id: uuid.UUID,
+        date_from: date,
+        date_to: date,
+    ) -> FinanceTenderReconciliationRangeResponse:
+        self._validate_range(date_from=date_from, date_to=date_to)
+        days = [
+            FinanceTenderReconciliationDayResponse.model_validate(row)
+            for row in self.db.scalars(
+                select(FinanceTenderReconciliation)
+                .where(
+                    FinanceTenderReconciliation.club_id == club_id,
+                    FinanceTenderReconciliation.business_date >= date_from,
+                    FinanceTenderReconciliation.business_date <= date_to,
+                )
+                .order_by(FinanceTenderReconciliation.business_date.asc())
+            )
+        ]
+        return FinanceTenderReconciliationRangeResponse(
+            club_id=club_id,
+            date_from=date_from,
+            date_to=date_to,
+            days=days,
+            drift_day_count=sum(
+                1 for day in days if day.status == FinanceTenderReconciliationStatus.DRIFT
+            ),
+        )
+
+    def _tender_totals(
+        self,
+        *,
+        club_id: uuid.UUID,
+        timezone_name: str,
+        range_start_utc: datetime,
+        range_end_utc: datetime,
+    ) -> dict[date, list[FinanceTenderTotal]]:
+        tenders = union_all(
+            select(
+                self._local_day(PosTransaction.created_at, timezone_name).label("business_date"),
+                PosTransaction.tender_type.label("tender_type"),
+                PosTransaction.total_amount.label("amount"),
+            ).where(
+                *self._window(
+                    PosTransaction.club_id,
+                    PosTransaction.created_at,
+                    club_id=club_id,
+                    range_start_utc=range_start_utc,
+                    range_end_utc=range_end_utc,
+                )
+            ),
+            select(
+                self._local_day(FinanceTenderRecord.created_at, timezone_name),
+                FinanceTenderRecord.tender_type,
+                FinanceTenderRecord.amount,
+            ).where(
+                *self._window(
+                    FinanceTenderRecord.club_id,
+                    FinanceTenderRecord.created_at,
+                    club_id=club_id,
+                    range_start_utc=range_start_utc,
+                    range_end_utc=range_end_utc,
+                )
+            ),
+        ).subquery()
+        totals: dict[date, list[FinanceTenderTotal]] = defaultdict(list)
+        for business_date, tender_type, amount, count in self.db.execute(
+            select(
+                tenders.c.business_date,
+                tenders.c.tender_type,
+                func.sum(tenders.c.amount),
+                func.count(),
+            )
+            .group_by(tenders.c.business_date, tenders.c.tender_type)
+            .order_by(tenders.c.business_date.asc(), tenders.c.tender_type.asc())
+        ):
+            totals[business_date].append(
+                FinanceTenderTotal(tender_type=tender_type, amount=amount, count=count)
+            )
+        return totals
+
+    def _drawer_totals(
+        self,
+        *,
+        club_id: uuid.UUID,
+        timezone_name: str,
+        range_start_utc: datetime,
+        range_end_utc: datetime,
+    ) -> dict[date, list[FinanceTenderDrawerTotal]]:
+        business_date = self._local_day(PosTransaction.created_at, timezone_name)
+        totals: dict[date, list[FinanceTenderDrawerTotal]] = defaultdict(list)
+        for local_date, drawer_code, tender_type, amount, count in self.db.execute(
+            select(
+                business_date,
+                PosTransaction.drawer_code,
+                PosTransaction.tender_type,
+                func.sum(PosTransaction.total_amount),
+                func.count(),
+            )
+            .where(
+                *self._window(
+                    PosTransaction.club_id,
+                    PosTransaction.created_at,
+                    club_id=club_id,
+                    range_start_utc=range_start_utc,
+                    range_end_utc=range_end_utc,
+                )
+            )
+            .group_by(business_date, PosTransaction.drawer_code, PosTransaction.tender_type)
+            .order_by(
+                business_date.asc(),
+                PosTransaction.drawer_code.asc().nulls_last(),
+                PosTransaction.tender_type.asc(),
+            )
+        ):
+            totals[local_date].append(
+                FinanceTenderDrawerTotal(
+                    drawer_code=drawer_code,
+                    tender_type=tender_type,
+                    amount=amount,
+                    count=count,
+                )
+            )
+        return totals
+
+    def _employee_totals(
+        self,
+        *,
+        club_id: uuid.UUID,
+        timezone_name: str,
+        range_start_utc: datetime,
+        range_end_utc: datetime,
+    ) -> dict[date, list[FinanceTenderEmployeeTotal]]:
+        business_date = self._local_day(PosTransaction.created_at, timezone_name)
+        totals: dict[date, list[FinanceTenderEmployeeTotal]] = defaultdict(list)
+        for local_date, user_id, display_name, tender_type, amount, count in self.db.execute(
+            select(
+                business_date,
+                PosTransaction.created_by_user_id,
+                User.display_name,
+                PosTransaction.tender_type,
+                func.sum(PosTransaction.total_amount),
+                func.count(),
+            )
+            .join(User, User.id == PosTransaction.created_by_user_id)
+            .where(
+                *self._window(
+                    PosTransaction.club_id,
+                    PosTransaction.created_at,
+                    club_id=club_id,
+                    range_start_utc=range_start_utc,
+                    range_end_utc=range_end_utc,
+                )
+            )
+            .group_by(
+                business_date,
+                PosTransaction.created_by_user_id,
+                User.display_name,
+                PosTransaction.tender_type,
+            )
+            .order_by(
+                business_date.asc(),
+                User.display_name.asc(),
+                PosTransaction.tender_type.asc(),
+            )
+        ):
+            totals[local_date].append(
+                FinanceTenderEmployeeTotal(
+                    user_id=user_id,
+                    display_name=display_name,
+                    tender_type=tender_type,
+                    amount=amount,
+                    count=count,
+                )
+            )
+        return totals
+
+    def _stream_card_tenders(
+        self,
+        *,
+        club_id: uuid.UUID,
+        timezone_name: str,
+        range_start_utc: datetime,
+        range_end_utc: datetime,
+    ) -> Iterator[CardLine]:
+        card_tenders = union_all(
+            select(
+                self._local_day(PosTransaction.created_at, timezone_name).label("business_date"),
+                PosTransaction.total_amount.label("amount"),
+                PosTransaction.created_at.label("occurred_at"),
+                func.concat("pos:", cast(PosTransaction.id, String)).label("reference"),
+            ).where(
+                PosTransaction.tender_type == TenderType.CARD,
+                *self._window(
+                    PosTransaction.club_id,
+                    PosTransaction.created_at,
+                    club_id=club_id,
+                    range_start_utc=range_start_utc,
+                    range_end_utc=range_end_utc,
+                ),
+            ),
+            select(
+                self._local_day(FinanceTenderRecord.created_at, timezone_name),
+                FinanceTenderRecord.amount,
+                FinanceTenderRecord.created_at,
+                func.concat("tender:", cast(FinanceTenderRecord.id, String)),
+            ).where(
+                FinanceTenderRecord.tender_type == TenderType.CARD,
+                *self._window(
+                    FinanceTenderRecord.club_id,
+                    FinanceTenderRecord.created_at,
+                    club_id=club_id,
+                    range_start_utc=range_start_utc,
+                    range_end_utc=range_end_utc,
+                ),
+            ),
+        ).subquery()
+        result = self.db.execute(
+            select(card_tenders)
+            .order_by(
+                card_tenders.c.business_date.asc(),
+                card_tenders.c.amount.asc(),
+                card_tenders.c.occurred_at.asc(),
+            )
+            .execution_options(yield_per=TENDER_RECONCILIATION_STREAM_BATCH)
+        )
+        yield from result.tuples()
+
+    def _match_card_tenders(
+        self,
+        pos_lines: Iterator[CardLine],
+        acquirer_lines: list[CardLine],
+    ) -> dict[date, _DayMatch]:
+        # Both sides are sorted by (business_date, amount, occurred_at). Equal
+        # (business_date, amount) keys pair off in time order; whatever is left on
+        # either side of a key is drift.
+        matches: dict[date, _DayMatch] = defaultdict(_DayMatch)
+        acquirer_iter = iter(acquirer_lines)
+        pos_line = next(pos_lines, None)
+        acquirer_line = next(acquirer_iter, None)
+        while pos_line is not None or acquirer_line is not None:
+            if acquirer_line is None or (pos_line is not None and pos_line[:2] < acquirer_line[:2]):
+                matches[pos_line[0]].record_unmatched("pos", pos_line)
+                pos_line = next(pos_lines, None)
+            elif pos_line is None or acquirer_line[:2] < pos_line[:2]:
+                matches[acquirer_line[0]].record_unmatched("acquirer", acquirer_line)
+                acquirer_line = next(acquirer_iter, None)
+            else:
+                match = matches[pos_line[0]]
+                match.matched_count += 1
+                match.acquirer_card_total += acquirer_line[1]
+                pos_line = next(pos_lines, None)
+                acquirer_line = next(acquirer_iter, None)
+        return matches
+
+    def _read_settlement_file(
+        self,
+        path: Path,
+        *,
+        zone: ZoneInfo,
+        date_from: date,
+        date_to: date,
+    ) -> list[CardLine]:
+        if not path.is_file():
+            raise AppError(
+                code="tender_settlement_file_missing",
+                message=f"Settlement file {path} was not found",
+                status_code=400,
+            )
+        lines: list[CardLine] = []
+        with path.open(newline="", encoding="utf-8-sig") as handle:
+            reader = csv.DictReader(handle)
+            missing = [
+                column
+                for column in SETTLEMENT_FILE_COLUMNS
+                if column not in (reader.fieldnames or [])
+            ]
+            if missing:
+                raise AppError(
+                    code="tender_settlement_file_invalid",
+                    message=f"Settlement file is missing columns: {', '.join(missing)}",
+                    status_code=400,
+                )
+            for line_number, row in enumerate(reader, start=2):
+                try:
+                    occurred_at = datetime.fromisoformat(row["transaction_time"].strip())
+                    amount = Decimal(row["amount"].strip()).quantize(CENT)
+                except (AttributeError, ValueError, InvalidOperation) as exc:
+                    raise AppError(
+                        code="tender_settlement_file_invalid",
+                        message=(
+                            f"Settlement file line {line_number} has an unreadable "
+                            "transaction_time or amount"
+                        ),
+                        status_code=400,
+                    ) from exc
+                if occurred_at.tzinfo is None:
+                    occurred_at = occurred_at.replace(tzinfo=zone)
+                business_date = occurred_at.astimezone(zone).date()
+                if not date_from <= business_date <= date_to:
+                    continue
+                reference = (row.get("reference") or "").strip() or None
+                lines.append((business_date, amount, occurred_at.astimezone(UTC), reference))
+        lines.sort(key=lambda line: line[:3])
+        return lines
+
+    def _validate_range(self, *, date_from: date, date_to: date) -> None:
+        if date_to < date_from:
+            raise AppError(
+                code="tender_reconciliation_range_invalid",
+                message="date_to must be on or after date_from",
+                status_code=400,
+            )
+        if (date_to - date_from).days >= TENDER_RECONCILIATION_MAX_RANGE_DAYS:
+            raise AppError(
+                code="tender_reconciliation_range_too_long",
+                message=(
+                    "Tender reconciliation ranges are limited to "
+                    f"{TENDER_RECONCILIATION_MAX_RANGE_DAYS} days"
+                ),
+                status_code=400,
+            )
+
+    def _window(
+        self,
+        club_column,
+        created_at_column,
+        *,
+        club_id: uuid.UUID,
+        range_start_utc: datetime,
+        range_end_utc: datetime,
+    ) -> list[ColumnElement[bool]]:
+        return [
+            club_column == club_id,
+            created_at_column >= range_start_utc,
+            created_at_column < range_end_utc,
+        ]
+
+    def _local_day(self, column, timezone_name: str) -> ColumnElement[date]:
+        return cast(func.timezone(timezone_name, column), Date)
+
+    def _local_day_start_utc(self, local_date: date, zone: ZoneInfo) -> datetime:
+        return datetime.combine(local_date, datetime.min.time(), tzinfo=zone).astimezone(UTC)
+
+    def _dump(self, items) -> list[dict[str, object]]:
+        return [item.model_dump(mode="json") for item in items]
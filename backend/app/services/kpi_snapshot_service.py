@@ -0,0 +1,145 @@
+"""Nightly refresh and backfill of the ``club_kpi_daily`` snapshots.
+
+Each club runs on its own worker thread with its own session. A run rewrites
+a trailing range of closed local days (by default the last
+``KPI_SNAPSHOT_REFRESH_DAYS``, so late postings and status changes are picked
+up) or an explicit backfill range, in chunks of ``KPI_SNAPSHOT_CHUNK_DAYS``
+committed one at a time. Writes are upserts, so runs can be repeated freely.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.datetime import utc_now
+from app.core.exceptions import AppError
+from app.models import Club
+from app.schemas.reports import KpiSnapshotClubResult, KpiSnapshotRunReport
+from app.semantic import list_metrics
+from app.semantic.snapshots import refresh_daily_snapshots
+
+_log = logging.getLogger(__name__)
+
+KPI_SNAPSHOT_DEFAULT_WORKERS = 4
+KPI_SNAPSHOT_REFRESH_DAYS = 7
+KPI_SNAPSHOT_CHUNK_DAYS = 92
+
+
+class KpiSnapshotService:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        max_workers: int = KPI_SNAPSHOT_DEFAULT_WORKERS,
+    ) -> None:
+        self.session_factory = session_factory
+        self.max_workers = max_workers
+
+    def run(
+        self,
+        *,
+        club_ids: list[uuid.UUID] | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        now: datetime | None = None,
+    ) -> KpiSnapshotRunReport:
+        """Snapshot local days ``date_from`` to ``date_to`` inclusive per club.
+
+        ``date_to`` defaults to, and is never later than, the club's last
+        closed day (yesterday in its timezone); ``date_from`` defaults to the
+        start of the trailing refresh range.
+        """
+        if date_from is not None and date_to is not None and date_to < date_from:
+            raise AppError(
+                code="kpi_snapshot_range_invalid",
+                message="date_to must be on or after date_from",
+                status_code=400,
+            )
+        started_at = utc_now()
+        reference_now = now or started_at
+        with self.session_factory() as db:
+            statement = select(Club.id, Club.slug, Club.timezone).where(Club.active.is_(True))
+            if club_ids is not None:
+                statement = statement.where(Club.id.in_(club_ids))
+            clubs = db.execute(statement.order_by(Club.slug.asc())).all()
+
+        work: list[tuple[uuid.UUID, str, date, date]] = []
+        for club_id, club_slug, timezone in clubs:
+            last_closed = reference_now.astimezone(ZoneInfo(timezone)).date() - timedelta(days=1)
+            club_date_to = min(date_to or last_closed, last_closed)
+            club_date_from = date_from or (
+                club_date_to - timedelta(days=KPI_SNAPSHOT_REFRESH_DAYS - 1)
+            )
+            work.append((club_id, club_slug, club_date_from, club_date_to))
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="kpi-snapshot",
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._snapshot_club,
+                    club_id=club_id,
+                    club_slug=club_slug,
+                    date_from=club_date_from,
+                    date_to=club_date_to,
+                )
+                for club_id, club_slug, club_date_from, club_date_to in work
+            ]
+            results = [future.result() for future in futures]
+
+        return KpiSnapshotRunReport(
+            started_at=started_at,
+            finished_at=utc_now(),
+            club_count=len(results),
+            completed_count=sum(1 for result in results if result.status == "completed"),
+            failed_count=sum(1 for result in results if result.status == "failed"),
+            clubs=results,
+        )
+
+    def _snapshot_club(
+        self,
+        *,
+        club_id: uuid.UUID,
+        club_slug: str,
+        date_from: date,
+        date_to: date,
+    ) -> KpiSnapshotClubResult:
+        result = KpiSnapshotClubResult(
+            club_id=club_id,
+            club_slug=club_slug,
+            date_from=date_from,
+            date_to=date_to,
+            status="completed",
+        )
+        metrics = list_metrics()
+        with self.session_factory() as db:
+            end = date_to + timedelta(days=1)
+            chunk_from = date_from
+            while chunk_from < end:
+                chunk_to = min(chunk_from + timedelta(days=KPI_SNAPSHOT_CHUNK_DAYS), end)
+                try:
+                    result.row_count += refresh_daily_snapshots(
+                        db,
+                        club_id=club_id,
+                        date_from=chunk_from,
+                        date_to=chunk_to,
+                        metrics=metrics,
+                    )
+                    db.commit()
+                except Exception as exc:
+                    db.rollback()
+                    _log.exception("KPI snapshot failed for club %s from %s", club_id, chunk_from)
+                    result.status = "failed"
+                    result.error_message = str(exc)
+                    return result
+                chunk_from = chunk_to
+        return result
@@ -0,0 +1,114 @@
+"""Keeps the ``member_activity`` projection current inside the writing transaction.
+
+Flushes that touch bookings, booking participants or finance charges record
+the affected booking and account ids on the session, along with the people a
+removed or reassigned participant used to point at; just before commit the
+people behind them are resolved and their all-time rows are rewritten with one
+upsert per club
+(:meth:`PeopleReadModelService.refresh_member_activity`). Booking status
+changes (completion, check-in, cancellation, no-show) and posted charges are
+therefore visible in the projection as soon as they commit. Disabled unless
+``member_activity_projection_enabled`` is set; enable it after backfilling
+with the ``refresh-member-activity`` command.
+"""
+
+from __future__ import annotations
+
+import uuid
+from itertools import chain
+
+from sqlalchemy import event, inspect, select, union
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models import (
+    AccountCustomer,
+    Booking,
+    BookingParticipant,
+    FinanceAccount,
+    FinanceTransaction,
+    FinanceTransactionType,
+)
+from app.services.people_read_model_service import PeopleReadModelService
+
+# ``Session.info`` entries collecting ids whose people need their row rewritten.
+AFFECTED_BOOKINGS_KEY = "greenlink.member_activity.bookings"
+AFFECTED_ACCOUNTS_KEY = "greenlink.member_activity.accounts"
+# ``(booking_id, person_id)`` pairs of participants no longer on the booking, and
+# the clubs of deleted bookings, which can no longer be read back from the table.
+FORMER_PARTICIPANTS_KEY = "greenlink.member_activity.former_participants"
+DELETED_BOOKING_CLUBS_KEY = "greenlink.member_activity.deleted_booking_clubs"
+
+
+@event.listens_for(Session, "after_flush")
+def _record_activity_writes(session: Session, flush_context: object) -> None:
+    if not get_settings().member_activity_projection_enabled:
+        return
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, Booking):
+            session.info.setdefault(AFFECTED_BOOKINGS_KEY, set()).add(instance.id)
+            if instance in session.deleted:
+                session.info.setdefault(DELETED_BOOKING_CLUBS_KEY, {})[instance.id] = (
+                    instance.club_id
+                )
+        elif isinstance(instance, BookingParticipant):
+            session.info.setdefault(AFFECTED_BOOKINGS_KEY, set()).add(instance.booking_id)
+            former_person_ids = (
+                [instance.person_id]
+                if instance in session.deleted
+                else inspect(instance).attrs.person_id.history.deleted
+            )
+            for person_id in former_person_ids:
+                if person_id is not None:
+                    session.info.setdefault(FORMER_PARTICIPANTS_KEY, set()).add(
+                        (instance.booking_id, person_id)
+                    )
+        elif (
+            isinstance(instance, FinanceTransaction)
+            and instance.type == FinanceTransactionType.CHARGE
+        ):
+            session.info.setdefault(AFFECTED_ACCOUNTS_KEY, set()).add(instance.account_id)
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_affected_members(session: Session) -> None:
+    if not get_settings().member_activity_projection_enabled:
+        return
+    # Pending changes are only flushed after this hook; flush now so the ids
+    # they add are collected and the refresh reads them.
+    session.flush()
+    if not (session.info.get(AFFECTED_BOOKINGS_KEY) or session.info.get(AFFECTED_ACCOUNTS_KEY)):
+        return
+    booking_ids: set[uuid.UUID] = session.info.pop(AFFECTED_BOOKINGS_KEY, set())
+    account_ids: set[uuid.UUID] = session.info.pop(AFFECTED_ACCOUNTS_KEY, set())
+    former_participants: set[tuple[uuid.UUID, uuid.UUID]] = session.info.pop(
+        FORMER_PARTICIPANTS_KEY, set()
+    )
+    booking_clubs: dict[uuid.UUID, uuid.UUID] = session.info.pop(DELETED_BOOKING_CLUBS_KEY, {})
+    affected = union(
+        select(Booking.club_id, BookingParticipant.person_id)
+        .join(Booking, Booking.id == BookingParticipant.booking_id)
+        .where(
+            BookingParticipant.booking_id.in_(booking_ids),
+            BookingParticipant.person_id.is_not(None),
+        ),
+        select(FinanceAccount.club_id, AccountCustomer.person_id)
+        .join(AccountCustomer, AccountCustomer.id == FinanceAccount.account_customer_id)
+        .where(FinanceAccount.id.in_(account_ids)),
+    )
+    by_club: dict[uuid.UUID, set[uuid.UUID]] = {}
+    for club_id, person_id in session.execute(affected):
+        by_club.setdefault(club_id, set()).add(person_id)
+    if former_participants:
+        unresolved = {booking_id for booking_id, _ in former_participants} - booking_clubs.keys()
+        booking_clubs.update(
+            session.execute(
+                select(Booking.id, Booking.club_id).where(Booking.id.in_(unresolved))
+            ).all()
+        )
+        for booking_id, person_id in former_participants:
+            if booking_id in booking_clubs:
+                by_club.setdefault(booking_clubs[booking_id], set()).add(person_id)
+    service = PeopleReadModelService(session)
+    for club_id, person_ids in by_club.items():
+        service.refresh_member_activity(club_id=club_id, person_ids=person_ids)
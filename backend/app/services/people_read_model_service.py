@@ -3,15 +3,20 @@
 Methods accept ``(session, club_id, …)`` plus an optional :class:`TimeWindow`
 and return Pydantic response models from ``app.schemas.reports``.
 
-Three public methods, all tenant-scoped:
+Public methods, all tenant-scoped:
 
 * :meth:`summary` — club-wide membership distributions by role / status /
   tenure bucket plus aggregates.
-* :meth:`list_member_activity` — every member's activity (rounds, spend,
-  last-played) for the supplied window. Drives the ``member_stats``
-  metric's all-club shape.
+* :meth:`list_member_activity` — members' activity (rounds, spend,
+  last-played) for the supplied window, sorted and paged in SQL. Drives the
+  ``member_stats`` metric's all-club shape.
 * :meth:`member_activity` — single-person activity for the same window.
 
+Activity is aggregated set-based from ``club_memberships`` outer-joined to
+per-person booking and charge aggregates, never by passing member id lists
+back to the database. :meth:`refresh_member_activity` maintains the optional
+all-time ``member_activity`` projection.
+
 Tenure bucketing uses ``ClubMembership.joined_at`` against a reference
 date (defaults to "today" in the club's timezone). The role-based "tier"
 proxy is documented in :class:`MemberStatsSummaryResponse`. A ``window``
@@ -21,14 +26,34 @@ of ``None`` means "all-time" for activity queries.
 from __future__ import annotations
 
 import uuid
+from collections.abc import Collection
 from datetime import UTC, date, datetime
 from decimal import Decimal
+from typing import Any
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    Date,
+    Integer,
+    Select,
+    Subquery,
+    Uuid,
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    select,
+    type_coerce,
+    union,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
+from app.config import get_settings
+from app.core.datetime import utc_now
 from app.core.exceptions import NotFoundError
+from app.db.types import UTCDateTime
 from app.models import (
     AccountCustomer,
     Booking,
@@ -36,12 +61,19 @@ from app.models import (
     BookingStatus,
     Club,
     ClubMembership,
+    ClubMembershipRole,
     ClubMembershipStatus,
     FinanceAccount,
     FinanceTransaction,
     FinanceTransactionType,
+    MemberActivity,
+    Person,
+)
+from app.schemas.reports import (
+    MemberActivityResponse,
+    MemberActivitySort,
+    MemberStatsSummaryResponse,
 )
-from app.schemas.reports import MemberActivityResponse, MemberStatsSummaryResponse
 from app.services._window import TimeWindow
 
 ZERO = Decimal("0.00")
@@ -52,6 +84,12 @@ TENURE_1_5Y = "1_to_5y"
 TENURE_5_10Y = "5_to_10y"
 TENURE_10_PLUS_Y = "10y_plus"
 TENURE_BUCKETS = (TENURE_UNDER_1Y, TENURE_1_5Y, TENURE_5_10Y, TENURE_10_PLUS_Y)
+# Exclusive upper bounds in days; anything longer is ``TENURE_10_PLUS_Y``.
+TENURE_BUCKET_LIMITS = (
+    (365, TENURE_UNDER_1Y),
+    (365 * 5, TENURE_1_5Y),
+    (365 * 10, TENURE_5_10Y),
+)
 
 
 class PeopleReadModelService:
@@ -66,60 +104,92 @@ class PeopleReadModelService:
         club_id: uuid.UUID,
         reference_date: date | None = None,
     ) -> MemberStatsSummaryResponse:
+        """Membership distributions from one aggregate row.
+
+        Every figure is a ``COUNT(*) FILTER`` (or ``AVG``) over the club's
+        memberships; tenure is ``joined_at`` as a club-local date against
+        ``reference_date``, bucketed with a ``CASE``. No membership rows are
+        loaded, so cost stays flat as the club grows.
+        """
         club = self._load_club(club_id)
         zone = ZoneInfo(club.timezone)
-        today_local = datetime.now(zone).date()
-        ref_date = reference_date or today_local
-
-        memberships = list(
-            self.db.scalars(select(ClubMembership).where(ClubMembership.club_id == club_id)).all()
-        )
-
-        by_role: dict[str, int] = {}
-        by_status: dict[str, int] = {}
-        by_tenure: dict[str, int] = {bucket: 0 for bucket in TENURE_BUCKETS}
-        tenure_total_days = 0
-        active_count = 0
-        growth_this_month = 0
-        first_of_month = ref_date.replace(day=1)
+        ref_date = reference_date or datetime.now(zone).date()
         first_of_month_utc = datetime.combine(
-            first_of_month, datetime.min.time(), tzinfo=zone
+            ref_date.replace(day=1), datetime.min.time(), tzinfo=zone
         ).astimezone(UTC)
 
-        for membership in memberships:
-            role_key = membership.role.value
-            by_role[role_key] = by_role.get(role_key, 0) + 1
-            status_key = membership.status.value
-            by_status[status_key] = by_status.get(status_key, 0) + 1
-
-            tenure_days = (
-                (ref_date - membership.joined_at.astimezone(zone).date()).days
-                if membership.joined_at is not None
-                else 0
+        joined_local = cast(func.timezone(zone.key, ClubMembership.joined_at), Date)
+        tenure_days = func.greatest(
+            func.coalesce(type_coerce(literal(ref_date, Date) - joined_local, Integer), 0),
+            0,
+        )
+        tenure_bucket = case(
+            *((tenure_days < limit, bucket) for limit, bucket in TENURE_BUCKET_LIMITS),
+            else_=TENURE_10_PLUS_Y,
+        )
+        memberships = (
+            select(
+                ClubMembership.role,
+                ClubMembership.status,
+                ClubMembership.joined_at,
+                tenure_days.label("tenure_days"),
+                tenure_bucket.label("tenure_bucket"),
+            )
+            .where(ClubMembership.club_id == club_id)
+            .subquery("memberships")
+        )
+        active = memberships.c.status == ClubMembershipStatus.ACTIVE
+        row = (
+            self.db.execute(
+                select(
+                    func.count().label("total"),
+                    *(
+                        func.count().filter(memberships.c.role == role).label(f"role_{role.value}")
+                        for role in ClubMembershipRole
+                    ),
+                    *(
+                        func.count()
+                        .filter(memberships.c.status == status)
+                        .label(f"status_{status.value}")
+                        for status in ClubMembershipStatus
+                    ),
+                    *(
+                        func.count()
+                        .filter(memberships.c.tenure_bucket == bucket)
+                        .label(f"tenure_{bucket}")
+                        for bucket in TENURE_BUCKETS
+                    ),
+                    func.floor(func.avg(memberships.c.tenure_days).filter(active)).label(
+                        "average_tenure"
+                    ),
+                    func.count()
+                    .filter(active, memberships.c.joined_at >= first_of_month_utc)
+                    .label("growth"),
+                )
             )
-            tenure_days = max(tenure_days, 0)
-            by_tenure[_bucket_for_days(tenure_days)] += 1
-            if membership.status == ClubMembershipStatus.ACTIVE:
-                tenure_total_days += tenure_days
-                active_count += 1
-            if (
-                membership.joined_at is not None
-                and membership.joined_at >= first_of_month_utc
-                and membership.status == ClubMembershipStatus.ACTIVE
-            ):
-                growth_this_month += 1
-
-        average = tenure_total_days // active_count if active_count else None
+            .one()
+            ._mapping
+        )
 
         return MemberStatsSummaryResponse(
             club_id=club_id,
             reference_date=ref_date,
-            total_members=len(memberships),
-            by_role=by_role,
-            by_status=by_status,
-            by_tenure_bucket=by_tenure,
-            growth_this_month=growth_this_month,
-            average_tenure_days=average,
+            total_members=row["total"],
+            by_role={
+                role.value: row[f"role_{role.value}"]
+                for role in ClubMembershipRole
+                if row[f"role_{role.value}"]
+            },
+            by_status={
+                status.value: row[f"status_{status.value}"]
+                for status in ClubMembershipStatus
+                if row[f"status_{status.value}"]
+            },
+            by_tenure_bucket={bucket: row[f"tenure_{bucket}"] for bucket in TENURE_BUCKETS},
+            growth_this_month=row["growth"],
+            average_tenure_days=(
+                int(row["average_tenure"]) if row["average_tenure"] is not None else None
+            ),
         )
 
     # ----- per-member activity ------------------------------------------
@@ -131,116 +201,115 @@ class PeopleReadModelService:
         person_id: uuid.UUID,
         window: TimeWindow | None = None,
     ) -> MemberActivityResponse:
-        entries = self._build_activity_rows(
-            club_id=club_id,
-            window=window,
-            person_ids=[person_id],
-        )
-        if entries:
-            return entries[0]
-        return MemberActivityResponse(person_id=person_id, rounds=0, spend=ZERO, last_played=None)
+        zone = ZoneInfo(self._load_club(club_id).timezone)
+        rounds = _rounds_by_person(club_id, window, person_ids=[person_id])
+        spend = _spend_by_person(club_id, window, person_ids=[person_id])
+        row = self.db.execute(
+            select(
+                func.coalesce(select(rounds.c.rounds).scalar_subquery(), 0),
+                func.coalesce(select(spend.c.spend).scalar_subquery(), ZERO),
+                select(rounds.c.last_played_at).scalar_subquery(),
+            )
+        ).one()
+        return _activity_response(person_id, *row, zone=zone)
 
     def list_member_activity(
         self,
         *,
         club_id: uuid.UUID,
         window: TimeWindow | None = None,
+        sort: MemberActivitySort = MemberActivitySort.PERSON,
+        descending: bool = False,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[MemberActivityResponse]:
-        member_person_ids = list(
-            self.db.scalars(
-                select(ClubMembership.person_id).where(ClubMembership.club_id == club_id)
-            ).all()
-        )
-        if not member_person_ids:
-            return []
-        rows = self._build_activity_rows(
-            club_id=club_id,
-            window=window,
-            person_ids=member_person_ids,
-        )
-        # Stable ordering: by person_id string for deterministic test output.
-        rows.sort(key=lambda entry: str(entry.person_id))
-        return rows
+        """One page of member activity in a single statement.
 
-    # ----- internals -----------------------------------------------------
+        Activity is aggregated per person and outer-joined onto the club's
+        memberships, so members without activity report zeros. Sorting and
+        paging run in SQL; ties (and ``sort=person``) fall back to person id.
+        Unwindowed reads use the ``member_activity`` projection when it is
+        enabled.
+        """
+        zone = ZoneInfo(self._load_club(club_id).timezone)
+        if window is None and get_settings().member_activity_projection_enabled:
+            statement = _projected_activity(club_id)
+        else:
+            statement = _live_activity(club_id, window)
+        columns = statement.selected_columns
+        sort_column = {
+            MemberActivitySort.PERSON: ClubMembership.person_id,
+            MemberActivitySort.ROUNDS: columns.rounds,
+            MemberActivitySort.SPEND: columns.spend,
+            MemberActivitySort.LAST_PLAYED: columns.last_played_at,
+        }[sort]
+        direction = sort_column.desc() if descending else sort_column.asc()
+        statement = statement.order_by(direction.nulls_last())
+        if sort != MemberActivitySort.PERSON:
+            statement = statement.order_by(ClubMembership.person_id.asc())
+        if limit is not None:
+            statement = statement.limit(limit)
+        if offset:
+            statement = statement.offset(offset)
+        return [_activity_response(*row, zone=zone) for row in self.db.execute(statement)]
 
-    def _build_activity_rows(
+    def refresh_member_activity(
         self,
         *,
         club_id: uuid.UUID,
-        window: TimeWindow | None,
-        person_ids: list[uuid.UUID],
-    ) -> list[MemberActivityResponse]:
-        if not person_ids:
-            return []
-        club = self._load_club(club_id)
-        zone = ZoneInfo(club.timezone)
-
-        rounds_stmt = (
-            select(
-                BookingParticipant.person_id,
-                func.count(Booking.id).label("rounds"),
-                func.max(Booking.slot_datetime).label("last_played_utc"),
-            )
-            .join(Booking, Booking.id == BookingParticipant.booking_id)
-            .where(
-                Booking.club_id == club_id,
-                Booking.status.in_(UTILISED_STATUSES),
-                BookingParticipant.person_id.in_(person_ids),
-            )
-            .group_by(BookingParticipant.person_id)
-        )
-        if window is not None:
-            rounds_stmt = rounds_stmt.where(
-                Booking.slot_datetime >= window.start_utc,
-                Booking.slot_datetime < window.end_utc,
+        person_ids: Collection[uuid.UUID] | None = None,
+    ) -> int:
+        """Rewrite the all-time ``member_activity`` rows of ``person_ids``
+        (every person with club activity or an existing row when ``None``)
+        with one upsert. The caller commits. Returns the rows written."""
+        rounds = _rounds_by_person(club_id, None, person_ids=person_ids)
+        spend = _spend_by_person(club_id, None, person_ids=person_ids)
+        if person_ids is None:
+            people = union(
+                select(rounds.c.person_id),
+                select(spend.c.person_id),
+                select(MemberActivity.person_id).where(MemberActivity.club_id == club_id),
+            ).subquery("affected_people")
+        else:
+            if not person_ids:
+                return 0
+            people = (
+                select(Person.id.label("person_id"))
+                .where(Person.id.in_(person_ids))
+                .subquery("affected_people")
             )
-        rounds_rows = self.db.execute(rounds_stmt).all()
-        rounds_by_person: dict[uuid.UUID, tuple[int, datetime | None]] = {
-            row.person_id: (int(row.rounds), row.last_played_utc) for row in rounds_rows
-        }
-
-        # Spend = sum of |amount| on charge-type finance transactions posted
-        # against any finance account whose account_customer is this person.
-        spend_stmt = (
+        source = (
             select(
-                AccountCustomer.person_id,
-                func.coalesce(func.sum(func.abs(FinanceTransaction.amount)), ZERO).label("spend"),
+                literal(club_id, Uuid),
+                people.c.person_id,
+                func.coalesce(rounds.c.rounds, 0),
+                func.coalesce(spend.c.spend, ZERO),
+                rounds.c.last_played_at,
+                literal(utc_now(), UTCDateTime()),
             )
-            .select_from(FinanceTransaction)
-            .join(FinanceAccount, FinanceAccount.id == FinanceTransaction.account_id)
-            .join(AccountCustomer, AccountCustomer.id == FinanceAccount.account_customer_id)
-            .where(
-                FinanceTransaction.club_id == club_id,
-                FinanceTransaction.type == FinanceTransactionType.CHARGE,
-                AccountCustomer.person_id.in_(person_ids),
-            )
-            .group_by(AccountCustomer.person_id)
+            .select_from(people)
+            .outerjoin(rounds, rounds.c.person_id == people.c.person_id)
+            .outerjoin(spend, spend.c.person_id == people.c.person_id)
         )
-        if window is not None:
-            spend_stmt = spend_stmt.where(
-                FinanceTransaction.created_at >= window.start_utc,
-                FinanceTransaction.created_at < window.end_utc,
-            )
-        spend_rows = self.db.execute(spend_stmt).all()
-        spend_by_person: dict[uuid.UUID, Decimal] = {row.person_id: row.spend for row in spend_rows}
-
-        results: list[MemberActivityResponse] = []
-        for person_id in person_ids:
-            rounds, last_played_utc = rounds_by_person.get(person_id, (0, None))
-            spend = spend_by_person.get(person_id, ZERO)
-            last_played: date | None = None
-            if last_played_utc is not None:
-                last_played = last_played_utc.astimezone(zone).date()
-            results.append(
-                MemberActivityResponse(
-                    person_id=person_id,
-                    rounds=rounds,
-                    spend=spend,
-                    last_played=last_played,
-                )
+        statement = pg_insert(MemberActivity).from_select(
+            ["club_id", "person_id", "rounds", "spend", "last_played_at", "refreshed_at"],
+            source,
+        )
+        result = self.db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[MemberActivity.club_id, MemberActivity.person_id],
+                set_={
+                    "rounds": statement.excluded.rounds,
+                    "spend": statement.excluded.spend,
+                    "last_played_at": statement.excluded.last_played_at,
+                    "refreshed_at": statement.excluded.refreshed_at,
+                    "updated_at": statement.excluded.refreshed_at,
+                },
             )
-        return results
+        )
+        return result.rowcount
+
+    # ----- internals -----------------------------------------------------
 
     def _load_club(self, club_id: uuid.UUID) -> Club:
         club = self.db.scalar(select(Club).where(Club.id == club_id))
@@ -249,11 +318,114 @@ class PeopleReadModelService:
         return club
 
 
-def _bucket_for_days(days: int) -> str:
-    if days < 365:
-        return TENURE_UNDER_1Y
-    if days < 365 * 5:
-        return TENURE_1_5Y
-    if days < 365 * 10:
-        return TENURE_5_10Y
-    return TENURE_10_PLUS_Y
+def _rounds_by_person(
+    club_id: uuid.UUID,
+    window: TimeWindow | None,
+    *,
+    person_ids: Collection[uuid.UUID] | None = None,
+) -> Subquery:
+    statement = (
+        select(
+            BookingParticipant.person_id.label("person_id"),
+            func.count(Booking.id).label("rounds"),
+            func.max(Booking.slot_datetime).label("last_played_at"),
+        )
+        .join(Booking, Booking.id == BookingParticipant.booking_id)
+        .where(
+            Booking.club_id == club_id,
+            Booking.status.in_(UTILISED_STATUSES),
+            BookingParticipant.person_id.is_not(None),
+        )
+        .group_by(BookingParticipant.person_id)
+    )
+    if person_ids is not None:
+        statement = statement.where(BookingParticipant.person_id.in_(person_ids))
+    if window is not None:
+        statement = statement.where(
+            Booking.slot_datetime >= window.start_utc,
+            Booking.slot_datetime < window.end_utc,
+        )
+    return statement.subquery("member_rounds")
+
+
+def _spend_by_person(
+    club_id: uuid.UUID,
+    window: TimeWindow | None,
+    *,
+    person_ids: Collection[uuid.UUID] | None = None,
+) -> Subquery:
+    # Spend = sum of |amount| on charge-type finance transactions posted
+    # against any finance account whose account_customer is this person.
+    statement = (
+        select(
+            AccountCustomer.person_id.label("person_id"),
+            func.sum(func.abs(FinanceTransaction.amount)).label("spend"),
+        )
+        .select_from(FinanceTransaction)
+        .join(FinanceAccount, FinanceAccount.id == FinanceTransaction.account_id)
+        .join(AccountCustomer, AccountCustomer.id == FinanceAccount.account_customer_id)
+        .where(
+            FinanceTransaction.club_id == club_id,
+            FinanceTransaction.type == FinanceTransactionType.CHARGE,
+        )
+        .group_by(AccountCustomer.person_id)
+    )
+    if person_ids is not None:
+        statement = statement.where(AccountCustomer.person_id.in_(person_ids))
+    if window is not None:
+        statement = statement.where(
+            FinanceTransaction.created_at >= window.start_utc,
+            FinanceTransaction.created_at < window.end_utc,
+        )
+    return statement.subquery("member_spend")
+
+
+def _live_activity(club_id: uuid.UUID, window: TimeWindow | None) -> Select[tuple[Any, ...]]:
+    rounds = _rounds_by_person(club_id, window)
+    spend = _spend_by_person(club_id, window)
+    return (
+        select(
+            ClubMembership.person_id,
+            func.coalesce(rounds.c.rounds, 0).label("rounds"),
+            func.coalesce(spend.c.spend, ZERO).label("spend"),
+            rounds.c.last_played_at,
+        )
+        .outerjoin(rounds, rounds.c.person_id == ClubMembership.person_id)
+        .outerjoin(spend, spend.c.person_id == ClubMembership.person_id)
+        .where(ClubMembership.club_id == club_id)
+    )
+
+
+def _projected_activity(club_id: uuid.UUID) -> Select[tuple[Any, ...]]:
+    return (
+        select(
+            ClubMembership.person_id,
+            func.coalesce(MemberActivity.rounds, 0).label("rounds"),
+            func.coalesce(MemberActivity.spend, ZERO).label("spend"),
+            MemberActivity.last_played_at,
+        )
+        .outerjoin(
+            MemberActivity,
+            and_(
+                MemberActivity.club_id == ClubMembership.club_id,
+                MemberActivity.person_id == ClubMembership.person_id,
+            ),
+        )
+        .where(ClubMembership.club_id == club_id)
+    )
+
+
+def _activity_response(
+    person_id: uuid.UUID,
+    rounds: int,
+    spend: Decimal,
+    last_played_at: datetime | None,
+    *,
+    zone: ZoneInfo,
+) -> MemberActivityResponse:
+    return MemberActivityResponse(
+        person_id=person_id,
+        rounds=int(rounds),
+        spend=spend,
+        last_played=last_played_at.astimezone(zone).date() if last_played_at else None,
+    )
@@ -165,6 +165,7 @@ class PosService:
             tender_type=payload.tender_type,
             finance_transaction_id=finance_transaction_id,
             notes=payload.notes,
+            drawer_code=payload.drawer_code,
             created_by_user_id=actor_user_id,
         )
         self.db.add(pos_tx)
@@ -303,6 +304,7 @@ class PosService:
             tender_type=tx.tender_type,
             finance_transaction_id=tx.finance_transaction_id,
             notes=tx.notes,
+            drawer_code=tx.drawer_code,
             created_by_user_id=tx.created_by_user_id,
             created_at=tx.created_at,
             items=[
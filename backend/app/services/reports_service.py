@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import uuid
 from collections import Counter
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
+from zoneinfo import ZoneInfo
 
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from app.core.datetime import utc_now
+from app.core.exceptions import AppError, NotFoundError
 from app.models import (
     AccountCustomer,
+    Club,
     ClubMembership,
     ClubMembershipRole,
     ClubMembershipStatus,
@@ -18,10 +22,20 @@ from app.models import (
 )
 from app.schemas.reports import (
     MemberBreakdown,
+    MemberStatsSummaryResponse,
+    MetricCourseBreakdownCollectionResponse,
+    MetricCourseBreakdownResponse,
+    MetricCourseValueResponse,
+    MetricSeriesCollectionResponse,
+    MetricSeriesGranularity,
+    MetricSeriesPointResponse,
+    MetricSeriesResponse,
     OrderStatusBreakdown,
     OrderStatusCount,
     ReportsSummaryResponse,
+    UtilisationHeatmapResponse,
 )
+from app.semantic import compute, compute_by_course, compute_series, get_metric
 
 _ORDER_STATUS_ORDER = [
     OrderStatus.PLACED,
@@ -43,6 +57,159 @@ class ReportsService:
             course_count=self._get_course_count(club_id),
         )
 
+    def get_member_summary(
+        self,
+        *,
+        club_id: uuid.UUID,
+        reference_date: date | None = None,
+    ) -> MemberStatsSummaryResponse:
+        """Membership summary through the ``member_summary`` metric, keyed on
+        the club-local date so it is cached per club and day."""
+        club = self.db.get(Club, club_id)
+        if club is None:
+            raise NotFoundError("Club not found")
+        today = utc_now().astimezone(ZoneInfo(club.timezone)).date()
+        result = compute("member_summary", self.db, club_id, reference_date=reference_date or today)
+        assert isinstance(result, MemberStatsSummaryResponse)
+        return result
+
+    def get_utilisation_heatmap(
+        self,
+        *,
+        club_id: uuid.UUID,
+        weeks: int,
+        band_minutes: int,
+    ) -> UtilisationHeatmapResponse:
+        """The ``utilisation_heatmap`` metric for the weeks before the
+        club-local today, cached per club and day."""
+        club = self.db.get(Club, club_id)
+        if club is None:
+            raise NotFoundError("Club not found")
+        result = compute(
+            "utilisation_heatmap",
+            self.db,
+            club_id,
+            weeks=weeks,
+            band_minutes=band_minutes,
+            reference_date=utc_now().astimezone(ZoneInfo(club.timezone)).date(),
+        )
+        assert isinstance(result, UtilisationHeatmapResponse)
+        return result
+
+    def get_metric_series(
+        self,
+        *,
+        club_id: uuid.UUID,
+        metrics: list[str],
+        date_from: date,
+        date_to: date,
+        granularity: MetricSeriesGranularity,
+    ) -> MetricSeriesCollectionResponse:
+        if not metrics:
+            raise AppError(
+                code="metric_series_metrics_required",
+                message="At least one metric is required",
+                status_code=400,
+            )
+        try:
+            definitions = [get_metric(name) for name in dict.fromkeys(metrics)]
+        except KeyError as exc:
+            raise NotFoundError(f"Metric not found: {exc.args[0]}") from exc
+        try:
+            series = compute_series(
+                [metric.name for metric in definitions],
+                self.db,
+                club_id,
+                date_from=date_from,
+                date_to=date_to,
+                granularity=granularity,
+            )
+        except ValueError as exc:
+            raise AppError(
+                code="metric_series_range_invalid",
+                message=str(exc),
+                status_code=400,
+            ) from exc
+        return MetricSeriesCollectionResponse(
+            club_id=club_id,
+            date_from=date_from,
+            date_to=date_to,
+            granularity=granularity,
+            series=[
+                MetricSeriesResponse(
+                    metric=metric.name,
+                    version=metric.version,
+                    points=[
+                        MetricSeriesPointResponse(
+                            period_start=point.period_start,
+                            period_end=point.period_end,
+                            result=point.result.model_dump(),
+                        )
+                        for point in series[metric.name]
+                    ],
+                )
+                for metric in definitions
+            ],
+        )
+
+    def get_metric_course_breakdown(
+        self,
+        *,
+        club_id: uuid.UUID,
+        metrics: list[str],
+        date_from: date,
+        date_to: date,
+    ) -> MetricCourseBreakdownCollectionResponse:
+        if not metrics:
+            raise AppError(
+                code="metric_course_breakdown_metrics_required",
+                message="At least one metric is required",
+                status_code=400,
+            )
+        if date_to <= date_from:
+            raise AppError(
+                code="metric_course_breakdown_range_invalid",
+                message="date_to must be strictly after date_from",
+                status_code=400,
+            )
+        try:
+            definitions = [get_metric(name) for name in dict.fromkeys(metrics)]
+        except KeyError as exc:
+            raise NotFoundError(f"Metric not found: {exc.args[0]}") from exc
+        try:
+            by_course = compute_by_course(
+                [metric.name for metric in definitions],
+                self.db,
+                club_id,
+                date_from=date_from,
+                date_to=date_to,
+            )
+        except ValueError as exc:
+            raise AppError(
+                code="metric_course_breakdown_unsupported",
+                message=str(exc),
+                status_code=400,
+            ) from exc
+        return MetricCourseBreakdownCollectionResponse(
+            club_id=club_id,
+            date_from=date_from,
+            date_to=date_to,
+            metrics=[
+                MetricCourseBreakdownResponse(
+                    metric=metric.name,
+                    version=metric.version,
+                    courses=[
+                        MetricCourseValueResponse(
+                            course_id=course_id,
+                            result=results[metric.name].model_dump(),
+                        )
+                        for course_id, results in by_course.items()
+                    ],
+                )
+                for metric in definitions
+            ],
+        )
+
     def _get_member_breakdown(self, club_id: uuid.UUID) -> MemberBreakdown:
         rows = list(
             self.db.execute(
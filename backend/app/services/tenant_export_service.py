@@ -0,0 +1,285 @@
+"""Complete extract of one club's data, written to object storage as one zip.
+
+Every entity is read with a server-side cursor (``yield_per``) and encoded as
+it streams past, one archive entry per entity, while the archive itself is
+uploaded part by part. Only the current cursor batch, the encoder buffer and
+one upload part are ever held in memory, so the footprint does not grow with
+the size of the club. ``manifest.json`` closes the archive with the row count
+of every entry.
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+
+from sqlalchemy import ColumnElement, Table, select, union
+from sqlalchemy.orm import Session
+
+from app.core.datetime import utc_now
+from app.core.exceptions import NotFoundError
+from app.models import (
+    AccountCustomer,
+    Booking,
+    BookingParticipant,
+    Club,
+    ClubMembership,
+    FinanceAccount,
+    FinanceTenderRecord,
+    FinanceTransaction,
+    Order,
+    OrderItem,
+    Person,
+    PosTransaction,
+    PosTransactionItem,
+    Product,
+)
+from app.schemas.tenant_export import (
+    TenantExportEntitySummary,
+    TenantExportFormat,
+    TenantExportProgress,
+    TenantExportReport,
+)
+from app.services._csv import iter_csv_chunks
+from app.services._zip import iter_zip_chunks
+from app.storage.object_storage import build_object_storage_client
+
+TENANT_EXPORT_STREAM_BATCH = 2_000
+TENANT_EXPORT_CHUNK_ROWS = 1_000
+TENANT_EXPORT_PROGRESS_ROWS = 10_000
+TENANT_EXPORT_CONTENT_TYPE = "application/zip"
+
+ProgressCallback = Callable[[TenantExportProgress], None]
+
+
+@dataclass(frozen=True, slots=True)
+class _ExportEntity:
+    name: str
+    table: Table
+    scope: Callable[[uuid.UUID], ColumnElement[bool]]
+
+
+def _club_people(club_id: uuid.UUID) -> ColumnElement[bool]:
+    # People are shared across clubs; export only those this club has a link to.
+    return Person.id.in_(
+        union(
+            select(ClubMembership.person_id).where(ClubMembership.club_id == club_id),
+            select(AccountCustomer.person_id).where(AccountCustomer.club_id == club_id),
+            select(BookingParticipant.person_id)
+            .join(Booking, Booking.id == BookingParticipant.booking_id)
+            .where(Booking.club_id == club_id, BookingParticipant.person_id.is_not(None)),
+        )
+    )
+
+
+TENANT_EXPORT_ENTITIES: tuple[_ExportEntity, ...] = (
+    _ExportEntity("people", Person.__table__, _club_people),
+    _ExportEntity(
+        "club_memberships",
+        ClubMembership.__table__,
+        lambda club_id: ClubMembership.club_id == club_id,
+    ),
+    _ExportEntity(
+        "account_customers",
+        AccountCustomer.__table__,
+        lambda club_id: AccountCustomer.club_id == club_id,
+    ),
+    _ExportEntity("bookings", Booking.__table__, lambda club_id: Booking.club_id == club_id),
+    _ExportEntity(
+        "booking_participants",
+        BookingParticipant.__table__,
+        lambda club_id: BookingParticipant.booking_id.in_(
+            select(Booking.id).where(Booking.club_id == club_id)
+        ),
+    ),
+    _ExportEntity(
+        "finance_accounts",
+        FinanceAccount.__table__,
+        lambda club_id: FinanceAccount.club_id == club_id,
+    ),
+    _ExportEntity(
+        "finance_transactions",
+        FinanceTransaction.__table__,
+        lambda club_id: FinanceTransaction.club_id == club_id,
+    ),
+    _ExportEntity(
+        "finance_tender_records",
+        FinanceTenderRecord.__table__,
+        lambda club_id: FinanceTenderRecord.club_id == club_id,
+    ),
+    _ExportEntity("products", Product.__table__, lambda club_id: Product.club_id == club_id),
+    _ExportEntity("orders", Order.__table__, lambda club_id: Order.club_id == club_id),
+    _ExportEntity(
+        "order_items",
+        OrderItem.__table__,
+        lambda club_id: OrderItem.order_id.in_(select(Order.id).where(Order.club_id == club_id)),
+    ),
+    _ExportEntity(
+        "pos_transactions",
+        PosTransaction.__table__,
+        lambda club_id: PosTransaction.club_id == club_id,
+    ),
+    _ExportEntity(
+        "pos_transaction_items",
+        PosTransactionItem.__table__,
+        lambda club_id: PosTransactionItem.pos_transaction_id.in_(
+            select(PosTransaction.id).where(PosTransaction.club_id == club_id)
+        ),
+    ),
+)
+
+
+def _export_value(value: object) -> object:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, uuid.UUID | Decimal):
+        return str(value)
+    if isinstance(value, datetime | date | time):
+        return value.isoformat()
+    return value
+
+
+def _csv_value(value: object) -> object:
+    if isinstance(value, dict | list):
+        return json.dumps(value, separators=(",", ":"))
+    return value
+
+
+class TenantExportService:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+        self.storage = build_object_storage_client()
+
+    def export_club(
+        self,
+        *,
+        club_id: uuid.UUID,
+        export_format: TenantExportFormat = TenantExportFormat.NDJSON,
+        progress: ProgressCallback | None = None,
+    ) -> TenantExportReport:
+        if self.db.get(Club, club_id) is None:
+            raise NotFoundError("Club not found")
+        started_at = utc_now()
+        storage_key = (
+            f"tenant-exports/{club_id}/{started_at:%Y%m%dT%H%M%SZ}-{export_format.value}.zip"
+        )
+        summaries: list[TenantExportEntitySummary] = []
+        byte_count = self.storage.put_object_stream(
+            storage_key,
+            iter_zip_chunks(
+                self._iter_entries(
+                    club_id=club_id,
+                    export_format=export_format,
+                    started_at=started_at,
+                    summaries=summaries,
+                    progress=progress,
+                )
+            ),
+            content_type=TENANT_EXPORT_CONTENT_TYPE,
+        )
+        return TenantExportReport(
+            club_id=club_id,
+            format=export_format,
+            storage_key=storage_key,
+            byte_count=byte_count,
+            started_at=started_at,
+            completed_at=utc_now(),
+            entities=summaries,
+        )
+
+    def _iter_entries(
+        self,
+        *,
+        club_id: uuid.UUID,
+        export_format: TenantExportFormat,
+        started_at: datetime,
+        summaries: list[TenantExportEntitySummary],
+        progress: ProgressCallback | None,
+    ) -> Iterator[tuple[str, Iterable[bytes]]]:
+        entity_count = len(TENANT_EXPORT_ENTITIES)
+        for index, entity in enumerate(TENANT_EXPORT_ENTITIES, start=1):
+            summary = TenantExportEntitySummary(
+                entity=entity.name,
+                file_name=f"{entity.name}.{export_format.value}",
+                row_count=0,
+            )
+            columns = [column.name for column in entity.table.columns]
+            rows = self._iter_rows(
+                entity,
+                club_id=club_id,
+                summary=summary,
+                entity_index=index,
+                entity_count=entity_count,
+                progress=progress,
+            )
+            if export_format == TenantExportFormat.CSV:
+                chunks = iter_csv_chunks(
+                    columns,
+                    ([_csv_value(value) for value in row] for row in rows),
+                    chunk_rows=TENANT_EXPORT_CHUNK_ROWS,
+                )
+            else:
+                chunks = self._iter_ndjson_chunks(columns, rows)
+            yield summary.file_name, chunks
+            summaries.append(summary)
+        manifest = {
+            "club_id": str(club_id),
+            "format": export_format.value,
+            "exported_at": started_at.isoformat(),
+            "entities": [summary.model_dump() for summary in summaries],
+        }
+        yield "manifest.json", [json.dumps(manifest, indent=2).encode("utf-8")]
+
+    def _iter_rows(
+        self,
+        entity: _ExportEntity,
+        *,
+        club_id: uuid.UUID,
+        summary: TenantExportEntitySummary,
+        entity_index: int,
+        entity_count: int,
+        progress: ProgressCallback | None,
+    ) -> Iterator[list[object]]:
+        def report(completed: bool) -> None:
+            if progress is not None:
+                progress(
+                    TenantExportProgress(
+                        entity=summary.entity,
+                        entity_index=entity_index,
+                        entity_count=entity_count,
+                        rows_written=summary.row_count,
+                        completed=completed,
+                    )
+                )
+
+        statement = (
+            select(*entity.table.columns)
+            .where(entity.scope(club_id))
+            .order_by(entity.table.c.id)
+            .execution_options(yield_per=TENANT_EXPORT_STREAM_BATCH)
+        )
+        for row in self.db.execute(statement):
+            yield [_export_value(value) for value in row]
+            summary.row_count += 1
+            if summary.row_count % TENANT_EXPORT_PROGRESS_ROWS == 0:
+                report(False)
+        report(True)
+
+    def _iter_ndjson_chunks(
+        self,
+        columns: Sequence[str],
+        rows: Iterable[list[object]],
+    ) -> Iterator[bytes]:
+        pending: list[str] = []
+        for row in rows:
+            pending.append(json.dumps(dict(zip(columns, row, strict=True)), separators=(",", ":")))
+            if len(pending) >= TENANT_EXPORT_CHUNK_ROWS:
+                yield "".join(f"{line}\n" for line in pending).encode("utf-8")
+                pending.clear()
+        if pending:
+            yield "".join(f"{line}\n" for line in pending).encode("utf-8")
@@ -0,0 +1,230 @@
+"""Utilisation heatmap: booked player places against capacity per weekday and
+local time band over the last ``weeks`` whole weeks of closed days.
+
+Three statements regardless of window length: the club calendar (timezone,
+operating hours, slot interval and active tee count), booked places grouped
+by ``(ISO weekday, band)`` over ``bookings``, and blocked or re-sized slots
+grouped the same way over ``tee_sheet_slot_states``. Capacity is generated
+from the calendar like the RevPATT slot denominator: ``(close - open) //
+interval`` slots per row per day, active tees × 2 lanes (one phantom row
+without tees), ``DEFAULT_PLAYER_CAPACITY`` places per slot unless a slot state
+says otherwise.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, date, datetime, time, timedelta
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import ColumnElement, Integer, and_, cast, extract, func, not_, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.datetime import utc_now
+from app.core.exceptions import AppError, NotFoundError
+from app.models import (
+    Booking,
+    BookingStatus,
+    Club,
+    ClubConfig,
+    Course,
+    Tee,
+    TeeSheetSlotState,
+)
+from app.schemas.reports import UtilisationHeatmapCell, UtilisationHeatmapResponse
+from app.semantic._queries import calendar_row_count, opening_minutes
+
+DEFAULT_PLAYER_CAPACITY = 4
+HEATMAP_DEFAULT_WEEKS = 8
+HEATMAP_MAX_WEEKS = 52
+HEATMAP_DEFAULT_BAND_MINUTES = 60
+HEATMAP_BAND_MINUTES = (15, 30, 60, 120, 180, 240)
+
+
+class UtilisationHeatmapService:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def heatmap(
+        self,
+        *,
+        club_id: uuid.UUID,
+        weeks: int = HEATMAP_DEFAULT_WEEKS,
+        band_minutes: int = HEATMAP_DEFAULT_BAND_MINUTES,
+        reference_date: date | None = None,
+    ) -> UtilisationHeatmapResponse:
+        """Cells for the ``weeks`` × 7 local days before ``reference_date``
+        (the club's today by default), ordered by weekday then band."""
+        if not 1 <= weeks <= HEATMAP_MAX_WEEKS:
+            raise AppError(
+                code="utilisation_heatmap_weeks_invalid",
+                message=f"weeks must be between 1 and {HEATMAP_MAX_WEEKS}",
+                status_code=400,
+            )
+        if band_minutes not in HEATMAP_BAND_MINUTES:
+            raise AppError(
+                code="utilisation_heatmap_band_invalid",
+                message=(
+                    "band_minutes must be one of "
+                    + ", ".join(str(minutes) for minutes in HEATMAP_BAND_MINUTES)
+                ),
+                status_code=400,
+            )
+        active_tees = (
+            select(func.count())
+            .select_from(Tee)
+            .join(Course, Course.id == Tee.course_id)
+            .where(Course.club_id == club_id, Tee.active.is_(True))
+            .scalar_subquery()
+        )
+        # A club without a ClubConfig row has no calendar, hence no capacity.
+        calendar = self.db.execute(
+            select(
+                func.coalesce(ClubConfig.timezone, Club.timezone),
+                ClubConfig.operating_hours,
+                ClubConfig.default_slot_interval_minutes,
+                active_tees,
+            )
+            .select_from(Club)
+            .outerjoin(ClubConfig, ClubConfig.club_id == Club.id)
+            .where(Club.id == club_id)
+        ).one_or_none()
+        if calendar is None:
+            raise NotFoundError("Club not found")
+        timezone_name, operating_hours, interval_minutes, active_tee_count = calendar
+        zone = ZoneInfo(timezone_name)
+        date_to = reference_date or utc_now().astimezone(zone).date()
+        date_from = date_to - timedelta(weeks=weeks)
+        start_utc = _local_midnight_utc(date_from, zone)
+        end_utc = _local_midnight_utc(date_to, zone)
+
+        capacity = _calendar_capacity(
+            date_from,
+            date_to,
+            operating_hours=operating_hours or {},
+            interval_minutes=interval_minutes,
+            row_count=calendar_row_count(active_tee_count),
+            band_minutes=band_minutes,
+        )
+
+        booking_weekday, booking_band = _weekday_and_band(
+            Booking.slot_datetime, timezone_name, band_minutes
+        )
+        booked = {
+            (int(weekday), int(band)): int(places)
+            for weekday, band, places in self.db.execute(
+                select(booking_weekday, booking_band, func.sum(Booking.party_size))
+                .where(
+                    Booking.club_id == club_id,
+                    Booking.status != BookingStatus.CANCELLED,
+                    Booking.slot_datetime >= start_utc,
+                    Booking.slot_datetime < end_utc,
+                )
+                .group_by(booking_weekday, booking_band)
+            )
+        }
+
+        state_weekday, state_band = _weekday_and_band(
+            TeeSheetSlotState.slot_datetime, timezone_name, band_minutes
+        )
+        places = func.coalesce(TeeSheetSlotState.player_capacity, DEFAULT_PLAYER_CAPACITY)
+        blocked = or_(
+            TeeSheetSlotState.manually_blocked.is_(True),
+            TeeSheetSlotState.competition_controlled.is_(True),
+            TeeSheetSlotState.event_controlled.is_(True),
+            TeeSheetSlotState.externally_unavailable.is_(True),
+        )
+        for weekday, band, removed in self.db.execute(
+            select(
+                state_weekday,
+                state_band,
+                func.coalesce(func.sum(places).filter(blocked), 0)
+                + func.coalesce(
+                    func.sum(DEFAULT_PLAYER_CAPACITY - TeeSheetSlotState.player_capacity).filter(
+                        and_(not_(blocked), TeeSheetSlotState.player_capacity.is_not(None))
+                    ),
+                    0,
+                ),
+            )
+            .where(
+                TeeSheetSlotState.club_id == club_id,
+                TeeSheetSlotState.slot_datetime >= start_utc,
+                TeeSheetSlotState.slot_datetime < end_utc,
+            )
+            .group_by(state_weekday, state_band)
+        ):
+            key = (int(weekday), int(band))
+            capacity[key] = max(capacity.get(key, 0) - int(removed or 0), 0)
+
+        cells: list[UtilisationHeatmapCell] = []
+        for weekday, band in sorted(capacity.keys() | booked.keys()):
+            booked_places = booked.get((weekday, band), 0)
+            capacity_places = capacity.get((weekday, band), 0)
+            cells.append(
+                UtilisationHeatmapCell(
+                    weekday=weekday,
+                    band_start=_band_start(band, band_minutes),
+                    booked_places=booked_places,
+                    capacity_places=capacity_places,
+                    utilisation=_utilisation(booked_places, capacity_places),
+                )
+            )
+        return UtilisationHeatmapResponse(
+            club_id=club_id,
+            date_from=date_from,
+            date_to=date_to,
+            band_minutes=band_minutes,
+            cells=cells,
+        )
+
+
+def _weekday_and_band(
+    column: ColumnElement[datetime],
+    timezone_name: str,
+    band_minutes: int,
+) -> tuple[ColumnElement[int], ColumnElement[int]]:
+    """Monday-based weekday and band index of ``column`` in club-local time."""
+    local = func.timezone(timezone_name, column)
+    weekday = cast(extract("isodow", local), Integer) - 1
+    band = func.floor((extract("hour", local) * 60 + extract("minute", local)) / band_minutes)
+    return weekday.label("weekday"), cast(band, Integer).label("band")
+
+
+def _calendar_capacity(
+    date_from: date,
+    date_to: date,
+    *,
+    operating_hours: dict[str, object],
+    interval_minutes: int | None,
+    row_count: int,
+    band_minutes: int,
+) -> dict[tuple[int, int], int]:
+    capacity: dict[tuple[int, int], int] = {}
+    if not interval_minutes or interval_minutes <= 0:
+        return capacity
+    current = date_from
+    while current < date_to:
+        opening = opening_minutes(operating_hours.get(current.strftime("%A").lower()))
+        if opening is not None:
+            open_minutes, close_minutes = opening
+            for index in range((close_minutes - open_minutes) // interval_minutes):
+                key = (current.weekday(), (open_minutes + index * interval_minutes) // band_minutes)
+                capacity[key] = capacity.get(key, 0) + row_count * DEFAULT_PLAYER_CAPACITY
+        current += timedelta(days=1)
+    return capacity
+
+
+def _band_start(band: int, band_minutes: int) -> time:
+    minutes = band * band_minutes
+    return time(hour=minutes // 60, minute=minutes % 60)
+
+
+def _utilisation(booked: int, capacity: int) -> Decimal | None:
+    if capacity <= 0:
+        return None
+    return (Decimal(booked) / Decimal(capacity)).quantize(Decimal("0.0001"))
+
+
+def _local_midnight_utc(local_date: date, zone: ZoneInfo) -> datetime:
+    return datetime.combine(local_date, datetime.min.time(), tzinfo=zone).astimezone(UTC)
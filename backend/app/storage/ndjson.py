@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import gzip
+import json
+import zlib
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+NDJSON_GZIP_CONTENT_TYPE = "application/x-ndjson"
+GZIP_WBITS = zlib.MAX_WBITS | 16
+
+
+def encode_ndjson_gz(records: Iterable[dict[str, Any]]) -> bytes:
+    lines = (json.dumps(record, sort_keys=True, separators=(",", ":")) for record in records)
+    return gzip.compress("".join(f"{line}\n" for line in lines).encode("utf-8"), mtime=0)
+
+
+def iter_ndjson_gz(chunks: Iterable[bytes]) -> Iterator[dict[str, Any]]:
+    """Decode gzip-compressed NDJSON incrementally from raw object chunks."""
+    decompressor = zlib.decompressobj(GZIP_WBITS)
+    pending = b""
+    for chunk in chunks:
+        pending += decompressor.decompress(chunk)
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if line:
+                yield json.loads(line)
+    pending += decompressor.flush()
+    for line in pending.split(b"\n"):
+        if line:
+            yield json.loads(line)
@@ -1,21 +1,260 @@
 from __future__ import annotations
 
+import hashlib
+import hmac
+from collections.abc import Iterable, Iterator
+from contextlib import suppress
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from http.client import HTTPResponse
+from pathlib import Path
+from typing import Protocol
+from urllib.error import HTTPError
+from urllib.parse import quote, urlsplit
+from urllib.request import Request, urlopen
+from xml.etree import ElementTree
 
 from app.config import get_settings
 
+OBJECT_READ_CHUNK_BYTES = 64 * 1024
+# S3 rejects multipart parts under 5 MiB except the last one.
+OBJECT_MULTIPART_PART_BYTES = 8 * 1024 * 1024
+EMPTY_PAYLOAD_SHA256 = hashlib.sha256(b"").hexdigest()
+
+
+class ObjectNotFoundError(LookupError):
+    pass
+
+
+class ObjectStorage(Protocol):
+    def put_object(self, key: str, body: bytes, *, content_type: str) -> None: ...
+
+    def put_object_stream(
+        self,
+        key: str,
+        chunks: Iterable[bytes],
+        *,
+        content_type: str,
+    ) -> int: ...
+
+    def iter_object(self, key: str) -> Iterator[bytes]: ...
+
+    def delete_object(self, key: str) -> None: ...
+
 
 @dataclass(slots=True)
 class ObjectStorageClient:
+    """S3-compatible client signing path-style requests with AWS Signature V4."""
+
     endpoint: str
     bucket: str
     region: str
     access_key: str
     secret_key: str
 
+    def put_object(self, key: str, body: bytes, *, content_type: str) -> None:
+        with self._send("PUT", key, body=body, content_type=content_type):
+            pass
+
+    def put_object_stream(
+        self,
+        key: str,
+        chunks: Iterable[bytes],
+        *,
+        content_type: str,
+    ) -> int:
+        """Upload a body of unknown length as a multipart upload, holding at
+        most one part in memory. Returns the number of bytes written."""
+        with self._send(
+            "POST",
+            key,
+            query={"uploads": ""},
+            content_type=content_type,
+        ) as response:
+            upload_id = ElementTree.fromstring(response.read()).findtext(".//{*}UploadId")
+        if not upload_id:
+            raise RuntimeError(f"Object storage did not return an upload id for {key}")
+        etags: list[str] = []
+        size = 0
+        try:
+            part = bytearray()
+            for chunk in chunks:
+                part += chunk
+                size += len(chunk)
+                if len(part) >= OBJECT_MULTIPART_PART_BYTES:
+                    etags.append(self._upload_part(key, upload_id, len(etags) + 1, bytes(part)))
+                    part.clear()
+            if part or not etags:
+                etags.append(self._upload_part(key, upload_id, len(etags) + 1, bytes(part)))
+            manifest = "".join(
+                f"<Part><PartNumber>{number}</PartNumber><ETag>{etag}</ETag></Part>"
+                for number, etag in enumerate(etags, start=1)
+            )
+            with self._send(
+                "POST",
+                key,
+                query={"uploadId": upload_id},
+                body=f"<CompleteMultipartUpload>{manifest}</CompleteMultipartUpload>".encode(),
+                content_type="application/xml",
+            ):
+                pass
+        except BaseException:
+            with suppress(OSError), self._send("DELETE", key, query={"uploadId": upload_id}):
+                pass
+            raise
+        return size
+
+    def iter_object(self, key: str) -> Iterator[bytes]:
+        with self._send("GET", key) as response:
+            while chunk := response.read(OBJECT_READ_CHUNK_BYTES):
+                yield chunk
+
+    def delete_object(self, key: str) -> None:
+        with self._send("DELETE", key):
+            pass
+
+    def _upload_part(self, key: str, upload_id: str, part_number: int, body: bytes) -> str:
+        with self._send(
+            "PUT",
+            key,
+            query={"partNumber": str(part_number), "uploadId": upload_id},
+            body=body,
+        ) as response:
+            return response.headers["ETag"]
+
+    def _send(
+        self,
+        method: str,
+        key: str,
+        *,
+        query: dict[str, str] | None = None,
+        body: bytes = b"",
+        content_type: str | None = None,
+    ) -> HTTPResponse:
+        endpoint = urlsplit(self.endpoint)
+        path = quote(f"/{self.bucket}/{key}", safe="/-_.~")
+        query_string = "&".join(
+            f"{quote(name, safe='-_.~')}={quote(value, safe='-_.~')}"
+            for name, value in sorted((query or {}).items())
+        )
+        now = datetime.now(UTC)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        scope = f"{now:%Y%m%d}/{self.region}/s3/aws4_request"
+        payload_hash = hashlib.sha256(body).hexdigest() if body else EMPTY_PAYLOAD_SHA256
+
+        headers = {
+            "host": endpoint.netloc,
+            "x-amz-content-sha256": payload_hash,
+            "x-amz-date": amz_date,
+        }
+        if content_type is not None:
+            headers["content-type"] = content_type
+        signed_headers = ";".join(sorted(headers))
+        canonical_request = "\n".join(
+            [
+                method,
+                path,
+                query_string,
+                "".join(f"{name}:{headers[name]}\n" for name in sorted(headers)),
+                signed_headers,
+                payload_hash,
+            ]
+        )
+        string_to_sign = "\n".join(
+            [
+                "AWS4-HMAC-SHA256",
+                amz_date,
+                scope,
+                hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+            ]
+        )
+        signing_key = f"AWS4{self.secret_key}".encode()
+        for part in scope.split("/"):
+            signing_key = hmac.new(signing_key, part.encode("utf-8"), hashlib.sha256).digest()
+        signature = hmac.new(signing_key, string_to_sign.encode("utf-8"), hashlib.sha256)
+        headers["authorization"] = (
+            f"AWS4-HMAC-SHA256 Credential={self.access_key}/{scope}, "
+            f"SignedHeaders={signed_headers}, Signature={signature.hexdigest()}"
+        )
+
+        request = Request(
+            f"{endpoint.scheme}://{endpoint.netloc}{path}"
+            + (f"?{query_string}" if query_string else ""),
+            data=body if method in {"PUT", "POST"} else None,
+            headers=headers,
+            method=method,
+        )
+        try:
+            return urlopen(request)
+        except HTTPError as exc:
+            if exc.code == 404:
+                raise ObjectNotFoundError(key) from exc
+            raise
+
+
+@dataclass(slots=True)
+class LocalObjectStorageClient:
+    """Filesystem-backed storage for tests and local development."""
+
+    root: Path
+    bucket: str
+
+    def put_object(self, key: str, body: bytes, *, content_type: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.with_name(f".{path.name}.tmp")
+        staging.write_bytes(body)
+        staging.replace(path)
+
+    def put_object_stream(
+        self,
+        key: str,
+        chunks: Iterable[bytes],
+        *,
+        content_type: str,
+    ) -> int:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.with_name(f".{path.name}.tmp")
+        size = 0
+        try:
+            with staging.open("wb") as handle:
+                for chunk in chunks:
+                    handle.write(chunk)
+                    size += len(chunk)
+        except BaseException:
+            staging.unlink(missing_ok=True)
+            raise
+        staging.replace(path)
+        return size
+
+    def iter_object(self, key: str) -> Iterator[bytes]:
+        try:
+            handle = self._path(key).open("rb")
+        except FileNotFoundError as exc:
+            raise ObjectNotFoundError(key) from exc
+        with handle:
+            while chunk := handle.read(OBJECT_READ_CHUNK_BYTES):
+                yield chunk
+
+    def delete_object(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        bucket_root = (self.root / self.bucket).resolve()
+        path = (bucket_root / key).resolve()
+        if not path.is_relative_to(bucket_root):
+            raise ValueError(f"Object key escapes the storage bucket: {key}")
+        return path
+
 
-def build_object_storage_client() -> ObjectStorageClient:
+def build_object_storage_client() -> ObjectStorage:
     settings = get_settings()
+    if settings.object_storage_backend == "local":
+        return LocalObjectStorageClient(
+            root=settings.object_storage_local_root,
+            bucket=settings.object_storage_bucket,
+        )
     return ObjectStorageClient(
         endpoint=settings.object_storage_endpoint,
         bucket=settings.object_storage_bucket,
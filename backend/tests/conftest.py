@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import re
+import tempfile
 import uuid
 from collections.abc import Generator
 from pathlib import Path
@@ -20,6 +21,14 @@ os.environ["GREENLINK_DATABASE_URL"] = os.environ.get(
 os.environ.setdefault("GREENLINK_SECRET_KEY", "pytest-only-secret-not-for-production")
 os.environ.setdefault("GREENLINK_OBJECT_STORAGE_ACCESS_KEY", "pytest-only")
 os.environ.setdefault("GREENLINK_OBJECT_STORAGE_SECRET_KEY", "pytest-only")
+# Export payloads and other blobs land in a throwaway directory via the local backend.
+os.environ.setdefault("GREENLINK_OBJECT_STORAGE_BACKEND", "local")
+os.environ.setdefault(
+    "GREENLINK_OBJECT_STORAGE_LOCAL_ROOT",
+    tempfile.mkdtemp(prefix="greenlink-object-storage-"),
+)
+# The test run is a single process, so the in-memory metric cache behaves like Redis.
+os.environ.setdefault("GREENLINK_SEMANTIC_CACHE_BACKEND", "memory")
 
 import pytest
 from alembic.config import Config
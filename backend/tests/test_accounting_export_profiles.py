@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import csv
+import hashlib
 import io
+import json
 import uuid
+import zipfile
 from datetime import UTC, datetime
 from decimal import Decimal
 
@@ -25,6 +28,12 @@ from app.models import (
     User,
 )
 from app.models.finance.transaction import FinanceTransaction
+from app.schemas.finance import AccountingExportProfileMappingConfig
+from app.services.finance.mapped_export_engine import (
+    compile_profile_mapping,
+    map_columns,
+    read_source_columns,
+)
 from tests.conftest import assert_event_emitted
 
 
@@ -443,3 +452,141 @@ def test_mapped_export_preview_surfaces_validation_errors_and_download_rejects_i
     assert "fallback_customer_code" in preview.json()["validation_errors"][0]["message"]
     assert download.status_code == 422
     assert download.json()["code"] == "accounting_export_validation_failed"
+
+
+def test_mapped_export_bundle_renders_each_target_from_one_batch(
+    client,
+    db_session: Session,
+) -> None:
+    club = _create_club(db_session, slug=f"aep-bundle-{uuid.uuid4().hex[:6]}")
+    admin = _create_user(
+        db_session,
+        email=f"aep_bundle_{uuid.uuid4().hex[:6]}@test.com",
+        role=ClubMembershipRole.CLUB_ADMIN,
+        club=club,
+    )
+    account = _create_finance_account(db_session, club=club, account_code="MAP-005")
+    _post_transaction(
+        db_session,
+        club=club,
+        account=account,
+        amount=Decimal("-45.00"),
+        tx_type=FinanceTransactionType.CHARGE,
+        source=FinanceTransactionSource.ORDER,
+        description="Bundle charge",
+        created_at=datetime(2026, 4, 8, 9, 0, tzinfo=UTC),
+    )
+
+    headers = _auth_headers(client, email=admin.email, club_id=club.id)
+    sage_profile = client.post(
+        "/api/finance/accounting-profiles",
+        headers=headers,
+        json=_profile_payload(
+            code="sage_ledger", name="Sage Ledger", target_system="sage_like", is_active=False
+        ),
+    ).json()
+    journal_profile = client.post(
+        "/api/finance/accounting-profiles", headers=headers, json=_profile_payload()
+    ).json()
+    broken_profile = AccountingExportProfile(
+        club_id=club.id,
+        code="broken_bundle",
+        name="Broken Bundle",
+        target_system="generic_journal",
+        is_active=False,
+        mapping_config_json={"reference_prefix": "GL", "transaction_mappings": {}},
+        created_by_person_id=admin.person_id,
+    )
+    db_session.add(broken_profile)
+    db_session.commit()
+    db_session.refresh(broken_profile)
+    batch = _create_canonical_batch(client, headers=headers)
+
+    bundle = client.get(
+        f"/api/finance/export-batches/{batch['id']}/mapped-export/bundle",
+        headers=headers,
+        params={"profile_id": [journal_profile["id"], sage_profile["id"], str(broken_profile.id)]},
+    )
+    default_bundle = client.get(
+        f"/api/finance/export-batches/{batch['id']}/mapped-export/bundle", headers=headers
+    )
+    preview = client.get(
+        f"/api/finance/export-batches/{batch['id']}/mapped-export",
+        headers=headers,
+        params={"profile_id": journal_profile["id"]},
+    )
+
+    assert bundle.status_code == 200
+    assert bundle.headers["content-type"] == "application/zip"
+    archive = zipfile.ZipFile(io.BytesIO(bundle.content))
+    manifest = json.loads(archive.read("manifest.json"))
+    targets = {target["accounting_profile_code"]: target for target in manifest["targets"]}
+    assert manifest["source_batch_id"] == batch["id"]
+    assert manifest["target_count"] == 3
+    assert manifest["ready_count"] == 1
+    assert targets["generic_journal_ops"]["content_hash"] == preview.json()["content_hash"]
+    assert targets["sage_ledger"]["target_system"] == "sage_like"
+    assert targets["sage_ledger"]["row_count"] == 1
+    # "GL-<transaction uuid>" is longer than Sage-like's 30 character reference limit.
+    assert targets["sage_ledger"]["download_ready"] is False
+    assert targets["sage_ledger"]["validation_errors"][0]["code"] == (
+        "accounting_export_sage_reference_too_long"
+    )
+    assert targets["broken_bundle"]["download_ready"] is False
+    assert targets["broken_bundle"]["validation_errors"][0]["code"] == (
+        "accounting_export_profile_invalid"
+    )
+    assert sorted(archive.namelist()) == sorted(
+        ["manifest.json", targets["generic_journal_ops"]["file_name"]]
+    )
+    journal_csv = archive.read(targets["generic_journal_ops"]["file_name"]).decode("utf-8")
+    parsed = list(csv.DictReader(io.StringIO(journal_csv)))
+    assert parsed[0]["description"] == "Charge Bundle charge"
+
+    assert default_bundle.status_code == 200
+    default_manifest = json.loads(
+        zipfile.ZipFile(io.BytesIO(default_bundle.content)).read("manifest.json")
+    )
+    assert [target["accounting_profile_code"] for target in default_manifest["targets"]] == [
+        "generic_journal_ops"
+    ]
+
+
+def test_columnar_mapping_reports_errors_row_by_row_and_hashes_canonical_rows() -> None:
+    mapping_config = _profile_payload()["mapping_config"]
+    mapping_config["transaction_mappings"]["payment"]["debit_account_code"] = "1000-bank"
+    config = AccountingExportProfileMappingConfig.model_validate(mapping_config)
+    records = [
+        {
+            "entry_date": "2026-04-08",
+            "transaction_id": f"tx-{index}",
+            "account_customer_code": None if index == 2 else "ACC-1",
+            "transaction_type": "charge" if index % 2 else "payment",
+            "source": "pos",
+            "reference_id": None,
+            "description": "Long description " * 5 if index == 1 else "Green fee",
+            "amount": "-10.00" if index % 2 else "10.00",
+            "debit_amount": "0.00",
+            "credit_amount": "0.00",
+        }
+        for index in range(1, 4)
+    ]
+
+    mapped = map_columns(
+        read_source_columns(records),
+        compile_profile_mapping(config, target_system="sage_like"),
+    )
+
+    assert mapped.row_count == 3
+    assert [(error.row_index, error.code) for error in mapped.validation_errors] == [
+        (1, "accounting_export_sage_description_too_long"),
+        (2, "accounting_export_sage_debit_account_code_case_invalid"),
+    ]
+    rows = mapped.to_preview_rows()
+    assert rows[1].customer_account_code == "UNASSIGNED"
+    assert rows[1].description == "Payment Green fee"
+    assert rows[0].amount == "10.00"
+    canonical = json.dumps(
+        [row.model_dump(mode="json") for row in rows], sort_keys=True, separators=(",", ":")
+    )
+    assert mapped.content_hash() == hashlib.sha256(canonical.encode("utf-8")).hexdigest()
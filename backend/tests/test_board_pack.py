@@ -0,0 +1,308 @@
+"""Monthly board pack: the two-page report and its ``POST /board-pack`` route."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import AppError
+from app.core.security import hash_password
+from app.domain.people.normalization import build_full_name, normalize_email
+from app.models import (
+    AccountCustomer,
+    Booking,
+    BookingParticipant,
+    BookingParticipantType,
+    BookingSource,
+    BookingStatus,
+    Club,
+    ClubConfig,
+    ClubMembership,
+    ClubMembershipRole,
+    ClubMembershipStatus,
+    Course,
+    FinanceAccount,
+    FinanceAccountStatus,
+    FinanceTransaction,
+    FinanceTransactionSource,
+    FinanceTransactionType,
+    Person,
+    Tee,
+    User,
+)
+from app.services.board_pack_service import BoardPackService
+from app.storage.object_storage import build_object_storage_client
+
+WINDOW_DAY = date(2026, 7, 6)
+
+
+def _seed_club(db: Session, *, slug: str, open_close: tuple[str, str] = ("06:00", "07:00")) -> Club:
+    club = Club(name=f"KPI {slug}", slug=slug, timezone="Africa/Johannesburg")
+    db.add(club)
+    db.commit()
+    db.refresh(club)
+    db.add(
+        ClubConfig(
+            club_id=club.id,
+            timezone="Africa/Johannesburg",
+            operating_hours={
+                day: {"open": open_close[0], "close": open_close[1], "closed": False}
+                for day in (
+                    "monday",
+                    "tuesday",
+                    "wednesday",
+                    "thursday",
+                    "friday",
+                    "saturday",
+                    "sunday",
+                )
+            },
+            booking_window_days=14,
+            cancellation_policy_hours=24,
+            default_slot_interval_minutes=30,
+        )
+    )
+    db.commit()
+    return club
+
+
+def _seed_course_and_tee(db: Session, *, club: Club) -> tuple[Course, Tee]:
+    course = Course(club_id=club.id, name="Main", holes=18, active=True)
+    db.add(course)
+    db.flush()
+    tee = Tee(
+        course_id=course.id,
+        name="Blue",
+        slope_rating=128,
+        course_rating="72.4",
+        color_code="#1b4d8f",
+        active=True,
+    )
+    db.add(tee)
+    db.commit()
+    db.refresh(course)
+    db.refresh(tee)
+    return course, tee
+
+
+def _seed_user(
+    db: Session,
+    *,
+    email: str,
+    club: Club,
+    role: ClubMembershipRole = ClubMembershipRole.MEMBER,
+) -> User:
+    local = email.split("@")[0]
+    person = Person(
+        first_name=local.title(),
+        last_name="Member",
+        full_name=build_full_name(local.title(), "Member"),
+        email=normalize_email(email),
+        normalized_email=normalize_email(email),
+        profile_metadata={},
+    )
+    db.add(person)
+    db.flush()
+    user = User(
+        email=email,
+        password_hash=hash_password("password123"),
+        display_name=local,
+        person_id=person.id,
+    )
+    db.add(user)
+    db.flush()
+    db.add(
+        ClubMembership(
+            person_id=person.id,
+            club_id=club.id,
+            role=role,
+            status=ClubMembershipStatus.ACTIVE,
+            is_primary=True,
+            joined_at=datetime(2025, 1, 1, tzinfo=UTC),
+        )
+    )
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def _seed_finance_account(
+    db: Session, *, club: Club, person: Person
+) -> tuple[AccountCustomer, FinanceAccount]:
+    customer = AccountCustomer(
+        club_id=club.id,
+        person_id=person.id,
+        account_code=f"AC-{uuid.uuid4().hex[:8]}",
+        active=True,
+        billing_metadata={},
+    )
+    db.add(customer)
+    db.flush()
+    account = FinanceAccount(
+        club_id=club.id,
+        account_customer_id=customer.id,
+        status=FinanceAccountStatus.ACTIVE,
+    )
+    db.add(account)
+    db.commit()
+    db.refresh(account)
+    return customer, account
+
+
+def _seed_booking_with_charge(
+    db: Session,
+    *,
+    club: Club,
+    course: Course,
+    tee: Tee,
+    person: Person,
+    account: FinanceAccount,
+    slot_local_hour: int,
+    status: BookingStatus,
+    party_size: int = 2,
+    fee_amount: Decimal = Decimal("325.00"),
+    day: date = WINDOW_DAY,
+) -> Booking:
+    slot_utc = datetime(day.year, day.month, day.day, slot_local_hour - 2, 0, tzinfo=UTC)
+    booking = Booking(
+        club_id=club.id,
+        course_id=course.id,
+        tee_id=tee.id,
+        slot_datetime=slot_utc,
+        slot_interval_minutes=30,
+        status=status,
+        source=BookingSource.ADMIN,
+        party_size=party_size,
+        primary_person_id=person.id,
+        fee_amount=fee_amount,
+        fee_currency="ZAR",
+    )
+    db.add(booking)
+    db.flush()
+    db.add(
+        BookingParticipant(
+            booking_id=booking.id,
+            person_id=person.id,
+            participant_type=BookingParticipantType.MEMBER,
+            display_name="Primary",
+            sort_order=0,
+            is_primary=True,
+        )
+    )
+    db.add(
+        FinanceTransaction(
+            club_id=club.id,
+            account_id=account.id,
+            amount=-fee_amount,
+            type=FinanceTransactionType.CHARGE,
+            source=FinanceTransactionSource.BOOKING,
+            reference_id=booking.id,
+            description="Green fee",
+            created_at=slot_utc,
+        )
+    )
+    db.commit()
+    db.refresh(booking)
+    return booking
+
+
+def _auth_headers(client: TestClient, *, email: str, club_id: uuid.UUID) -> dict[str, str]:
+    response = client.post("/api/auth/login", json={"email": email, "password": "password123"})
+    assert response.status_code == 200
+    return {
+        "Authorization": f"Bearer {response.json()['access_token']}",
+        "X-Club-Id": str(club_id),
+    }
+
+
+def test_board_pack_covers_a_closed_month_with_a_twelve_month_trend(db_session: Session) -> None:
+    club = _seed_club(db_session, slug="kpi-board-pack")
+    course, tee = _seed_course_and_tee(db_session, club=club)
+    member = _seed_user(db_session, email="kpi-board-pack@example.com", club=club)
+    _, account = _seed_finance_account(db_session, club=club, person=member.person)
+    _seed_booking_with_charge(
+        db_session,
+        club=club,
+        course=course,
+        tee=tee,
+        person=member.person,
+        account=account,
+        slot_local_hour=6,
+        status=BookingStatus.COMPLETED,
+        party_size=4,
+        fee_amount=Decimal("650.00"),
+    )
+    club_id = club.id
+    service = BoardPackService(db_session)
+    now = datetime(2026, 8, 3, 8, 0, tzinfo=UTC)
+
+    with pytest.raises(AppError) as exc_info:
+        service.generate(club_id=club_id, month=date(2026, 8, 1), now=now)
+    assert exc_info.value.code == "board_pack_month_open"
+
+    pack = service.generate(club_id=club_id, now=now)
+
+    assert pack.month == date(2026, 7, 1)
+    assert pack.trend_from == date(2025, 8, 1)
+    assert pack.financial.revenue == Decimal("650.00")
+    assert len(pack.financial.revenue_trend) == 12
+    assert pack.financial.active_members == 1
+    kpis = {kpi.metric: kpi for kpi in pack.operational.kpis}
+    # The weather metric is still a stub and has no place in a board report.
+    assert "weather_adjusted_utilisation" not in kpis
+    assert kpis["rounds_played"].value == Decimal("4")
+    assert kpis["revpur"].value == Decimal("162.50")
+    assert [point.month for point in kpis["revpur"].trend][-2:] == [
+        date(2026, 6, 1),
+        date(2026, 7, 1),
+    ]
+    assert kpis["revpur"].trend[-2].value == Decimal("0")
+    stored = b"".join(build_object_storage_client().iter_object(pack.storage_key)).decode()
+    assert pack.storage_key == f"board-packs/{club_id}/2026-07.html"
+    assert stored.count('class="page"') == 2
+    assert "Rounds played" in stored
+
+
+def test_board_pack_route_requires_write_access_and_a_closed_month(
+    client: TestClient, db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    club = _seed_club(db_session, slug="board-pack-route")
+    admin = _seed_user(
+        db_session,
+        email="board-pack-admin@example.com",
+        club=club,
+        role=ClubMembershipRole.CLUB_ADMIN,
+    )
+    member = _seed_user(db_session, email="board-pack-member@example.com", club=club)
+    club_id = club.id
+    monkeypatch.setattr(
+        "app.services.board_pack_service.utc_now",
+        lambda: datetime(2026, 8, 3, 8, 0, tzinfo=UTC),
+    )
+
+    denied = client.post(
+        "/api/admin/reports/board-pack",
+        headers=_auth_headers(client, email=member.email, club_id=club_id),
+    )
+    assert denied.status_code == 403
+
+    headers = _auth_headers(client, email=admin.email, club_id=club_id)
+    open_month = client.post(
+        "/api/admin/reports/board-pack", params={"month": "2026-08-01"}, headers=headers
+    )
+    assert open_month.status_code == 400
+    assert open_month.json()["code"] == "board_pack_month_open"
+
+    response = client.post("/api/admin/reports/board-pack", headers=headers)
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["month"] == "2026-07-01"
+    assert payload["storage_key"] == f"board-packs/{club_id}/2026-07.html"
+    stored = b"".join(build_object_storage_client().iter_object(payload["storage_key"])).decode()
+    assert stored.count('class="page"') == 2
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from datetime import UTC, date, datetime
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
 
 from fastapi.testclient import TestClient
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from app.core.datetime import utc_now
 from app.core.security import hash_password
 from app.domain.people.normalization import build_full_name, normalize_email
 from app.models import (
+    AccountCustomer,
     Booking,
     BookingParticipant,
     BookingParticipantType,
@@ -26,6 +29,10 @@ from app.models import (
     ClubMembershipRole,
     ClubMembershipStatus,
     Course,
+    FinanceAccount,
+    FinanceTransaction,
+    FinanceTransactionSource,
+    FinanceTransactionType,
     Person,
     PricingDayType,
     PricingMatrix,
@@ -39,6 +46,7 @@ from app.models import (
     TeeSheetSlotState,
     User,
 )
+from app.services.finance.arrears_block_service import ArrearsBlockService
 from tests.conftest import assert_event_emitted
 
 
@@ -745,3 +753,112 @@ def test_booking_create_with_walk_in_source_persists_and_emits_audit(
         entity_id=payload["booking"]["id"],
         action="booking.created",
     )
+
+
+def test_booking_create_blocks_member_with_overdue_account_until_payment_posts(
+    client: TestClient, db_session: Session
+) -> None:
+    admin = _create_user(db_session, email="arrears-admin@example.com")
+    member = _create_user(db_session, email="arrears-member@example.com")
+    club = _create_club(db_session, name="Arrears Club", slug="arrears-club")
+    _assign_membership(db_session, user=admin, club=club, role=ClubMembershipRole.CLUB_ADMIN)
+    _assign_membership(db_session, user=member, club=club, role=ClubMembershipRole.MEMBER)
+    course, tee = _seed_course_stack(db_session, club=club)
+    config = _seed_club_config(db_session, club=club)
+    _seed_rules(db_session, club=club)
+
+    account_customer = AccountCustomer(
+        club_id=club.id,
+        person_id=member.person_id,
+        account_code="ARR-001",
+        active=True,
+        billing_metadata={},
+    )
+    db_session.add(account_customer)
+    db_session.flush()
+    account = FinanceAccount(club_id=club.id, account_customer_id=account_customer.id)
+    db_session.add(account)
+    db_session.flush()
+    db_session.add(
+        FinanceTransaction(
+            club_id=club.id,
+            account_id=account.id,
+            amount=Decimal("-450.00"),
+            type=FinanceTransactionType.CHARGE,
+            source=FinanceTransactionSource.MANUAL,
+            description="Annual levy",
+            created_at=utc_now() - timedelta(days=45),
+        )
+    )
+    slot_datetime = datetime(2026, 3, 30, 4, 0, tzinfo=UTC)
+    db_session.add(
+        TeeSheetSlotState(
+            club_id=club.id,
+            course_id=course.id,
+            tee_id=tee.id,
+            slot_datetime=slot_datetime,
+            player_capacity=4,
+            manually_blocked=False,
+            reserved_state_active=False,
+            competition_controlled=False,
+            event_controlled=False,
+            externally_unavailable=False,
+        )
+    )
+    db_session.commit()
+    # Blocking is opt-in per club.
+    arrears = ArrearsBlockService(db_session)
+    assert not arrears.is_blocked(club_id=club.id, person_id=member.person_id)
+    config.arrears_block_enabled = True
+    db_session.commit()
+
+    headers = _auth_headers(client, admin.email, str(club.id))
+    booking_request = {
+        "course_id": str(course.id),
+        "tee_id": str(tee.id),
+        "slot_datetime": slot_datetime.isoformat(),
+        "source": "admin",
+        "applies_to": "member",
+        "reference_datetime": datetime(2026, 3, 25, 6, 0, tzinfo=UTC).isoformat(),
+        "participants": [
+            {
+                "participant_type": "member",
+                "person_id": str(member.person_id),
+                "is_primary": True,
+            }
+        ],
+    }
+    blocked = client.post("/api/golf/bookings", headers=headers, json=booking_request)
+    assert blocked.status_code == 201
+    blocked_payload = blocked.json()
+    assert blocked_payload["decision"] == "blocked"
+    arrears_blockers = [
+        item
+        for item in blocked_payload["availability"]["blockers"]
+        if item["code"] == "account_in_arrears"
+    ]
+    assert len(arrears_blockers) == 1
+    assert "overdue balance" in arrears_blockers[0]["reason"]
+    assert db_session.scalar(select(func.count()).select_from(Booking)) == 0
+
+    payment = client.post(
+        "/api/finance/transactions",
+        headers=headers,
+        json={
+            "account_id": str(account.id),
+            "amount": "450.00",
+            "type": "payment",
+            "source": "manual",
+            "description": "Levy settled",
+        },
+    )
+    assert payment.status_code == 201
+
+    allowed = client.post("/api/golf/bookings", headers=headers, json=booking_request)
+    assert allowed.status_code == 201
+    allowed_payload = allowed.json()
+    assert allowed_payload["decision"] == "allowed"
+    assert any(
+        item["code"] == "account_in_good_standing"
+        for item in allowed_payload["availability"]["resolved_checks"]
+    )
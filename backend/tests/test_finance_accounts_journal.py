@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import csv
+import io
 import uuid
+import zipfile
+from datetime import UTC, datetime
 from decimal import Decimal
 
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.core.security import hash_password
@@ -386,3 +392,223 @@ def test_get_club_journal_is_club_scoped(client: TestClient, db_session: Session
     data = resp.json()
     assert data["total_count"] == 1
     assert data["entries"][0]["description"] == "Club A transaction"
+
+
+def test_get_club_journal_pages_by_cursor_in_both_directions(
+    client: TestClient, db_session: Session
+) -> None:
+    club = _create_club(db_session, slug=f"jnl-page-{uuid.uuid4().hex[:6]}")
+    admin = _create_user(
+        db_session,
+        email=f"jnl_page_{uuid.uuid4().hex[:6]}@test.com",
+        role=ClubMembershipRole.CLUB_ADMIN,
+        club=club,
+    )
+    _, fa = _create_finance_account(db_session, club=club, account_code="PAGE-001")
+    for index in range(1, 6):
+        _post_transaction(
+            db_session,
+            club=club,
+            account=fa,
+            amount=Decimal("-10.00") if index % 2 else Decimal("10.00"),
+            tx_type=FinanceTransactionType.CHARGE if index % 2 else FinanceTransactionType.PAYMENT,
+            source=FinanceTransactionSource.MANUAL,
+            description=f"Entry {index}",
+        )
+
+    headers = _auth_headers(client, email=admin.email)
+    headers["X-Club-Id"] = str(club.id)
+
+    def descriptions(payload: dict) -> list[str]:
+        return [entry["description"] for entry in payload["entries"]]
+
+    first = client.get("/api/finance/journal", headers=headers, params={"limit": 2}).json()
+    assert descriptions(first) == ["Entry 5", "Entry 4"]
+    assert first["total_count"] == 5
+    assert first["total_count_is_estimate"] is False
+    assert first["prev_cursor"] is None
+
+    second = client.get(
+        "/api/finance/journal",
+        headers=headers,
+        params={"limit": 2, "after": first["next_cursor"]},
+    ).json()
+    assert descriptions(second) == ["Entry 3", "Entry 2"]
+
+    last = client.get(
+        "/api/finance/journal",
+        headers=headers,
+        params={"limit": 2, "after": second["next_cursor"]},
+    ).json()
+    assert descriptions(last) == ["Entry 1"]
+    assert last["next_cursor"] is None
+
+    back = client.get(
+        "/api/finance/journal",
+        headers=headers,
+        params={"limit": 2, "before": last["prev_cursor"]},
+    ).json()
+    assert descriptions(back) == ["Entry 3", "Entry 2"]
+    assert back["prev_cursor"] is not None
+
+    payments = client.get(
+        "/api/finance/journal",
+        headers=headers,
+        params={"type": "payment", "account_id": str(fa.id)},
+    ).json()
+    assert descriptions(payments) == ["Entry 4", "Entry 2"]
+    assert payments["total_count"] == 2
+
+    invalid = client.get("/api/finance/journal", headers=headers, params={"after": "not-a-cursor"})
+    assert invalid.status_code == 400
+    assert invalid.json()["code"] == "finance_journal_cursor_invalid"
+
+
+def test_get_club_journal_falls_back_to_the_planner_estimate_past_the_count_cap(
+    client: TestClient, db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    club = _create_club(db_session, slug=f"jnl-est-{uuid.uuid4().hex[:6]}")
+    admin = _create_user(
+        db_session,
+        email=f"jnl_est_{uuid.uuid4().hex[:6]}@test.com",
+        role=ClubMembershipRole.CLUB_ADMIN,
+        club=club,
+    )
+    _, fa = _create_finance_account(db_session, club=club, account_code="EST-001")
+    for index in range(1, 6):
+        _post_transaction(
+            db_session,
+            club=club,
+            account=fa,
+            amount=Decimal("-10.00"),
+            tx_type=FinanceTransactionType.CHARGE,
+            source=FinanceTransactionSource.MANUAL,
+            description=f"Entry {index}",
+        )
+    monkeypatch.setattr("app.services.finance.ledger_service.JOURNAL_EXACT_COUNT_LIMIT", 2)
+    headers = _auth_headers(client, email=admin.email)
+    headers["X-Club-Id"] = str(club.id)
+
+    unfiltered = client.get("/api/finance/journal", headers=headers, params={"limit": 2}).json()
+    # The planner estimate is compiled with literal enum and UUID filters.
+    filtered = client.get(
+        "/api/finance/journal",
+        headers=headers,
+        params={"limit": 2, "type": "charge", "account_id": str(fa.id)},
+    ).json()
+
+    for payload in (unfiltered, filtered):
+        assert payload["total_count_is_estimate"] is True
+        assert payload["total_count"] > 2
+        assert len(payload["entries"]) == 2
+
+
+# ---------------------------------------------------------------------------
+# GET /api/finance/statements/download
+# ---------------------------------------------------------------------------
+
+
+def test_statement_archive_renders_each_member_with_opening_and_closing_balance(
+    client: TestClient, db_session: Session
+) -> None:
+    club = _create_club(db_session, slug=f"stm-{uuid.uuid4().hex[:6]}")
+    admin = _create_user(
+        db_session,
+        email=f"stm_{uuid.uuid4().hex[:6]}@test.com",
+        role=ClubMembershipRole.CLUB_ADMIN,
+        club=club,
+    )
+    _, active = _create_finance_account(db_session, club=club, account_code="STM-A")
+    _, quiet = _create_finance_account(db_session, club=club, account_code="STM-B")
+    for account, amount, tx_type, description, created_at in (
+        (
+            active,
+            "-120.00",
+            FinanceTransactionType.CHARGE,
+            "March levy",
+            datetime(2026, 3, 20, 8, tzinfo=UTC),
+        ),
+        (
+            active,
+            "-80.00",
+            FinanceTransactionType.CHARGE,
+            "April green fee",
+            datetime(2026, 4, 5, 8, tzinfo=UTC),
+        ),
+        (
+            active,
+            "150.00",
+            FinanceTransactionType.PAYMENT,
+            "April payment",
+            datetime(2026, 4, 18, 8, tzinfo=UTC),
+        ),
+        (
+            active,
+            "-40.00",
+            FinanceTransactionType.CHARGE,
+            "May bar tab",
+            datetime(2026, 5, 2, 8, tzinfo=UTC),
+        ),
+        (
+            quiet,
+            "-25.00",
+            FinanceTransactionType.CHARGE,
+            "March locker",
+            datetime(2026, 3, 10, 8, tzinfo=UTC),
+        ),
+    ):
+        # Finance transactions are immutable through the ORM; backdate them with a Core insert.
+        db_session.execute(
+            insert(FinanceTransaction.__table__).values(
+                club_id=club.id,
+                account_id=account.id,
+                amount=Decimal(amount),
+                type=tx_type,
+                source=FinanceTransactionSource.MANUAL,
+                description=description,
+                created_at=created_at,
+            )
+        )
+    db_session.commit()
+
+    headers = _auth_headers(client, email=admin.email)
+    headers["X-Club-Id"] = str(club.id)
+    resp = client.get(
+        "/api/finance/statements/download",
+        headers=headers,
+        params={"date_from": "2026-04-01", "date_to": "2026-04-30"},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/zip"
+
+    archive = zipfile.ZipFile(io.BytesIO(resp.content))
+    active_file = f"statements/STM-A-{active.id}.csv"
+    quiet_file = f"statements/STM-B-{quiet.id}.csv"
+    assert archive.namelist() == [active_file, quiet_file, "summary.csv"]
+    active_rows = list(csv.reader(io.StringIO(archive.read(active_file).decode())))
+    assert [row[1] for row in active_rows[1:]] == [
+        "Opening balance",
+        "April green fee",
+        "April payment",
+        "Closing balance",
+    ]
+    assert active_rows[1][7] == "-120.00"
+    assert active_rows[-1][7] == "-50.00"
+    summary = list(csv.DictReader(io.StringIO(archive.read("summary.csv").decode())))
+    assert [
+        (
+            row["account_customer_code"],
+            row["opening_balance"],
+            row["closing_balance"],
+            row["line_count"],
+        )
+        for row in summary
+    ] == [("STM-A", "-120.00", "-50.00", "2"), ("STM-B", "-25.00", "-25.00", "0")]
+
+    invalid = client.get(
+        "/api/finance/statements/download",
+        headers=headers,
+        params={"date_from": "2026-04-30", "date_to": "2026-04-01"},
+    )
+    assert invalid.status_code == 400
+    assert invalid.json()["code"] == "finance_statement_range_invalid"
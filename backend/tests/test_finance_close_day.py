@@ -0,0 +1,480 @@
+from __future__ import annotations
+
+import csv
+import io
+import uuid
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.security import hash_password
+from app.domain.people.normalization import build_full_name, normalize_email
+from app.models import (
+    AccountCustomer,
+    AccountingExportProfile,
+    Club,
+    ClubConfig,
+    ClubMembership,
+    ClubMembershipRole,
+    ClubMembershipStatus,
+    FinanceAccount,
+    FinanceExportBatch,
+    FinanceTenderReconciliation,
+    FinanceTenderReconciliationStatus,
+    FinanceTransactionSource,
+    FinanceTransactionType,
+    Person,
+    PosTransaction,
+    User,
+)
+from app.models.enums import TenderType
+from app.models.finance.transaction import FinanceTransaction
+from app.services.finance.close_day_service import FinanceCloseDayService
+from app.services.finance.tender_reconciliation_service import (
+    FinanceTenderReconciliationService,
+)
+from app.storage.object_storage import build_object_storage_client
+
+
+def _create_club(db: Session, *, slug: str, timezone: str = "Africa/Johannesburg") -> Club:
+    club = Club(name=f"Club {slug}", slug=slug, timezone=timezone)
+    db.add(club)
+    db.commit()
+    db.refresh(club)
+    return club
+
+
+def _create_user(db: Session, *, email: str, club: Club) -> User:
+    local = email.split("@")[0]
+    person = Person(
+        first_name=local.title(),
+        last_name="Close",
+        full_name=build_full_name(local.title(), "Close"),
+        email=normalize_email(email),
+        normalized_email=normalize_email(email),
+        profile_metadata={},
+    )
+    db.add(person)
+    db.flush()
+    user = User(
+        email=email,
+        password_hash=hash_password("password123"),
+        display_name=local,
+        person_id=person.id,
+    )
+    db.add(user)
+    db.flush()
+    db.add(
+        ClubMembership(
+            person_id=person.id,
+            club_id=club.id,
+            role=ClubMembershipRole.CLUB_ADMIN,
+            status=ClubMembershipStatus.ACTIVE,
+        )
+    )
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def _create_finance_account(db: Session, *, club: Club, account_code: str) -> FinanceAccount:
+    local = account_code.lower()
+    person = Person(
+        first_name=local.title(),
+        last_name="Member",
+        full_name=build_full_name(local.title(), "Member"),
+        email=normalize_email(f"{local}_{uuid.uuid4().hex[:6]}@test.com"),
+        normalized_email=normalize_email(f"{local}_{uuid.uuid4().hex[:6]}@test.com"),
+        profile_metadata={},
+    )
+    db.add(person)
+    db.flush()
+    account_customer = AccountCustomer(
+        club_id=club.id,
+        person_id=person.id,
+        account_code=account_code,
+        active=True,
+        billing_metadata={},
+    )
+    db.add(account_customer)
+    db.flush()
+    finance_account = FinanceAccount(club_id=club.id, account_customer_id=account_customer.id)
+    db.add(finance_account)
+    db.commit()
+    db.refresh(finance_account)
+    return finance_account
+
+
+def _post_transaction(
+    db: Session,
+    *,
+    club: Club,
+    account: FinanceAccount,
+    amount: Decimal,
+    tx_type: FinanceTransactionType,
+    created_at: datetime,
+) -> FinanceTransaction:
+    transaction = FinanceTransaction(
+        club_id=club.id,
+        account_id=account.id,
+        amount=amount,
+        type=tx_type,
+        source=FinanceTransactionSource.MANUAL,
+        description=f"Close day {tx_type.value}",
+        created_at=created_at,
+    )
+    db.add(transaction)
+    db.commit()
+    db.refresh(transaction)
+    return transaction
+
+
+def _create_profile(db: Session, *, club: Club, created_by: User) -> AccountingExportProfile:
+    profile = AccountingExportProfile(
+        club_id=club.id,
+        code="close_day_journal",
+        name="Close Day Journal",
+        target_system="generic_journal",
+        is_active=True,
+        mapping_config_json={
+            "reference_prefix": "GL",
+            "fallback_customer_code": "UNASSIGNED",
+            "transaction_mappings": {
+                "charge": {
+                    "debit_account_code": "1100-AR",
+                    "credit_account_code": "4000-SALES",
+                    "description_prefix": "Charge",
+                },
+                "payment": {
+                    "debit_account_code": "1000-BANK",
+                    "credit_account_code": "1100-AR",
+                    "description_prefix": "Payment",
+                },
+                "adjustment": {
+                    "debit_account_code": "9990-ADJUST",
+                    "credit_account_code": "9990-ADJUST",
+                    "description_prefix": "Adjust",
+                },
+                "refund": {
+                    "debit_account_code": "4000-SALES",
+                    "credit_account_code": "1100-AR",
+                    "description_prefix": "Refund",
+                },
+            },
+        },
+        created_by_person_id=created_by.person_id,
+    )
+    db.add(profile)
+    db.commit()
+    db.refresh(profile)
+    return profile
+
+
+def _close_day_service(db: Session) -> FinanceCloseDayService:
+    return FinanceCloseDayService(
+        sessionmaker(bind=db.get_bind(), autoflush=False, expire_on_commit=False),
+        max_workers=2,
+    )
+
+
+def test_close_day_exports_each_club_once_per_business_date(db_session: Session) -> None:
+    active_club = _create_club(db_session, slug=f"close-a-{uuid.uuid4().hex[:6]}")
+    quiet_club = _create_club(db_session, slug=f"close-b-{uuid.uuid4().hex[:6]}")
+    admin = _create_user(
+        db_session, email=f"close_{uuid.uuid4().hex[:6]}@test.com", club=active_club
+    )
+    account = _create_finance_account(db_session, club=active_club, account_code="CLS-001")
+    _post_transaction(
+        db_session,
+        club=active_club,
+        account=account,
+        amount=Decimal("-80.00"),
+        tx_type=FinanceTransactionType.CHARGE,
+        created_at=datetime(2026, 4, 10, 9, 0, tzinfo=UTC),
+    )
+    _post_transaction(
+        db_session,
+        club=active_club,
+        account=account,
+        amount=Decimal("80.00"),
+        tx_type=FinanceTransactionType.PAYMENT,
+        created_at=datetime(2026, 4, 10, 11, 0, tzinfo=UTC),
+    )
+    profile = _create_profile(db_session, club=active_club, created_by=admin)
+    service = _close_day_service(db_session)
+    club_ids = [active_club.id, quiet_club.id]
+
+    first = service.run(actor_email=admin.email, business_date=date(2026, 4, 10), club_ids=club_ids)
+
+    assert first.club_count == 2
+    assert first.completed_count == 1
+    assert first.no_transaction_count == 1
+    assert first.failed_count == 0
+    results = {result.club_id: result for result in first.clubs}
+    closed = results[active_club.id]
+    assert closed.status == "completed"
+    assert closed.batch_created is True
+    assert [item.accounting_profile_id for item in closed.profiles] == [profile.id]
+    exported = closed.profiles[0]
+    assert exported.status == "exported"
+    assert exported.storage_key == (
+        f"finance-close-day/{active_club.id}/2026-04-10/{exported.file_name}"
+    )
+    stored_csv = b"".join(build_object_storage_client().iter_object(exported.storage_key))
+    parsed = list(csv.DictReader(io.StringIO(stored_csv.decode("utf-8"))))
+    assert len(parsed) == 2
+    assert results[quiet_club.id].status == "no_transactions"
+    assert results[quiet_club.id].error_code == "finance_export_empty"
+
+    second = service.run(
+        actor_email=admin.email, business_date=date(2026, 4, 10), club_ids=club_ids
+    )
+
+    rerun = {result.club_id: result for result in second.clubs}[active_club.id]
+    assert rerun.batch_id == closed.batch_id
+    assert rerun.batch_created is False
+    assert rerun.profiles[0].status == "already_exported"
+    assert rerun.profiles[0].storage_key == exported.storage_key
+    assert rerun.profiles[0].content_hash == exported.content_hash
+
+
+class _UnavailableStorage:
+    def put_object(self, key: str, body: bytes, *, content_type: str) -> None:
+        raise OSError("object storage unavailable")
+
+
+def test_close_day_retries_an_export_whose_file_write_failed(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    club = _create_club(db_session, slug=f"close-store-{uuid.uuid4().hex[:6]}")
+    admin = _create_user(
+        db_session, email=f"close_store_{uuid.uuid4().hex[:6]}@test.com", club=club
+    )
+    account = _create_finance_account(db_session, club=club, account_code="CLS-002")
+    _post_transaction(
+        db_session,
+        club=club,
+        account=account,
+        amount=Decimal("-45.00"),
+        tx_type=FinanceTransactionType.CHARGE,
+        created_at=datetime(2026, 4, 10, 9, 0, tzinfo=UTC),
+    )
+    profile = _create_profile(db_session, club=club, created_by=admin)
+    service = _close_day_service(db_session)
+    storage = service.storage
+    monkeypatch.setattr(service, "storage", _UnavailableStorage())
+
+    failed = service.run(
+        actor_email=admin.email, business_date=date(2026, 4, 10), club_ids=[club.id]
+    )
+
+    assert failed.failed_count == 1
+    attempt = failed.clubs[0].profiles[0]
+    assert attempt.accounting_profile_id == profile.id
+    assert attempt.status == "failed"
+    assert attempt.error_code == "close_day_unexpected_error"
+    assert attempt.storage_key is None
+    db_session.expire_all()
+    batch = db_session.get(FinanceExportBatch, failed.clubs[0].batch_id)
+    assert batch is not None
+    assert not batch.metadata_json.get("export_events")
+
+    monkeypatch.setattr(service, "storage", storage)
+    retried = service.run(
+        actor_email=admin.email, business_date=date(2026, 4, 10), club_ids=[club.id]
+    )
+
+    exported = retried.clubs[0].profiles[0]
+    assert retried.clubs[0].status == "completed"
+    assert exported.status == "exported"
+    stored_csv = b"".join(storage.iter_object(exported.storage_key))
+    assert len(list(csv.DictReader(io.StringIO(stored_csv.decode("utf-8"))))) == 1
+
+
+def test_close_day_defaults_to_last_closed_local_business_date(db_session: Session) -> None:
+    club = _create_club(db_session, slug=f"close-hours-{uuid.uuid4().hex[:6]}")
+    admin = _create_user(
+        db_session, email=f"close_hours_{uuid.uuid4().hex[:6]}@test.com", club=club
+    )
+    db_session.add(
+        ClubConfig(
+            club_id=club.id,
+            timezone=club.timezone,
+            operating_hours={"friday": {"open": "06:00", "close": "18:00"}},
+        )
+    )
+    db_session.commit()
+    service = _close_day_service(db_session)
+
+    # 17:00 local on Friday: the day is still trading, so Thursday is the last closed day.
+    before_close = service.run(
+        actor_email=admin.email,
+        club_ids=[club.id],
+        now=datetime(2026, 4, 10, 15, 0, tzinfo=UTC),
+    )
+    # 19:00 local on Friday: past the configured close time.
+    after_close = service.run(
+        actor_email=admin.email,
+        club_ids=[club.id],
+        now=datetime(2026, 4, 10, 17, 0, tzinfo=UTC),
+    )
+
+    assert before_close.clubs[0].business_date == date(2026, 4, 9)
+    assert after_close.clubs[0].business_date == date(2026, 4, 10)
+
+
+def test_tender_reconciliation_matches_acquirer_lines_and_flags_drift(
+    db_session: Session, tmp_path: Path
+) -> None:
+    club = _create_club(db_session, slug=f"tender-{uuid.uuid4().hex[:6]}")
+    cashier = _create_user(db_session, email=f"tender_{uuid.uuid4().hex[:6]}@test.com", club=club)
+    for amount, tender_type, drawer_code, created_at in (
+        ("100.00", TenderType.CARD, "A", datetime(2026, 4, 10, 8, 0, tzinfo=UTC)),
+        ("45.50", TenderType.CARD, "A", datetime(2026, 4, 10, 9, 0, tzinfo=UTC)),
+        ("30.00", TenderType.CASH, "B", datetime(2026, 4, 10, 10, 0, tzinfo=UTC)),
+        ("60.00", TenderType.CARD, "A", datetime(2026, 4, 11, 8, 0, tzinfo=UTC)),
+    ):
+        db_session.add(
+            PosTransaction(
+                club_id=club.id,
+                total_amount=Decimal(amount),
+                tender_type=tender_type,
+                drawer_code=drawer_code,
+                created_by_user_id=cashier.id,
+                created_at=created_at,
+            )
+        )
+    db_session.commit()
+    settlement_file = tmp_path / "acquirer-2026-04.csv"
+    settlement_file.write_text(
+        "transaction_time,amount,reference\n"
+        "2026-04-10T10:00:05,100.00,AUTH-1\n"
+        "2026-04-10T11:00:07,45.00,AUTH-2\n"
+        "2026-04-11T10:00:03,60.00,AUTH-3\n",
+        encoding="utf-8",
+    )
+    service = FinanceTenderReconciliationService(db_session)
+
+    report = service.reconcile(
+        club_id=club.id,
+        date_from=date(2026, 4, 10),
+        date_to=date(2026, 4, 11),
+        settlement_file=settlement_file,
+    )
+    rerun = service.reconcile(
+        club_id=club.id,
+        date_from=date(2026, 4, 10),
+        date_to=date(2026, 4, 11),
+        settlement_file=settlement_file,
+    )
+
+    assert report.drift_day_count == 1
+    drift_day, balanced_day = report.days
+    assert drift_day.status == FinanceTenderReconciliationStatus.DRIFT
+    assert drift_day.pos_card_total == Decimal("145.50")
+    assert drift_day.acquirer_card_total == Decimal("145.00")
+    assert drift_day.drift_amount == Decimal("-0.50")
+    assert drift_day.matched_count == 1
+    assert drift_day.unmatched_pos_count == 1
+    assert drift_day.unmatched_acquirer_count == 1
+    assert {(item.side, item.amount) for item in drift_day.unmatched_items} == {
+        ("pos", Decimal("45.50")),
+        ("acquirer", Decimal("45.00")),
+    }
+    assert [(item.tender_type, item.amount, item.count) for item in drift_day.tender_totals] == [
+        (TenderType.CASH, Decimal("30.00"), 1),
+        (TenderType.CARD, Decimal("145.50"), 2),
+    ]
+    assert {
+        (item.drawer_code, item.tender_type, item.amount) for item in drift_day.drawer_totals
+    } == {
+        ("A", TenderType.CARD, Decimal("145.50")),
+        ("B", TenderType.CASH, Decimal("30.00")),
+    }
+    assert [(item.user_id, item.tender_type, item.count) for item in drift_day.employee_totals] == [
+        (cashier.id, TenderType.CASH, 1),
+        (cashier.id, TenderType.CARD, 2),
+    ]
+    assert balanced_day.status == FinanceTenderReconciliationStatus.BALANCED
+    assert balanced_day.matched_count == 1
+    assert balanced_day.drift_amount == Decimal("0.00")
+    assert (
+        rerun.days
+        == service.list_reconciliations(
+            club_id=club.id, date_from=date(2026, 4, 10), date_to=date(2026, 4, 11)
+        ).days
+    )
+    assert (
+        db_session.scalar(
+            select(func.count())
+            .select_from(FinanceTenderReconciliation)
+            .where(FinanceTenderReconciliation.club_id == club.id)
+        )
+        == 2
+    )
+
+
+def test_tender_reconciliation_rerun_without_settlement_file_keeps_drift(
+    db_session: Session, tmp_path: Path
+) -> None:
+    club = _create_club(db_session, slug=f"tender-keep-{uuid.uuid4().hex[:6]}")
+    cashier = _create_user(
+        db_session, email=f"tender_keep_{uuid.uuid4().hex[:6]}@test.com", club=club
+    )
+    db_session.add(
+        PosTransaction(
+            club_id=club.id,
+            total_amount=Decimal("80.00"),
+            tender_type=TenderType.CARD,
+            drawer_code="A",
+            created_by_user_id=cashier.id,
+            created_at=datetime(2026, 4, 10, 8, 0, tzinfo=UTC),
+        )
+    )
+    db_session.commit()
+    settlement_file = tmp_path / "acquirer-2026-04-10.csv"
+    settlement_file.write_text(
+        "transaction_time,amount\n2026-04-10T10:00:05,75.00\n",
+        encoding="utf-8",
+    )
+    service = FinanceTenderReconciliationService(db_session)
+    service.reconcile(
+        club_id=club.id,
+        date_from=date(2026, 4, 10),
+        date_to=date(2026, 4, 10),
+        settlement_file=settlement_file,
+    )
+    db_session.add(
+        PosTransaction(
+            club_id=club.id,
+            total_amount=Decimal("20.00"),
+            tender_type=TenderType.CASH,
+            drawer_code="B",
+            created_by_user_id=cashier.id,
+            created_at=datetime(2026, 4, 10, 12, 0, tzinfo=UTC),
+        )
+    )
+    db_session.commit()
+
+    rerun = service.reconcile(
+        club_id=club.id,
+        date_from=date(2026, 4, 10),
+        date_to=date(2026, 4, 10),
+    )
+
+    (day,) = rerun.days
+    assert day.status == FinanceTenderReconciliationStatus.DRIFT
+    assert day.settlement_file_name == settlement_file.name
+    assert day.acquirer_card_total == Decimal("75.00")
+    assert day.drift_amount == Decimal("-5.00")
+    assert day.unmatched_pos_count == 1
+    assert day.unmatched_acquirer_count == 1
+    assert len(day.unmatched_items) == 2
+    assert [(item.tender_type, item.amount) for item in day.tender_totals] == [
+        (TenderType.CASH, Decimal("20.00")),
+        (TenderType.CARD, Decimal("80.00")),
+    ]
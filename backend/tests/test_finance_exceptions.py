@@ -260,6 +260,79 @@ def test_exceptions_returns_empty_when_no_exceptions(
     assert data["total_exception_count"] == 0
 
 
+def test_exceptions_range_buckets_days_and_flags_close_day_readiness(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    club = _create_club(db_session, slug=f"exc-range-{uuid.uuid4().hex[:6]}")
+    admin = _create_user(
+        db_session,
+        email=f"exc_range_admin_{uuid.uuid4().hex[:6]}@test.com",
+        club=club,
+        role=ClubMembershipRole.CLUB_ADMIN,
+    )
+    player = _create_person(db_session, email=f"exc_range_{uuid.uuid4().hex[:6]}@test.com")
+    course = _create_course(db_session, club=club)
+    headers = _auth_headers(client, email=admin.email, club_id=club.id)
+
+    # 10 Apr: unpaid booking that was never checked in.
+    _create_booking(db_session, club=club, course=course, person=player, slot_datetime=_SLOT_UTC)
+    # 11 Apr: paid and completed, plus an order still waiting for collection.
+    _create_booking(
+        db_session,
+        club=club,
+        course=course,
+        person=player,
+        slot_datetime=_NEXT_DAY_UTC,
+        payment_status=BookingPaymentStatus.PAID,
+        status=BookingStatus.COMPLETED,
+    )
+    _create_order(
+        db_session,
+        club=club,
+        person=player,
+        created_at=datetime(2026, 4, 11, 9, 0, tzinfo=UTC),
+        status=OrderStatus.PLACED,
+    )
+    # 12 Apr: paid but still reserved after its tee time passed.
+    _create_booking(
+        db_session,
+        club=club,
+        course=course,
+        person=player,
+        slot_datetime=datetime(2026, 4, 12, 6, 0, tzinfo=UTC),
+        payment_status=BookingPaymentStatus.PAID,
+    )
+
+    response = client.get(
+        "/api/finance/exceptions/range?date_from=2026-04-10&date_to=2026-04-13",
+        headers=headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    days = {day["date"]: day for day in data["days"]}
+
+    assert list(days) == ["2026-04-10", "2026-04-11", "2026-04-12", "2026-04-13"]
+    assert data["total_exception_count"] == 2
+    assert data["close_day_ready_count"] == 2
+    assert len(days["2026-04-10"]["unpaid_bookings"]) == 1
+    assert days["2026-04-10"]["no_show_risk_count"] == 1
+    assert days["2026-04-10"]["close_day_ready"] is False
+    assert len(days["2026-04-11"]["unresolved_orders"]) == 1
+    assert days["2026-04-11"]["close_day_ready"] is True
+    assert days["2026-04-12"]["total_exception_count"] == 0
+    assert days["2026-04-12"]["no_show_risk_count"] == 1
+    assert days["2026-04-12"]["close_day_ready"] is False
+    assert days["2026-04-13"]["close_day_ready"] is True
+
+    inverted = client.get(
+        "/api/finance/exceptions/range?date_from=2026-04-13&date_to=2026-04-10",
+        headers=headers,
+    )
+    assert inverted.status_code == 400
+    assert inverted.json()["code"] == "finance_exceptions_range_invalid"
+
+
 def test_exceptions_tenant_isolation(
     client: TestClient,
     db_session: Session,
@@ -18,12 +18,16 @@ from app.models import (
     ClubMembershipRole,
     ClubMembershipStatus,
     FinanceAccount,
+    FinanceExportBatch,
     FinanceTransactionSource,
     FinanceTransactionType,
     Person,
     User,
 )
 from app.models.finance.transaction import FinanceTransaction
+from app.services._csv import iter_csv_chunks
+from app.storage.ndjson import iter_ndjson_gz
+from app.storage.object_storage import build_object_storage_client
 from tests.conftest import assert_event_emitted
 
 
@@ -292,6 +296,134 @@ def test_finance_export_download_is_stable_from_persisted_payload(
     assert parsed[0]["debit_amount"] == "42.00"
 
 
+def test_finance_export_batch_payload_is_stored_as_compressed_blob(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    club = _create_club(db_session, slug=f"feb-blob-{uuid.uuid4().hex[:6]}")
+    admin = _create_user(
+        db_session,
+        email=f"feb_blob_{uuid.uuid4().hex[:6]}@test.com",
+        role=ClubMembershipRole.CLUB_ADMIN,
+        club=club,
+    )
+    account = _create_finance_account(db_session, club=club, account_code="EXP-BLOB")
+    for hour, amount, tx_type in (
+        (6, Decimal("-18.00"), FinanceTransactionType.CHARGE),
+        (7, Decimal("18.00"), FinanceTransactionType.PAYMENT),
+    ):
+        _post_transaction(
+            db_session,
+            club=club,
+            account=account,
+            amount=amount,
+            tx_type=tx_type,
+            source=FinanceTransactionSource.MANUAL,
+            description=f"Blob row {hour}",
+            created_at=datetime(2026, 4, 4, hour, 0, tzinfo=UTC),
+        )
+    headers = _auth_headers(client, email=admin.email, club_id=club.id)
+    create = client.post(
+        "/api/finance/export-batches",
+        headers=headers,
+        json={
+            "export_profile": "journal_basic",
+            "date_from": "2026-04-04",
+            "date_to": "2026-04-04",
+        },
+    )
+    assert create.status_code == 201
+    batch = create.json()["batch"]
+
+    stored = db_session.get(FinanceExportBatch, uuid.UUID(batch["id"]))
+    assert stored is not None
+    assert stored.storage_key == (
+        f"finance-export-batches/{club.id}/{batch['content_hash']}.ndjson.gz"
+    )
+    blob_rows = list(iter_ndjson_gz(build_object_storage_client().iter_object(stored.storage_key)))
+    assert blob_rows == batch["rows"]
+    assert [row["description"] for row in blob_rows] == ["Blob row 6", "Blob row 7"]
+
+    listing = client.get("/api/finance/export-batches", headers=headers)
+    assert listing.status_code == 200
+    assert "rows" not in listing.json()["batches"][0]
+
+
+def test_finance_export_batch_reconciliation_reports_new_live_transactions(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    club = _create_club(db_session, slug=f"feb-recon-{uuid.uuid4().hex[:6]}")
+    admin = _create_user(
+        db_session,
+        email=f"feb_recon_{uuid.uuid4().hex[:6]}@test.com",
+        role=ClubMembershipRole.CLUB_ADMIN,
+        club=club,
+    )
+    account = _create_finance_account(db_session, club=club, account_code="EXP-RECON")
+    for day in (5, 6):
+        _post_transaction(
+            db_session,
+            club=club,
+            account=account,
+            amount=Decimal("-25.00"),
+            tx_type=FinanceTransactionType.CHARGE,
+            source=FinanceTransactionSource.MANUAL,
+            description=f"Recon day {day}",
+            created_at=datetime(2026, 4, day, 8, 0, tzinfo=UTC),
+        )
+    headers = _auth_headers(client, email=admin.email, club_id=club.id)
+    create = client.post(
+        "/api/finance/export-batches",
+        headers=headers,
+        json={
+            "export_profile": "journal_basic",
+            "date_from": "2026-04-05",
+            "date_to": "2026-04-06",
+        },
+    )
+    batch = create.json()["batch"]
+    url = f"/api/finance/export-batches/{batch['id']}/reconciliation"
+
+    unchanged = client.get(url, headers=headers)
+    assert unchanged.status_code == 200
+    assert unchanged.json()["matches_live_state"] is True
+    assert unchanged.json()["current_content_hash"] == batch["content_hash"]
+
+    late = _post_transaction(
+        db_session,
+        club=club,
+        account=account,
+        amount=Decimal("10.00"),
+        tx_type=FinanceTransactionType.PAYMENT,
+        source=FinanceTransactionSource.MANUAL,
+        description="Late payment",
+        created_at=datetime(2026, 4, 5, 7, 0, tzinfo=UTC),
+    )
+
+    drifted = client.get(url, headers=headers)
+    assert drifted.status_code == 200
+    body = drifted.json()
+    assert body["matches_live_state"] is False
+    assert body["persisted_content_hash"] == batch["content_hash"]
+    assert body["persisted_transaction_count"] == 2
+    assert body["current_transaction_count"] == 3
+    assert body["missing_transaction_count"] == 0
+    assert body["new_transaction_count"] == 1
+    assert [row["transaction_id"] for row in body["new_transactions"]] == [str(late.id)]
+
+
+def test_csv_chunks_yield_header_first_and_bounded_row_batches() -> None:
+    rows = [(f"ref-{index}", index) for index in range(5)]
+
+    chunks = list(iter_csv_chunks(("reference", "amount"), rows, chunk_rows=2))
+
+    assert chunks[0] == b"reference,amount\n"
+    assert [chunk.count(b"\n") for chunk in chunks[1:]] == [2, 2, 1]
+    parsed = list(csv.DictReader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+    assert [row["reference"] for row in parsed] == [f"ref-{index}" for index in range(5)]
+
+
 def test_finance_export_selection_includes_order_and_pos_transactions(
     client: TestClient,
     db_session: Session,
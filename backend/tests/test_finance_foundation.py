@@ -215,6 +215,102 @@ def test_finance_transactions_create_and_ledger_is_derived(
     ]
 
 
+def test_finance_transactions_batch_posts_once_per_idempotency_key(
+    client: TestClient, db_session: Session
+) -> None:
+    admin = _create_user(db_session, email="finance-batch-admin@example.com")
+    club = _create_club(db_session, name="Finance Batch Club", slug="finance-batch-club")
+    _assign_membership(db_session, user=admin, club=club, role=ClubMembershipRole.CLUB_ADMIN)
+    accounts = [
+        _create_finance_account(
+            db_session,
+            club=club,
+            account_customer=_create_account_customer(
+                db_session,
+                club=club,
+                person=_create_person(db_session, email=f"finance-batch-{index}@example.com"),
+                account_code=f"ACCT-B{index}",
+            ),
+        )
+        for index in range(2)
+    ]
+    headers = _auth_headers(client, admin.email, str(club.id))
+
+    def dues(account: FinanceAccount, key: str, amount: str = "-300.00") -> dict[str, object]:
+        return {
+            "account_id": str(account.id),
+            "amount": amount,
+            "type": "charge",
+            "source": "manual",
+            "description": "May subscription",
+            "idempotency_key": key,
+        }
+
+    first = client.post(
+        "/api/finance/transactions/batch",
+        headers=headers,
+        json={"items": [dues(accounts[0], "dues-0"), dues(accounts[1], "dues-1")]},
+    )
+    assert first.status_code == 201
+    assert first.json()["created_count"] == 2
+    assert first.json()["replayed_count"] == 0
+    assert {item["balance"] for item in first.json()["balances"]} == {"-300.00"}
+    assert_event_emitted(
+        db_session,
+        entity_type="finance_transaction",
+        entity_id=first.json()["items"][0]["transaction"]["id"],
+        action="finance.transaction.posted",
+    )
+
+    retry = client.post(
+        "/api/finance/transactions/batch",
+        headers=headers,
+        json={
+            "items": [
+                dues(accounts[0], "dues-0"),
+                dues(accounts[1], "dues-1"),
+                dues(accounts[1], "levy-1", amount="-50.00"),
+            ]
+        },
+    )
+    assert retry.status_code == 201
+    assert retry.json()["created_count"] == 1
+    assert [item["status"] for item in retry.json()["items"]] == [
+        "replayed",
+        "replayed",
+        "created",
+    ]
+    assert (
+        retry.json()["items"][0]["transaction"]["id"]
+        == (first.json()["items"][0]["transaction"]["id"])
+    )
+    assert [item["balance"] for item in retry.json()["balances"]] == ["-300.00", "-350.00"]
+
+    reused = client.post(
+        "/api/finance/transactions/batch",
+        headers=headers,
+        json={"items": [dues(accounts[0], "dues-0", amount="-310.00")]},
+    )
+    assert reused.status_code == 409
+    assert reused.json()["code"] == "finance_idempotency_key_conflict"
+
+    duplicated = client.post(
+        "/api/finance/transactions/batch",
+        headers=headers,
+        json={"items": [dues(accounts[0], "dues-2"), dues(accounts[1], "dues-2")]},
+    )
+    assert duplicated.status_code == 422
+
+    posted = db_session.scalars(
+        select(FinanceTransaction).where(FinanceTransaction.club_id == club.id)
+    ).all()
+    assert sorted(transaction.idempotency_key or "" for transaction in posted) == [
+        "dues-0",
+        "dues-1",
+        "levy-1",
+    ]
+
+
 def test_finance_account_access_is_scoped_to_selected_club(
     client: TestClient, db_session: Session
 ) -> None:
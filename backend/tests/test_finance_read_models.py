@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import csv
+import io
 import uuid
 from datetime import UTC, datetime
 from decimal import Decimal
@@ -17,11 +19,13 @@ from app.models import (
     ClubMembershipStatus,
     FinanceAccount,
     FinanceAccountStatus,
+    FinanceTenderRecord,
     FinanceTransactionSource,
     FinanceTransactionType,
     Person,
     User,
 )
+from app.models.enums import TenderType
 from app.models.finance.transaction import FinanceTransaction
 
 
@@ -472,3 +476,191 @@ def test_finance_chart_proportions_sum_correctly_and_match_raw_data(
         + float(out["accounts_settled_pct"])
     )
     assert abs(health_total - 100.0) < 0.1
+
+
+def test_finance_aged_receivables_allocates_payments_fifo_into_age_buckets(
+    client: TestClient, db_session: Session
+) -> None:
+    club = _create_club(db_session, slug=f"fin-aged-{uuid.uuid4().hex[:6]}")
+    admin = _create_user(
+        db_session,
+        email=f"fin_aged_{uuid.uuid4().hex[:6]}@test.com",
+        role=ClubMembershipRole.CLUB_ADMIN,
+        club=club,
+    )
+    aged_account = _create_finance_account(db_session, club=club, account_code="AGE-001")
+    recent_account = _create_finance_account(db_session, club=club, account_code="AGE-002")
+    settled_account = _create_finance_account(db_session, club=club, account_code="AGE-003")
+
+    for account, amount, tx_type, created_at in [
+        (aged_account, "-100.00", FinanceTransactionType.CHARGE, datetime(2026, 1, 15, 8, 0)),
+        (aged_account, "-60.00", FinanceTransactionType.CHARGE, datetime(2026, 2, 15, 8, 0)),
+        (aged_account, "-40.00", FinanceTransactionType.CHARGE, datetime(2026, 4, 20, 8, 0)),
+        (aged_account, "120.00", FinanceTransactionType.PAYMENT, datetime(2026, 4, 25, 8, 0)),
+        (aged_account, "-500.00", FinanceTransactionType.CHARGE, datetime(2026, 5, 2, 8, 0)),
+        (recent_account, "-30.00", FinanceTransactionType.CHARGE, datetime(2026, 3, 15, 8, 0)),
+        (settled_account, "-25.00", FinanceTransactionType.CHARGE, datetime(2026, 2, 1, 8, 0)),
+        (settled_account, "25.00", FinanceTransactionType.PAYMENT, datetime(2026, 2, 2, 8, 0)),
+    ]:
+        _post_transaction(
+            db_session,
+            club=club,
+            account=account,
+            amount=Decimal(amount),
+            tx_type=tx_type,
+            source=FinanceTransactionSource.MANUAL,
+            description=f"{tx_type.value} {amount}",
+            created_at=created_at.replace(tzinfo=UTC),
+        )
+
+    headers = _auth_headers(client, email=admin.email, club_id=str(club.id))
+    response = client.get(
+        "/api/finance/summaries/aged-receivables",
+        headers=headers,
+        params={"as_of": "2026-04-30"},
+    )
+    assert response.status_code == 200
+    payload = response.json()
+
+    assert payload["as_of"] == "2026-04-30"
+    assert payload["account_count"] == 2
+    assert payload["totals"] == {
+        "current": "40.00",
+        "days_30": "30.00",
+        "days_60": "40.00",
+        "days_90_plus": "0.00",
+        "total_outstanding": "110.00",
+    }
+    aged, recent = payload["accounts"]
+    assert aged["account_customer_code"] == "AGE-001"
+    assert (aged["current"], aged["days_60"], aged["days_90_plus"]) == ("40.00", "40.00", "0.00")
+    assert aged["total_outstanding"] == "80.00"
+    assert aged["oldest_outstanding_at"].startswith("2026-02-15")
+    assert recent["account_customer_code"] == "AGE-002"
+    assert recent["days_30"] == "30.00"
+
+    download = client.get(
+        "/api/finance/summaries/aged-receivables/download",
+        headers=headers,
+        params={"as_of": "2026-04-30"},
+    )
+    assert download.status_code == 200
+    assert "greenlink-aged-receivables-2026-04-30.csv" in download.headers["content-disposition"]
+    parsed = list(csv.DictReader(io.StringIO(download.text)))
+    assert [row["account_customer_code"] for row in parsed] == ["AGE-001", "AGE-002", "TOTAL"]
+    assert parsed[-1]["total_outstanding"] == "110.00"
+
+
+def test_finance_consolidated_summary_rolls_up_clubs_in_their_own_timezones(
+    client: TestClient, db_session: Session
+) -> None:
+    suffix = uuid.uuid4().hex[:6]
+    home_club = _create_club(db_session, slug=f"fin-group-a-{suffix}")
+    away_club = _create_club(db_session, slug=f"fin-group-b-{suffix}")
+    away_club.timezone = "America/New_York"
+    outside_club = _create_club(db_session, slug=f"fin-group-c-{suffix}")
+    admin = _create_user(
+        db_session,
+        email=f"fin_group_{suffix}@test.com",
+        role=ClubMembershipRole.CLUB_ADMIN,
+        club=home_club,
+    )
+    db_session.add(
+        ClubMembership(
+            person_id=admin.person_id,
+            club_id=away_club.id,
+            role=ClubMembershipRole.CLUB_STAFF,
+            status=ClubMembershipStatus.ACTIVE,
+        )
+    )
+    db_session.commit()
+    home_account = _create_finance_account(db_session, club=home_club, account_code="GRP-A")
+    away_account = _create_finance_account(db_session, club=away_club, account_code="GRP-B")
+
+    # 2026-05-02T02:00Z is Saturday 2 May in Johannesburg but Friday 1 May in New York.
+    for club, account, amount, tx_type, created_at in [
+        (home_club, home_account, "-100.00", FinanceTransactionType.CHARGE, "2026-05-01T23:00"),
+        (home_club, home_account, "40.00", FinanceTransactionType.PAYMENT, "2026-05-01T08:00"),
+        (away_club, away_account, "-50.00", FinanceTransactionType.CHARGE, "2026-05-01T23:00"),
+        (away_club, away_account, "-20.00", FinanceTransactionType.CHARGE, "2026-04-30T12:00"),
+    ]:
+        _post_transaction(
+            db_session,
+            club=club,
+            account=account,
+            amount=Decimal(amount),
+            tx_type=tx_type,
+            source=FinanceTransactionSource.MANUAL,
+            description=f"{tx_type.value} {amount}",
+            created_at=datetime.fromisoformat(created_at).replace(tzinfo=UTC),
+        )
+    for tender_type, amount in ((TenderType.CASH, "30.00"), (TenderType.CARD, "10.00")):
+        db_session.add(
+            FinanceTenderRecord(
+                club_id=home_club.id,
+                account_id=home_account.id,
+                source=FinanceTransactionSource.POS,
+                tender_type=tender_type,
+                amount=Decimal(amount),
+                description=f"{tender_type.value} tender",
+                created_at=datetime(2026, 5, 1, 8, 0, tzinfo=UTC),
+            )
+        )
+    db_session.commit()
+
+    headers = _auth_headers(client, email=admin.email, club_id=str(home_club.id))
+    response = client.get(
+        "/api/finance/consolidated/summary",
+        headers=headers,
+        params={"reference_datetime": "2026-05-02T02:00:00Z"},
+    )
+    assert response.status_code == 200
+    payload = response.json()
+
+    assert payload["club_count"] == 2
+    home, away = payload["clubs"]
+    assert home["club_id"] == str(home_club.id)
+    assert home["as_of"] == "2026-05-02"
+    assert (home["day"]["revenue"], home["week"]["collections"]) == ("100.00", "40.00")
+    assert home["receivables"]["current"] == "60.00"
+    assert away["as_of"] == "2026-05-01"
+    assert away["day"]["date_from"] == "2026-05-01"
+    assert (away["day"]["revenue"], away["week"]["revenue"]) == ("50.00", "70.00")
+    assert (away["month"]["revenue"], away["month"]["charge_count"]) == ("50.00", 1)
+    assert payload["totals"]["day_revenue"] == "150.00"
+    assert payload["totals"]["week_revenue"] == "170.00"
+    assert payload["totals"]["week_collections"] == "40.00"
+    assert payload["totals"]["receivables"]["total_outstanding"] == "130.00"
+    assert payload["totals"]["accounts_in_arrears"] == 2
+    home_tenders = {
+        tender["tender_type"]: tender["amount"] for tender in home["cash_position"]["tenders"]
+    }
+    assert home_tenders == {"cash": "30.00", "card": "10.00", "member_account": "0.00"}
+    assert home["cash_position"]["received"] == "40.00"
+    assert home["cash_position"]["account_balance"] == "-60.00"
+    assert away["cash_position"]["received"] == "0.00"
+    assert payload["totals"]["cash_position"]["received"] == "40.00"
+    assert payload["totals"]["cash_position"]["account_balance"] == "-130.00"
+    assert [kpi["metric"] for kpi in payload["totals"]["kpis"]] == [
+        "rounds_played",
+        "revpatt",
+        "revpur",
+        "effective_green_fee",
+        "fnb_per_round",
+    ]
+    assert home["kpis"][0]["result"]["value"] == 0
+
+    subset = client.get(
+        "/api/finance/consolidated/summary",
+        headers=headers,
+        params={"club_id": [str(away_club.id)], "reference_datetime": "2026-05-02T02:00:00Z"},
+    )
+    assert subset.status_code == 200
+    assert [club["club_id"] for club in subset.json()["clubs"]] == [str(away_club.id)]
+
+    forbidden = client.get(
+        "/api/finance/consolidated/summary",
+        headers=headers,
+        params={"club_id": [str(home_club.id), str(outside_club.id)]},
+    )
+    assert forbidden.status_code == 403
@@ -12,8 +12,11 @@ import uuid
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 
+import pytest
+from sqlalchemy import event, select
 from sqlalchemy.orm import Session
 
+from app.config import get_settings
 from app.core.security import hash_password
 from app.domain.people.normalization import build_full_name, normalize_email
 from app.models import (
@@ -34,13 +37,16 @@ from app.models import (
     FinanceTransaction,
     FinanceTransactionSource,
     FinanceTransactionType,
+    MemberActivity,
     Person,
     Tee,
     User,
 )
+from app.schemas.reports import MemberActivitySort
 from app.semantic import compute, get_metric
 from app.services._window import TimeWindow
 from app.services.people_read_model_service import PeopleReadModelService
+from app.services.reports_service import ReportsService
 
 WINDOW_DAY = date(2026, 7, 6)  # a Monday — operating hours apply
 WINDOW_NEXT = date(2026, 7, 7)
@@ -264,6 +270,78 @@ def test_member_stats_summary_counts_growth_this_month(db_session: Session) -> N
     assert result.growth_this_month == 1
 
 
+def test_member_stats_summary_aggregates_in_one_statement_and_caches_per_day(
+    db_session: Session,
+) -> None:
+    club = _seed_club(db_session, slug="member-summary-sql")
+    # 01:00 club-local on the reference date: zero days, although the UTC date
+    # is the day before.
+    _seed_user(
+        db_session,
+        email="midnight@example.com",
+        club=club,
+        joined_at=datetime(2026, 7, 5, 23, 0, tzinfo=UTC),
+    )
+    _seed_user(
+        db_session,
+        email="ten-days@example.com",
+        club=club,
+        joined_at=datetime(2026, 6, 26, tzinfo=UTC),
+    )
+    invited = _seed_user(
+        db_session,
+        email="invited@example.com",
+        club=club,
+        joined_at=datetime(2020, 1, 1, tzinfo=UTC),
+    )
+    membership = db_session.scalar(
+        select(ClubMembership).where(ClubMembership.person_id == invited.person_id)
+    )
+    assert membership is not None
+    membership.status = ClubMembershipStatus.INVITED
+    db_session.commit()
+    club_id = club.id
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    connection = db_session.connection()
+    event.listen(connection, "before_cursor_execute", _count)
+    try:
+        result = PeopleReadModelService(db_session).summary(
+            club_id=club_id, reference_date=WINDOW_DAY
+        )
+        statements_after_summary = len(statements)
+        first = ReportsService(db_session).get_member_summary(
+            club_id=club_id, reference_date=WINDOW_DAY
+        )
+        statements_after_first = len(statements)
+        cached = ReportsService(db_session).get_member_summary(
+            club_id=club_id, reference_date=WINDOW_DAY
+        )
+    finally:
+        event.remove(connection, "before_cursor_execute", _count)
+
+    # One club lookup and one aggregate; no membership rows are loaded.
+    assert statements_after_summary == 2
+    assert "count(*) FILTER" in statements[1]
+    assert result.by_status == {"active": 2, "invited": 1}
+    assert result.by_tenure_bucket == {"under_1y": 2, "1_to_5y": 0, "5_to_10y": 1, "10y_plus": 0}
+    assert result.average_tenure_days == 5
+    assert result.growth_this_month == 1
+    assert first == result
+    assert cached == result
+    assert len(statements) == statements_after_first
+
+    membership.status = ClubMembershipStatus.ACTIVE
+    db_session.commit()
+    refreshed = ReportsService(db_session).get_member_summary(
+        club_id=club_id, reference_date=WINDOW_DAY
+    )
+    assert refreshed.by_status == {"active": 3}
+
+
 def test_member_activity_returns_rounds_spend_and_last_played(db_session: Session) -> None:
     club = _seed_club(db_session, slug="member-activity")
     course, tee = _seed_course_and_tee(db_session, club=club)
@@ -366,6 +444,154 @@ def test_member_activity_respects_window(db_session: Session) -> None:
     _ = booking  # silence unused
 
 
+def test_list_member_activity_sorts_and_pages_in_one_statement(db_session: Session) -> None:
+    club = _seed_club(db_session, slug="member-paged")
+    course, tee = _seed_course_and_tee(db_session, club=club)
+    members = [
+        _seed_user(db_session, email=f"paged-{index}@example.com", club=club) for index in range(3)
+    ]
+    for member, fee in ((members[0], Decimal("100.00")), (members[2], Decimal("900.00"))):
+        _, account = _seed_finance_account(db_session, club=club, person=member.person)
+        _seed_booking_with_charge(
+            db_session,
+            club=club,
+            course=course,
+            tee=tee,
+            person=member.person,
+            account=account,
+            slot_local_hour=6,
+            status=BookingStatus.COMPLETED,
+            fee_amount=fee,
+        )
+    club_id = club.id
+    person_ids = [member.person_id for member in members]
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    connection = db_session.connection()
+    event.listen(connection, "before_cursor_execute", _count)
+    try:
+        page = PeopleReadModelService(db_session).list_member_activity(
+            club_id=club_id,
+            sort=MemberActivitySort.SPEND,
+            descending=True,
+            limit=2,
+        )
+    finally:
+        event.remove(connection, "before_cursor_execute", _count)
+
+    assert [entry.person_id for entry in page] == [person_ids[2], person_ids[0]]
+    assert page[0].spend == Decimal("900.00")
+    # One club lookup and one activity statement, with no member id list.
+    assert len(statements) == 2
+    assert "club_memberships" in statements[1]
+
+    rest = PeopleReadModelService(db_session).list_member_activity(
+        club_id=club_id,
+        sort=MemberActivitySort.SPEND,
+        descending=True,
+        limit=2,
+        offset=2,
+    )
+    assert [(entry.person_id, entry.rounds) for entry in rest] == [(person_ids[1], 0)]
+
+
+def test_member_activity_projection_follows_booking_status_changes(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(get_settings(), "member_activity_projection_enabled", True)
+    club = _seed_club(db_session, slug="member-projection")
+    course, tee = _seed_course_and_tee(db_session, club=club)
+    member = _seed_user(db_session, email="projection@example.com", club=club)
+    _, account = _seed_finance_account(db_session, club=club, person=member.person)
+    booking = _seed_booking_with_charge(
+        db_session,
+        club=club,
+        course=course,
+        tee=tee,
+        person=member.person,
+        account=account,
+        slot_local_hour=6,
+        status=BookingStatus.COMPLETED,
+        fee_amount=Decimal("275.00"),
+    )
+    club_id = club.id
+    person_id = member.person_id
+
+    projected = db_session.scalar(
+        select(MemberActivity).where(
+            MemberActivity.club_id == club_id,
+            MemberActivity.person_id == person_id,
+        )
+    )
+    assert projected is not None
+    assert (projected.rounds, projected.spend) == (1, Decimal("275.00"))
+    [entry] = PeopleReadModelService(db_session).list_member_activity(club_id=club_id)
+    assert (entry.rounds, entry.spend, entry.last_played) == (1, Decimal("275.00"), WINDOW_DAY)
+
+    booking.status = BookingStatus.CANCELLED
+    db_session.commit()
+    db_session.refresh(projected)
+    assert projected.rounds == 0
+    assert projected.last_played_at is None
+
+
+def test_member_activity_projection_drops_removed_and_reassigned_participants(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(get_settings(), "member_activity_projection_enabled", True)
+    club = _seed_club(db_session, slug="member-projection-party")
+    course, tee = _seed_course_and_tee(db_session, club=club)
+    member = _seed_user(db_session, email="party-primary@example.com", club=club)
+    guest = _seed_user(db_session, email="party-guest@example.com", club=club)
+    substitute = _seed_user(db_session, email="party-substitute@example.com", club=club)
+    _, account = _seed_finance_account(db_session, club=club, person=member.person)
+    booking = _seed_booking_with_charge(
+        db_session,
+        club=club,
+        course=course,
+        tee=tee,
+        person=member.person,
+        account=account,
+        slot_local_hour=6,
+        status=BookingStatus.COMPLETED,
+    )
+    participant = BookingParticipant(
+        booking_id=booking.id,
+        person_id=guest.person_id,
+        participant_type=BookingParticipantType.MEMBER,
+        display_name="Second",
+        sort_order=1,
+        is_primary=False,
+    )
+    db_session.add(participant)
+    db_session.commit()
+
+    def rounds() -> dict[uuid.UUID, int]:
+        return {
+            person_id: rounds
+            for person_id, rounds in db_session.execute(
+                select(MemberActivity.person_id, MemberActivity.rounds).where(
+                    MemberActivity.club_id == club.id
+                )
+            )
+        }
+
+    assert rounds()[guest.person_id] == 1
+
+    participant.person_id = substitute.person_id
+    db_session.commit()
+    assert rounds()[guest.person_id] == 0
+    assert rounds()[substitute.person_id] == 1
+
+    db_session.delete(participant)
+    db_session.commit()
+    assert rounds()[substitute.person_id] == 0
+    assert rounds()[member.person_id] == 1
+
+
 def test_member_stats_is_tenant_scoped(db_session: Session) -> None:
     """A summary for club A must not include club B's memberships."""
     club_a = _seed_club(db_session, slug="member-tenant-a")
@@ -9,13 +9,16 @@ shapes — with tenant isolation enforced.
 from __future__ import annotations
 
 import uuid
-from datetime import UTC, date, datetime
+from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 
-from sqlalchemy.orm import Session
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.security import hash_password
 from app.domain.people.normalization import build_full_name, normalize_email
+from app.events.publisher import DatabaseEventPublisher
 from app.models import (
     AccountCustomer,
     Booking,
@@ -47,7 +50,9 @@ from app.models import (
     VatCategory,
 )
 from app.models.enums import TenderType
-from app.semantic import compute
+from app.schemas.reports import MetricSeriesGranularity
+from app.semantic import compute, compute_by_course, compute_many, compute_series
+from app.services.kpi_snapshot_service import KpiSnapshotService
 
 WINDOW_DAY = date(2026, 7, 6)  # a Monday — operating hours apply
 WINDOW_NEXT = date(2026, 7, 7)
@@ -172,10 +177,9 @@ def _seed_booking_with_charge(
     status: BookingStatus,
     party_size: int = 2,
     fee_amount: Decimal = Decimal("325.00"),
+    day: date = WINDOW_DAY,
 ) -> Booking:
-    slot_utc = datetime(
-        WINDOW_DAY.year, WINDOW_DAY.month, WINDOW_DAY.day, slot_local_hour - 2, 0, tzinfo=UTC
-    )
+    slot_utc = datetime(day.year, day.month, day.day, slot_local_hour - 2, 0, tzinfo=UTC)
     booking = Booking(
         club_id=club.id,
         course_id=course.id,
@@ -412,6 +416,344 @@ def test_revpur_excludes_no_show_and_cancelled_from_denominator(db_session: Sess
     assert result.value == Decimal("150.00")  # 300 / 2
 
 
+def test_metric_results_are_cached_until_a_relevant_event_commits(db_session: Session) -> None:
+    """Direct writes leave the cached RevPUR in place; a committed booking
+    event recomputes it, and a slot-state write recomputes RevPATT."""
+    club = _seed_club(db_session, slug="kpi-cache")
+    course, tee = _seed_course_and_tee(db_session, club=club)
+    member = _seed_user(db_session, email="kpi-cache@example.com", club=club)
+    _, account = _seed_finance_account(db_session, club=club, person=member.person)
+    _seed_booking_with_charge(
+        db_session,
+        club=club,
+        course=course,
+        tee=tee,
+        person=member.person,
+        account=account,
+        slot_local_hour=6,
+        status=BookingStatus.COMPLETED,
+        party_size=2,
+        fee_amount=Decimal("500.00"),
+    )
+    window = {"date_from": WINDOW_DAY, "date_to": WINDOW_NEXT}
+    assert compute("revpur", db_session, club_id=club.id, **window).value == Decimal("250.00")
+    assert compute("revpatt", db_session, club_id=club.id, **window).value == Decimal("125.00")
+
+    late_booking = _seed_booking_with_charge(
+        db_session,
+        club=club,
+        course=course,
+        tee=tee,
+        person=member.person,
+        account=account,
+        slot_local_hour=7,
+        status=BookingStatus.CHECKED_IN,
+        party_size=2,
+        fee_amount=Decimal("300.00"),
+    )
+    assert compute("revpur", db_session, club_id=club.id, **window).value == Decimal("250.00")
+
+    DatabaseEventPublisher(db_session).publish(
+        event_type="booking.checked_in",
+        aggregate_type="booking",
+        aggregate_id=str(late_booking.id),
+        payload={"booking_id": str(late_booking.id)},
+        club_id=club.id,
+    )
+    db_session.commit()
+    assert compute("revpur", db_session, club_id=club.id, **window).value == Decimal("200.00")
+    assert compute("revpatt", db_session, club_id=club.id, **window).value == Decimal("200.00")
+
+    blocked_slot_utc = datetime(
+        WINDOW_DAY.year, WINDOW_DAY.month, WINDOW_DAY.day, 4, 30, tzinfo=UTC
+    )
+    db_session.add(
+        TeeSheetSlotState(
+            club_id=club.id,
+            course_id=course.id,
+            tee_id=tee.id,
+            slot_datetime=blocked_slot_utc,
+            player_capacity=4,
+            manually_blocked=True,
+            blocked_reason="Maintenance",
+        )
+    )
+    db_session.commit()
+    assert compute("revpatt", db_session, club_id=club.id, **window).value == Decimal("266.67")
+    assert compute("revpur", db_session, club_id=club.id, **window).value == Decimal("200.00")
+
+
+def test_compute_many_shares_window_and_quantity_queries_across_metrics(
+    db_session: Session,
+) -> None:
+    """Five KPI metrics resolve the window once and read every shared
+    quantity in one live SELECT. 4 rounds, R650 over 4 generated slots."""
+    club = _seed_club(db_session, slug="kpi-batch")
+    course, tee = _seed_course_and_tee(db_session, club=club)
+    member = _seed_user(db_session, email="kpi-batch@example.com", club=club)
+    _, account = _seed_finance_account(db_session, club=club, person=member.person)
+    _seed_booking_with_charge(
+        db_session,
+        club=club,
+        course=course,
+        tee=tee,
+        person=member.person,
+        account=account,
+        slot_local_hour=6,
+        status=BookingStatus.COMPLETED,
+        party_size=4,
+        fee_amount=Decimal("650.00"),
+    )
+    club_id = club.id
+    names = [
+        "revpatt",
+        "revpur",
+        "effective_green_fee",
+        "fnb_per_round",
+        "weather_adjusted_utilisation",
+    ]
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    connection = db_session.connection()
+    event.listen(connection, "before_cursor_execute", _count)
+    try:
+        results = compute_many(
+            names,
+            db_session,
+            club_id=club_id,
+            date_from=WINDOW_DAY,
+            date_to=WINDOW_NEXT,
+        )
+    finally:
+        event.remove(connection, "before_cursor_execute", _count)
+
+    assert list(results) == names
+    assert results["revpatt"].value == Decimal("162.50")
+    assert results["revpur"].value == Decimal("162.50")
+    assert results["effective_green_fee"].value == Decimal("162.50")
+    assert results["fnb_per_round"].value == Decimal("0.00")
+    assert results["weather_adjusted_utilisation"].value == Decimal("0.00")
+    # Window lookup, snapshot probe (none stored), one live SELECT of every quantity.
+    assert len(statements) == 3
+
+    cached = compute_many(
+        names[:2], db_session, club_id=club_id, date_from=WINDOW_DAY, date_to=WINDOW_NEXT
+    )
+    assert cached == {name: results[name] for name in names[:2]}
+
+
+def test_compute_series_buckets_daily_quantities_in_one_statement(db_session: Session) -> None:
+    """Three local days: R650 / 4 rounds on Monday, nothing Tuesday, R325 /
+    2 rounds Wednesday; 4 generated slots a day."""
+    club = _seed_club(db_session, slug="kpi-series")
+    course, tee = _seed_course_and_tee(db_session, club=club)
+    member = _seed_user(db_session, email="kpi-series@example.com", club=club)
+    _, account = _seed_finance_account(db_session, club=club, person=member.person)
+    for day, party_size, fee in (
+        (WINDOW_DAY, 4, Decimal("650.00")),
+        (WINDOW_DAY + timedelta(days=2), 2, Decimal("325.00")),
+    ):
+        _seed_booking_with_charge(
+            db_session,
+            club=club,
+            course=course,
+            tee=tee,
+            person=member.person,
+            account=account,
+            slot_local_hour=6,
+            status=BookingStatus.COMPLETED,
+            party_size=party_size,
+            fee_amount=fee,
+            day=day,
+        )
+    club_id = club.id
+    date_to = WINDOW_DAY + timedelta(days=3)
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    connection = db_session.connection()
+    event.listen(connection, "before_cursor_execute", _count)
+    try:
+        daily = compute_series(
+            ["revpatt", "revpur"],
+            db_session,
+            club_id,
+            date_from=WINDOW_DAY,
+            date_to=date_to,
+        )
+    finally:
+        event.remove(connection, "before_cursor_execute", _count)
+
+    assert [point.period_start for point in daily["revpur"]] == [
+        WINDOW_DAY,
+        WINDOW_DAY + timedelta(days=1),
+        WINDOW_DAY + timedelta(days=2),
+    ]
+    assert [point.result.value for point in daily["revpur"]] == [
+        Decimal("162.50"),
+        Decimal("0.00"),
+        Decimal("162.50"),
+    ]
+    assert [point.result.value for point in daily["revpatt"]] == [
+        Decimal("162.50"),
+        Decimal("0.00"),
+        Decimal("81.25"),
+    ]
+    # Window lookup, snapshot probe (none stored), one grouped live SELECT.
+    assert len(statements) == 3
+
+    weekly = compute_series(
+        ["revpatt", "revpur"],
+        db_session,
+        club_id,
+        date_from=WINDOW_DAY,
+        date_to=date_to,
+        granularity=MetricSeriesGranularity.WEEK,
+    )
+    assert [(point.period_start, point.period_end) for point in weekly["revpatt"]] == [
+        (WINDOW_DAY, date_to)
+    ]
+    assert weekly["revpatt"][0].result.value == Decimal("81.25")
+    assert weekly["revpur"][0].result.value == Decimal("162.50")
+
+
+def test_compute_by_course_splits_numerators_and_denominators_in_one_statement(
+    db_session: Session,
+) -> None:
+    """Two courses with one tee each: 4 generated slots a course. R650 / 4
+    rounds on Main, R325 / 2 rounds on North."""
+    club = _seed_club(db_session, slug="kpi-courses")
+    main, main_tee = _seed_course_and_tee(db_session, club=club)
+    north = Course(club_id=club.id, name="North", holes=9, active=True)
+    db_session.add(north)
+    db_session.flush()
+    north_tee = Tee(
+        course_id=north.id,
+        name="White",
+        slope_rating=120,
+        course_rating="68.1",
+        color_code="#ffffff",
+        active=True,
+    )
+    db_session.add(north_tee)
+    db_session.commit()
+    member = _seed_user(db_session, email="kpi-courses@example.com", club=club)
+    _, account = _seed_finance_account(db_session, club=club, person=member.person)
+    for course, tee, party_size, fee in (
+        (main, main_tee, 4, Decimal("650.00")),
+        (north, north_tee, 2, Decimal("325.00")),
+    ):
+        _seed_booking_with_charge(
+            db_session,
+            club=club,
+            course=course,
+            tee=tee,
+            person=member.person,
+            account=account,
+            slot_local_hour=6,
+            status=BookingStatus.COMPLETED,
+            party_size=party_size,
+            fee_amount=fee,
+        )
+    club_id, main_id, north_id = club.id, main.id, north.id
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    connection = db_session.connection()
+    event.listen(connection, "before_cursor_execute", _count)
+    try:
+        by_course = compute_by_course(
+            ["revpatt", "revpur", "rounds_played"],
+            db_session,
+            club_id,
+            date_from=WINDOW_DAY,
+            date_to=WINDOW_NEXT,
+        )
+    finally:
+        event.remove(connection, "before_cursor_execute", _count)
+
+    assert list(by_course) == [main_id, north_id]
+    assert by_course[main_id]["revpatt"].value == Decimal("162.50")
+    assert by_course[north_id]["revpatt"].value == Decimal("81.25")
+    assert by_course[main_id]["revpur"].value == Decimal("162.50")
+    assert by_course[north_id]["revpur"].value == Decimal("162.50")
+    assert by_course[main_id]["rounds_played"].value == 4
+    assert by_course[north_id]["rounds_played"].value == 2
+    # Window lookup and one live SELECT grouped by course.
+    assert len(statements) == 2
+
+    with pytest.raises(ValueError):
+        compute_by_course(
+            ["fnb_per_round"], db_session, club_id, date_from=WINDOW_DAY, date_to=WINDOW_NEXT
+        )
+
+
+def test_closed_days_are_read_from_daily_kpi_snapshots(db_session: Session) -> None:
+    """After a snapshot run, a window of closed days re-aggregates
+    club_kpi_daily components and never reads bookings or finance rows."""
+    club = _seed_club(db_session, slug="kpi-snapshot")
+    course, tee = _seed_course_and_tee(db_session, club=club)
+    member = _seed_user(db_session, email="kpi-snapshot@example.com", club=club)
+    _, account = _seed_finance_account(db_session, club=club, person=member.person)
+    for day, party_size, fee in (
+        (WINDOW_DAY, 4, Decimal("650.00")),
+        (WINDOW_DAY + timedelta(days=2), 2, Decimal("325.00")),
+    ):
+        _seed_booking_with_charge(
+            db_session,
+            club=club,
+            course=course,
+            tee=tee,
+            person=member.person,
+            account=account,
+            slot_local_hour=6,
+            status=BookingStatus.COMPLETED,
+            party_size=party_size,
+            fee_amount=fee,
+            day=day,
+        )
+    club_id = club.id
+    report = KpiSnapshotService(
+        sessionmaker(bind=db_session.get_bind(), autoflush=False, expire_on_commit=False),
+        max_workers=1,
+    ).run(club_ids=[club_id], date_from=WINDOW_DAY, date_to=WINDOW_DAY + timedelta(days=2))
+    # Three days for each of the five quantity-based metrics.
+    assert report.clubs[0].status == "completed"
+    assert report.clubs[0].row_count == 15
+
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    connection = db_session.connection()
+    event.listen(connection, "before_cursor_execute", _count)
+    try:
+        results = compute_many(
+            ["revpatt", "revpur"],
+            db_session,
+            club_id=club_id,
+            date_from=WINDOW_DAY,
+            date_to=WINDOW_DAY + timedelta(days=3),
+        )
+    finally:
+        event.remove(connection, "before_cursor_execute", _count)
+
+    assert results["revpatt"].value == Decimal("81.25")
+    assert results["revpur"].value == Decimal("162.50")
+    assert len(statements) == 2
+    assert not any(
+        "bookings" in statement or "finance_transactions" in statement for statement in statements
+    )
+
+
 def test_effective_green_fee_matches_revpur_semantically(db_session: Session) -> None:
     """EGF and RevPUR are numerically identical; semantically distinct."""
     club = _seed_club(db_session, slug="kpi-egf")
@@ -0,0 +1,363 @@
+"""Semantic metric report routes: daily series and per-course breakdowns."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.security import hash_password
+from app.domain.people.normalization import build_full_name, normalize_email
+from app.models import (
+    AccountCustomer,
+    Booking,
+    BookingParticipant,
+    BookingParticipantType,
+    BookingSource,
+    BookingStatus,
+    Club,
+    ClubConfig,
+    ClubMembership,
+    ClubMembershipRole,
+    ClubMembershipStatus,
+    Course,
+    FinanceAccount,
+    FinanceAccountStatus,
+    FinanceTransaction,
+    FinanceTransactionSource,
+    FinanceTransactionType,
+    Person,
+    Tee,
+    User,
+)
+from app.semantic.registry import SERIES_MAX_DAYS
+
+WINDOW_DAY = date(2026, 7, 6)  # a Monday — operating hours apply
+SERIES_PATH = "/api/admin/reports/metrics/series"
+COURSES_PATH = "/api/admin/reports/metrics/courses"
+
+
+def _seed_club(db: Session, *, slug: str, open_close: tuple[str, str] = ("06:00", "07:00")) -> Club:
+    club = Club(name=f"KPI {slug}", slug=slug, timezone="Africa/Johannesburg")
+    db.add(club)
+    db.commit()
+    db.refresh(club)
+    db.add(
+        ClubConfig(
+            club_id=club.id,
+            timezone="Africa/Johannesburg",
+            operating_hours={
+                day: {"open": open_close[0], "close": open_close[1], "closed": False}
+                for day in (
+                    "monday",
+                    "tuesday",
+                    "wednesday",
+                    "thursday",
+                    "friday",
+                    "saturday",
+                    "sunday",
+                )
+            },
+            booking_window_days=14,
+            cancellation_policy_hours=24,
+            default_slot_interval_minutes=30,
+        )
+    )
+    db.commit()
+    return club
+
+
+def _seed_course_and_tee(db: Session, *, club: Club) -> tuple[Course, Tee]:
+    course = Course(club_id=club.id, name="Main", holes=18, active=True)
+    db.add(course)
+    db.flush()
+    tee = Tee(
+        course_id=course.id,
+        name="Blue",
+        slope_rating=128,
+        course_rating="72.4",
+        color_code="#1b4d8f",
+        active=True,
+    )
+    db.add(tee)
+    db.commit()
+    db.refresh(course)
+    db.refresh(tee)
+    return course, tee
+
+
+def _seed_user(
+    db: Session,
+    *,
+    email: str,
+    club: Club,
+    role: ClubMembershipRole = ClubMembershipRole.MEMBER,
+) -> User:
+    local = email.split("@")[0]
+    person = Person(
+        first_name=local.title(),
+        last_name="Member",
+        full_name=build_full_name(local.title(), "Member"),
+        email=normalize_email(email),
+        normalized_email=normalize_email(email),
+        profile_metadata={},
+    )
+    db.add(person)
+    db.flush()
+    user = User(
+        email=email,
+        password_hash=hash_password("password123"),
+        display_name=local,
+        person_id=person.id,
+    )
+    db.add(user)
+    db.flush()
+    db.add(
+        ClubMembership(
+            person_id=person.id,
+            club_id=club.id,
+            role=role,
+            status=ClubMembershipStatus.ACTIVE,
+            is_primary=True,
+            joined_at=datetime(2025, 1, 1, tzinfo=UTC),
+        )
+    )
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def _seed_finance_account(
+    db: Session, *, club: Club, person: Person
+) -> tuple[AccountCustomer, FinanceAccount]:
+    customer = AccountCustomer(
+        club_id=club.id,
+        person_id=person.id,
+        account_code=f"AC-{uuid.uuid4().hex[:8]}",
+        active=True,
+        billing_metadata={},
+    )
+    db.add(customer)
+    db.flush()
+    account = FinanceAccount(
+        club_id=club.id,
+        account_customer_id=customer.id,
+        status=FinanceAccountStatus.ACTIVE,
+    )
+    db.add(account)
+    db.commit()
+    db.refresh(account)
+    return customer, account
+
+
+def _seed_booking_with_charge(
+    db: Session,
+    *,
+    club: Club,
+    course: Course,
+    tee: Tee,
+    person: Person,
+    account: FinanceAccount,
+    slot_local_hour: int,
+    status: BookingStatus,
+    party_size: int = 2,
+    fee_amount: Decimal = Decimal("325.00"),
+    day: date = WINDOW_DAY,
+) -> Booking:
+    slot_utc = datetime(day.year, day.month, day.day, slot_local_hour - 2, 0, tzinfo=UTC)
+    booking = Booking(
+        club_id=club.id,
+        course_id=course.id,
+        tee_id=tee.id,
+        slot_datetime=slot_utc,
+        slot_interval_minutes=30,
+        status=status,
+        source=BookingSource.ADMIN,
+        party_size=party_size,
+        primary_person_id=person.id,
+        fee_amount=fee_amount,
+        fee_currency="ZAR",
+    )
+    db.add(booking)
+    db.flush()
+    db.add(
+        BookingParticipant(
+            booking_id=booking.id,
+            person_id=person.id,
+            participant_type=BookingParticipantType.MEMBER,
+            display_name="Primary",
+            sort_order=0,
+            is_primary=True,
+        )
+    )
+    db.add(
+        FinanceTransaction(
+            club_id=club.id,
+            account_id=account.id,
+            amount=-fee_amount,
+            type=FinanceTransactionType.CHARGE,
+            source=FinanceTransactionSource.BOOKING,
+            reference_id=booking.id,
+            description="Green fee",
+            created_at=slot_utc,
+        )
+    )
+    db.commit()
+    db.refresh(booking)
+    return booking
+
+
+def _auth_headers(client: TestClient, *, email: str, club_id: uuid.UUID) -> dict[str, str]:
+    response = client.post("/api/auth/login", json={"email": email, "password": "password123"})
+    assert response.status_code == 200
+    return {
+        "Authorization": f"Bearer {response.json()['access_token']}",
+        "X-Club-Id": str(club_id),
+    }
+
+
+def _seed_staff_headers(
+    client: TestClient, db: Session, *, slug: str
+) -> tuple[Club, User, dict[str, str]]:
+    club = _seed_club(db, slug=slug)
+    staff = _seed_user(
+        db, email=f"{slug}@example.com", club=club, role=ClubMembershipRole.CLUB_STAFF
+    )
+    return club, staff, _auth_headers(client, email=staff.email, club_id=club.id)
+
+
+def test_metric_series_route_returns_daily_points(client: TestClient, db_session: Session) -> None:
+    club, staff, headers = _seed_staff_headers(client, db_session, slug="series-route")
+    course, tee = _seed_course_and_tee(db_session, club=club)
+    _, account = _seed_finance_account(db_session, club=club, person=staff.person)
+    _seed_booking_with_charge(
+        db_session,
+        club=club,
+        course=course,
+        tee=tee,
+        person=staff.person,
+        account=account,
+        slot_local_hour=6,
+        status=BookingStatus.COMPLETED,
+        party_size=4,
+        fee_amount=Decimal("650.00"),
+    )
+
+    response = client.get(
+        SERIES_PATH,
+        params={
+            "metric": ["revpur", "rounds_played"],
+            "date_from": WINDOW_DAY.isoformat(),
+            "date_to": (WINDOW_DAY + timedelta(days=2)).isoformat(),
+        },
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["granularity"] == "day"
+    revpur, rounds = payload["series"]
+    assert (revpur["metric"], rounds["metric"]) == ("revpur", "rounds_played")
+    assert [point["period_start"] for point in revpur["points"]] == [
+        "2026-07-06",
+        "2026-07-07",
+    ]
+    assert [Decimal(point["result"]["value"]) for point in revpur["points"]] == [
+        Decimal("162.50"),
+        Decimal("0.00"),
+    ]
+    assert [point["result"]["value"] for point in rounds["points"]] == [4, 0]
+
+
+def test_metric_series_route_rejects_unknown_metrics_and_long_ranges(
+    client: TestClient, db_session: Session
+) -> None:
+    _, _, headers = _seed_staff_headers(client, db_session, slug="series-route-errors")
+
+    unknown = client.get(
+        SERIES_PATH,
+        params={"metric": "not_a_metric", "date_from": "2026-07-06", "date_to": "2026-07-07"},
+        headers=headers,
+    )
+    too_long = client.get(
+        SERIES_PATH,
+        params={
+            "metric": "revpur",
+            "date_from": WINDOW_DAY.isoformat(),
+            "date_to": (WINDOW_DAY + timedelta(days=SERIES_MAX_DAYS + 1)).isoformat(),
+        },
+        headers=headers,
+    )
+
+    assert unknown.status_code == 404
+    assert too_long.status_code == 400
+    assert too_long.json()["code"] == "metric_series_range_invalid"
+
+
+def test_metric_course_breakdown_route_splits_each_metric_by_course(
+    client: TestClient, db_session: Session
+) -> None:
+    club, staff, headers = _seed_staff_headers(client, db_session, slug="courses-route")
+    main, main_tee = _seed_course_and_tee(db_session, club=club)
+    north = Course(club_id=club.id, name="North", holes=9, active=True)
+    db_session.add(north)
+    db_session.flush()
+    north_tee = Tee(
+        course_id=north.id,
+        name="White",
+        slope_rating=120,
+        course_rating="68.1",
+        color_code="#ffffff",
+        active=True,
+    )
+    db_session.add(north_tee)
+    db_session.commit()
+    _, account = _seed_finance_account(db_session, club=club, person=staff.person)
+    for course, tee, party_size in ((main, main_tee, 4), (north, north_tee, 2)):
+        _seed_booking_with_charge(
+            db_session,
+            club=club,
+            course=course,
+            tee=tee,
+            person=staff.person,
+            account=account,
+            slot_local_hour=6,
+            status=BookingStatus.COMPLETED,
+            party_size=party_size,
+        )
+    main_id, north_id = main.id, north.id
+
+    response = client.get(
+        COURSES_PATH,
+        params={
+            "metric": "rounds_played",
+            "date_from": WINDOW_DAY.isoformat(),
+            "date_to": (WINDOW_DAY + timedelta(days=1)).isoformat(),
+        },
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    (rounds,) = response.json()["metrics"]
+    assert rounds["metric"] == "rounds_played"
+    assert {
+        uuid.UUID(course["course_id"]): course["result"]["value"] for course in rounds["courses"]
+    } == {main_id: 4, north_id: 2}
+
+
+def test_metric_course_breakdown_route_rejects_metrics_without_quantities(
+    client: TestClient, db_session: Session
+) -> None:
+    _, _, headers = _seed_staff_headers(client, db_session, slug="courses-route-errors")
+
+    response = client.get(
+        COURSES_PATH,
+        params={"metric": "member_summary", "date_from": "2026-07-06", "date_to": "2026-07-07"},
+        headers=headers,
+    )
+
+    assert response.status_code == 400
+    assert response.json()["code"] == "metric_course_breakdown_unsupported"
@@ -3,11 +3,15 @@ from __future__ import annotations
 import re
 
 import pytest
+from fastapi.testclient import TestClient
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from app.models import Club
+from app.core.security import hash_password
+from app.domain.people.normalization import build_full_name, normalize_email
+from app.models import Club, Person, User, UserType
 from app.semantic import Metric, compute, get_metric, list_metrics
+from app.semantic.profiling import get_metric_profile_store
 
 V1_METRIC_NAMES = {
     "effective_green_fee",
@@ -21,14 +25,45 @@ V1_METRIC_NAMES = {
 SEMVER_PATTERN = re.compile(r"^\d+\.\d+\.\d+$")
 
 
-def _seed_club(db: Session) -> Club:
-    club = Club(name="Semantic Test Club", slug="semantic-test", timezone="Africa/Johannesburg")
+def _seed_club(db: Session, *, slug: str = "semantic-test") -> Club:
+    club = Club(name="Semantic Test Club", slug=slug, timezone="Africa/Johannesburg")
     db.add(club)
     db.commit()
     db.refresh(club)
     return club
 
 
+def _seed_user(db: Session, *, email: str, user_type: UserType) -> User:
+    local = email.split("@")[0]
+    person = Person(
+        first_name=local.title(),
+        last_name="User",
+        full_name=build_full_name(local.title(), "User"),
+        email=normalize_email(email),
+        normalized_email=normalize_email(email),
+        profile_metadata={},
+    )
+    db.add(person)
+    db.flush()
+    user = User(
+        email=email,
+        password_hash=hash_password("password123"),
+        display_name=local,
+        user_type=user_type,
+        person_id=person.id,
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def _auth_headers(client: TestClient, *, email: str) -> dict[str, str]:
+    response = client.post("/api/auth/login", json={"email": email, "password": "password123"})
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
 def test_all_six_v1_metrics_registered() -> None:
     registered_names = {metric.name for metric in list_metrics()}
     assert V1_METRIC_NAMES <= registered_names
@@ -65,6 +100,70 @@ def test_compute_returns_result_schema_instance(db_session: Session) -> None:
         )
 
 
+def test_compute_records_execution_profile_per_metric_and_club(db_session: Session) -> None:
+    club = _seed_club(db_session)
+    compute("revpatt", db_session, club_id=club.id)
+    compute("revpatt", db_session, club_id=club.id)
+
+    summary = get_metric_profile_store().summarise(metric="revpatt", club_id=club.id)
+    assert len(summary.profiles) == 1
+    profile = summary.profiles[0]
+    assert profile.sample_count == 2
+    assert (profile.cache_misses, profile.cache_hits) == (1, 1)
+    assert profile.statements_max > 0
+    assert profile.statements_last == 0
+    assert sum(bucket.count for bucket in profile.histogram) == 2
+    assert profile.wall_ms_p50 <= profile.wall_ms_p95 <= profile.wall_ms_max
+    assert profile.error_count == 0
+
+    with pytest.raises(TypeError):
+        compute("revpatt", db_session, club_id=club.id, date_from="2026-05-01")
+    profile = get_metric_profile_store().summarise(metric="revpatt", club_id=club.id).profiles[0]
+    assert (profile.sample_count, profile.error_count) == (3, 1)
+
+
+def test_superadmin_metric_profiles_route_filters_by_metric_and_club(
+    client: TestClient, db_session: Session
+) -> None:
+    club = _seed_club(db_session, slug="semantic-profile-a")
+    other_club = _seed_club(db_session, slug="semantic-profile-b")
+    compute("revpatt", db_session, club_id=club.id)
+    compute("rounds_played", db_session, club_id=club.id)
+    compute("revpatt", db_session, club_id=other_club.id)
+    superadmin = _seed_user(
+        db_session, email="semantic-superadmin@example.com", user_type=UserType.SUPERADMIN
+    )
+    user = _seed_user(db_session, email="semantic-user@example.com", user_type=UserType.USER)
+
+    denied = client.get(
+        "/api/superadmin/diagnostics/metrics",
+        headers=_auth_headers(client, email=user.email),
+    )
+    assert denied.status_code == 403
+
+    headers = _auth_headers(client, email=superadmin.email)
+    by_club = client.get(
+        "/api/superadmin/diagnostics/metrics",
+        params={"club_id": str(club.id)},
+        headers=headers,
+    )
+    by_metric_and_club = client.get(
+        "/api/superadmin/diagnostics/metrics",
+        params={"metric": "revpatt", "club_id": str(other_club.id)},
+        headers=headers,
+    )
+
+    assert by_club.status_code == 200
+    assert {(item["metric"], item["club_id"]) for item in by_club.json()["profiles"]} == {
+        ("revpatt", str(club.id)),
+        ("rounds_played", str(club.id)),
+    }
+    assert by_metric_and_club.status_code == 200
+    [profile] = by_metric_and_club.json()["profiles"]
+    assert (profile["metric"], profile["club_id"]) == ("revpatt", str(other_club.id))
+    assert profile["sample_count"] == 1
+
+
 def test_get_metric_raises_on_unknown() -> None:
     with pytest.raises(KeyError):
         get_metric("does_not_exist")
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import uuid
+import zipfile
+from datetime import UTC, datetime
+from decimal import Decimal
+
+from sqlalchemy.orm import Session
+
+from app.domain.people.normalization import build_full_name, normalize_email
+from app.models import (
+    AccountCustomer,
+    Club,
+    ClubMembership,
+    ClubMembershipRole,
+    ClubMembershipStatus,
+    FinanceAccount,
+    FinanceTransactionSource,
+    FinanceTransactionType,
+    Person,
+)
+from app.models.finance.transaction import FinanceTransaction
+from app.schemas.tenant_export import TenantExportFormat, TenantExportProgress
+from app.services.tenant_export_service import TENANT_EXPORT_ENTITIES, TenantExportService
+from app.storage.object_storage import build_object_storage_client
+
+
+def _create_club(db: Session, *, slug: str) -> Club:
+    club = Club(name=f"Club {slug}", slug=slug, timezone="Africa/Johannesburg")
+    db.add(club)
+    db.commit()
+    db.refresh(club)
+    return club
+
+
+def _create_member_with_account(db: Session, *, club: Club, account_code: str) -> Person:
+    local = account_code.lower()
+    email = normalize_email(f"{local}_{uuid.uuid4().hex[:6]}@test.com")
+    person = Person(
+        first_name=local.title(),
+        last_name="Member",
+        full_name=build_full_name(local.title(), "Member"),
+        email=email,
+        normalized_email=email,
+        profile_metadata={},
+    )
+    db.add(person)
+    db.flush()
+    db.add(
+        ClubMembership(
+            person_id=person.id,
+            club_id=club.id,
+            role=ClubMembershipRole.MEMBER,
+            status=ClubMembershipStatus.ACTIVE,
+        )
+    )
+    account_customer = AccountCustomer(
+        club_id=club.id,
+        person_id=person.id,
+        account_code=account_code,
+        active=True,
+        billing_metadata={},
+    )
+    db.add(account_customer)
+    db.flush()
+    account = FinanceAccount(club_id=club.id, account_customer_id=account_customer.id)
+    db.add(account)
+    db.flush()
+    db.add(
+        FinanceTransaction(
+            club_id=club.id,
+            account_id=account.id,
+            amount=Decimal("-125.50"),
+            type=FinanceTransactionType.CHARGE,
+            source=FinanceTransactionSource.MANUAL,
+            description="Green fee",
+            created_at=datetime(2026, 5, 1, 8, 0, tzinfo=UTC),
+        )
+    )
+    db.commit()
+    db.refresh(person)
+    return person
+
+
+def _read_archive(storage_key: str) -> bytes:
+    return b"".join(build_object_storage_client().iter_object(storage_key))
+
+
+def test_tenant_export_streams_each_club_entity_into_one_archive(db_session: Session) -> None:
+    club = _create_club(db_session, slug=f"export-{uuid.uuid4().hex[:6]}")
+    other_club = _create_club(db_session, slug=f"export-other-{uuid.uuid4().hex[:6]}")
+    member = _create_member_with_account(db_session, club=club, account_code="EXP-001")
+    _create_member_with_account(db_session, club=other_club, account_code="EXP-999")
+
+    progress: list[TenantExportProgress] = []
+    report = TenantExportService(db_session).export_club(
+        club_id=club.id,
+        progress=progress.append,
+    )
+
+    counts = {summary.entity: summary.row_count for summary in report.entities}
+    assert [summary.entity for summary in report.entities] == [
+        entity.name for entity in TENANT_EXPORT_ENTITIES
+    ]
+    assert counts["people"] == 1
+    assert counts["club_memberships"] == 1
+    assert counts["finance_transactions"] == 1
+    assert counts["bookings"] == 0
+    assert [item.entity for item in progress if item.completed] == list(counts)
+
+    body = _read_archive(report.storage_key)
+    assert report.byte_count == len(body)
+    archive = zipfile.ZipFile(io.BytesIO(body))
+    assert archive.namelist() == [summary.file_name for summary in report.entities] + [
+        "manifest.json"
+    ]
+    people = [json.loads(line) for line in archive.read("people.ndjson").splitlines()]
+    assert [person["id"] for person in people] == [str(member.id)]
+    (transaction,) = [
+        json.loads(line) for line in archive.read("finance_transactions.ndjson").splitlines()
+    ]
+    assert (transaction["amount"], transaction["type"]) == ("-125.50", "charge")
+    assert transaction["created_at"].startswith("2026-05-01T08:00:00")
+    manifest = json.loads(archive.read("manifest.json"))
+    assert manifest["club_id"] == str(club.id)
+    assert {entry["entity"]: entry["row_count"] for entry in manifest["entities"]} == counts
+
+    csv_report = TenantExportService(db_session).export_club(
+        club_id=club.id,
+        export_format=TenantExportFormat.CSV,
+    )
+    csv_archive = zipfile.ZipFile(io.BytesIO(_read_archive(csv_report.storage_key)))
+    rows = list(
+        csv.DictReader(io.StringIO(csv_archive.read("account_customers.csv").decode("utf-8")))
+    )
+    assert [row["account_code"] for row in rows] == ["EXP-001"]
@@ -0,0 +1,329 @@
+"""Utilisation heatmap: weekday x time-band cells and the report route."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, date, datetime, time, timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.security import hash_password
+from app.domain.people.normalization import build_full_name, normalize_email
+from app.models import (
+    AccountCustomer,
+    Booking,
+    BookingParticipant,
+    BookingParticipantType,
+    BookingSource,
+    BookingStatus,
+    Club,
+    ClubConfig,
+    ClubMembership,
+    ClubMembershipRole,
+    ClubMembershipStatus,
+    Course,
+    FinanceAccount,
+    FinanceAccountStatus,
+    FinanceTransaction,
+    FinanceTransactionSource,
+    FinanceTransactionType,
+    Person,
+    Tee,
+    TeeSheetSlotState,
+    User,
+)
+from app.services.utilisation_heatmap_service import UtilisationHeatmapService
+
+WINDOW_DAY = date(2026, 7, 6)  # a Monday — operating hours apply
+HEATMAP_PATH = "/api/admin/reports/utilisation/heatmap"
+
+
+def _seed_club(db: Session, *, slug: str, open_close: tuple[str, str] = ("06:00", "07:00")) -> Club:
+    club = Club(name=f"KPI {slug}", slug=slug, timezone="Africa/Johannesburg")
+    db.add(club)
+    db.commit()
+    db.refresh(club)
+    db.add(
+        ClubConfig(
+            club_id=club.id,
+            timezone="Africa/Johannesburg",
+            operating_hours={
+                day: {"open": open_close[0], "close": open_close[1], "closed": False}
+                for day in (
+                    "monday",
+                    "tuesday",
+                    "wednesday",
+                    "thursday",
+                    "friday",
+                    "saturday",
+                    "sunday",
+                )
+            },
+            booking_window_days=14,
+            cancellation_policy_hours=24,
+            default_slot_interval_minutes=30,
+        )
+    )
+    db.commit()
+    return club
+
+
+def _seed_course_and_tee(db: Session, *, club: Club) -> tuple[Course, Tee]:
+    course = Course(club_id=club.id, name="Main", holes=18, active=True)
+    db.add(course)
+    db.flush()
+    tee = Tee(
+        course_id=course.id,
+        name="Blue",
+        slope_rating=128,
+        course_rating="72.4",
+        color_code="#1b4d8f",
+        active=True,
+    )
+    db.add(tee)
+    db.commit()
+    db.refresh(course)
+    db.refresh(tee)
+    return course, tee
+
+
+def _seed_user(
+    db: Session,
+    *,
+    email: str,
+    club: Club,
+    role: ClubMembershipRole = ClubMembershipRole.MEMBER,
+) -> User:
+    local = email.split("@")[0]
+    person = Person(
+        first_name=local.title(),
+        last_name="Member",
+        full_name=build_full_name(local.title(), "Member"),
+        email=normalize_email(email),
+        normalized_email=normalize_email(email),
+        profile_metadata={},
+    )
+    db.add(person)
+    db.flush()
+    user = User(
+        email=email,
+        password_hash=hash_password("password123"),
+        display_name=local,
+        person_id=person.id,
+    )
+    db.add(user)
+    db.flush()
+    db.add(
+        ClubMembership(
+            person_id=person.id,
+            club_id=club.id,
+            role=role,
+            status=ClubMembershipStatus.ACTIVE,
+            is_primary=True,
+            joined_at=datetime(2025, 1, 1, tzinfo=UTC),
+        )
+    )
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def _seed_finance_account(
+    db: Session, *, club: Club, person: Person
+) -> tuple[AccountCustomer, FinanceAccount]:
+    customer = AccountCustomer(
+        club_id=club.id,
+        person_id=person.id,
+        account_code=f"AC-{uuid.uuid4().hex[:8]}",
+        active=True,
+        billing_metadata={},
+    )
+    db.add(customer)
+    db.flush()
+    account = FinanceAccount(
+        club_id=club.id,
+        account_customer_id=customer.id,
+        status=FinanceAccountStatus.ACTIVE,
+    )
+    db.add(account)
+    db.commit()
+    db.refresh(account)
+    return customer, account
+
+
+def _seed_booking_with_charge(
+    db: Session,
+    *,
+    club: Club,
+    course: Course,
+    tee: Tee,
+    person: Person,
+    account: FinanceAccount,
+    slot_local_hour: int,
+    status: BookingStatus,
+    party_size: int = 2,
+    fee_amount: Decimal = Decimal("325.00"),
+    day: date = WINDOW_DAY,
+) -> Booking:
+    slot_utc = datetime(day.year, day.month, day.day, slot_local_hour - 2, 0, tzinfo=UTC)
+    booking = Booking(
+        club_id=club.id,
+        course_id=course.id,
+        tee_id=tee.id,
+        slot_datetime=slot_utc,
+        slot_interval_minutes=30,
+        status=status,
+        source=BookingSource.ADMIN,
+        party_size=party_size,
+        primary_person_id=person.id,
+        fee_amount=fee_amount,
+        fee_currency="ZAR",
+    )
+    db.add(booking)
+    db.flush()
+    db.add(
+        BookingParticipant(
+            booking_id=booking.id,
+            person_id=person.id,
+            participant_type=BookingParticipantType.MEMBER,
+            display_name="Primary",
+            sort_order=0,
+            is_primary=True,
+        )
+    )
+    db.add(
+        FinanceTransaction(
+            club_id=club.id,
+            account_id=account.id,
+            amount=-fee_amount,
+            type=FinanceTransactionType.CHARGE,
+            source=FinanceTransactionSource.BOOKING,
+            reference_id=booking.id,
+            description="Green fee",
+            created_at=slot_utc,
+        )
+    )
+    db.commit()
+    db.refresh(booking)
+    return booking
+
+
+def _auth_headers(client: TestClient, *, email: str, club_id: uuid.UUID) -> dict[str, str]:
+    response = client.post("/api/auth/login", json={"email": email, "password": "password123"})
+    assert response.status_code == 200
+    return {
+        "Authorization": f"Bearer {response.json()['access_token']}",
+        "X-Club-Id": str(club_id),
+    }
+
+
+def test_utilisation_heatmap_groups_places_by_weekday_and_band(db_session: Session) -> None:
+    club = _seed_club(db_session, slug="kpi-heatmap")
+    course, tee = _seed_course_and_tee(db_session, club=club)
+    member = _seed_user(db_session, email="kpi-heatmap@example.com", club=club)
+    _, account = _seed_finance_account(db_session, club=club, person=member.person)
+    for status, party_size in ((BookingStatus.COMPLETED, 4), (BookingStatus.CANCELLED, 2)):
+        _seed_booking_with_charge(
+            db_session,
+            club=club,
+            course=course,
+            tee=tee,
+            person=member.person,
+            account=account,
+            slot_local_hour=6,
+            status=status,
+            party_size=party_size,
+        )
+    db_session.add(
+        TeeSheetSlotState(
+            club_id=club.id,
+            course_id=course.id,
+            tee_id=tee.id,
+            slot_datetime=datetime(2026, 7, 6, 4, 30, tzinfo=UTC),  # 06:30 local
+            player_capacity=4,
+            manually_blocked=True,
+            blocked_reason="Maintenance",
+        )
+    )
+    db_session.commit()
+    club_id = club.id
+
+    heatmap = UtilisationHeatmapService(db_session).heatmap(
+        club_id=club_id, weeks=1, reference_date=WINDOW_DAY + timedelta(days=7)
+    )
+
+    assert (heatmap.date_from, heatmap.date_to) == (WINDOW_DAY, WINDOW_DAY + timedelta(days=7))
+    # 06:00-07:00 daily: two 30-minute slots x (1 tee x 2 lanes) x 4 places.
+    assert [(cell.weekday, cell.band_start) for cell in heatmap.cells] == [
+        (weekday, time(6, 0)) for weekday in range(7)
+    ]
+    monday = heatmap.cells[0]
+    assert (monday.booked_places, monday.capacity_places) == (4, 12)
+    assert monday.utilisation == Decimal("0.3333")
+    assert {cell.capacity_places for cell in heatmap.cells[1:]} == {16}
+    assert {cell.utilisation for cell in heatmap.cells[1:]} == {Decimal("0")}
+
+
+def test_utilisation_heatmap_route_rejects_unsupported_band_minutes(
+    client: TestClient, db_session: Session
+) -> None:
+    club = _seed_club(db_session, slug="heatmap-route-band")
+    staff = _seed_user(
+        db_session,
+        email="heatmap-band@example.com",
+        club=club,
+        role=ClubMembershipRole.CLUB_STAFF,
+    )
+    headers = _auth_headers(client, email=staff.email, club_id=club.id)
+
+    response = client.get(HEATMAP_PATH, params={"band_minutes": 45}, headers=headers)
+
+    assert response.status_code == 400
+    assert response.json()["code"] == "utilisation_heatmap_band_invalid"
+
+
+def test_utilisation_heatmap_route_is_cached_per_club_day(
+    client: TestClient, db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    club = _seed_club(db_session, slug="heatmap-route-cache")
+    course, tee = _seed_course_and_tee(db_session, club=club)
+    staff = _seed_user(
+        db_session,
+        email="heatmap-cache@example.com",
+        club=club,
+        role=ClubMembershipRole.CLUB_STAFF,
+    )
+    _, account = _seed_finance_account(db_session, club=club, person=staff.person)
+    headers = _auth_headers(client, email=staff.email, club_id=club.id)
+    params = {"weeks": 2, "band_minutes": 60}
+    today = datetime(2026, 7, 13, 8, 0, tzinfo=UTC)
+    monkeypatch.setattr("app.services.reports_service.utc_now", lambda: today)
+
+    def monday_booked_places() -> int:
+        response = client.get(HEATMAP_PATH, params=params, headers=headers)
+        assert response.status_code == 200
+        monday = response.json()["cells"][0]
+        assert monday["weekday"] == 0
+        return monday["booked_places"]
+
+    assert monday_booked_places() == 0
+
+    # A direct write publishes no booking event, so today's cached heatmap stays.
+    _seed_booking_with_charge(
+        db_session,
+        club=club,
+        course=course,
+        tee=tee,
+        person=staff.person,
+        account=account,
+        slot_local_hour=6,
+        status=BookingStatus.COMPLETED,
+        party_size=4,
+    )
+    assert monday_booked_places() == 0
+
+    today += timedelta(days=1)
+    assert monday_booked_places() == 4
@@ -35,6 +35,9 @@ export interface FinanceJournalEntry {
 export interface FinanceClubJournal {
   entries: FinanceJournalEntry[];
   total_count: number;
+  total_count_is_estimate: boolean;
+  next_cursor: string | null;
+  prev_cursor: string | null;
 }
 
 export interface FinanceSummaryWindow {
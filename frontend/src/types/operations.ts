@@ -26,6 +26,7 @@ export interface ClubConfig {
   booking_window_days: number;
   cancellation_policy_hours: number;
   default_slot_interval_minutes: number;
+  arrears_block_enabled: boolean;
   created_at: string;
   updated_at: string;
 }
@@ -36,6 +37,7 @@ export interface ClubConfigInput {
   booking_window_days: number;
   cancellation_policy_hours: number;
   default_slot_interval_minutes: number;
+  arrears_block_enabled?: boolean;
 }
 
 export interface Course {
@@ -22,6 +22,7 @@ export interface PosTransactionCreateInput {
   tender_type: TenderType;
   person_id?: string | null;
   notes?: string | null;
+  drawer_code?: string | null;
 }
 
 export interface PosTransactionItemDetail {
@@ -40,6 +41,7 @@ export interface PosTransactionDetail {
   tender_type: TenderType;
   finance_transaction_id: string | null;
   notes: string | null;
+  drawer_code: string | null;
   created_by_user_id: string;
   created_at: string;
   items: PosTransactionItemDetail[];